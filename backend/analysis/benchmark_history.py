@@ -0,0 +1,185 @@
+"""
+Benchmark History Cache — shared SPY/QQQ/sector ETF/VIX daily histories
+=======================================================================
+Relative strength, sector momentum and the VIX regime all read the same
+handful of benchmark series. HybridScannerService used to keep SPY in a class
+attribute that was filled once and never refreshed (so a long-running worker
+scored RS against a stale SPY), while SectorAnalysis downloaded each sector
+ETF on every ranking refresh.
+
+One process-wide cache now serves every consumer:
+
+  - entries are keyed by the last completed NYSE session
+    (market_hours.last_completed_session), so they roll over by themselves
+    after the close bookend instead of on an arbitrary TTL
+  - if ORATS hasn't published the newest bar yet, the entry is re-fetched
+    at most every STALE_RETRY_SECONDS until it has
+  - each entry keeps its prepared DataFrame, and aligned_df() reindexes it
+    onto a stock's dates so 5-bar RS compares the same sessions
+  - concurrent misses for the same symbol wait on one fetch
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any, Dict, Optional
+
+import pandas as pd
+
+from backend.analysis.technical_indicators import TechnicalIndicators
+from backend.utils.market_hours import last_completed_session
+
+logger = logging.getLogger(__name__)
+
+# Series served by the cache (sector ETFs match SectorAnalysis.SECTOR_MAP)
+BENCHMARK_SYMBOLS = ('SPY', 'QQQ', 'VIX',
+                     'XLK', 'XLF', 'XLV', 'XLY', 'XLC', 'XLE', 'XLI', 'XLP', 'XLU', 'XLRE', 'XLB')
+
+# While the newest bar is missing (ORATS publishes EOD data with a lag),
+# re-fetch no more often than this
+STALE_RETRY_SECONDS = 3600
+
+
+@dataclass
+class BenchmarkEntry:
+    """One cached benchmark history and its prepared DataFrame."""
+    symbol: str
+    session: date                      # last_completed_session() when fetched
+    history: Optional[Dict[str, Any]]  # ORATS get_history() payload
+    df: Optional[pd.DataFrame]
+    fetched_at: float = field(default_factory=time.time)
+
+    @property
+    def last_bar_date(self) -> Optional[date]:
+        if self.df is None or self.df.empty:
+            return None
+        return self.df.index[-1].date()
+
+    def is_current(self, session: date, now: float = None) -> bool:
+        """True while this entry still serves `session` without a re-fetch."""
+        if self.session != session:
+            return False  # Trading-day rollover
+        last = self.last_bar_date
+        if last is not None and last >= session:
+            return True
+        now = time.time() if now is None else now
+        return now - self.fetched_at < STALE_RETRY_SECONDS
+
+
+class BenchmarkHistoryCache:
+    """Thread-safe, session-keyed cache of benchmark daily histories."""
+
+    def __init__(self):
+        self._entries: Dict[str, BenchmarkEntry] = {}
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, threading.Event] = {}
+        self._technical = TechnicalIndicators()
+
+    # ── Lookup ──────────────────────────────────────────────────────
+
+    def get_entry(self, orats_api, symbol, force_refresh=False) -> Optional[BenchmarkEntry]:
+        """Return the current entry for `symbol`, fetching it on a miss or rollover."""
+        symbol = symbol.replace('$', '').upper()
+        session = last_completed_session()
+
+        while True:
+            with self._lock:
+                entry = self._entries.get(symbol)
+                if not force_refresh and entry is not None and entry.is_current(session):
+                    return entry
+                waiter = self._inflight.get(symbol)
+                if waiter is None:
+                    self._inflight[symbol] = threading.Event()
+                    break
+            # Another thread is fetching this symbol; use its result
+            waiter.wait(timeout=60)
+            force_refresh = False
+
+        try:
+            if orats_api is None:
+                return entry
+            history = orats_api.get_history(symbol)
+            if not history or not history.get('candles'):
+                logger.warning(f"Benchmark history unavailable for {symbol}")
+                return entry  # Keep serving the previous session's data if we had any
+            return self._store(symbol, session, history)
+        finally:
+            with self._lock:
+                self._inflight.pop(symbol).set()
+
+    def get_history(self, orats_api, symbol, force_refresh=False):
+        """Cached ORATS history payload for `symbol` (None if unavailable)."""
+        entry = self.get_entry(orats_api, symbol, force_refresh)
+        return entry.history if entry else None
+
+    def get_df(self, orats_api, symbol):
+        """Cached prepared DataFrame for `symbol`. Shared — treat as read-only."""
+        entry = self.get_entry(orats_api, symbol)
+        return entry.df if entry else None
+
+    def get_histories(self, orats_api, symbols):
+        """Cached histories for several symbols; misses are fetched in one batch call.
+
+        Returns:
+            dict: symbol -> history payload (symbols without data are omitted)
+        """
+        session = last_completed_session()
+        symbols = [s.replace('$', '').upper() for s in symbols]
+        with self._lock:
+            current = {s: self._entries[s] for s in symbols
+                       if s in self._entries and self._entries[s].is_current(session)}
+        missing = [s for s in symbols if s not in current]
+
+        if missing and orats_api is not None:
+            try:
+                fetched = orats_api.get_history_batch(missing) or {}
+            except Exception as e:
+                logger.warning(f"Benchmark batch fetch failed: {e}")
+                fetched = {}
+            for symbol, history in fetched.items():
+                if history and history.get('candles'):
+                    current[symbol] = self._store(symbol, session, history)
+
+        # Stale entries still beat nothing when a re-fetch failed
+        with self._lock:
+            for s in symbols:
+                if s not in current and s in self._entries:
+                    current[s] = self._entries[s]
+        return {s: e.history for s, e in current.items()}
+
+    def aligned_df(self, orats_api, symbol, df):
+        """Benchmark DataFrame reindexed onto `df`'s dates (forward-filled).
+
+        Positional comparisons such as calculate_relative_strength() then look
+        at the same sessions for both series, even when the stock history ends
+        a day earlier or later than the benchmark's.
+        """
+        bench = self.get_df(orats_api, symbol)
+        if bench is None or df is None or df.empty:
+            return None
+        aligned = bench.reindex(bench.index.union(df.index)).ffill().reindex(df.index)
+        return aligned if aligned['Close'].notna().any() else None
+
+    # ── Maintenance ────────────────────────────────────────────────
+
+    def _store(self, symbol, session, history):
+        entry = BenchmarkEntry(symbol=symbol, session=session, history=history,
+                               df=self._technical.prepare_dataframe(history))
+        with self._lock:
+            self._entries[symbol] = entry
+        logger.info(f"Benchmark history cached: {symbol} through {entry.last_bar_date} (session {session})")
+        return entry
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __contains__(self, symbol):
+        with self._lock:
+            return symbol.upper() in self._entries
+
+
+# Process-wide cache shared by scanners, SectorAnalysis and RegimeDetector
+benchmark_cache = BenchmarkHistoryCache()
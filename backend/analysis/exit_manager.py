@@ -72,6 +72,25 @@ class ExitManager:
         },
     }
 
+    def __init__(self, earnings_calendar=None):
+        """
+        Args:
+            earnings_calendar: Optional next-earnings index (EarningsCalendar) used
+                               when the caller passes no days_to_earnings
+        """
+        self.earnings_calendar = earnings_calendar
+
+    def _days_to_earnings(self, record):
+        """Days to the next report for record['ticker'/'symbol'] from the index (no request)."""
+        symbol = record.get('ticker') or record.get('symbol') if record else None
+        if self.earnings_calendar is None or not symbol:
+            return None
+        try:
+            return self.earnings_calendar.days_to_earnings(symbol)
+        except Exception as e:
+            logger.debug(f"Earnings index lookup failed for {symbol}: {e}")
+            return None
+
     def generate_exit_plan(self, opportunity, strategy='LEAP', vix_regime='NORMAL',
                            days_to_earnings=None, iv_percentile=50):
         """
@@ -100,6 +119,8 @@ class ExitManager:
 
         premium = opportunity.get('premium', 0)
         dte = opportunity.get('days_to_expiry', 0)
+        if days_to_earnings is None:
+            days_to_earnings = self._days_to_earnings(opportunity)
 
         # --- VIX Regime Adjustments ---
         if vix_regime == 'CRISIS':
@@ -179,7 +200,7 @@ class ExitManager:
             position: dict with entry details
             current_pnl_pct: Current P&L as percentage (e.g., 35.0 = +35%)
             dte_remaining: Days to expiration remaining
-            days_to_earnings: Days until next earnings (or None)
+            days_to_earnings: Days until next earnings (None: look up position['ticker'])
             exit_plan: Pre-generated exit plan dict
 
         Returns:
@@ -187,6 +208,8 @@ class ExitManager:
         """
         if not exit_plan:
             return {'should_exit': False, 'reason': 'no_plan', 'action': 'hold'}
+        if days_to_earnings is None:
+            days_to_earnings = self._days_to_earnings(position)
 
         # 1. Stop Loss
         if current_pnl_pct <= exit_plan['stop_loss_pct']:
@@ -0,0 +1,178 @@
+"""
+IndicatorFrame — compute-once technical indicators per (ticker, last bar, live price)
+=====================================================================================
+A weekly scan, a LEAP CALL scan, a LEAP PUT scan and the detail route all
+turned the same ORATS history into a DataFrame and ran the full indicator
+suite on it, often within minutes of each other.
+
+An IndicatorFrame holds the prepared DataFrame (with the live-price override
+already applied to the last Close) and everything derived from it by
+TechnicalIndicators.get_all_indicators_for_df(): RSI, MACD, Bollinger Bands,
+SMA stack, volume, support/resistance, ATR, HV rank, RSI-2, VWAP and
+Minervini. Frames live in one bounded LRU cache shared by every scanner and
+analysis route in the process.
+
+Live-price frames are derived from the plain (no override) frame of the
+same history: its LiveBarState (backend/analysis/live_indicators.py) keeps
+every indicator's accumulators through the previous bar, so each new quote
+re-evaluates only the last bar instead of reprocessing ~275 bars.
+
+Frames are shared — treat `df` as read-only and use indicators_copy() for a
+dict you intend to mutate (e.g. injecting Minervini criterion 8).
+"""
+
+import copy
+import logging
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+import pandas as pd
+from cachetools import LRUCache
+
+from backend.analysis.live_indicators import LiveBarState
+
+log = logging.getLogger(__name__)
+
+# ~275 daily bars x OHLCV per frame — 256 frames is a few MB
+INDICATOR_FRAME_CACHE_SIZE = 256
+RS_PERIOD = 5  # Matches TechnicalIndicators.calculate_relative_strength()
+
+
+@dataclass
+class IndicatorFrame:
+    """Prepared price DataFrame plus the full indicator suite computed from it."""
+    ticker: str
+    last_bar: Any                      # Timestamp (ms) of the last candle
+    live_price: Optional[float]        # Override applied to the last Close, if any
+    df: pd.DataFrame
+    indicators: Optional[Dict[str, Any]]
+    built_at: datetime = field(default_factory=datetime.now)
+    # % return vs SPY over 5 bars, when computed in a panel pass (indicator_panel.py)
+    relative_strength: Optional[float] = None
+    # Lazily seeded incremental state (False = too little history to seed)
+    live_state: Any = field(default=None, repr=False, compare=False)
+
+    @property
+    def current_price(self) -> float:
+        return float(self.df['Close'].iloc[-1])
+
+    @property
+    def atr(self) -> float:
+        return (self.indicators or {}).get('volatility', {}).get('values', {}).get('atr', 0)
+
+    @property
+    def hv_rank(self) -> float:
+        return (self.indicators or {}).get('volatility', {}).get('values', {}).get('hv_rank', 50)
+
+    def indicators_copy(self) -> Optional[Dict[str, Any]]:
+        """Deep copy of the indicator dict, safe for callers that mutate it."""
+        return copy.deepcopy(self.indicators)
+
+    def with_live_price(self, live_price, technical_analyzer) -> Optional['IndicatorFrame']:
+        """Derive a frame whose last Close is `live_price`, updating indicators in O(1).
+
+        Returns None when the history is too short for the incremental state;
+        the caller then falls back to a full recompute.
+        """
+        if self.live_state is None:
+            self.live_state = LiveBarState.from_df(self.df) or False
+        if not self.live_state:
+            return None
+
+        df = self.df.copy()
+        df.iloc[-1, df.columns.get_loc('Close')] = live_price
+        quality = (self.indicators or {}).get('_data_quality')
+        relative_strength = self.relative_strength
+        if relative_strength is not None and len(self.df) > RS_PERIOD:
+            # Only the stock leg of the RS return moves with the live price
+            close = self.df['Close'].to_numpy()
+            relative_strength = relative_strength + (live_price - close[-1]) / close[-RS_PERIOD - 1] * 100
+        return IndicatorFrame(
+            ticker=self.ticker,
+            last_bar=self.last_bar,
+            live_price=round(float(live_price), 4),
+            df=df,
+            indicators=self.live_state.indicators(technical_analyzer, live_price, quality),
+            relative_strength=relative_strength,
+        )
+
+
+class IndicatorFrameCache:
+    """Thread-safe LRU of IndicatorFrames keyed by (ticker, bars, last bar, live price)."""
+
+    def __init__(self, maxsize=INDICATOR_FRAME_CACHE_SIZE):
+        self._frames = LRUCache(maxsize=maxsize)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(ticker, price_history, live_price=None):
+        candles = (price_history or {}).get('candles') or []
+        if not candles:
+            return None
+        last_bar = candles[-1].get('datetime')
+        price_key = round(float(live_price), 4) if live_price else None
+        return ((ticker or '').replace('$', '').upper(), len(candles), last_bar, price_key)
+
+    def get_or_build(self, technical_analyzer, ticker, price_history, live_price=None):
+        """Return the cached frame for this history/live price, building it on a miss.
+
+        Returns None if the history can't be turned into a DataFrame.
+        """
+        key = self.make_key(ticker, price_history, live_price)
+        if key is None:
+            return None
+
+        with self._lock:
+            frame = self._frames.get(key)
+        if frame is not None:
+            log.debug(f"IndicatorFrame hit: {key[0]} ({key[1]} bars)")
+            return frame
+
+        frame = None
+        if live_price:
+            # Revise the last bar of the base frame instead of recomputing everything
+            base = self.get_or_build(technical_analyzer, ticker, price_history)
+            if base is None:
+                return None
+            frame = base.with_live_price(live_price, technical_analyzer)
+
+        if frame is None:
+            df = technical_analyzer.prepare_dataframe(price_history)
+            if df is None or df.empty:
+                return None
+            if live_price:
+                df.iloc[-1, df.columns.get_loc('Close')] = live_price
+            frame = IndicatorFrame(
+                ticker=key[0],
+                last_bar=key[2],
+                live_price=key[3],
+                df=df,
+                indicators=technical_analyzer.get_all_indicators_for_df(df),
+            )
+        # Two threads may build the same frame concurrently; last write wins, both are identical
+        with self._lock:
+            self._frames[key] = frame
+        return frame
+
+    def put(self, key, frame):
+        """Store a frame built elsewhere (e.g. a batched panel pass) under `key`."""
+        with self._lock:
+            self._frames[key] = frame
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._frames
+
+    def clear(self):
+        with self._lock:
+            self._frames.clear()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._frames)
+
+
+# Process-wide cache shared by all scanners and analysis routes
+indicator_frames = IndicatorFrameCache()
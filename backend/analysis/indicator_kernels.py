@@ -0,0 +1,187 @@
+"""
+Indicator Kernels — pure-NumPy implementations of the `ta` indicators we use
+============================================================================
+`ta` builds an indicator object and a chain of pandas Series for every call,
+and TechnicalIndicators keeps only `.iloc[-1]`. On the Raspberry Pi
+deployment that overhead dominates per-ticker CPU.
+
+These kernels take raw float64 arrays and return float64 arrays of the same
+length, with NaN where `ta` (fillna=False) would return NaN. They reproduce
+`ta`'s exact conventions so signals don't change:
+
+  - EMA:  adjust=False recursion seeded with the first value, NaN until
+          `min_periods` observations (pandas ewm semantics)
+  - RSI:  Wilder smoothing (alpha = 1/period); 100 when average loss is 0
+  - ATR:  first value = mean of the first `period` true ranges, then Wilder;
+          0.0 (not NaN) before that, as in ta.volatility.AverageTrueRange
+  - Bollinger std uses ddof=0; HV std uses ddof=1 (pandas default)
+
+tests/test_indicator_kernels.py checks every kernel against `ta`/pandas.
+"""
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+TRADING_DAYS = 252
+
+
+def _as_array(values):
+    return np.asarray(values, dtype=np.float64)
+
+
+# ─── Moving averages ────────────────────────────────────────────────────────
+
+def ewm_mean(values, alpha, min_periods=0):
+    """pandas `ewm(alpha=alpha, adjust=False, min_periods=...).mean()`.
+
+    Leading NaNs are skipped (the recursion starts at the first real value);
+    NaNs after that carry the previous average forward.
+    """
+    x = _as_array(values)
+    out = np.full(x.shape, np.nan)
+    decay = 1.0 - alpha
+    avg = np.nan
+    seen = 0
+    # Recursive by nature; a plain loop over Python floats beats ufunc overhead at ~300 bars
+    for i, v in enumerate(x.tolist()):
+        if v != v:  # NaN
+            if seen:
+                out[i] = avg if seen >= min_periods else np.nan
+            continue
+        avg = v if not seen else decay * avg + alpha * v
+        seen += 1
+        if seen >= min_periods:
+            out[i] = avg
+    return out
+
+
+def ema(values, span, min_periods=None):
+    """Exponential moving average with alpha = 2 / (span + 1) (ta.utils._ema)."""
+    return ewm_mean(values, 2.0 / (span + 1.0), span if min_periods is None else min_periods)
+
+
+def rolling_mean(values, window):
+    """Trailing simple moving average; NaN for the first window-1 values."""
+    x = _as_array(values)
+    out = np.full(x.shape, np.nan)
+    if window <= 0 or len(x) < window:
+        return out
+    out[window - 1:] = sliding_window_view(x, window).mean(axis=1)
+    return out
+
+
+def rolling_std(values, window, ddof=1):
+    """Trailing rolling standard deviation; NaN where the window contains a NaN."""
+    x = _as_array(values)
+    out = np.full(x.shape, np.nan)
+    if window <= ddof or len(x) < window:
+        return out
+    out[window - 1:] = sliding_window_view(x, window).std(axis=1, ddof=ddof)
+    return out
+
+
+def rolling_max(values, window):
+    x = _as_array(values)
+    out = np.full(x.shape, np.nan)
+    if len(x) >= window:
+        out[window - 1:] = sliding_window_view(x, window).max(axis=1)
+    return out
+
+
+def rolling_min(values, window):
+    x = _as_array(values)
+    out = np.full(x.shape, np.nan)
+    if len(x) >= window:
+        out[window - 1:] = sliding_window_view(x, window).min(axis=1)
+    return out
+
+
+# ─── Momentum ───────────────────────────────────────────────────────────────
+
+def wilder_averages(close, period=14):
+    """Wilder-smoothed average gain and average loss series (RSI building blocks)."""
+    c = _as_array(close)
+    if len(c) == 0:
+        return c.copy(), c.copy()
+    diff = np.empty_like(c)
+    diff[0] = np.nan
+    diff[1:] = np.diff(c)
+    # ta: diff.where(diff > 0, 0.0) turns the leading NaN into 0.0
+    up = np.where(diff > 0, diff, 0.0)
+    down = np.where(diff < 0, -diff, 0.0)
+    return ewm_mean(up, 1.0 / period, period), ewm_mean(down, 1.0 / period, period)
+
+
+def rsi_from_averages(avg_up, avg_down):
+    """RSI from average gain/loss (scalars or arrays); 100 when average loss is 0."""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rsi = 100.0 - 100.0 / (1.0 + np.divide(avg_up, avg_down))
+    return np.where(np.equal(avg_down, 0), 100.0, rsi)
+
+
+def wilder_rsi(close, period=14):
+    """RSI with Wilder smoothing — matches ta.momentum.RSIIndicator."""
+    return rsi_from_averages(*wilder_averages(close, period))
+
+
+def macd(close, fast=12, slow=26, signal=9):
+    """MACD line, signal line and histogram — matches ta.trend.MACD."""
+    c = _as_array(close)
+    line = ema(c, fast) - ema(c, slow)
+    signal_line = ema(line, signal)
+    return line, signal_line, line - signal_line
+
+
+def bollinger(close, window=20, window_dev=2):
+    """(upper, middle, lower) bands — matches ta.volatility.BollingerBands (ddof=0)."""
+    mid = rolling_mean(close, window)
+    std = rolling_std(close, window, ddof=0)
+    return mid + window_dev * std, mid, mid - window_dev * std
+
+
+# ─── Volatility ─────────────────────────────────────────────────────────────
+
+def true_range(high, low, close):
+    """max(H-L, |H-prevC|, |L-prevC|); first bar is H-L (no previous close)."""
+    h, l, c = _as_array(high), _as_array(low), _as_array(close)
+    tr = h - l
+    if len(c) > 1:
+        prev = c[:-1]
+        tr[1:] = np.maximum.reduce([tr[1:], np.abs(h[1:] - prev), np.abs(l[1:] - prev)])
+    return tr
+
+
+def atr(high, low, close, period=14):
+    """Average True Range — matches ta.volatility.AverageTrueRange."""
+    tr = true_range(high, low, close)
+    out = np.zeros(tr.shape)
+    if len(tr) < period:
+        return out
+    avg = tr[:period].mean()
+    out[period - 1] = avg
+    for i, v in enumerate(tr[period:].tolist(), start=period):
+        avg = (avg * (period - 1) + v) / period
+        out[i] = avg
+    return out
+
+
+def log_returns(close):
+    c = _as_array(close)
+    out = np.full(c.shape, np.nan)
+    if len(c) > 1:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            out[1:] = np.log(c[1:] / c[:-1])
+    return out
+
+
+def historical_volatility(close, window=20, periods_per_year=TRADING_DAYS):
+    """Annualized rolling std of log returns, in percent (ddof=1)."""
+    return rolling_std(log_returns(close), window, ddof=1) * np.sqrt(periods_per_year) * 100
+
+
+def last_valid(values, n=None):
+    """Non-NaN values of an array (optionally only the last n of the array first)."""
+    x = _as_array(values)
+    if n is not None:
+        x = x[-n:]
+    return x[~np.isnan(x)]
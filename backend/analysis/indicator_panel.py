@@ -0,0 +1,274 @@
+"""
+Indicator Panel — one vectorized indicator pass for a whole batch of tickers
+===========================================================================
+Sector scans fetch up to 75 histories with get_history_batch(), and every
+ticker then went through its own TechnicalIndicators pass (one DataFrame,
+a dozen indicator calls). The panel aligns the batch into 2-D
+(dates x tickers) arrays and computes RSI, MACD, Bollinger, the SMA stack,
+volume, support/resistance, ATR, HV rank, RSI-2, VWAP, Minervini and
+relative strength vs SPY for all tickers at once.
+
+Results are assembled into the same get_all_indicators() dict (via the
+TechnicalIndicators signal helpers) and primed into the shared
+IndicatorFrame cache, so the per-ticker scans that follow get cache hits.
+
+Only tickers whose bars line up with the panel's trailing dates and that
+have a full year of history (>= PANEL_MIN_BARS) go through the panel; the
+rest keep the per-ticker path, which handles short and gappy histories.
+"""
+
+import logging
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+from backend.analysis import indicator_kernels as kernels
+from backend.analysis.indicator_frame import RS_PERIOD, IndicatorFrame, indicator_frames
+
+logger = logging.getLogger(__name__)
+
+# Minervini (the most demanding indicator) needs 252 bars
+PANEL_MIN_BARS = 252
+
+
+# ─── Column-wise kernels (rows = dates, columns = tickers) ──────────────────
+# Leading NaNs pad tickers with shorter histories; each column's recursion
+# starts at its own first bar, exactly like the 1-D kernels.
+
+def ewm_mean_2d(values, alpha, min_periods=0):
+    """Column-wise indicator_kernels.ewm_mean()."""
+    x = np.asarray(values, dtype=np.float64)
+    out = np.full(x.shape, np.nan)
+    decay = 1.0 - alpha
+    avg = np.full(x.shape[1], np.nan)
+    seen = np.zeros(x.shape[1], dtype=np.int64)
+    for i in range(x.shape[0]):
+        row = x[i]
+        valid = ~np.isnan(row)
+        avg = np.where(valid, np.where(seen > 0, decay * avg + alpha * row, row), avg)
+        seen += valid
+        out[i] = np.where((seen > 0) & (seen >= min_periods), avg, np.nan)
+    return out
+
+
+def ema_2d(values, span):
+    return ewm_mean_2d(values, 2.0 / (span + 1.0), span)
+
+
+def wilder_rsi_2d(close, period=14):
+    """Column-wise indicator_kernels.wilder_rsi()."""
+    diff = np.full(close.shape, np.nan)
+    diff[1:] = close[1:] - close[:-1]
+    padded = np.isnan(close)
+    # First real bar: diff is NaN -> 0.0 gain/loss (ta convention); padding stays NaN
+    up = np.where(padded, np.nan, np.where(diff > 0, diff, 0.0))
+    down = np.where(padded, np.nan, np.where(diff < 0, -diff, 0.0))
+    return kernels.rsi_from_averages(ewm_mean_2d(up, 1.0 / period, period),
+                                     ewm_mean_2d(down, 1.0 / period, period))
+
+
+def atr_2d(high, low, close, period=14):
+    """Latest Wilder ATR per column (indicator_kernels.atr()[-1])."""
+    tr = high - low
+    prev = close[:-1]
+    # fmax ignores the missing previous close on each column's first bar
+    tr[1:] = np.fmax.reduce([tr[1:], np.abs(high[1:] - prev), np.abs(low[1:] - prev)])
+    counts = np.cumsum(~np.isnan(close), axis=0)
+    acc = np.zeros(close.shape[1])
+    avg = np.zeros(close.shape[1])
+    for i in range(close.shape[0]):
+        n = counts[i]
+        seeding = (n >= 1) & (n <= period)
+        acc = np.where(seeding, acc + np.nan_to_num(tr[i]), acc)
+        avg = np.where(n == period, acc / period, avg)
+        avg = np.where(n > period, (avg * (period - 1) + tr[i]) / period, avg)
+    return avg
+
+
+def _windows(values, window, rows):
+    """The last `rows` trailing windows per column: shape (rows, tickers, window)."""
+    return sliding_window_view(values[-(rows + window - 1):], window, axis=0)
+
+
+# ─── Panel ──────────────────────────────────────────────────────────────────
+
+class IndicatorPanel:
+    """Date-aligned OHLCV arrays for a batch of tickers plus their indicator suites."""
+
+    def __init__(self, dataframes):
+        """
+        Args:
+            dataframes: {ticker: prepared OHLCV DataFrame} (TechnicalIndicators.prepare_dataframe)
+        """
+        columns = {}
+        for ticker, df in dataframes.items():
+            if df is None or len(df) < PANEL_MIN_BARS:
+                continue
+            ohlcv = df[['High', 'Low', 'Close', 'Volume']].to_numpy(np.float64)
+            if np.isnan(ohlcv).any() or not df.index.is_monotonic_increasing or not df.index.is_unique:
+                continue
+            columns[ticker] = (df, ohlcv)
+
+        self.dates = pd.DatetimeIndex(np.unique(np.concatenate(
+            [df.index.asi8 for df, _ in columns.values()])) if columns else [])
+        total = len(self.dates)
+
+        # A ticker belongs in the panel only if its bars are exactly the last len(df) dates
+        self.frames = {}
+        for ticker, (df, _) in columns.items():
+            n = len(df)
+            if total and self.dates.asi8[total - n] == df.index.asi8[0] and self.dates.asi8[-1] == df.index.asi8[-1]:
+                self.frames[ticker] = df
+        self.tickers = list(self.frames)
+
+        # Right-aligned (dates x tickers) arrays, NaN before each ticker's first bar
+        panel = np.full((4, total, len(self.tickers)), np.nan)
+        for j, ticker in enumerate(self.tickers):
+            ohlcv = columns[ticker][1]
+            panel[:, total - len(ohlcv):, j] = ohlcv.T
+        self.high, self.low, self.close, self.volume = panel
+
+    def __len__(self):
+        return len(self.tickers)
+
+    def relative_strength(self, benchmark_close, period=RS_PERIOD):
+        """Period % return of each ticker minus the benchmark's (calculate_relative_strength)."""
+        bench = np.asarray(benchmark_close, dtype=np.float64)
+        if len(bench) < period + 1 or self.close.shape[0] < period + 1:
+            return np.zeros(len(self.tickers))
+        stock = (self.close[-1] - self.close[-period - 1]) / self.close[-period - 1]
+        market = (bench[-1] - bench[-period - 1]) / bench[-period - 1]
+        return (stock - market) * 100
+
+    def compute(self, technical_analyzer):
+        """Full indicator suite for every panel ticker: {ticker: indicators dict}."""
+        if not self.tickers:
+            return {}
+        ti = technical_analyzer
+        c, h, l, v = self.close, self.high, self.low, self.volume
+        price = c[-1]
+
+        rsi14 = wilder_rsi_2d(c, 14)[-1]
+        rsi2 = wilder_rsi_2d(c, 2)[-1]
+
+        macd_line = ema_2d(c, 12) - ema_2d(c, 26)
+        macd_sig = ema_2d(macd_line, 9)
+        macd_hist = macd_line - macd_sig
+
+        bb_win = _windows(c, 20, 100)
+        bb_mid, bb_std = bb_win.mean(axis=-1), bb_win.std(axis=-1, ddof=0)
+        bb_upper, bb_lower = bb_mid + 2 * bb_std, bb_mid - 2 * bb_std
+        bb_widths = (bb_upper - bb_lower) / bb_mid
+
+        sma = {w: c[-w:].mean(axis=0) for w in (5, 50, 150, 200)}
+        sma5_prev = c[-6:-1].mean(axis=0)
+        sma200_22d_ago = c[-222:-22].mean(axis=0)
+
+        vol_avg = v[-20:].mean(axis=0)
+        vol_mean, vol_std = v[-50:].mean(axis=0), v[-50:].std(axis=0, ddof=1)
+
+        sr_high, sr_low = h[-20:].max(axis=0), l[-20:].min(axis=0)
+        high_52w, low_52w = h[-252:].max(axis=0), l[-252:].min(axis=0)
+
+        atr = atr_2d(h, l, c, 14)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            returns = np.full(c.shape, np.nan)
+            returns[1:] = np.log(c[1:] / c[:-1])
+        rows = min(252, c.shape[0] - 19)
+        hv = _windows(returns, 20, rows).std(axis=-1, ddof=1) * np.sqrt(kernels.TRADING_DAYS) * 100
+        with np.errstate(invalid='ignore'):
+            hv_min, hv_max = np.nanmin(hv, axis=0), np.nanmax(hv, axis=0)
+
+        tpv = (h + l + c) / 3 * v
+        vwap = {}
+        for w in (5, 22):
+            vol_sum = v[-w:].sum(axis=0)
+            vwap[w] = [tpv[-w:, j].sum() / vol_sum[j] if vol_sum[j] > 0 else None for j in range(len(self.tickers))]
+
+        results = {}
+        for j, ticker in enumerate(self.tickers):
+            x = price[j]
+
+            hist_tail = kernels.last_valid(macd_hist[:, j])[-3:].tolist()
+            macd_values = {'macd': macd_line[-1, j], 'signal': macd_sig[-1, j], 'histogram': macd_hist[-1, j]}
+
+            upper, middle, lower = bb_upper[-1, j], bb_mid[-1, j], bb_lower[-1, j]
+            bandwidth = (upper - lower) / middle if middle > 0 else 0
+            percentile = (bb_widths[:, j] < bandwidth).sum() / len(bb_widths) * 100
+            bb_values, bb_signal = ti.bollinger_result(x, upper, middle, lower, bandwidth, percentile)
+
+            volume_values, volume_signal = ti.volume_result(v[-1, j], vol_avg[j], vol_mean[j], vol_std[j])
+
+            current_hv = hv[-1, j]
+            hv_rank = 50 if hv_max[j] == hv_min[j] else (current_hv - hv_min[j]) / (hv_max[j] - hv_min[j]) * 100
+
+            exit_trigger = x > sma[5][j] and c[-2, j] <= sma5_prev[j]
+
+            results[ticker] = {
+                'rsi': {'value': rsi14[j], 'signal': ti.rsi_signal(rsi14[j])},
+                'macd': {'values': macd_values,
+                         'signal': ti.macd_signal(macd_line[-1, j], macd_sig[-1, j], macd_hist[-1, j], hist_tail)},
+                'bollinger_bands': {'values': bb_values, 'signal': bb_signal},
+                'moving_averages': {
+                    'values': {'sma_5': sma[5][j], 'sma_50': sma[50][j], 'sma_200': sma[200][j], 'current_price': x},
+                    'signal': ti.moving_average_signal(x, sma[50][j], sma[200][j]),
+                },
+                'volume': {'values': volume_values, 'signal': volume_signal},
+                'volatility': {'values': {'atr': atr[j], 'hv_rank': hv_rank}, 'signal': 'neutral'},
+                'support_resistance': ti.support_resistance_result(sr_high[j], sr_low[j], x),
+                'rsi2': ti.rsi2_result(rsi2[j], x > sma[200][j], exit_trigger),
+                'vwap': ti.vwap_result(x, vwap[5][j], vwap[22][j]),
+                'minervini': ti.minervini_result(x, sma[50][j], sma[150][j], sma[200][j], sma200_22d_ago[j],
+                                                 high_52w[j], low_52w[j]),
+                '_data_quality': {'bars': len(self.frames[ticker]), 'degraded': [], 'failed': []},
+            }
+        return results
+
+
+def prime_indicator_frames(technical_analyzer, histories, benchmark_history=None, cache=None):
+    """Compute indicators for a batch of histories in one panel pass and seed the frame cache.
+
+    Args:
+        technical_analyzer: TechnicalIndicators instance
+        histories: {ticker: price_history} as returned by get_history_batch()
+        benchmark_history: Optional SPY price history for relative strength
+        cache: IndicatorFrameCache to seed (default: the shared one)
+
+    Returns:
+        Number of frames primed (tickers outside the panel are left to the per-ticker path)
+    """
+    cache = cache if cache is not None else indicator_frames
+    keys, pending = {}, {}
+    for ticker, history in (histories or {}).items():
+        key = cache.make_key(ticker, history)
+        if key is not None and key not in cache:
+            keys[key[0]] = key
+            pending[key[0]] = technical_analyzer.prepare_dataframe(history)
+    if not pending:
+        return 0
+
+    panel = IndicatorPanel(pending)
+    suites = panel.compute(technical_analyzer)
+
+    rs = {}
+    if benchmark_history and panel.tickers:
+        bench = technical_analyzer.prepare_dataframe(benchmark_history)
+        if bench is not None and len(bench):
+            # Align onto the panel's dates so both returns span the same sessions
+            close = bench['Close'].reindex(bench.index.union(panel.dates)).ffill().reindex(panel.dates)
+            rs = dict(zip(panel.tickers, panel.relative_strength(close.to_numpy())))
+
+    for ticker, indicators in suites.items():
+        key = keys[ticker]
+        cache.put(key, IndicatorFrame(
+            ticker=ticker,
+            last_bar=key[2],
+            live_price=None,
+            df=panel.frames[ticker],
+            indicators=indicators,
+            relative_strength=rs.get(ticker),
+        ))
+    logger.info(f"\U0001f4ca Indicator panel: {len(suites)}/{len(pending)} tickers computed in one pass")
+    return len(suites)
@@ -0,0 +1,351 @@
+"""
+Live-Bar Indicator State — O(1) revise/advance of the latest daily bar
+======================================================================
+Intraday, only the last bar of a ticker's daily history changes: its Close
+moves with the live quote. Recomputing RSI, MACD, Bollinger, the SMA stack,
+ATR, HV rank, RSI-2, VWAP and Minervini over ~275 bars for every price
+refresh is wasted work, since everything before the last bar is fixed.
+
+LiveBarState splits each indicator into:
+
+  - committed state: accumulators through the second-to-last bar
+    (EMA values, Wilder averages, rolling-window sums, prior extremes)
+  - the live bar:    High / Low / Volume of the last bar, plus a Close
+                     that can be revised any number of times
+
+`indicators(close)` evaluates the full get_all_indicators() dict for a
+revised Close in O(1) per indicator; `advance(bar)` commits the live bar
+and starts a new one (next session). Signal classification reuses the
+TechnicalIndicators helpers, so both paths always agree.
+"""
+
+import math
+from collections import deque
+
+import numpy as np
+
+from backend.analysis import indicator_kernels as kernels
+
+# Minervini needs 252 bars and its SMA200 slope 22 more; below this, callers
+# fall back to a full recompute (which handles the degraded cases).
+MIN_LIVE_BARS = 275
+
+
+# ─── Primitive accumulators ─────────────────────────────────────────────────
+
+class EMAState:
+    """adjust=False EMA: committed value through the previous bar."""
+
+    def __init__(self, alpha, value):
+        self.alpha = alpha
+        self.value = value
+
+    def at(self, x):
+        return (1.0 - self.alpha) * self.value + self.alpha * x
+
+    def advance(self, x):
+        self.value = self.at(x)
+
+
+class WilderRSIState:
+    """Wilder average gain/loss through the previous bar."""
+
+    def __init__(self, period, avg_up, avg_down, prev_close):
+        self.alpha = 1.0 / period
+        self.avg_up = avg_up
+        self.avg_down = avg_down
+        self.prev_close = prev_close
+
+    def _averages(self, x):
+        diff = x - self.prev_close
+        up, down = (diff, 0.0) if diff > 0 else (0.0, -diff if diff < 0 else 0.0)
+        decay = 1.0 - self.alpha
+        return decay * self.avg_up + self.alpha * up, decay * self.avg_down + self.alpha * down
+
+    def at(self, x):
+        return float(kernels.rsi_from_averages(*self._averages(x)))
+
+    def advance(self, x):
+        self.avg_up, self.avg_down = self._averages(x)
+        self.prev_close = x
+
+
+class ATRState:
+    """Wilder ATR through the previous bar."""
+
+    def __init__(self, period, atr, prev_close):
+        self.period = period
+        self.atr = atr
+        self.prev_close = prev_close
+
+    def at(self, high, low):
+        tr = max(high - low, abs(high - self.prev_close), abs(low - self.prev_close))
+        return (self.atr * (self.period - 1) + tr) / self.period
+
+    def advance(self, high, low, close):
+        self.atr = self.at(high, low)
+        self.prev_close = close
+
+
+class RollingWindow:
+    """Trailing window: the last (window - 1) committed values plus one live value.
+
+    Keeps running sum / sum of squares, so mean and std of the window
+    including a live value are O(1).
+    """
+
+    def __init__(self, window, committed):
+        self.window = window
+        self._values = deque((float(v) for v in committed[-(window - 1):]), maxlen=window - 1)
+        self._sum = math.fsum(self._values)
+        self._sumsq = math.fsum(v * v for v in self._values)
+
+    def mean(self, live):
+        return (self._sum + live) / self.window
+
+    def std(self, live, ddof=1):
+        n = self.window
+        total = self._sum + live
+        var = (self._sumsq + live * live - total * total / n) / (n - ddof)
+        return math.sqrt(var) if var > 0 else 0.0
+
+    def sum(self, live):
+        return self._sum + live
+
+    def advance(self, live):
+        if len(self._values) == self._values.maxlen:
+            old = self._values[0]
+            self._sum -= old
+            self._sumsq -= old * old
+        self._values.append(float(live))
+        self._sum += live
+        self._sumsq += live * live
+
+
+class RollingExtreme:
+    """Max and min over the last (window - 1) committed values plus one live value."""
+
+    def __init__(self, window, committed):
+        self._values = deque((float(v) for v in committed[-(window - 1):]), maxlen=window - 1)
+        self._refresh()
+
+    def _refresh(self):
+        self._max = max(self._values) if self._values else -math.inf
+        self._min = min(self._values) if self._values else math.inf
+
+    def max(self, live):
+        return max(self._max, live)
+
+    def min(self, live):
+        return min(self._min, live)
+
+    def advance(self, live):
+        self._values.append(float(live))
+        self._refresh()  # O(window), once per new bar — revisions stay O(1)
+
+
+# ─── Composite state ────────────────────────────────────────────────────────
+
+class LiveBarState:
+    """All indicator accumulators for one ticker, with the last bar kept live."""
+
+    @classmethod
+    def from_df(cls, df):
+        """Seed from a prepared OHLCV DataFrame; the last row becomes the live bar.
+
+        Returns None when there is not enough history for every indicator.
+        """
+        if df is None or len(df) < MIN_LIVE_BARS:
+            return None
+        c = df['Close'].to_numpy(dtype=np.float64)
+        h = df['High'].to_numpy(dtype=np.float64)
+        l = df['Low'].to_numpy(dtype=np.float64)
+        v = df['Volume'].to_numpy(dtype=np.float64)
+        if np.isnan(c).any() or np.isnan(h).any() or np.isnan(l).any() or np.isnan(v).any():
+            return None
+        return cls(c, h, l, v)
+
+    def __init__(self, close, high, low, volume):
+        pc, ph, pl, pv = close[:-1], high[:-1], low[:-1], volume[:-1]
+        self.bars = len(close)
+
+        # Live bar
+        self.high, self.low, self.volume = float(high[-1]), float(low[-1]), float(volume[-1])
+        self.close = float(close[-1])
+
+        # RSI-14 / RSI-2
+        self.rsi14 = WilderRSIState(14, *(a[-1] for a in kernels.wilder_averages(pc, 14)), pc[-1])
+        self.rsi2 = WilderRSIState(2, *(a[-1] for a in kernels.wilder_averages(pc, 2)), pc[-1])
+
+        # MACD 12/26/9
+        ema_fast, ema_slow = kernels.ema(pc, 12), kernels.ema(pc, 26)
+        line = ema_fast - ema_slow
+        signal = kernels.ema(line, 9)
+        self.ema_fast = EMAState(2.0 / 13, ema_fast[-1])
+        self.ema_slow = EMAState(2.0 / 27, ema_slow[-1])
+        self.macd_signal = EMAState(2.0 / 10, signal[-1])
+        self.macd_hist = deque((line - signal)[-2:].tolist(), maxlen=2)
+
+        # ATR-14
+        self.atr = ATRState(14, kernels.atr(ph, pl, pc, 14)[-1], pc[-1])
+
+        # Close windows: SMA stack + Bollinger(20)
+        self.closes = {w: RollingWindow(w, pc) for w in (5, 20, 50, 150, 200)}
+        self.prev_close = float(pc[-1])
+        self.prev_sma5 = float(pc[-5:].mean())
+        upper, middle, lower = kernels.bollinger(pc)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            self.bb_widths = deque(kernels.last_valid((upper - lower) / middle)[-99:].tolist(), maxlen=99)
+        self.sma200_history = deque(kernels.rolling_mean(pc, 200)[-22:].tolist(), maxlen=22)
+
+        # Volume (20-bar average, 50-bar z-score)
+        self.volume_avg = RollingWindow(20, pv)
+        self.volume_z = RollingWindow(50, pv)
+
+        # Highs / lows: support-resistance (20) and 52-week (252)
+        self.sr_high, self.sr_low = RollingExtreme(20, ph), RollingExtreme(20, -pl)
+        self.high_52w, self.low_52w = RollingExtreme(252, ph), RollingExtreme(252, -pl)
+
+        # VWAP (5 / 22 bars of typical price x volume)
+        tpv = (ph + pl + pc) / 3 * pv
+        self.vwap = {w: (RollingWindow(w, tpv), RollingWindow(w, pv)) for w in (5, 22)}
+
+        # HV(20) of log returns and its trailing-year range
+        returns = kernels.log_returns(pc)
+        self.returns = RollingWindow(20, returns)
+        self.hv_history = deque(kernels.historical_volatility(pc, 20)[-251:].tolist(), maxlen=251)
+
+    # ── Evaluation ──────────────────────────────────────────────────
+
+    def _hv(self, close):
+        return self.returns.std(math.log(close / self.prev_close), ddof=1) * math.sqrt(kernels.TRADING_DAYS) * 100
+
+    def _macd(self, close):
+        line = self.ema_fast.at(close) - self.ema_slow.at(close)
+        signal = self.macd_signal.at(line)
+        return line, signal, line - signal
+
+    def indicators(self, ti, close=None, data_quality=None):
+        """get_all_indicators()-shaped dict with the live bar's Close set to `close`.
+
+        Args:
+            ti: TechnicalIndicators instance (signal thresholds + classifiers)
+            close: Revised Close for the live bar (default: current live close)
+            data_quality: Optional '_data_quality' dict to carry over
+        """
+        x = float(self.close if close is None else close)
+        h, l, vol = self.high, self.low, self.volume
+
+        rsi_value = self.rsi14.at(x)
+
+        line, signal, hist = self._macd(x)
+        macd_values = {'macd': line, 'signal': signal, 'histogram': hist}
+        macd_sig = ti.macd_signal(line, signal, hist, list(self.macd_hist) + [hist])
+
+        w20 = self.closes[20]
+        middle = w20.mean(x)
+        std = w20.std(x, ddof=0)
+        upper, lower = middle + 2 * std, middle - 2 * std
+        bandwidth = (upper - lower) / middle if middle > 0 else 0
+        widths = list(self.bb_widths) + [(upper - lower) / middle]
+        percentile = sum(1 for w in widths if w < bandwidth) / len(widths) * 100
+        bb_values, bb_sig = ti.bollinger_result(x, upper, middle, lower, bandwidth, percentile)
+
+        sma5, sma50, sma150, sma200 = (self.closes[w].mean(x) for w in (5, 50, 150, 200))
+        ma_values = {'sma_5': sma5, 'sma_50': sma50, 'sma_200': sma200, 'current_price': x}
+
+        volume_values, volume_sig = ti.volume_result(
+            vol, self.volume_avg.mean(vol), self.volume_z.mean(vol), self.volume_z.std(vol, ddof=1))
+
+        sr_levels = ti.support_resistance_result(self.sr_high.max(h), -self.sr_low.max(-l), x)
+
+        hv = self._hv(x)
+        hv_values = [v for v in self.hv_history if not math.isnan(v)] + [hv]
+        hv_min, hv_max = min(hv_values), max(hv_values)
+        hv_rank = 50 if hv_max == hv_min else (hv - hv_min) / (hv_max - hv_min) * 100
+
+        exit_trigger = x > sma5 and self.prev_close <= self.prev_sma5
+        rsi2 = ti.rsi2_result(self.rsi2.at(x), x > sma200, exit_trigger)
+
+        tp = (h + l + x) / 3
+        vwaps = {}
+        for w, (tpv_win, vol_win) in self.vwap.items():
+            vol_sum = vol_win.sum(vol)
+            vwaps[w] = tpv_win.sum(tp * vol) / vol_sum if vol_sum > 0 else None
+        vwap = ti.vwap_result(x, vwaps[5], vwaps[22])
+
+        minervini = ti.minervini_result(x, sma50, sma150, sma200, self.sma200_history[0],
+                                        self.high_52w.max(h), -self.low_52w.max(-l))
+
+        return {
+            'rsi': {'value': rsi_value, 'signal': ti.rsi_signal(rsi_value)},
+            'macd': {'values': macd_values, 'signal': macd_sig},
+            'bollinger_bands': {'values': bb_values, 'signal': bb_sig},
+            'moving_averages': {'values': ma_values, 'signal': ti.moving_average_signal(x, sma50, sma200)},
+            'volume': {'values': volume_values, 'signal': volume_sig},
+            'volatility': {
+                'values': {'atr': self.atr.at(h, l), 'hv_rank': hv_rank},
+                'signal': 'neutral'
+            },
+            'support_resistance': sr_levels,
+            'rsi2': rsi2,
+            'vwap': vwap,
+            'minervini': minervini,
+            '_data_quality': dict(data_quality) if data_quality else {'bars': self.bars, 'degraded': [], 'failed': []},
+        }
+
+    # ── Mutation ────────────────────────────────────────────────────
+
+    def revise(self, close):
+        """Set the live bar's Close (e.g. a fresh quote)."""
+        self.close = float(close)
+
+    def advance(self, bar):
+        """Commit the live bar and start a new one.
+
+        Args:
+            bar: dict with 'high', 'low', 'close', 'volume' for the new bar
+        """
+        x, h, l, vol = self.close, self.high, self.low, self.volume
+
+        line, signal, _ = self._macd(x)
+        hist_width = None
+        w20 = self.closes[20]
+        middle = w20.mean(x)
+        if middle:
+            hist_width = 4 * w20.std(x, ddof=0) / middle
+        sma200 = self.closes[200].mean(x)
+        hv = self._hv(x)
+
+        self.rsi14.advance(x)
+        self.rsi2.advance(x)
+        self.ema_fast.advance(x)
+        self.ema_slow.advance(x)
+        self.macd_signal.advance(line)
+        self.macd_hist.append(line - signal)
+        self.atr.advance(h, l, x)
+
+        self.prev_sma5 = self.closes[5].mean(x)
+        if hist_width is not None:
+            self.bb_widths.append(hist_width)
+        self.sma200_history.append(sma200)
+        for window in self.closes.values():
+            window.advance(x)
+
+        self.volume_avg.advance(vol)
+        self.volume_z.advance(vol)
+        self.sr_high.advance(h)
+        self.sr_low.advance(-l)
+        self.high_52w.advance(h)
+        self.low_52w.advance(-l)
+        tp = (h + l + x) / 3
+        for tpv_win, vol_win in self.vwap.values():
+            tpv_win.advance(tp * vol)
+            vol_win.advance(vol)
+        self.returns.advance(math.log(x / self.prev_close))
+        self.hv_history.append(hv)
+        self.prev_close = x
+
+        self.high, self.low = float(bar['high']), float(bar['low'])
+        self.close, self.volume = float(bar['close']), float(bar['volume'])
+        self.bars += 1
@@ -10,9 +10,18 @@ caution is warranted.
 
 Data Source: CBOE publishes daily P/C ratios; we proxy through
 the ORATS data or fallback to a lightweight web fetch.
+
+Primary source: the cached /cores snapshot already holds cVolu, pVolu, cOi
+and pOi for ~5,000 tickers, so equity-wide, per-sector (bestEtf) and index
+P/C ratios come from one vectorized aggregation with no extra requests.
+The daily equity ratio is persisted (PutCallHistory) so the Z-score
+survives restarts and is shared by every worker.
 """
 
+import json
 import logging
+import os
+import threading
 import time
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
@@ -23,6 +32,102 @@ import numpy as np
 
 log = logging.getLogger(__name__)
 
+DEFAULT_HISTORY_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'put_call_history.json')
+
+# Index option products; everything else in /cores counts toward the equity
+# ratio unless it is itself a sector benchmark (some ticker's bestEtf)
+INDEX_TICKERS = ('SPY', 'QQQ', 'IWM', 'DIA', 'SPX', 'SPXW', 'NDX', 'RUT', 'XSP', 'VIX')
+
+# Z-score priors (mean, std) until 10 daily observations exist.
+# Equity-wide P/C runs near the CBOE equity average; SPY alone runs 1.5-3.0x.
+EQUITY_PC_PRIOR = (0.65, 0.12)
+SPY_PC_PRIOR = (1.8, 0.30)
+
+PC_HISTORY_DAYS = 63  # ~3 months of trading days
+
+
+def _ratio(puts, calls):
+    return float(puts) / float(calls) if calls > 0 else None
+
+
+def put_call_ratios(snapshot) -> Optional[Dict]:
+    """Aggregate P/C ratios from a /cores snapshot in one vectorized pass.
+
+    Returns:
+        dict with trade_date, equity (volume P/C), equity_oi (open-interest
+        P/C), index, sectors ({bestEtf: volume P/C}), puts, calls — or None
+        if the snapshot lacks the volume columns.
+    """
+    tickers = snapshot.column('ticker')
+    best_etf = snapshot.column('bestEtf')
+    columns = [snapshot.column(name) for name in ('pVolu', 'cVolu', 'pOi', 'cOi')]
+    if tickers is None or any(col is None for col in columns[:2]):
+        return None
+    p_vol, c_vol, p_oi, c_oi = (np.nan_to_num(np.asarray(col, dtype=np.float64)) if col is not None
+                                else np.zeros(len(tickers)) for col in columns)
+
+    is_index = np.isin(tickers, INDEX_TICKERS)
+    is_benchmark = np.isin(tickers, np.unique(best_etf)) if best_etf is not None else np.zeros(len(tickers), bool)
+    equity = ~is_index & ~is_benchmark
+
+    sectors = {}
+    if best_etf is not None:
+        etfs, group = np.unique(best_etf[equity], return_inverse=True)
+        put_sums = np.bincount(group, weights=p_vol[equity], minlength=len(etfs))
+        call_sums = np.bincount(group, weights=c_vol[equity], minlength=len(etfs))
+        sectors = {str(etf): round(_ratio(p, c), 3) for etf, p, c in zip(etfs, put_sums, call_sums)
+                   if etf and c > 0}
+
+    puts, calls = p_vol[equity].sum(), c_vol[equity].sum()
+    equity_oi = _ratio(p_oi[equity].sum(), c_oi[equity].sum())
+    index = _ratio(p_vol[is_index].sum(), c_vol[is_index].sum())
+    return {
+        'trade_date': snapshot.trade_date,
+        'equity': _ratio(puts, calls),
+        'equity_oi': round(equity_oi, 3) if equity_oi is not None else None,
+        'index': round(index, 3) if index is not None else None,
+        'sectors': sectors,
+        'puts': int(puts),
+        'calls': int(calls),
+    }
+
+
+class PutCallHistory:
+    """Daily equity P/C series persisted as JSON ({tradeDate: ratio}).
+
+    Every worker records the same value for a tradeDate, so concurrent
+    writers are harmless; writes go through a temp file and os.replace().
+    """
+
+    def __init__(self, path=None, max_days=PC_HISTORY_DAYS):
+        self.path = path or DEFAULT_HISTORY_PATH
+        self.max_days = max_days
+        self._lock = threading.Lock()
+
+    def load(self) -> Dict[str, float]:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return {str(k): float(v) for k, v in json.load(f).items()}
+        except (OSError, ValueError, TypeError, AttributeError):
+            return {}
+
+    def record(self, trade_date: str, ratio: float) -> List[float]:
+        """Store `ratio` for `trade_date`; return the series oldest-first."""
+        with self._lock:
+            series = self.load()
+            if series.get(trade_date) != ratio:
+                series[trade_date] = ratio
+                series = dict(sorted(series.items())[-self.max_days:])
+                try:
+                    os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                    tmp = f"{self.path}.{os.getpid()}.tmp"
+                    with open(tmp, 'w', encoding='utf-8') as f:
+                        json.dump(series, f)
+                    os.replace(tmp, self.path)
+                except OSError as e:
+                    log.warning(f"[MacroSignals] P/C history not persisted: {e}")
+            return [series[k] for k in sorted(series)]
+
 
 @dataclass
 class PutCallSignal:
@@ -35,6 +140,11 @@ class PutCallSignal:
     lookback_days: int = 21
     timestamp: Optional[str] = None
     source: str = 'unknown'
+    # Breakdown from the /cores aggregation (empty/None for other sources)
+    oi_ratio: Optional[float] = None
+    index_ratio: Optional[float] = None
+    sector_ratios: Dict[str, float] = field(default_factory=dict)
+    trade_date: Optional[str] = None
 
 
 class MacroSignals:
@@ -52,17 +162,22 @@ class MacroSignals:
     # Cache TTL: P/C ratio only changes once per day
     _CACHE_TTL_SECONDS = 3600  # 1 hour
 
-    def __init__(self, orats_api=None, fmp_api_key: Optional[str] = None):
+    def __init__(self, orats_api=None, fmp_api_key: Optional[str] = None,
+                 cores_store=None, history: Optional[PutCallHistory] = None):
         """
         Args:
             orats_api: OratsAPI instance for fetching VIX/market data
             fmp_api_key: Financial Modeling Prep API key (alternate data source)
+            cores_store: CoresSnapshotStore holding the /cores universe (primary source)
+            history: Persisted daily equity P/C series (default: backend/data/put_call_history.json)
         """
         self.orats_api = orats_api
         self.fmp_api_key = fmp_api_key
+        self.cores_store = cores_store
+        self.history = history or PutCallHistory()
         
-        # Rolling history for Z-score calculation
-        self._pc_history: deque = deque(maxlen=63)  # ~3 months of trading days
+        # Rolling history for Z-score calculation (SPY-level fallback sources only)
+        self._pc_history: deque = deque(maxlen=PC_HISTORY_DAYS)
         self._last_fetch_time: float = 0
         self._cached_signal: Optional[PutCallSignal] = None
 
@@ -92,6 +207,11 @@ class MacroSignals:
         ratio = None
         source = 'none'
 
+        # Strategy 0: Aggregate the cached /cores snapshot (no requests)
+        signal = self._signal_from_cores()
+        if signal is not None:
+            return signal
+
         # Strategy 1: Derive from ORATS options volume data
         if self.orats_api:
             ratio = self._fetch_from_orats()
@@ -138,6 +258,44 @@ class MacroSignals:
             source=source
         )
 
+    def _signal_from_cores(self) -> Optional[PutCallSignal]:
+        """Equity-wide P/C signal from the /cores snapshot, or None if unavailable."""
+        if self.cores_store is None:
+            return None
+        try:
+            snapshot = self.cores_store.current()
+            if not self.cores_store.is_fresh(snapshot):
+                return None
+            ratios = put_call_ratios(snapshot)
+        except Exception as e:
+            log.debug(f"[MacroSignals] /cores P/C aggregation failed: {e}")
+            return None
+        if not ratios or ratios['equity'] is None:
+            return None
+
+        ratio = ratios['equity']
+        series = self.history.record(ratios['trade_date'], round(ratio, 4))
+        z_score = self._compute_z_score(ratio, history=series, prior=EQUITY_PC_PRIOR)
+        signal, contrarian_bias, score_mod = self._interpret_z_score(z_score, ratio)
+        log.info(f"[MacroSignals] /cores equity P/C: {ratio:.3f} "
+                 f"(puts={ratios['puts']:,}, calls={ratios['calls']:,}, index={ratios['index']}, "
+                 f"{len(series)} days of history)")
+
+        return PutCallSignal(
+            ratio=round(ratio, 3),
+            z_score=round(z_score, 2) if z_score is not None else None,
+            signal=signal,
+            contrarian_bias=contrarian_bias,
+            score_modifier=score_mod,
+            lookback_days=21,
+            timestamp=datetime.utcnow().isoformat() + 'Z',
+            source='orats_cores',
+            oi_ratio=ratios['equity_oi'],
+            index_ratio=ratios['index'],
+            sector_ratios=ratios['sectors'],
+            trade_date=ratios['trade_date'],
+        )
+
     def _fetch_from_orats(self) -> Optional[float]:
         """Derive P/C ratio from ORATS SPY volume data.
         
@@ -286,22 +444,26 @@ class MacroSignals:
 
     # ─── Z-Score Computation ───────────────────────────────────────────────────────────────────
 
-    def _compute_z_score(self, current_ratio: float) -> Optional[float]:
+    def _compute_z_score(self, current_ratio: float, history=None, prior=SPY_PC_PRIOR) -> Optional[float]:
         """Compute Z-score of current P/C ratio against rolling 21-day window.
         
         Z = (current - mean) / std_dev
         
         Falls back to absolute thresholds if insufficient history.
+
+        Args:
+            history: Ratio series, oldest first (default: the in-memory SPY-level deque)
+            prior: (mean, std) used while history has fewer than 10 values
         """
-        if len(self._pc_history) < 10:
+        history = list(self._pc_history if history is None else history)
+        if len(history) < 10:
             # Not enough history — use absolute heuristic
             # S2-FIX: SPY single-ticker P/C ratio runs 1.5-3.0x (not equity-market
-            # CBOE P/C which averages ~0.65). Updated priors match observed SPY range.
-            mean = 1.8
-            std = 0.30
+            # CBOE P/C which averages ~0.65). Callers pass the prior for their source.
+            mean, std = prior
         else:
             # Use most recent 21 values (or all if fewer)
-            lookback = list(self._pc_history)[-21:]
+            lookback = history[-21:]
             mean = np.mean(lookback)
             std = np.std(lookback)
 
@@ -366,5 +528,6 @@ class MacroSignals:
             'contrarian_bias': sig.contrarian_bias,
             'score_modifier': sig.score_modifier,
             'source': sig.source,
-            'history_length': len(self._pc_history),
+            'index_ratio': sig.index_ratio,
+            'history_length': len(self.history.load()) if sig.source == 'orats_cores' else len(self._pc_history),
         }
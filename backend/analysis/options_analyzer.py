@@ -11,7 +11,7 @@ class OptionsAnalyzer:
         self.min_profit_potential = Config.MIN_PROFIT_POTENTIAL
         # QW-8: Removed duplicate min_profit_potential assignment
 
-    def parse_options_chain(self, options_data, current_price, min_profit_override=None):
+    def parse_options_chain(self, options_data, current_price, min_profit_override=None, chain_filter=None):
         """
         Parse options chain data and filter for LEAPs
         
@@ -19,6 +19,9 @@ class OptionsAnalyzer:
             options_data: Options chain data from TD Ameritrade/Schwab
             current_price: Current stock price
             min_profit_override: Optional override for minimum profit potential (e.g. 30 for LEAPs)
+            chain_filter: Optional ChainFilter (DTE window, direction, moneyness,
+                          min OI/volume, max spread). Rejected expiries, sides and
+                          strikes are skipped before any opportunity dict is built.
         
         Returns:
             List of LEAP opportunities
@@ -36,40 +39,45 @@ class OptionsAnalyzer:
             local_max_investment = 50000
         else:
             local_max_investment = self.max_investment
-            
-        # Process call options
-        call_map = options_data.get('callExpDateMap', {}) or {}
-        for exp_date_str, strikes in call_map.items():
-            results = self._process_expiration(
-                strikes, 
-                exp_date_str, 
-                'Call', 
-                current_price,
-                local_max_investment,
-                symbol=symbol,
-                min_profit_override=min_profit_override
-            )
-            if results:
-                opportunities.extend(results)
-        
-        # Process put options
-        put_map = options_data.get('putExpDateMap', {}) or {}
-        for exp_date_str, strikes in put_map.items():
-            results = self._process_expiration(
-                strikes, 
-                exp_date_str, 
-                'Put', 
-                current_price,
-                local_max_investment,
-                symbol=symbol,
-                min_profit_override=min_profit_override
-            )
-            if results:
-                opportunities.extend(results)
+
+        sides = []
+        if chain_filter is None or chain_filter.wants_calls():
+            sides.append(('Call', options_data.get('callExpDateMap', {}) or {}))
+        if chain_filter is None or chain_filter.wants_puts():
+            sides.append(('Put', options_data.get('putExpDateMap', {}) or {}))
+
+        # Process call options, then put options
+        for option_type, exp_map in sides:
+            for exp_date_str, strikes in exp_map.items():
+                # Predicate pushdown: skip whole expiries outside the DTE window
+                if chain_filter is not None:
+                    exp_date = self._parse_expiry(exp_date_str)
+                    if exp_date is None or not chain_filter.accepts_dte((exp_date - datetime.now()).days):
+                        continue
+                results = self._process_expiration(
+                    strikes, 
+                    exp_date_str, 
+                    option_type, 
+                    current_price,
+                    local_max_investment,
+                    symbol=symbol,
+                    min_profit_override=min_profit_override,
+                    chain_filter=chain_filter
+                )
+                if results:
+                    opportunities.extend(results)
         
         return opportunities
+
+    @staticmethod
+    def _parse_expiry(exp_date_str):
+        """Parse an expiry map key ("2024-12-20:365" or "2024-12-20") to datetime, or None."""
+        try:
+            return datetime.strptime(exp_date_str.split(':')[0], '%Y-%m-%d')
+        except Exception:  # P2-NEW-7 FIX: Was bare except — now catches only real errors
+            return None
     
-    def _process_expiration(self, strikes, exp_date_str, option_type, current_price, max_investment_limit=None, symbol='', min_profit_override=None):
+    def _process_expiration(self, strikes, exp_date_str, option_type, current_price, max_investment_limit=None, symbol='', min_profit_override=None, chain_filter=None):
         """
         Process options for a specific expiration date
         
@@ -81,6 +89,7 @@ class OptionsAnalyzer:
             max_investment_limit: Custom limit for this batch (defaults to config)
             symbol: Ticker symbol (for exemptions)
             min_profit_override: Optional profit floor override
+            chain_filter: Optional ChainFilter for strike/contract predicates
         
         Returns:
             List of opportunities for this expiration
@@ -91,10 +100,9 @@ class OptionsAnalyzer:
         limit = max_investment_limit if max_investment_limit is not None else self.max_investment
         
         # Parse expiration date
-        try:
-            # Format: "2024-12-20:365"
-            exp_date = datetime.strptime(exp_date_str.split(':')[0], '%Y-%m-%d')
-        except Exception:  # P2-NEW-7 FIX: Was bare except — now catches only real errors
+        # Format: "2024-12-20:365"
+        exp_date = self._parse_expiry(exp_date_str)
+        if exp_date is None:
             return opportunities
         
         # Calculate days to expiry
@@ -114,6 +122,14 @@ class OptionsAnalyzer:
                 continue
             
             option = option_list[0]
+
+            # Predicate pushdown: moneyness band + liquidity before any math
+            if chain_filter is not None:
+                if not chain_filter.accepts_strike(strike_price, current_price):
+                    continue
+                if not chain_filter.accepts_contract(option.get('bid', 0), option.get('ask', 0),
+                                                     option.get('openInterest', 0), option.get('totalVolume', 0)):
+                    continue
             
             # Extract option details
             # Extract option details
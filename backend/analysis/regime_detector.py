@@ -17,6 +17,9 @@ from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Optional
 
+from backend.analysis.benchmark_history import benchmark_cache
+from backend.utils.market_hours import now_eastern
+
 log = logging.getLogger(__name__)
 
 
@@ -121,10 +124,15 @@ class RegimeDetector:
     # 2-day minimum regime duration to prevent whipsaw (per Risk Manager resolution)
     # Note: enforced at scan level — if regime just changed, we use the MORE conservative one
 
-    def __init__(self, orats_api=None, fmp_api=None):
-        """Accept either ORATS or FMP for VIX data (ORATS preferred)."""
+    def __init__(self, orats_api=None, fmp_api=None, market_context=None):
+        """Accept either ORATS or FMP for VIX data (ORATS preferred).
+
+        market_context: optional shared quote snapshot (services/market_context.py);
+        when given, the ORATS VIX quote is read from it instead of fetched.
+        """
         self._orats = orats_api
         self._fmp = fmp_api
+        self._market_context = market_context
         self._last_regime: Optional[VIXRegime] = None
         # S1-FIX: Initialize to utcnow() so the first regime change also
         # respects the 48-hour anti-whipsaw stickiness window.
@@ -177,6 +185,7 @@ class RegimeDetector:
         ctx = RegimeContext(
             regime=regime,
             vix_level=vix_level,
+            vix_change_1d=self._vix_change_1d(vix_level),
             timestamp=now,
             is_fallback=False
         )
@@ -192,7 +201,10 @@ class RegimeDetector:
         # Source 1: ORATS
         if self._orats:
             try:
-                quote = self._orats.get_quote('VIX')
+                if self._market_context is not None:
+                    quote = self._market_context.quote('VIX', self._orats)
+                else:
+                    quote = self._orats.get_quote('VIX')
                 price = quote.get('price') if quote else None
                 if price is not None and float(price) > 0:
                     return float(price)
@@ -288,6 +300,22 @@ class RegimeDetector:
 
         return None
 
+    def _vix_change_1d(self, vix_level: float) -> Optional[float]:
+        """VIX change vs the prior session's close, from the shared benchmark cache."""
+        if not self._orats:
+            return None
+        try:
+            df = benchmark_cache.get_df(self._orats, 'VIX')
+            if df is None or df.empty:
+                return None
+            # If the cached history already holds today's bar, compare with the bar before it
+            ref = df['Close'].iloc[-2] if df.index[-1].date() >= now_eastern().date() and len(df) > 1 \
+                else df['Close'].iloc[-1]
+            return round(vix_level - float(ref), 2) if ref and ref > 0 else None
+        except Exception as e:
+            log.debug("VIX 1-day change unavailable: %s", e)
+            return None
+
     def _classify(self, vix_level: float) -> VIXRegime:
         """Classify VIX level into regime tier."""
         if vix_level < self.CALM_CEILING:
@@ -6,7 +6,10 @@ Top-quartile sectors outperform by 3-5% annually. 18-Persona verdict:
 15/18 APPROVED WITH CONDITIONS (daily cache, 10-sector SPDR universe).
 
 Implementation: 
-  - Rank 11 sector ETFs by 1-month momentum (% change over 21 trading days)
+  - Rank 11 sector ETFs by 1-month momentum (% change over 21 trading days),
+    read from the cached /cores snapshot's stkPxChng1m in one vectorized
+    pass; ORATS price history is only fetched for ETFs the snapshot lacks
+  - Industry groups (ORATS sectorName) can be ranked the same way
   - Tickers in top 3 sectors get a score boost
   - Tickers in bottom 3 sectors get a penalty
   - Results cached for 1 trading day (reduces API calls)
@@ -19,11 +22,20 @@ from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Tuple
 
+import numpy as np
+
+from backend.analysis.benchmark_history import benchmark_cache
+from backend.utils.market_hours import last_completed_session
+
 log = logging.getLogger(__name__)
 
 # Module-level TTL cache: shared across all SectorAnalysis instances
-# maxsize=1 because we only cache one result (all sectors ranked together)
-_sector_cache = TTLCache(maxsize=1, ttl=6 * 3600)  # 6-hour TTL
+# maxsize=2: one sector ranking + one industry ranking
+_sector_cache = TTLCache(maxsize=2, ttl=6 * 3600)  # 6-hour TTL
+
+# An ETF without its own /cores row falls back to the median 1-month change
+# of its constituents; an industry needs this many tickers to be ranked
+MIN_GROUP_MEMBERS = 5
 
 
 @dataclass
@@ -89,12 +101,19 @@ class SectorAnalysis:
     # Cache TTL: 6 hours (momentum doesn't change dramatically intraday)
     _CACHE_TTL_SECONDS = 6 * 3600
 
-    def __init__(self, orats_api=None):
+    def __init__(self, orats_api=None, cores_store=None, symbol_master=None):
         """
         Args:
             orats_api: OratsAPI instance for fetching price data
+            cores_store: CoresSnapshotStore holding the /cores universe
+                         (stkPxChng1m for every ETF and ticker)
+            symbol_master: SymbolMaster for O(1) ticker -> sector ETF (the
+                           scanner injects it; without one, SECTOR_MEMBERS
+                           and /cores bestEtf are consulted directly)
         """
         self.orats_api = orats_api
+        self.cores_store = cores_store
+        self.symbol_master = symbol_master
 
     # ─── Public API ──────────────────────────────────────────────────────────
 
@@ -103,15 +122,53 @@ class SectorAnalysis:
         
         Returns cached result if within TTL unless force_refresh=True.
         Uses module-level TTLCache (shared across Gunicorn workers in same process).
+        The key carries the last completed session and the /cores tradeDate,
+        so a trading-day rollover or a new snapshot recomputes the rankings
+        even inside the TTL.
         """
-        cache_key = 'sector_rankings'
+        snapshot = self._cores_snapshot()
+        cache_key = ('sector_rankings', last_completed_session(), snapshot.trade_date if snapshot else None)
 
         if not force_refresh and cache_key in _sector_cache:
             result = _sector_cache[cache_key]
             result.is_cached = True
             return result
 
-        result = self._compute_rankings()
+        result = self._compute_rankings(snapshot)
+        _sector_cache[cache_key] = result
+        return result
+
+    def get_industry_rankings(self, force_refresh: bool = False) -> List[Dict]:
+        """Rank ORATS industry groups (sectorName) by median 1-month change.
+
+        Computed from the /cores snapshot only; empty if it is unavailable.
+
+        Returns:
+            list of dicts with industry, momentum_pct, members, rank (1 = strongest)
+        """
+        snapshot = self._cores_snapshot()
+        if snapshot is None:
+            return []
+        cache_key = ('industry_rankings', snapshot.trade_date)
+        if not force_refresh and cache_key in _sector_cache:
+            return _sector_cache[cache_key]
+
+        change = snapshot.column('stkPxChng1m')
+        if change is None:
+            return []
+        change = np.asarray(change, dtype=np.float64)
+        groups = []
+        for industry, rows in snapshot.sector_names().items():
+            values = change[rows]
+            values = values[~np.isnan(values)]
+            if len(values) >= MIN_GROUP_MEMBERS:
+                groups.append((industry, float(np.median(values)), len(values)))
+        groups.sort(key=lambda g: g[1], reverse=True)
+
+        result = [
+            {'industry': industry, 'momentum_pct': round(momentum, 2), 'members': members, 'rank': i + 1}
+            for i, (industry, momentum, members) in enumerate(groups)
+        ]
         _sector_cache[cache_key] = result
         return result
 
@@ -158,12 +215,23 @@ class SectorAnalysis:
 
     # ─── Computation ─────────────────────────────────────────────────────────
 
-    def _compute_rankings(self) -> SectorMomentumResult:
+    def _compute_rankings(self, snapshot=None) -> SectorMomentumResult:
         """Compute momentum for all sectors and rank them."""
         momentum_data = []  # List of (etf, name, momentum_pct)
 
+        cores_momentum = self._cores_momentum(snapshot) if snapshot is not None else {}
+        missing = [etf for etf in self.SECTOR_MAP if cores_momentum.get(etf) is None]
+
+        # ETFs the snapshot lacks: shared benchmark cache (one batch call on a miss)
+        histories = {}
+        if missing and self.orats_api:
+            histories = benchmark_cache.get_histories(self.orats_api, missing)
+
         for etf, name in self.SECTOR_MAP.items():
-            momentum = self._get_sector_momentum(etf)
+            momentum = cores_momentum.get(etf)
+            if momentum is None:
+                # {} = batch fetch already failed; go straight to the quote proxy
+                momentum = self._get_sector_momentum(etf, histories.get(etf) or {})
             momentum_data.append((etf, name, momentum))
 
         # Sort by momentum (descending — highest momentum first)
@@ -204,7 +272,12 @@ class SectorAnalysis:
                 score_modifier=score_modifier,
             ))
 
-        source = 'orats' if self.orats_api else 'none'
+        if cores_momentum and not missing:
+            source = 'orats_cores'
+        elif self.orats_api:
+            source = 'orats'
+        else:
+            source = 'orats_cores' if cores_momentum else 'none'
         return SectorMomentumResult(
             rankings=rankings,
             timestamp=datetime.utcnow().isoformat() + 'Z',
@@ -213,17 +286,53 @@ class SectorAnalysis:
             cache_age_minutes=0,
         )
 
-    def _get_sector_momentum(self, etf: str) -> Optional[float]:
+    def _cores_snapshot(self):
+        """The shared /cores snapshot if it is fresh (never triggers a refresh), else None."""
+        if self.cores_store is None:
+            return None
+        try:
+            snapshot = self.cores_store.current()
+            return snapshot if self.cores_store.is_fresh(snapshot) else None
+        except Exception as e:
+            log.debug(f"[SectorAnalysis] Cores snapshot unavailable: {e}")
+            return None
+
+    def _cores_momentum(self, snapshot) -> Dict[str, float]:
+        """1-month % change per sector ETF from the /cores snapshot (no API calls).
+
+        Uses the ETF's own stkPxChng1m row; an ETF missing from the universe
+        falls back to the median of its constituents (rows with that bestEtf).
+        """
+        tickers = snapshot.column('ticker')
+        change = snapshot.column('stkPxChng1m')
+        if tickers is None or change is None:
+            return {}
+        change = np.asarray(change, dtype=np.float64)
+
+        etfs = list(self.SECTOR_MAP)
+        rows = np.flatnonzero(np.isin(tickers, etfs))
+        momentum = {str(tickers[i]): float(change[i]) for i in rows if not np.isnan(change[i])}
+
+        for etf in etfs:
+            if etf in momentum:
+                continue
+            members = change[snapshot.etf_slice(etf)]
+            members = members[~np.isnan(members)]
+            if len(members) >= MIN_GROUP_MEMBERS:
+                momentum[etf] = float(np.median(members))
+        return momentum
+
+    def _get_sector_momentum(self, etf: str, raw_history=None) -> Optional[float]:
         """Get 21-day momentum (% change) for a sector ETF.
         
-        Uses ORATS price history if available.
+        Uses the cached ORATS price history (benchmark_history.py) if available.
         """
         if not self.orats_api:
             return None
 
         try:
-            # Try to get price history from ORATS
-            raw_history = self.orats_api.get_history(etf, days=30)
+            if raw_history is None:
+                raw_history = benchmark_cache.get_history(self.orats_api, etf)
             
             # get_history() returns {'candles': [...], 'symbol': ticker, 'empty': bool}
             # Unwrap the candles list from the dict
@@ -267,12 +376,16 @@ class SectorAnalysis:
     # ─── Lookup ──────────────────────────────────────────────────────────────
 
     def _find_sector(self, ticker: str) -> Optional[str]:
-        """Find the sector ETF for a given ticker."""
+        """Find the sector ETF for a given ticker (symbol master, else static map, then /cores bestEtf)."""
         ticker = ticker.upper()
-        for etf, members in self.SECTOR_MEMBERS.items():
-            if ticker in members:
-                return etf
-        return None
+        if self.symbol_master is not None:
+            return self.symbol_master.sector_etf(ticker)
+        if ticker in _MEMBER_ETF:
+            return _MEMBER_ETF[ticker]
+        snapshot = self._cores_snapshot()
+        record = snapshot.get(ticker) if snapshot is not None else None
+        best_etf = ((record or {}).get('bestEtf') or '').upper()
+        return best_etf if best_etf in self.SECTOR_MAP else None
 
     # ─── Summary ─────────────────────────────────────────────────────────────
 
@@ -289,3 +402,7 @@ class SectorAnalysis:
             'is_cached': result.is_cached,
             'cache_age_minutes': result.cache_age_minutes,
         }
+
+
+# Ticker -> sector ETF, the O(1) reverse of SectorAnalysis.SECTOR_MEMBERS
+_MEMBER_ETF = {ticker: etf for etf, members in SectorAnalysis.SECTOR_MEMBERS.items() for ticker in members}
@@ -8,13 +8,38 @@ Signal hierarchy:
   3. Neutral 50 (no data)
 """
 
+import concurrent.futures
+import hashlib
+import json
 import logging
+import re
+import threading
 import requests
+from cachetools import TTLCache
 from datetime import datetime, timedelta
 from backend.config import Config
 
 logger = logging.getLogger(__name__)
 
+MAX_HEADLINES = 15               # Headlines per ticker sent for scoring
+BATCH_TOKEN_BUDGET = 3000        # Approximate prompt tokens per batched request
+BATCH_WORKERS = 3
+
+# (TICKER, headline-set hash) -> (score, rationale). Shared by every analyzer in
+# the process so an unchanged headline set is never sent to the LLM twice.
+_headline_scores = TTLCache(maxsize=4096, ttl=24 * 3600)
+_headline_lock = threading.Lock()
+
+
+def headline_set_key(ticker, headlines):
+    """Cache key: ticker plus a hash of the (order-independent) headline set that gets scored."""
+    scored = sorted({h.strip() for h in headlines[:MAX_HEADLINES] if h})
+    return (ticker or '').upper(), hashlib.sha1('\n'.join(scored).encode('utf-8')).hexdigest()
+
+
+def _estimate_tokens(text):
+    return len(text) // 4 + 1
+
 
 class SentimentAnalyzer:
     def __init__(self):
@@ -54,11 +79,16 @@ class SentimentAnalyzer:
         """
         Use Perplexity sonar-pro to score a batch of headlines 0-100.
         Returns (score, breakdown_list) or (50, []) on failure.
+        Headline sets already scored (here or by score_headlines_batch) are served from cache.
         """
         if not self.perplexity_api_key or not headlines:
             return 50, []
 
-        bullet_list = "\n".join(f"- {h}" for h in headlines[:15])
+        cached = self._cached_headline_score(ticker, headlines)
+        if cached is not None:
+            return cached[0], self._breakdown(*cached)
+
+        bullet_list = "\n".join(f"- {h}" for h in headlines[:MAX_HEADLINES])
 
         prompt = (
             f"You are a quantitative sentiment scorer for options trading.\n"
@@ -69,44 +99,146 @@ class SentimentAnalyzer:
         )
 
         try:
-            resp = requests.post(
-                self.perplexity_url,
-                json={
-                    "model": "sonar-pro",
-                    "messages": [
-                        {"role": "system", "content": "You are a financial sentiment scoring engine. Return only JSON."},
-                        {"role": "user", "content": prompt}
-                    ],
-                    "temperature": 0.0
-                },
-                headers={
-                    "Authorization": f"Bearer {self.perplexity_api_key}",
-                    "Content-Type": "application/json"
-                },
-                timeout=15
-            )
-
-            if resp.status_code != 200:
-                logger.warning("Perplexity sentiment API returned %d", resp.status_code)
+            content = self._ask_perplexity(prompt, timeout=15)
+            if content is None:
                 return 50, []
 
-            content = resp.json()['choices'][0]['message']['content']
-
             # Extract JSON from response
-            import json, re
             json_match = re.search(r'\{[^}]*"score"\s*:\s*(\d+)[^}]*\}', content)
             if json_match:
                 parsed = json.loads(json_match.group(0))
                 score = max(0, min(100, int(parsed.get('score', 50))))
                 rationale = parsed.get('rationale', '')
                 logger.info("Perplexity sentiment for %s: %d (%s)", ticker, score, rationale)
-                return score, [{"source": "Perplexity AI", "score": score, "rationale": rationale}]
+                self._remember_headline_score(ticker, headlines, score, rationale)
+                return score, self._breakdown(score, rationale)
 
         except Exception as e:
             logger.warning("Perplexity sentiment failed for %s: %s", ticker, e)
 
         return 50, []
 
+    def score_headlines_batch(self, headlines_by_ticker, token_budget=BATCH_TOKEN_BUDGET):
+        """
+        Score many tickers' headlines in as few Perplexity calls as possible.
+
+        Cached headline sets are served without a call; the rest are packed
+        into prompts of at most ~`token_budget` tokens (one JSON object keyed
+        by ticker per response, chunks sent concurrently).
+
+        Returns:
+            {ticker: (score, breakdown_list)} for every ticker scored. Tickers
+            a response left out are omitted, so score_headlines_with_perplexity
+            still handles them individually.
+        """
+        results = {}
+        pending = []
+        for ticker, headlines in (headlines_by_ticker or {}).items():
+            headlines = [h for h in (headlines or []) if h]
+            if not headlines:
+                continue
+            cached = self._cached_headline_score(ticker, headlines)
+            if cached is not None:
+                results[ticker] = (cached[0], self._breakdown(*cached))
+            else:
+                pending.append((ticker, headlines[:MAX_HEADLINES]))
+
+        if not pending or not self.perplexity_api_key:
+            return results
+
+        chunks = self._pack_headline_batches(pending, token_budget)
+        logger.info("Batched headline sentiment: %d tickers (%d cached) in %d request(s)",
+                    len(pending) + len(results), len(results), len(chunks))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(BATCH_WORKERS, len(chunks))) as pool:
+            for scored in pool.map(self._score_headline_batch, chunks):
+                results.update(scored)
+        return results
+
+    @staticmethod
+    def _headline_block(ticker, headlines):
+        return f"[{ticker}]\n" + "\n".join(f"- {h}" for h in headlines)
+
+    def _pack_headline_batches(self, pending, token_budget):
+        """Split (ticker, headlines) pairs into chunks whose prompt fits the token budget."""
+        chunks, current, used = [], [], 0
+        for ticker, headlines in pending:
+            cost = _estimate_tokens(self._headline_block(ticker, headlines))
+            if current and used + cost > token_budget:
+                chunks.append(current)
+                current, used = [], 0
+            current.append((ticker, headlines))
+            used += cost
+        if current:
+            chunks.append(current)
+        return chunks
+
+    def _score_headline_batch(self, chunk):
+        blocks = "\n\n".join(self._headline_block(t, h) for t, h in chunk)
+        prompt = (
+            f"You are a quantitative sentiment scorer for options trading.\n"
+            f"For EACH ticker below, rate the overall sentiment of its own headlines on a 0-100 scale:\n"
+            f"0 = extremely bearish, 50 = neutral, 100 = extremely bullish.\n\n"
+            f"{blocks}\n\n"
+            f"Respond with ONLY a JSON object keyed by ticker, one entry per ticker above:\n"
+            f"{{\"<TICKER>\": {{\"score\": <int>, \"rationale\": \"<1 sentence>\"}}}}"
+        )
+        scored = {}
+        try:
+            content = self._ask_perplexity(prompt, timeout=45)
+            json_match = re.search(r'\{.*\}', content or '', re.DOTALL)
+            if not json_match:
+                logger.warning("Batched sentiment returned no JSON for %d tickers", len(chunk))
+                return scored
+            parsed = {str(k).upper(): v for k, v in json.loads(json_match.group(0)).items()}
+            for ticker, headlines in chunk:
+                entry = parsed.get(ticker.upper())
+                if not isinstance(entry, dict) or entry.get('score') is None:
+                    continue
+                score = max(0, min(100, int(entry['score'])))
+                rationale = entry.get('rationale', '')
+                self._remember_headline_score(ticker, headlines, score, rationale)
+                scored[ticker] = (score, self._breakdown(score, rationale))
+        except Exception as e:
+            logger.warning("Batched sentiment failed for %d tickers: %s", len(chunk), e)
+        return scored
+
+    def _ask_perplexity(self, prompt, timeout):
+        """One sonar-pro chat call; returns the message content or None on HTTP error."""
+        resp = requests.post(
+            self.perplexity_url,
+            json={
+                "model": "sonar-pro",
+                "messages": [
+                    {"role": "system", "content": "You are a financial sentiment scoring engine. Return only JSON."},
+                    {"role": "user", "content": prompt}
+                ],
+                "temperature": 0.0
+            },
+            headers={
+                "Authorization": f"Bearer {self.perplexity_api_key}",
+                "Content-Type": "application/json"
+            },
+            timeout=timeout
+        )
+        if resp.status_code != 200:
+            logger.warning("Perplexity sentiment API returned %d", resp.status_code)
+            return None
+        return resp.json()['choices'][0]['message']['content']
+
+    @staticmethod
+    def _cached_headline_score(ticker, headlines):
+        with _headline_lock:
+            return _headline_scores.get(headline_set_key(ticker, headlines))
+
+    @staticmethod
+    def _remember_headline_score(ticker, headlines, score, rationale):
+        with _headline_lock:
+            _headline_scores[headline_set_key(ticker, headlines)] = (score, rationale)
+
+    @staticmethod
+    def _breakdown(score, rationale):
+        return [{"source": "Perplexity AI", "score": score, "rationale": rationale}]
+
     # ------------------------------------------------------------------
     # UNIFIED ENTRY POINT
     # ------------------------------------------------------------------
@@ -3,13 +3,22 @@ import ta
 import numpy as np
 import logging
 from backend.config import Config
+from backend.analysis.indicator_frame import indicator_frames
+from backend.analysis.indicator_panel import prime_indicator_frames
+from backend.analysis import indicator_kernels as kernels
 
 logger = logging.getLogger(__name__)
 
 class TechnicalIndicators:
-    def __init__(self):
+    def __init__(self, use_kernels=None):
         self.rsi_oversold = Config.RSI_OVERSOLD
         self.rsi_overbought = Config.RSI_OVERBOUGHT
+        # NumPy kernels match `ta` to float precision (tests/test_indicator_kernels.py)
+        self.use_kernels = Config.USE_NUMPY_INDICATORS if use_kernels is None else use_kernels
+
+    @staticmethod
+    def _col(df, name):
+        return df[name].to_numpy(dtype=np.float64)
         
     def prepare_dataframe(self, price_history):
         """
@@ -55,23 +64,26 @@ class TechnicalIndicators:
         if df is None or len(df) < period:
             return None, 'neutral'
         
-        rsi_indicator = ta.momentum.RSIIndicator(close=df['Close'], window=period)
-        rsi = rsi_indicator.rsi()
-        current_rsi = rsi.iloc[-1]
+        if self.use_kernels:
+            current_rsi = kernels.wilder_rsi(self._col(df, 'Close'), period)[-1]
+        else:
+            rsi_indicator = ta.momentum.RSIIndicator(close=df['Close'], window=period)
+            rsi = rsi_indicator.rsi()
+            current_rsi = rsi.iloc[-1]
         
-        # Determine signal (5-zone system)
+        return current_rsi, self.rsi_signal(current_rsi)
+
+    def rsi_signal(self, current_rsi):
+        """Classify an RSI value (5-zone system)."""
         if current_rsi < self.rsi_oversold:
-            signal = 'oversold'      # < 30 — strong buy signal
+            return 'oversold'         # < 30 — strong buy signal
         elif current_rsi < 40:
-            signal = 'near oversold'  # 30-40 — approaching buy zone
+            return 'near oversold'    # 30-40 — approaching buy zone
         elif current_rsi > self.rsi_overbought:
-            signal = 'overbought'     # > 70 — strong sell signal
+            return 'overbought'       # > 70 — strong sell signal
         elif current_rsi > 60:
-            signal = 'near overbought' # 60-70 — approaching sell zone
-        else:
-            signal = 'neutral'         # 40-60 — no signal
-        
-        return current_rsi, signal
+            return 'near overbought'  # 60-70 — approaching sell zone
+        return 'neutral'              # 40-60 — no signal
     
     def calculate_macd(self, df, fast=12, slow=26, signal=9):
         """
@@ -89,38 +101,46 @@ class TechnicalIndicators:
         if df is None or len(df) < slow:
             return None, 'neutral'
         
-        macd_indicator = ta.trend.MACD(close=df['Close'], window_slow=slow, window_fast=fast, window_sign=signal)
-        
-        macd_line = macd_indicator.macd().iloc[-1]
-        signal_line = macd_indicator.macd_signal().iloc[-1]
-        histogram = macd_indicator.macd_diff().iloc[-1]
-        
-        # Get last 3 histogram bars for momentum detection
-        hist_series = macd_indicator.macd_diff().dropna().tail(3).tolist()
+        if self.use_kernels:
+            line, sig, diff = kernels.macd(self._col(df, 'Close'), fast, slow, signal)
+            macd_line, signal_line, histogram = line[-1], sig[-1], diff[-1]
+            # Get last 3 histogram bars for momentum detection
+            hist_series = kernels.last_valid(diff)[-3:].tolist()
+        else:
+            macd_indicator = ta.trend.MACD(close=df['Close'], window_slow=slow, window_fast=fast, window_sign=signal)
+            
+            macd_line = macd_indicator.macd().iloc[-1]
+            signal_line = macd_indicator.macd_signal().iloc[-1]
+            histogram = macd_indicator.macd_diff().iloc[-1]
+            
+            # Get last 3 histogram bars for momentum detection
+            hist_series = macd_indicator.macd_diff().dropna().tail(3).tolist()
         
-        # Determine signal with histogram momentum (2-bar confirmation)
+        return {
+            'macd': macd_line,
+            'signal': signal_line,
+            'histogram': histogram
+        }, self.macd_signal(macd_line, signal_line, histogram, hist_series)
+
+    @staticmethod
+    def macd_signal(macd_line, signal_line, histogram, hist_series):
+        """Classify MACD with histogram momentum (2-bar confirmation).
+
+        hist_series: last (up to) 3 histogram values, oldest first.
+        """
         if macd_line > signal_line and histogram > 0:
             # Check if histogram is shrinking for 2+ consecutive bars
             if (len(hist_series) >= 3 and 
                 hist_series[-1] < hist_series[-2] < hist_series[-3]):
-                signal_type = 'weakening bullish'  # Trend losing steam
-            else:
-                signal_type = 'bullish'
+                return 'weakening bullish'  # Trend losing steam
+            return 'bullish'
         elif macd_line < signal_line and histogram < 0:
             # Check if bearish histogram is shrinking (becoming less negative)
             if (len(hist_series) >= 3 and 
                 hist_series[-1] > hist_series[-2] > hist_series[-3]):
-                signal_type = 'weakening bearish'  # Bear trend fading
-            else:
-                signal_type = 'bearish'
-        else:
-            signal_type = 'neutral'
-        
-        return {
-            'macd': macd_line,
-            'signal': signal_line,
-            'histogram': histogram
-        }, signal_type
+                return 'weakening bearish'  # Bear trend fading
+            return 'bearish'
+        return 'neutral'
     
     def calculate_bollinger_bands(self, df, period=20, std=2):
         """
@@ -137,19 +157,29 @@ class TechnicalIndicators:
         if df is None or len(df) < period:
             return None, 'neutral'
         
-        bb_indicator = ta.volatility.BollingerBands(close=df['Close'], window=period, window_dev=std)
-        
         current_price = df['Close'].iloc[-1]
-        upper_band = bb_indicator.bollinger_hband().iloc[-1]
-        middle_band = bb_indicator.bollinger_mavg().iloc[-1]
-        lower_band = bb_indicator.bollinger_lband().iloc[-1]
+        if self.use_kernels:
+            upper, middle, lower = kernels.bollinger(self._col(df, 'Close'), period, std)
+            upper_band, middle_band, lower_band = upper[-1], middle[-1], lower[-1]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                bb_width_history = pd.Series(kernels.last_valid((upper - lower) / middle)[-100:])
+        else:
+            bb_indicator = ta.volatility.BollingerBands(close=df['Close'], window=period, window_dev=std)
+            
+            upper_band = bb_indicator.bollinger_hband().iloc[-1]
+            middle_band = bb_indicator.bollinger_mavg().iloc[-1]
+            lower_band = bb_indicator.bollinger_lband().iloc[-1]
+            bb_width_series = (bb_indicator.bollinger_hband() - bb_indicator.bollinger_lband()) / bb_indicator.bollinger_mavg()
+            bb_width_history = bb_width_series.dropna().tail(100)
         
         # Calculate bandwidth and percentile for squeeze detection
         bandwidth = (upper_band - lower_band) / middle_band if middle_band > 0 else 0
-        bb_width_series = (bb_indicator.bollinger_hband() - bb_indicator.bollinger_lband()) / bb_indicator.bollinger_mavg()
-        bb_width_history = bb_width_series.dropna().tail(100)
         bandwidth_percentile = (bb_width_history < bandwidth).sum() / len(bb_width_history) * 100 if len(bb_width_history) > 0 else 50
-        
+        return self.bollinger_result(current_price, upper_band, middle_band, lower_band, bandwidth, bandwidth_percentile)
+
+    @staticmethod
+    def bollinger_result(current_price, upper_band, middle_band, lower_band, bandwidth, bandwidth_percentile):
+        """Build the Bollinger values dict and squeeze-aware 5-zone signal."""
         # Price position within bands (0 = lower, 100 = upper)
         band_range = upper_band - lower_band
         band_position = ((current_price - lower_band) / band_range * 100) if band_range > 0 else 50
@@ -194,37 +224,44 @@ class TechnicalIndicators:
         if df is None or len(df) < 200:
             return None, 'neutral'
         
-        sma_5_indicator = ta.trend.SMAIndicator(close=df['Close'], window=5)
-        sma_50_indicator = ta.trend.SMAIndicator(close=df['Close'], window=50)
-        sma_200_indicator = ta.trend.SMAIndicator(close=df['Close'], window=200)
-        
-        sma_5 = sma_5_indicator.sma_indicator().iloc[-1]
-        sma_50 = sma_50_indicator.sma_indicator().iloc[-1]
-        sma_200 = sma_200_indicator.sma_indicator().iloc[-1]
+        if self.use_kernels:
+            close = self._col(df, 'Close')
+            sma_5 = close[-5:].mean()
+            sma_50 = close[-50:].mean()
+            sma_200 = close[-200:].mean()
+        else:
+            sma_5_indicator = ta.trend.SMAIndicator(close=df['Close'], window=5)
+            sma_50_indicator = ta.trend.SMAIndicator(close=df['Close'], window=50)
+            sma_200_indicator = ta.trend.SMAIndicator(close=df['Close'], window=200)
+            
+            sma_5 = sma_5_indicator.sma_indicator().iloc[-1]
+            sma_50 = sma_50_indicator.sma_indicator().iloc[-1]
+            sma_200 = sma_200_indicator.sma_indicator().iloc[-1]
         current_price = df['Close'].iloc[-1]
         
         logger.debug(f"Calculated SMA5={sma_5}, SMA50={sma_50}")
         
-        # 5-zone trend analysis with SMA200 safety net
-        if sma_50 > sma_200 and current_price > sma_50:
-            signal = 'bullish'             # Full uptrend: price > SMA50 > SMA200
-        elif sma_50 > sma_200 and current_price > sma_200:
-            signal = 'pullback bullish'    # Dip in uptrend: SMA200 < price < SMA50 (buy-the-dip)
-        elif sma_50 > sma_200 and current_price < sma_200:
-            signal = 'breakdown'           # SMA50 > SMA200 but price crashed below both — danger
-        elif sma_50 < sma_200 and current_price < sma_50:
-            signal = 'bearish'             # Full downtrend: price < SMA50 < SMA200
-        elif sma_50 < sma_200 and current_price > sma_200:
-            signal = 'rally bearish'       # Bear bounce above SMA200 — dead cat bounce
-        else:
-            signal = 'neutral'
-        
         return {
             'sma_5': sma_5,
             'sma_50': sma_50,
             'sma_200': sma_200,
             'current_price': current_price
-        }, signal
+        }, self.moving_average_signal(current_price, sma_50, sma_200)
+
+    @staticmethod
+    def moving_average_signal(current_price, sma_50, sma_200):
+        """5-zone trend analysis with SMA200 safety net."""
+        if sma_50 > sma_200 and current_price > sma_50:
+            return 'bullish'             # Full uptrend: price > SMA50 > SMA200
+        elif sma_50 > sma_200 and current_price > sma_200:
+            return 'pullback bullish'    # Dip in uptrend: SMA200 < price < SMA50 (buy-the-dip)
+        elif sma_50 > sma_200 and current_price < sma_200:
+            return 'breakdown'           # SMA50 > SMA200 but price crashed below both — danger
+        elif sma_50 < sma_200 and current_price < sma_50:
+            return 'bearish'             # Full downtrend: price < SMA50 < SMA200
+        elif sma_50 < sma_200 and current_price > sma_200:
+            return 'rally bearish'       # Bear bounce above SMA200 — dead cat bounce
+        return 'neutral'
     
     def analyze_volume(self, df, period=20):
         """
@@ -243,12 +280,14 @@ class TechnicalIndicators:
         avg_volume = df['Volume'].rolling(window=period).mean().iloc[-1]
         current_volume = df['Volume'].iloc[-1]
         
-        volume_ratio = current_volume / avg_volume if avg_volume > 0 else 0
-        
         # Z-score based volume tiers (ticker-adaptive)
         vol_series = df['Volume'].tail(50)
-        vol_mean = vol_series.mean()
-        vol_std = vol_series.std()
+        return self.volume_result(current_volume, avg_volume, vol_series.mean(), vol_series.std())
+
+    @staticmethod
+    def volume_result(current_volume, avg_volume, vol_mean, vol_std):
+        """Volume ratio and z-score tier (vol_mean/vol_std over the last 50 bars)."""
+        volume_ratio = current_volume / avg_volume if avg_volume > 0 else 0
         
         if vol_mean > 0 and vol_std > 0:
             z_score = (current_volume - vol_mean) / vol_std
@@ -288,7 +327,11 @@ class TechnicalIndicators:
         recent_high = df['High'].rolling(window=window).max().iloc[-1]
         recent_low = df['Low'].rolling(window=window).min().iloc[-1]
         current_price = df['Close'].iloc[-1]
-        
+        return self.support_resistance_result(recent_high, recent_low, current_price)
+
+    @staticmethod
+    def support_resistance_result(recent_high, recent_low, current_price):
+        """Classic pivot point with first support/resistance."""
         # Simple pivot point calculation
         pivot = (recent_high + recent_low + current_price) / 3
         resistance_1 = (2 * pivot) - recent_low
@@ -323,8 +366,36 @@ class TechnicalIndicators:
         Returns:
             Dictionary with all indicators and signals, or None if df fails
         """
-        df = self.prepare_dataframe(price_history)
-        
+        return self.get_all_indicators_for_df(self.prepare_dataframe(price_history))
+
+    def get_indicator_frame(self, ticker, price_history, live_price=None):
+        """Return the shared IndicatorFrame for this history (computed once, LRU-cached).
+
+        Args:
+            ticker: Symbol (part of the cache key)
+            price_history: Price history data
+            live_price: Optional real-time price applied to the last Close
+                        before any indicator is computed
+
+        Returns:
+            IndicatorFrame, or None if the history is empty
+        """
+        return indicator_frames.get_or_build(self, ticker, price_history, live_price)
+
+    def prime_indicator_frames(self, histories, benchmark_history=None):
+        """Compute a batch of histories in one vectorized panel pass and cache the frames.
+
+        Args:
+            histories: {ticker: price_history} (e.g. from get_history_batch())
+            benchmark_history: Optional SPY history for relative strength
+
+        Returns:
+            Number of frames primed; get_indicator_frame() then hits the cache
+        """
+        return prime_indicator_frames(self, histories, benchmark_history)
+
+    def get_all_indicators_for_df(self, df):
+        """Same as get_all_indicators(), for an already-prepared DataFrame."""
         if df is None:
             return None
         
@@ -574,6 +645,9 @@ class TechnicalIndicators:
         """
         if df is None or len(df) < period:
             return 0
+
+        if self.use_kernels:
+            return kernels.atr(self._col(df, 'High'), self._col(df, 'Low'), self._col(df, 'Close'), period)[-1]
             
         atr_indicator = ta.volatility.AverageTrueRange(
             high=df['High'], 
@@ -591,6 +665,15 @@ class TechnicalIndicators:
         """
         if df is None or len(df) < 30: # Need some data
             return 50 # Default neutral
+
+        if self.use_kernels:
+            last_year_hv = kernels.last_valid(kernels.historical_volatility(self._col(df, 'Close'), 20), window)
+            if last_year_hv.size == 0:
+                return 50
+            current_hv, min_hv, max_hv = last_year_hv[-1], last_year_hv.min(), last_year_hv.max()
+            if max_hv == min_hv:
+                return 50
+            return ((current_hv - min_hv) / (max_hv - min_hv)) * 100
         
         # XC-5: Work on a copy to avoid SettingWithCopyWarning on caller's DataFrame
         df = df.copy()
@@ -633,9 +716,12 @@ class TechnicalIndicators:
         if df is None or len(df) < 10:  # Need minimal data for 2-period RSI
             return {'value': None, 'signal': 'neutral', 'exit_trigger': False}
         
-        rsi2_indicator = ta.momentum.RSIIndicator(close=df['Close'], window=2)
-        rsi2 = rsi2_indicator.rsi()
-        current_rsi2 = rsi2.iloc[-1]
+        if self.use_kernels:
+            current_rsi2 = kernels.wilder_rsi(self._col(df, 'Close'), 2)[-1]
+        else:
+            rsi2_indicator = ta.momentum.RSIIndicator(close=df['Close'], window=2)
+            rsi2 = rsi2_indicator.rsi()
+            current_rsi2 = rsi2.iloc[-1]
         
         # S3-FIX: 200-day SMA trend filter — Connors RSI-2 is explicitly designed
         # to only trigger BUY signals when price is ABOVE the 200-day SMA.
@@ -649,6 +735,21 @@ class TechnicalIndicators:
         # If fewer than 200 bars, we cannot confirm the uptrend — suppress buy signals
         # (conservative default per Risk Manager and Bear Market Survivor personas).
 
+        # Exit trigger: price crosses above 5-day SMA (Connors exit rule)
+        sma5 = df['Close'].rolling(window=5).mean()
+        exit_trigger = False
+        if len(sma5.dropna()) >= 2:
+            # Price crossed above SMA5 today (was below yesterday)
+            exit_trigger = (
+                df['Close'].iloc[-1] > sma5.iloc[-1] and
+                df['Close'].iloc[-2] <= sma5.iloc[-2]
+            )
+        
+        return self.rsi2_result(current_rsi2, above_sma200, exit_trigger)
+
+    @staticmethod
+    def rsi2_result(current_rsi2, above_sma200, exit_trigger):
+        """Classify RSI-2 (Connors thresholds, buy side gated by the SMA200 filter)."""
         # Connors thresholds: <5 = extreme oversold (buy), >95 = extreme overbought (sell)
         if current_rsi2 < 5:
             # Only fire buy signal if price is above the 200-day SMA trend filter
@@ -662,16 +763,6 @@ class TechnicalIndicators:
         else:
             signal = 'neutral'
         
-        # Exit trigger: price crosses above 5-day SMA (Connors exit rule)
-        sma5 = df['Close'].rolling(window=5).mean()
-        exit_trigger = False
-        if len(sma5.dropna()) >= 2:
-            # Price crossed above SMA5 today (was below yesterday)
-            exit_trigger = (
-                df['Close'].iloc[-1] > sma5.iloc[-1] and
-                df['Close'].iloc[-2] <= sma5.iloc[-2]
-            )
-        
         return {
             'value': round(current_rsi2, 2) if not pd.isna(current_rsi2) else None,
             'signal': signal,
@@ -707,18 +798,34 @@ class TechnicalIndicators:
         current_price = close.iloc[-1]
         
         # Calculate SMAs
-        sma50 = close.rolling(window=50).mean().iloc[-1]
-        sma150 = close.rolling(window=150).mean().iloc[-1]
-        sma200 = close.rolling(window=200).mean().iloc[-1]
+        if self.use_kernels:
+            close_arr = self._col(df, 'Close')
+            sma50 = close_arr[-50:].mean()
+            sma150 = close_arr[-150:].mean()
+            sma200_series = pd.Series(kernels.rolling_mean(close_arr, 200))
+            sma200 = sma200_series.iloc[-1]
+        else:
+            sma50 = close.rolling(window=50).mean().iloc[-1]
+            sma150 = close.rolling(window=150).mean().iloc[-1]
+            sma200 = close.rolling(window=200).mean().iloc[-1]
+            sma200_series = close.rolling(window=200).mean()
         
         # SMA200 slope (22 trading days ago)
-        sma200_series = close.rolling(window=200).mean()
         sma200_22d_ago = sma200_series.iloc[-23] if len(sma200_series) > 23 else sma200
-        sma200_trending_up = sma200 > sma200_22d_ago
         
         # 52-week high/low
         high_52w = df['High'].tail(252).max()
         low_52w = df['Low'].tail(252).min()
+        return self.minervini_result(current_price, sma50, sma150, sma200, sma200_22d_ago, high_52w, low_52w)
+
+    @staticmethod
+    def minervini_result(current_price, sma50, sma150, sma200, sma200_22d_ago, high_52w, low_52w):
+        """Score the 8 Stage 2 criteria from precomputed SMA / 52-week levels."""
+        # The full pass compares pandas/numpy scalars; coerce so the panel and
+        # live-bar paths (plain floats) build the same criteria values
+        current_price, sma50, sma150, sma200, sma200_22d_ago, high_52w, low_52w = (
+            np.float64(v) for v in (current_price, sma50, sma150, sma200, sma200_22d_ago, high_52w, low_52w))
+        sma200_trending_up = sma200 > sma200_22d_ago
         
         # Evaluate 8 criteria
         criteria = {}
@@ -793,7 +900,11 @@ class TechnicalIndicators:
         tp_22d = tp.tail(22)
         vol_22d = vol.tail(22)
         monthly_vwap = (tp_22d * vol_22d).sum() / vol_22d.sum() if vol_22d.sum() > 0 else None
-        
+        return self.vwap_result(current_price, weekly_vwap, monthly_vwap)
+
+    @staticmethod
+    def vwap_result(current_price, weekly_vwap, monthly_vwap):
+        """Distances and institutional-level signal for weekly/monthly VWAP."""
         # Distance from VWAP levels (as percentage)
         weekly_dist = ((current_price - weekly_vwap) / weekly_vwap * 100) if weekly_vwap else None
         monthly_dist = ((current_price - monthly_vwap) / monthly_vwap * 100) if monthly_vwap else None
@@ -52,14 +52,14 @@ class FinnhubAPI:
         """
         return self._get("news-sentiment", {'symbol': ticker})
 
-    def get_company_news(self, ticker):
+    def get_company_news(self, ticker, days=5):
         """
         Get recent company news (Free Tier Compatible).
         Returns list of articles {headline, summary, url, datetime}
         """
-        # Get last 5 days
+        # Get last `days` days
         today = datetime.date.today()
-        start = today - datetime.timedelta(days=5)
+        start = today - datetime.timedelta(days=days)
         
         params = {
             'symbol': ticker,
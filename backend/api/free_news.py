@@ -1,6 +1,7 @@
 import feedparser
 import requests
 from datetime import datetime, timedelta
+from backend.config import Config
 
 class FreeNewsAPIs:
     """Free news sources without API keys"""
@@ -16,7 +17,10 @@ class FreeNewsAPIs:
             # Google News RSS feed for stock ticker
             url = f"https://news.google.com/rss/search?q={ticker}+stock&hl=en-US&gl=US&ceid=US:en"
             
-            feed = feedparser.parse(url)
+            # feedparser.parse(url) has no timeout; fetch first, then parse the body
+            response = requests.get(url, timeout=Config.NEWS_HTTP_TIMEOUT)
+            response.raise_for_status()
+            feed = feedparser.parse(response.content)
             
             articles = []
             cutoff_date = datetime.now() - timedelta(days=days_back)
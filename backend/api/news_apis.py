@@ -34,7 +34,7 @@ class NewsAPIs:
                 'apiKey': self.newsapi_key
             }
             
-            response = requests.get(url, params=params)
+            response = requests.get(url, params=params, timeout=Config.NEWS_HTTP_TIMEOUT)
             
             if response.status_code == 200:
                 data = response.json()
@@ -73,15 +73,13 @@ class NewsAPIs:
             return []
         
         try:
-            import finnhub
-            
-            finnhub_client = finnhub.Client(api_key=self.finnhub_key)
-            
-            from_date = (datetime.now() - timedelta(days=days_back)).strftime('%Y-%m-%d')
-            to_date = datetime.now().strftime('%Y-%m-%d')
-            
-            news = finnhub_client.company_news(ticker, _from=from_date, to=to_date)
-            
+            # FinnhubAPI: HTTP timeout + retry (the finnhub SDK is not a dependency)
+            from backend.api.finnhub import FinnhubAPI
+
+            news = FinnhubAPI().get_company_news(ticker, days=days_back)
+            if not isinstance(news, list):
+                return []
+
             articles = []
             for item in news:
                 articles.append({
@@ -119,7 +117,7 @@ class NewsAPIs:
                 'apikey': self.alphavantage_key
             }
             
-            response = requests.get(url, params=params)
+            response = requests.get(url, params=params, timeout=Config.NEWS_HTTP_TIMEOUT)
             
             if response.status_code == 200:
                 data = response.json()
@@ -17,6 +17,30 @@ class OratsAPI:
         # RUT excluded — ORATS has inconsistent coverage
     }
 
+    # /live/strikes field projections — request only the columns each caller
+    # reads (same idea as get_cores_bulk's `fields`). A full strikes row has
+    # ~45 columns; the chain needs ~25, a stock quote needs a handful.
+    CHAIN_FIELDS = (
+        "ticker,expirDate,dte,strike,stockPrice,spotPrice,"
+        "callBidPrice,callAskPrice,callPrice,callValue,callVolume,callOpenInterest,callMidIv,"
+        "putBidPrice,putAskPrice,putPrice,putValue,putVolume,putOpenInterest,putMidIv,"
+        "smvVol,delta,gamma,theta,vega,rho"
+    )
+    QUOTE_FIELDS = "ticker,expirDate,dte,strike,stockPrice,spotPrice"
+    OPTION_QUOTE_FIELDS = (
+        "ticker,expirDate,dte,strike,stockPrice,spotPrice,"
+        "callBidPrice,callAskPrice,callValue,callVolume,callOpenInterest,callMidIv,"
+        "putBidPrice,putAskPrice,putValue,putVolume,putOpenInterest,putMidIv,"
+        "smvVol,delta,gamma,theta,vega"
+    )
+
+    # A stock quote only needs one row: the front expiries always exist and
+    # carry stockPrice, so a 0-45 DTE window is enough (covers monthly-only names).
+    QUOTE_DTE_WINDOW = (0, 45)
+
+    # Upper bound sent when a caller only sets a DTE floor (LEAPs run ~3 years)
+    MAX_CHAIN_DTE = 1500
+
     def __init__(self, api_key=None):
         self.api_key = api_key or os.getenv("ORATS_API_KEY")
         self.base_url = "https://api.orats.io/datav2"
@@ -36,6 +60,38 @@ class OratsAPI:
         clean = ticker.replace('$', '').replace('.X', '').strip().upper()
         return self.INDEX_ALIASES.get(clean, clean)
 
+    def _dte_param(self, min_dte=None, max_dte=None):
+        """Build the ORATS `dte` range param ("min,max") or None for no window.
+
+        Padded by one day on each side: ORATS counts DTE from the snapshot
+        date, we count from now. Exact bounds are re-applied client-side
+        (ChainFilter / expiry match), so padding never leaks extra results.
+        """
+        if min_dte is None and max_dte is None:
+            return None
+        lo = max(0, (min_dte if min_dte is not None else 0) - 1)
+        hi = (max_dte if max_dte is not None else self.MAX_CHAIN_DTE) + 1
+        return f"{lo},{max(lo, hi)}"
+
+    def _get_live_strikes(self, ticker, fields=None, dte=None):
+        """GET /live/strikes with optional field projection and DTE window.
+
+        Returns the raw JSON dict. Raises on HTTP/connection errors so each
+        caller keeps its own error handling and log message.
+        """
+        url = f"{self.base_url}/live/strikes"
+        params = {
+            "token": self.api_key,
+            "ticker": ticker
+        }
+        if fields:
+            params["fields"] = fields
+        if dte:
+            params["dte"] = dte
+        response = requests.get(url, params=params, timeout=(5, 30))  # QW-5
+        response.raise_for_status()
+        return response.json()
+
     @retry_api(max_retries=2, base_delay=1.0)
     def get_ticker_universe(self):
         """Fetch complete ORATS ticker universe with date ranges.
@@ -73,23 +129,27 @@ class OratsAPI:
             return False
 
     @retry_api(max_retries=2, base_delay=1.0)
-    def get_option_chain(self, ticker):
+    def get_option_chain(self, ticker, chain_filter=None, fields=None):
         """
         Fetch option chain (strikes) for a ticker.
         Returns standardized format compatible with internal logic.
+
+        Args:
+            chain_filter: Optional ChainFilter (backend.utils.chain_filter).
+                          Its DTE window is sent to ORATS as `dte` so far
+                          expiries never leave the server; expiries/strikes/sides
+                          it rejects are also skipped during standardization.
+            fields: Optional comma-separated field projection.
+                    Defaults to CHAIN_FIELDS (what _standardize_response reads).
         """
         ticker = self._clean_ticker(ticker)
-        url = f"{self.base_url}/live/strikes"
-        params = {
-            "token": self.api_key,
-            "ticker": ticker
-        }
-        
+        dte = None
+        if chain_filter is not None:
+            dte = self._dte_param(chain_filter.min_dte, chain_filter.max_dte)
+
         try:
-            response = requests.get(url, params=params, timeout=(5, 30))  # QW-5
-            response.raise_for_status()
-            data = response.json()
-            return self._standardize_response(data)
+            data = self._get_live_strikes(ticker, fields=fields or self.CHAIN_FIELDS, dte=dte)
+            return self._standardize_response(data, chain_filter=chain_filter)
         except requests.exceptions.HTTPError as e:
             logger.warning(f"ORATS API Error (Chain): {e}")
             return None
@@ -170,15 +230,14 @@ class OratsAPI:
         """
         ticker = self._clean_ticker(ticker)
         # User suggested: https://api.orats.io/datav2/live/strikes
-        url = f"{self.base_url}/live/strikes" 
-        params = {
-            "token": self.api_key,
-            "ticker": ticker
-        }
+        # Only one row is read: project the price columns over the front expiries.
         try:
-            response = requests.get(url, params=params, timeout=(5, 30))  # QW-5
-            response.raise_for_status()
-            data = response.json()
+            data = self._get_live_strikes(
+                ticker, fields=self.QUOTE_FIELDS, dte=self._dte_param(*self.QUOTE_DTE_WINDOW)
+            )
+            if not data.get("data"):
+                # No front-month rows (unusual listing) — retry without the window
+                data = self._get_live_strikes(ticker, fields=self.QUOTE_FIELDS)
             
             # Data format: { data: [ { ticker:..., price:... } ] }
             if "data" in data and len(data["data"]) > 0:
@@ -217,13 +276,22 @@ class OratsAPI:
             logger.warning(f"ORATS Quote Connection Error: {e}")
             return None
 
+    @staticmethod
+    def _find_contract_row(data, expiry_date, strike):
+        """The /live/strikes row for (expiry_date, strike), or None."""
+        for item in (data or {}).get("data") or []:
+            if item.get("expirDate", "") == expiry_date and abs(float(item.get("strike", 0)) - strike) < 0.01:
+                return item
+        return None
+
     @retry_api(max_retries=2, base_delay=1.0)
     def get_option_quote(self, ticker, strike, expiry_date, option_type='CALL'):
         """
         Fetch real-time price for a specific option contract.
         
-        Fetches all strikes from /live/strikes and filters to match
-        the exact contract by expiry, strike, and type.
+        Fetches /live/strikes narrowed to the contract's DTE (projected to
+        the quote columns) and filters to match the exact contract by
+        expiry, strike, and type.
         
         Args:
             ticker: Underlying ticker (e.g. 'GOOG')
@@ -236,81 +304,79 @@ class OratsAPI:
             or None if not found
         """
         ticker = self._clean_ticker(ticker)
-        url = f"{self.base_url}/live/strikes"
-        params = {
-            "token": self.api_key,
-            "ticker": ticker
-        }
+        dte = None
+        try:
+            exp_dt = datetime.strptime(str(expiry_date)[:10], "%Y-%m-%d")
+            days = (exp_dt.date() - datetime.now().date()).days
+            dte = self._dte_param(days, days)
+        except (ValueError, TypeError):
+            pass  # Unparseable expiry: fall back to the full chain
+
         try:
-            response = requests.get(url, params=params, timeout=(5, 30))  # QW-5
-            response.raise_for_status()
-            data = response.json()
-            
-            if "data" not in data or not data["data"]:
-                return None
-            
-            # Find the matching strike+expiry row
             strike_f = float(strike)
             is_call = option_type.upper() == 'CALL'
+
+            data = self._get_live_strikes(ticker, fields=self.OPTION_QUOTE_FIELDS, dte=dte)
+            item = self._find_contract_row(data, expiry_date, strike_f)
+            if item is None and dte:
+                # The window missed the contract: on weekends/holidays ORATS's
+                # snapshot date lags ours by more than the padding, so daily or
+                # adjacent expiries (SPY, QQQ) fill it instead — retry unwindowed
+                data = self._get_live_strikes(ticker, fields=self.OPTION_QUOTE_FIELDS)
+                item = self._find_contract_row(data, expiry_date, strike_f)
+
+            if item is None:
+                logger.debug(f"ORATS: No contract found for {ticker} {strike} {expiry_date} {option_type}")
+                return None
+
+            underlying = (
+                item.get("stockPrice") or 
+                item.get("tickerPrice") or 
+                item.get("price") or 0.0
+            )
             
-            for item in data["data"]:
-                item_expiry = item.get("expirDate", "")
-                item_strike = float(item.get("strike", 0))
-                
-                if item_expiry == expiry_date and abs(item_strike - strike_f) < 0.01:
-                    # Found the matching contract row
-                    underlying = (
-                        item.get("stockPrice") or 
-                        item.get("tickerPrice") or 
-                        item.get("price") or 0.0
-                    )
-                    
-                    if is_call:
-                        bid = item.get("callBidPrice", 0) or 0
-                        ask = item.get("callAskPrice", 0) or 0
-                        value = item.get("callValue", 0) or 0
-                        volume = item.get("callVolume", 0) or 0
-                        oi = item.get("callOpenInterest", 0) or 0
-                    else:
-                        bid = item.get("putBidPrice", 0) or 0
-                        ask = item.get("putAskPrice", 0) or 0
-                        value = item.get("putValue", 0) or 0
-                        volume = item.get("putVolume", 0) or 0
-                        oi = item.get("putOpenInterest", 0) or 0
-                    
-                    # Mark = theoretical value if available, else mid-price
-                    mark = value if value > 0 else (bid + ask) / 2 if (bid + ask) > 0 else 0
-
-                    # Greeks (shared per strike row in ORATS)
-                    delta = item.get("delta", 0) or 0
-                    gamma = item.get("gamma", 0) or 0
-                    theta = item.get("theta", 0) or 0
-                    vega = item.get("vega", 0) or 0
-                    iv_key = "callMidIv" if is_call else "putMidIv"
-                    iv_raw = item.get(iv_key) or item.get("smvVol") or 0
-                    iv = round(iv_raw * 100, 2) if iv_raw and iv_raw < 10 else iv_raw
-
-                    # Negate delta for puts
-                    if not is_call:
-                        delta = -(abs(delta))
-
-                    return {
-                        "bid": float(bid),
-                        "ask": float(ask),
-                        "mark": float(mark),
-                        "underlying": float(underlying),
-                        "volume": int(volume),
-                        "oi": int(oi),
-                        "delta": float(delta),
-                        "gamma": float(gamma),
-                        "theta": float(theta),
-                        "vega": float(vega),
-                        "iv": float(iv),
-                    }
+            if is_call:
+                bid = item.get("callBidPrice", 0) or 0
+                ask = item.get("callAskPrice", 0) or 0
+                value = item.get("callValue", 0) or 0
+                volume = item.get("callVolume", 0) or 0
+                oi = item.get("callOpenInterest", 0) or 0
+            else:
+                bid = item.get("putBidPrice", 0) or 0
+                ask = item.get("putAskPrice", 0) or 0
+                value = item.get("putValue", 0) or 0
+                volume = item.get("putVolume", 0) or 0
+                oi = item.get("putOpenInterest", 0) or 0
             
-            # No matching contract found
-            logger.debug(f"ORATS: No contract found for {ticker} {strike} {expiry_date} {option_type}")
-            return None
+            # Mark = theoretical value if available, else mid-price
+            mark = value if value > 0 else (bid + ask) / 2 if (bid + ask) > 0 else 0
+
+            # Greeks (shared per strike row in ORATS)
+            delta = item.get("delta", 0) or 0
+            gamma = item.get("gamma", 0) or 0
+            theta = item.get("theta", 0) or 0
+            vega = item.get("vega", 0) or 0
+            iv_key = "callMidIv" if is_call else "putMidIv"
+            iv_raw = item.get(iv_key) or item.get("smvVol") or 0
+            iv = round(iv_raw * 100, 2) if iv_raw and iv_raw < 10 else iv_raw
+
+            # Negate delta for puts
+            if not is_call:
+                delta = -(abs(delta))
+
+            return {
+                "bid": float(bid),
+                "ask": float(ask),
+                "mark": float(mark),
+                "underlying": float(underlying),
+                "volume": int(volume),
+                "oi": int(oi),
+                "delta": float(delta),
+                "gamma": float(gamma),
+                "theta": float(theta),
+                "vega": float(vega),
+                "iv": float(iv),
+            }
 
         except requests.exceptions.HTTPError as e:
             logger.warning(f"ORATS API Error (Option Quote): {e}")
@@ -319,25 +385,32 @@ class OratsAPI:
             logger.warning(f"ORATS Option Quote Error: {e}")
             return None
 
-    def _standardize_response(self, orats_data):
+    def _standardize_response(self, orats_data, chain_filter=None):
         """
         Convert ORATS flattened data to nested structure (Schwab-like)
         ORATS returns a list of objects (one per strike/expiry).
         We need {callExpDateMap: {expiry: {strike: [option, ...]}}}
+
+        chain_filter: Optional ChainFilter. Rows outside its DTE window or
+        moneyness band, sides it doesn't want, and contracts failing its
+        OI/volume/spread predicates are skipped before the call/put dicts
+        are built.
         """
         if not orats_data or "data" not in orats_data:
             logger.debug("No 'data' field in ORATS response")
             return {}
 
         raw_list = orats_data["data"]
-        if len(raw_list) > 0:
-             # Debugging removed for production
-             pass
 
-        
+        want_calls = chain_filter.wants_calls() if chain_filter else True
+        want_puts = chain_filter.wants_puts() if chain_filter else True
+
         call_map = {}
         put_map = {}
-        
+        # One strptime per expiry (not per row): expiry -> (exp_key, dte, accepted)
+        expiry_info = {}
+        now = datetime.now()
+
         for item in raw_list:
             # ORATS "Wide" Format: One row per strike, containing both Call and Put columns
             # Fields: ticker, expirDate, strike, callBid, callAsk, putBid, putAsk, etc.
@@ -347,73 +420,89 @@ class OratsAPI:
             if not expiry or not strike:
                 continue
 
-            # Calculate DTE once
-            days_to_expiry = 0
-            try:
-                exp_date = datetime.strptime(expiry, "%Y-%m-%d")
-                days_to_expiry = (exp_date - datetime.now()).days
-                exp_key = f"{expiry}:{days_to_expiry}"
-            except (ValueError, TypeError):
-                exp_key = expiry
-                days_to_expiry = 0
+            # Calculate DTE once per expiry
+            info = expiry_info.get(expiry)
+            if info is None:
+                try:
+                    exp_date = datetime.strptime(expiry, "%Y-%m-%d")
+                    days_to_expiry = (exp_date - now).days
+                    exp_key = f"{expiry}:{days_to_expiry}"
+                except (ValueError, TypeError):
+                    exp_key = expiry
+                    days_to_expiry = 0
+                accepted = chain_filter.accepts_dte(days_to_expiry) if chain_filter else True
+                info = expiry_info[expiry] = (exp_key, days_to_expiry, accepted)
+            exp_key, days_to_expiry, accepted = info
+            if not accepted:
+                continue
+
+            if chain_filter:
+                spot = item.get("stockPrice") or item.get("spotPrice") or 0
+                try:
+                    if not chain_filter.accepts_strike(float(strike), spot):
+                        continue
+                except (ValueError, TypeError):
+                    continue
 
             # --- PROCESS CALL ---
-            call_obj = {
-                "putCall": "CALL",
-                "symbol": f"{item.get('ticker')}_{expiry}_C{strike}",
-                "description": f"{item.get('ticker')} {expiry} {strike} CALL",
-                "bid": item.get("callBidPrice", 0),
-                "ask": item.get("callAskPrice", 0),
-                "last": item.get("callPrice", 0), 
-                "mark": item.get("callValue", 0) or ((item.get("callBidPrice",0) + item.get("callAskPrice",0))/2), 
-                "totalVolume": item.get("callVolume", 0),
-                "openInterest": item.get("callOpenInterest", 0),
-                "volatility": item.get("callMidIv", 0) * 100 if item.get("callMidIv") else 0,
-                "delta": item.get("delta", 0),
-                "gamma": item.get("gamma", 0),
-                "theta": item.get("theta", 0),
-                "vega": item.get("vega", 0),
-                "rho": item.get("rho", 0),
-                "strikePrice": float(strike),
-                "expirationDate": expiry,
-                "daysToExpiration": days_to_expiry
-            }
-            
-            if call_obj['volatility'] == 0:
-                 call_obj['volatility'] = item.get("smvVol", 0) * 100 # Smoothed Vol?
+            if want_calls and (chain_filter is None or chain_filter.accepts_contract(
+                    item.get("callBidPrice", 0), item.get("callAskPrice", 0),
+                    item.get("callOpenInterest", 0), item.get("callVolume", 0))):
+                call_obj = {
+                    "putCall": "CALL",
+                    "symbol": f"{item.get('ticker')}_{expiry}_C{strike}",
+                    "description": f"{item.get('ticker')} {expiry} {strike} CALL",
+                    "bid": item.get("callBidPrice", 0),
+                    "ask": item.get("callAskPrice", 0),
+                    "last": item.get("callPrice", 0), 
+                    "mark": item.get("callValue", 0) or ((item.get("callBidPrice",0) + item.get("callAskPrice",0))/2), 
+                    "totalVolume": item.get("callVolume", 0),
+                    "openInterest": item.get("callOpenInterest", 0),
+                    "volatility": item.get("callMidIv", 0) * 100 if item.get("callMidIv") else 0,
+                    "delta": item.get("delta", 0),
+                    "gamma": item.get("gamma", 0),
+                    "theta": item.get("theta", 0),
+                    "vega": item.get("vega", 0),
+                    "rho": item.get("rho", 0),
+                    "strikePrice": float(strike),
+                    "expirationDate": expiry,
+                    "daysToExpiration": days_to_expiry
+                }
+                
+                if call_obj['volatility'] == 0:
+                     call_obj['volatility'] = item.get("smvVol", 0) * 100 # Smoothed Vol?
 
-            if exp_key not in call_map: call_map[exp_key] = {}
-            if strike not in call_map[exp_key]: call_map[exp_key][strike] = []
-            call_map[exp_key][strike].append(call_obj)
+                call_map.setdefault(exp_key, {}).setdefault(strike, []).append(call_obj)
 
             # --- PROCESS PUT ---
-            put_obj = {
-                "putCall": "PUT",
-                "symbol": f"{item.get('ticker')}_{expiry}_P{strike}",
-                "description": f"{item.get('ticker')} {expiry} {strike} PUT",
-                "bid": item.get("putBidPrice", 0),
-                "ask": item.get("putAskPrice", 0),
-                "last": item.get("putPrice", 0),
-                "mark": item.get("putValue", 0) or ((item.get("putBidPrice",0) + item.get("putAskPrice",0))/2),
-                "totalVolume": item.get("putVolume", 0),
-                "openInterest": item.get("putOpenInterest", 0),
-                "volatility": item.get("putMidIv", 0) * 100 if item.get("putMidIv") else 0,
-                "delta": -(abs(item.get("delta", 0))),
-                "gamma": item.get("gamma", 0),
-                "theta": item.get("theta", 0),
-                "vega": item.get("vega", 0),
-                "rho": -(item.get("rho", 0)),
-                "strikePrice": float(strike),
-                "expirationDate": expiry,
-                "daysToExpiration": days_to_expiry
-            }
-            
-            if put_obj['volatility'] == 0:
-                 put_obj['volatility'] = item.get("smvVol", 0) * 100
+            if want_puts and (chain_filter is None or chain_filter.accepts_contract(
+                    item.get("putBidPrice", 0), item.get("putAskPrice", 0),
+                    item.get("putOpenInterest", 0), item.get("putVolume", 0))):
+                put_obj = {
+                    "putCall": "PUT",
+                    "symbol": f"{item.get('ticker')}_{expiry}_P{strike}",
+                    "description": f"{item.get('ticker')} {expiry} {strike} PUT",
+                    "bid": item.get("putBidPrice", 0),
+                    "ask": item.get("putAskPrice", 0),
+                    "last": item.get("putPrice", 0),
+                    "mark": item.get("putValue", 0) or ((item.get("putBidPrice",0) + item.get("putAskPrice",0))/2),
+                    "totalVolume": item.get("putVolume", 0),
+                    "openInterest": item.get("putOpenInterest", 0),
+                    "volatility": item.get("putMidIv", 0) * 100 if item.get("putMidIv") else 0,
+                    "delta": -(abs(item.get("delta", 0))),
+                    "gamma": item.get("gamma", 0),
+                    "theta": item.get("theta", 0),
+                    "vega": item.get("vega", 0),
+                    "rho": -(item.get("rho", 0)),
+                    "strikePrice": float(strike),
+                    "expirationDate": expiry,
+                    "daysToExpiration": days_to_expiry
+                }
+                
+                if put_obj['volatility'] == 0:
+                     put_obj['volatility'] = item.get("smvVol", 0) * 100
 
-            if exp_key not in put_map: put_map[exp_key] = {}
-            if strike not in put_map[exp_key]: put_map[exp_key][strike] = []
-            put_map[exp_key][strike].append(put_obj)
+                put_map.setdefault(exp_key, {}).setdefault(strike, []).append(put_obj)
 
         return {
             "symbol": raw_list[0].get("ticker") if raw_list else "UNKNOWN",
@@ -486,7 +575,8 @@ class OratsAPI:
                 "mktWidthVol,iv30d,orHv20d,"
                 "stkPxChng1wk,stkPxChng1m,stkPxChng6m,"
                 "beta1y,daysToNextErn,impliedEarningsMove,"
-                "orIvXern20d,iv200Ma,pxAtmIv"
+                "orIvXern20d,iv200Ma,pxAtmIv,"
+                "divYield,divDate"  # Lets scanners skip per-ticker hist/cores
             )
 
         try:
@@ -13,7 +13,7 @@ if sys.stderr and hasattr(sys.stderr, 'reconfigure'):
 # Add project root to sys.path so 'backend' module is found
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from flask import Flask, jsonify, request, render_template, session, redirect, send_from_directory
+from flask import Flask, jsonify, request, render_template, session, redirect, send_from_directory, Response, stream_with_context
 from flask_cors import CORS
 try:
     from flask_limiter import Limiter
@@ -28,6 +28,7 @@ from backend.services.watchlist_service import WatchlistService
 from backend.security import Security
 from datetime import datetime
 import atexit
+import json
 import re
 
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -99,7 +100,7 @@ def get_scanner():
         try:
             logger.info("Initializing global ScannerService...")
             scanner_service = ScannerService()
-            logger.info("ScannerService initialized.")
+            logger.info(f"ScannerService initialized: {scanner_service.startup_report()}")
         except Exception as e:
             logger.error(f"Error initializing ScannerService: {e}")
             raise e
@@ -438,17 +439,43 @@ def scan_ticker_daily(ticker):
 
 @app.route('/api/tickers', methods=['GET'])
 def get_tickers():
-    """Get cached full ticker list for autocomplete"""
+    """Get cached full ticker list (gzip + ETag; prefer /api/tickers/search for autocomplete)"""
     try:
         service = get_scanner()
-        tickers = service.get_cached_tickers()
-        
+        body, gzipped, etag = service.get_ticker_index().payload()
+
+        if request.if_none_match.contains_weak(etag):
+            response = Response(status=304)
+        elif 'gzip' in request.accept_encodings:
+            response = Response(gzipped, mimetype='application/json')
+            response.headers['Content-Encoding'] = 'gzip'
+        else:
+            response = Response(body, mimetype='application/json')
+        response.set_etag(etag, weak=True)  # Same entity in gzip and identity encodings
+        response.headers['Vary'] = 'Accept-Encoding'
+        response.headers['Cache-Control'] = 'private, no-cache'
+        return response
+    except Exception as e:
+        logger.error(f"Error getting tickers: {e}")
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/api/tickers/search', methods=['GET'])
+def search_tickers():
+    """Autocomplete: top N tickers by symbol/company-name prefix, ranked by market cap"""
+    try:
+        query = request.args.get('q', '')
+        limit = request.args.get('limit', 8, type=int)
+        service = get_scanner()
         return jsonify({
             'success': True,
-            'tickers': tickers
+            'query': query,
+            'tickers': service.search_tickers(query, limit)
         })
     except Exception as e:
-        logger.error(f"Error getting tickers: {e}")
+        logger.error(f"Error searching tickers: {e}")
         return jsonify({
             'success': False,
             'error': str(e)
@@ -535,11 +562,14 @@ def get_history():
              return jsonify({'success': False, 'error': 'Not authenticated'}), 401
              
         db = get_db()
-        history = db.query(SearchHistory).filter_by(username=current_user).order_by(SearchHistory.last_searched.desc()).limit(15).all()
-        return jsonify({
-            'success': True,
-            'history': [h.ticker for h in history]
-        })
+        try:
+            history = db.query(SearchHistory).filter_by(username=current_user).order_by(SearchHistory.last_searched.desc()).limit(15).all()
+            return jsonify({
+                'success': True,
+                'history': [h.ticker for h in history]
+            })
+        finally:
+            db.close()
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
@@ -559,30 +589,33 @@ def add_history():
         if not re.match(r'^[$]?[A-Z]{1,9}([./][A-Z]{1,2})?$', ticker):
             return jsonify({'success': False, 'error': f'Invalid ticker format: {ticker}'}), 400
             
-        db = get_db()
         current_user = session.get('user')
         
         if not current_user:
              return jsonify({'success': False, 'error': 'Not authenticated'}), 401
              
-        # Check if exists for this user
-        existing = db.query(SearchHistory).filter_by(username=current_user, ticker=ticker).first()
-        if existing:
-            existing.last_searched = datetime.utcnow()
-        else:
-            new_entry = SearchHistory(username=current_user, ticker=ticker)
-            db.add(new_entry)
+        db = get_db()
+        try:
+            # Check if exists for this user
+            existing = db.query(SearchHistory).filter_by(username=current_user, ticker=ticker).first()
+            if existing:
+                existing.last_searched = datetime.utcnow()
+            else:
+                new_entry = SearchHistory(username=current_user, ticker=ticker)
+                db.add(new_entry)
             
-        db.commit()
-        
-        # Cleanup old entries (keep top 15 mostly recent PER USER)
-        total_count = db.query(SearchHistory).filter_by(username=current_user).count()
-        if total_count > 15:
-            # Delete oldest for this user
-            subquery = db.query(SearchHistory.id).filter_by(username=current_user).order_by(SearchHistory.last_searched.desc()).limit(15)
-            db.query(SearchHistory).filter(SearchHistory.username == current_user, ~SearchHistory.id.in_(subquery)).delete(synchronize_session=False)
             db.commit()
-            
+        
+            # Cleanup old entries (keep top 15 mostly recent PER USER)
+            total_count = db.query(SearchHistory).filter_by(username=current_user).count()
+            if total_count > 15:
+                # Delete oldest for this user
+                subquery = db.query(SearchHistory.id).filter_by(username=current_user).order_by(SearchHistory.last_searched.desc()).limit(15)
+                db.query(SearchHistory).filter(SearchHistory.username == current_user, ~SearchHistory.id.in_(subquery)).delete(synchronize_session=False)
+                db.commit()
+        finally:
+            db.close()
+
         return jsonify({'success': True})
     except Exception as e:
         logger.error(f"Error adding history: {e}")
@@ -666,6 +699,35 @@ def get_ai_analysis_route(ticker):
         logger.error(f"Error getting AI analysis: {e}")
         return jsonify({'success': False, 'error': str(e)}), 500
 
+@app.route('/api/analysis/ai/<ticker>/stream', methods=['POST'])
+def stream_ai_analysis_route(ticker):
+    """Stream AI-Reasoned Analysis as Server-Sent Events.
+
+    Same request body as /api/analysis/ai/<ticker>. Events: `status` (progress),
+    `token` ({text}) as the model writes, then one `result` (the same dict
+    ai_analysis carries) or `error` ({error}).
+    """
+    data = request.get_json() or {}
+    service = get_scanner()
+    events = service.stream_ai_analysis(
+        ticker,
+        strategy=data.get('strategy', 'LEAP'),
+        expiry_date=data.get('expiry'),
+        strike=data.get('strike'),
+        type=data.get('type'),
+    )
+
+    def generate():
+        try:
+            for event, payload in events:
+                yield f"event: {event}\ndata: {json.dumps(payload, default=str)}\n\n"
+        except Exception as e:
+            logger.error(f"Error streaming AI analysis: {e}")
+            yield f"event: error\ndata: {json.dumps({'error': str(e)})}\n\n"
+
+    return Response(stream_with_context(generate()), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
 # \u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550
 # Phase 3: APScheduler \u2014 Background Engine
 # \u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550
@@ -678,6 +740,10 @@ def init_scheduler(app):
       2. update_price_snapshots \u2014 every 40s  (market hours only)
       3. pre_market_bookend     \u2014 Mon-Fri 9:25 AM ET
       4. post_market_bookend    \u2014 Mon-Fri 4:05 PM ET
+      5. lifecycle_sync         \u2014 every 120s
+      6. feature_store          \u2014 Mon-Fri every 20 min 6:00-9:40 AM ET until built
+      7. market_context         \u2014 every MARKET_CONTEXT_REFRESH_SECONDS (frozen after close)
+      8. earnings_calendar      \u2014 Mon-Fri 8:00 AM ET (one market-wide Finnhub call)
     """
     try:
         from apscheduler.schedulers.background import BackgroundScheduler
@@ -752,21 +818,74 @@ def init_scheduler(app):
             max_instances=1,
         )
 
+        # Job 6: Feature store, pre-market (Mon-Fri). ORATS hist/dailies is T-1,
+        # so the previous session's bar appears overnight; each run is a no-op
+        # once the snapshot holds it, and retries while ORATS hasn't published
+        if Config.ENABLE_FEATURE_STORE:
+            from backend.services.feature_store import build_feature_store
+            scheduler.add_job(
+                func=lambda: build_feature_store(get_scanner(), max_tickers=Config.FEATURE_STORE_MAX_TICKERS),
+                trigger=CronTrigger(
+                    day_of_week='mon-fri',
+                    hour='6-9',
+                    minute='0,20,40',
+                    timezone=EASTERN,
+                ),
+                id='feature_store',
+                name='Pre-Market Feature Store (6:00-9:40 AM ET)',
+                replace_existing=True,
+                max_instances=1,
+            )
+
+        # Job 7: Shared SPY/QQQ/VIX/sector ETF quote snapshot. After the close
+        # one refresh captures closing prices, then the job is a no-op
+        from backend.services.market_context import market_context
+        scheduler.add_job(
+            func=lambda: market_context.refresh(monitor.orats),
+            trigger=IntervalTrigger(seconds=Config.MARKET_CONTEXT_REFRESH_SECONDS),
+            id='market_context',
+            name=f'Market Context ({Config.MARKET_CONTEXT_REFRESH_SECONDS}s)',
+            replace_existing=True,
+            max_instances=1,
+        )
+
+        # Job 8: Market-wide earnings index, rebuilt pre-market from one
+        # calendar request; scanners and exit logic read it without requests
+        from backend.api.finnhub import FinnhubAPI
+        from backend.services.earnings_calendar import earnings_calendar
+        finnhub = FinnhubAPI()
+        scheduler.add_job(
+            func=lambda: earnings_calendar.refresh(finnhub),
+            trigger=CronTrigger(
+                day_of_week='mon-fri',
+                hour=8,
+                minute=0,
+                timezone=EASTERN,
+            ),
+            id='earnings_calendar',
+            name='Earnings Calendar (8:00 AM ET)',
+            replace_existing=True,
+            max_instances=1,
+        )
+
         scheduler.start()
         atexit.register(lambda: scheduler.shutdown(wait=False))
 
         logger = logging.getLogger(__name__)
         logger.info(
-            "APScheduler started \u2014 5 jobs registered "
+            f"APScheduler started \u2014 {len(scheduler.get_jobs())} jobs registered "
             "(order sync 60s, snapshots 40s, bookends 9:25/16:05 ET, lifecycle 120s)"
         )
         logger.info(
-            "APScheduler started - 5 background jobs registered"
+            f"APScheduler started - {len(scheduler.get_jobs())} background jobs registered"
             "   \u2022 sync_tradier_orders  (every 60s)\n"
             "   \u2022 update_price_snapshots (every 40s)\n"
             "   \u2022 pre_market_bookend   (9:25 AM ET Mon-Fri)\n"
             "   \u2022 post_market_bookend  (4:05 PM ET Mon-Fri)\n"
             "   \u2022 lifecycle_sync       (every 120s)\n"
+            + ("   \u2022 feature_store        (6:00-9:40 AM ET Mon-Fri, until built)\n" if Config.ENABLE_FEATURE_STORE else "")
+            + f"   \u2022 market_context       (every {Config.MARKET_CONTEXT_REFRESH_SECONDS}s)\n"
+            + "   \u2022 earnings_calendar    (8:00 AM ET Mon-Fri)\n"
         )
 
     except ImportError:
@@ -783,6 +902,10 @@ def init_scheduler(app):
 # prevents duplicate jobs if the module is re-imported.
 init_scheduler(app)
 
+# Parse tickers.json / orats_universe.json off-thread now so the first
+# request doesn't (file reads only \u2014 clients are still built lazily)
+ScannerService.preload_universe()
+
 
 if __name__ == '__main__':
     app.run(
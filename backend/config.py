@@ -15,6 +15,7 @@ class Config:
     FMP_API_KEY = os.getenv('FMP_API_KEY')
     FINNHUB_API_KEY = os.getenv('FINNHUB_API_KEY')
     NEWSAPI_KEY = os.getenv('NEWSAPI_KEY')
+    ALPHAVANTAGE_API_KEY = os.getenv('ALPHAVANTAGE_API_KEY')
     
     # API Keys — Optional
     TRADIER_API_KEY = os.getenv('TRADIER_API_KEY')
@@ -43,6 +44,8 @@ class Config:
     
     # Database — Scanner (existing SQLite)
     DATABASE_URL = os.getenv('DATABASE_URL', 'sqlite:///./leap_scanner.db')
+    # SQLite: seconds a writer waits on a locked database before failing (WAL mode, see models.py)
+    SQLITE_BUSY_TIMEOUT_SECONDS = float(os.getenv('SQLITE_BUSY_TIMEOUT_SECONDS', 15))
     
     # Database — Paper Trading (App connects as app_user for RLS enforcement)
     # Dev: port 5433 (paper_trading_dev_db), Prod: port 5432 (paper_trading_db)
@@ -65,6 +68,30 @@ class Config:
     
     # Rate Limiting
     NEWS_CACHE_HOURS = 6  # cache news for 6 hours
+    NEWS_REFRESH_MINUTES = int(os.getenv('NEWS_REFRESH_MINUTES', 30))  # older cached news refreshes in background
+    NEWS_DEADLINE_SECONDS = float(os.getenv('NEWS_DEADLINE_SECONDS', 6))  # multi-provider news fan-out budget
+    NEWS_HTTP_TIMEOUT = 8  # per-request timeout for the news providers
+
+    # ORATS /cores snapshot (shared by all gunicorn workers, survives restarts)
+    CORES_SNAPSHOT_DIR = os.getenv('CORES_SNAPSHOT_DIR')  # default: backend/data/cores_snapshot
+
+    # Nightly feature store (built pre-market once ORATS publishes the T-1 bar, see feature_store.py)
+    ENABLE_FEATURE_STORE = os.getenv('ENABLE_FEATURE_STORE', 'True') == 'True'
+    FEATURE_STORE_DIR = os.getenv('FEATURE_STORE_DIR')    # default: backend/data/feature_store
+    HISTORY_STORE_DIR = os.getenv('HISTORY_STORE_DIR')    # default: backend/data/history_store
+    FEATURE_STORE_MAX_TICKERS = int(os.getenv('FEATURE_STORE_MAX_TICKERS', 500))
+
+    # Shared SPY/QQQ/VIX/sector ETF quote snapshot (market_context.py), refreshed while open
+    MARKET_CONTEXT_REFRESH_SECONDS = int(os.getenv('MARKET_CONTEXT_REFRESH_SECONDS', 60))
+
+    # Daily equity put/call series from /cores (Z-score history, see macro_signals.py)
+    PUT_CALL_HISTORY_PATH = os.getenv('PUT_CALL_HISTORY_PATH')  # default: backend/data/put_call_history.json
+
+    # Market-wide earnings index, rebuilt pre-market from one Finnhub call (earnings_calendar.py)
+    EARNINGS_CALENDAR_PATH = os.getenv('EARNINGS_CALENDAR_PATH')  # default: backend/data/earnings_calendar.json
+
+    # Compact snapshot of tickers.json + orats_universe.json, loaded off-thread (universe_store.py)
+    UNIVERSE_SNAPSHOT_PATH = os.getenv('UNIVERSE_SNAPSHOT_PATH')  # default: backend/data/universe.bin
 
     # G17: Maximum position limits
     MAX_POSITIONS_PER_TICKER = int(os.getenv('MAX_POSITIONS_PER_TICKER', 3))
@@ -84,6 +111,9 @@ class Config:
     ENABLE_MINERVINI_FILTER = os.getenv('ENABLE_MINERVINI_FILTER', 'True') == 'True'# S5
     ENABLE_VWAP_LEVELS = os.getenv('ENABLE_VWAP_LEVELS', 'True') == 'True'         # S7A
 
+    # Indicator engine: pure-NumPy kernels (indicator_kernels.py) instead of `ta` in hot paths
+    USE_NUMPY_INDICATORS = os.getenv('USE_NUMPY_INDICATORS', 'True') == 'True'
+
     @staticmethod
     def get_paper_db_url():
         """Get the paper trading database URL.
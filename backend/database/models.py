@@ -1,13 +1,61 @@
-from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, Boolean, Text
+from contextlib import contextmanager
+from sqlalchemy import create_engine, event, Column, Index, Integer, String, Float, DateTime, Boolean, Text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from datetime import datetime
 from backend.config import Config
 
+
+def create_scanner_engine(url):
+    """Engine for the scanner DB, safe to share across request and scan threads.
+
+    SQLite: connections may move between threads (each session still owns
+    one at a time), WAL lets readers run while another thread writes, and
+    busy_timeout makes a second writer wait instead of failing with
+    "database is locked".
+    """
+    if not url.startswith('sqlite'):
+        return create_engine(url, pool_pre_ping=True)
+
+    engine = create_engine(url, connect_args={'check_same_thread': False,
+                                              'timeout': Config.SQLITE_BUSY_TIMEOUT_SECONDS})
+
+    @event.listens_for(engine, 'connect')
+    def _sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.execute('PRAGMA journal_mode=WAL')
+            cursor.execute('PRAGMA synchronous=NORMAL')
+            cursor.execute(f'PRAGMA busy_timeout={int(Config.SQLITE_BUSY_TIMEOUT_SECONDS * 1000)}')
+        finally:
+            cursor.close()
+
+    return engine
+
+
 Base = declarative_base()
-engine = create_engine(Config.DATABASE_URL)
+engine = create_scanner_engine(Config.DATABASE_URL)
 SessionLocal = sessionmaker(bind=engine)
 
+
+@contextmanager
+def session_scope(session_factory=SessionLocal):
+    """Short-lived session for one unit of work (one request or scan task).
+
+    Commits on success, rolls back on error, always closes — sessions are
+    never shared between threads.
+    """
+    session = session_factory()
+    try:
+        yield session
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
+
 class Watchlist(Base):
     __tablename__ = 'watchlist'
     
@@ -19,9 +67,12 @@ class Watchlist(Base):
     
 class ScanResult(Base):
     __tablename__ = 'scan_results'
+    __table_args__ = (
+        Index('ix_scan_results_ticker_scan_date', 'ticker', 'scan_date'),  # Per-ticker history
+    )
     
     id = Column(Integer, primary_key=True)
-    scan_date = Column(DateTime, default=datetime.utcnow)
+    scan_date = Column(DateTime, default=datetime.utcnow, index=True)  # get_latest_results ordering
     ticker = Column(String(10), nullable=False)
     opportunity_score = Column(Float)
     technical_score = Column(Float)
@@ -32,7 +83,7 @@ class Opportunity(Base):
     __tablename__ = 'opportunities'
     
     id = Column(Integer, primary_key=True)
-    scan_result_id = Column(Integer)
+    scan_result_id = Column(Integer, index=True)
     ticker = Column(String(10), nullable=False)
     option_type = Column(String(4))  # CALL or PUT
     strike_price = Column(Float)
@@ -63,6 +114,18 @@ class NewsCache(Base):
     sentiment_score = Column(Float)
     cached_date = Column(DateTime, default=datetime.utcnow)
 
+class AIAnalysisCache(Base):
+    __tablename__ = 'ai_analysis_cache'
+
+    id = Column(Integer, primary_key=True)
+    cache_key = Column(String(64), nullable=False, unique=True, index=True)  # sha256 of the prompt inputs
+    ticker = Column(String(10), nullable=False)
+    strategy = Column(String(10))
+    model = Column(String(50))
+    result = Column(Text)  # JSON analyze_ticker() result
+    created_date = Column(DateTime, default=datetime.utcnow)
+    expires_at = Column(DateTime, nullable=False, index=True)
+
 class SearchHistory(Base):
     __tablename__ = 'search_history'
     
@@ -79,9 +142,15 @@ def init_db():
     """
     scanner_tables = [
         t for t in Base.metadata.sorted_tables
-        if t.name in ('watchlist', 'scan_results', 'opportunities', 'news_cache', 'search_history')
+        if t.name in ('watchlist', 'scan_results', 'opportunities', 'news_cache', 'search_history',
+                      'ai_analysis_cache')
     ]
     Base.metadata.create_all(engine, tables=scanner_tables)
+    # create_all skips tables that already exist, so add indexes introduced
+    # after a database was first created
+    for table in scanner_tables:
+        for index in table.indexes:
+            index.create(engine, checkfirst=True)
 
 def get_db():
     """Get database session.
@@ -200,6 +200,9 @@ if __name__ == "__main__":
     if universe:
         save_orats_universe(universe)
         enrich_tickers_json(universe)
+        # Pre-build the compact snapshot the scanner loads at startup
+        from backend.services.universe_store import UniverseStore
+        UniverseStore().reload()
         print_summary(universe)
     else:
         print("\n❌ Failed to fetch ORATS universe. Aborting.")
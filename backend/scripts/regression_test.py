@@ -408,11 +408,12 @@ def test_data_integrity(scanner):
     
     # 9e) Verify ORATS universe cache
     test_name = "ORATS Universe Cache"
-    if HybridScannerService._orats_universe:
-        universe_size = len(HybridScannerService._orats_universe)
-        has_aapl = 'AAPL' in HybridScannerService._orats_universe
-        has_spy = 'SPY' in HybridScannerService._orats_universe
-        has_spx = 'SPX' in HybridScannerService._orats_universe
+    orats_universe = HybridScannerService._universe.orats
+    if orats_universe:
+        universe_size = len(orats_universe)
+        has_aapl = 'AAPL' in orats_universe
+        has_spy = 'SPY' in orats_universe
+        has_spx = 'SPX' in orats_universe
         if universe_size > 1000 and has_aapl and has_spy:
             record_pass(test_name, f"{universe_size} tickers, AAPL={has_aapl}, SPY={has_spy}, SPX={has_spx}")
         else:
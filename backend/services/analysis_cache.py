@@ -0,0 +1,251 @@
+"""
+Analysis Cache — persistent AI analysis results
+===============================================
+ReasoningEngine.analyze_ticker sent a fresh Perplexity request on every
+Analyze click, even when the same ticker, strategy and expiry had just been
+analyzed with identical inputs.
+
+AnalysisCache stores finished analyses in the scanner DB (ai_analysis_cache):
+
+  - keyed on a fingerprint of everything that shapes the prompt — ticker,
+    strategy, expiry, requested strike/type, the context (floats rounded to
+    4 significant digits), model and the ET date (DTE is in the prompt)
+  - fields that tick all session are left out of the key (volumes, OI,
+    SMA-5, volume ratio/z-score) or bucketed (spot, VIX, greeks, RSI, ATR,
+    HV rank, BB bandwidth), so a re-analysis minutes later still hits
+  - expiry depends on the effective strategy: minutes for 0DTE, hours for LEAP
+  - concurrent identical requests share one in-flight LLM call
+  - errors are returned to every waiter but never stored
+"""
+
+import hashlib
+import json
+import logging
+import math
+import threading
+from datetime import datetime, timedelta
+
+from backend.database.models import AIAnalysisCache, SessionLocal
+from backend.utils.market_hours import now_eastern
+
+logger = logging.getLogger(__name__)
+
+ANALYSIS_TTL_SECONDS = {
+    '0DTE': 5 * 60,
+    'WEEKLY': 30 * 60,
+    'LEAP': 6 * 3600,
+}
+DEFAULT_TTL_SECONDS = 30 * 60
+INFLIGHT_WAIT_SECONDS = 120       # Covers analyze_ticker's 3 attempts x 30s timeout
+MAX_HEADLINES = 10                # The prompt only shows the first 10
+
+# Context fields that move intraday: dropped from the fingerprint, or bucketed.
+# RELATIVE steps are log-scale (0.005 = spot within ~0.5% shares a key);
+# ABSOLUTE steps suit 0-100 oscillators and ranks.
+RELATIVE, ABSOLUTE = 'relative', 'absolute'
+VOLATILE_CONTEXT_FIELDS = {
+    'technicals': ('sma_5', 'volume_ratio', 'volume_zscore'),
+    'option_greeks': ('volume', 'oi'),
+}
+BUCKETED_CONTEXT_FIELDS = {
+    'current_price': (RELATIVE, 0.005),
+    'vix_level': (RELATIVE, 0.02),
+    'vix': {'level': (RELATIVE, 0.02)},
+    'technicals': {
+        'rsi': (ABSOLUTE, 5),
+        'atr': (RELATIVE, 0.05),
+        'hv_rank': (ABSOLUTE, 5),
+        'bb_bandwidth_pct': (ABSOLUTE, 10),
+    },
+    'option_greeks': {greek: (RELATIVE, 0.05) for greek in ('delta', 'gamma', 'theta', 'iv')},
+}
+
+
+def _normalize(value):
+    """JSON-stable form of prompt inputs; small float jitter maps to the same key."""
+    if isinstance(value, bool) or value is None or isinstance(value, (int, str)):
+        return value
+    if isinstance(value, float):
+        return float(f"{value:.4g}")
+    if isinstance(value, dict):
+        return {str(k): _normalize(v) for k, v in value.items() if v not in (None, '', [], {})}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v) for v in value]
+    return str(value)
+
+
+def _bucket(value, spec):
+    """Bucket of `value` (numbers or pre-formatted strings); other values pass through.
+
+    RELATIVE buckets are (sign, log-magnitude index), so x, 1/x and -x differ.
+    """
+    kind, step = spec
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return value
+    if not math.isfinite(number):
+        return value
+    if kind == ABSOLUTE:
+        return round(number / step)
+    if number == 0:
+        return [0, 0]
+    return [1 if number > 0 else -1, round(math.log(abs(number)) / math.log1p(step))]
+
+
+def _stable_context(context, buckets=BUCKETED_CONTEXT_FIELDS):
+    """Copy of `context` without intraday-volatile fields, the rest bucketed."""
+    stable = dict(context)
+    for section, fields in VOLATILE_CONTEXT_FIELDS.items():
+        if isinstance(stable.get(section), dict):
+            stable[section] = {k: v for k, v in stable[section].items() if k not in fields}
+    for field, spec in buckets.items():
+        value = stable.get(field)
+        if isinstance(spec, dict):
+            if isinstance(value, dict):
+                stable[field] = _stable_context(value, spec)
+        elif value is not None:
+            stable[field] = _bucket(value, spec)
+    return stable
+
+
+class _Flight:
+    """One in-progress analysis that identical requests wait on."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+
+
+class AnalysisCache:
+    """Fingerprint-keyed, DB-backed cache of analyze_ticker() results."""
+
+    def __init__(self, session_factory=SessionLocal, ttl_seconds=None):
+        """
+        Args:
+            session_factory: SQLAlchemy session factory for ai_analysis_cache
+                             (None shares in-flight calls but persists nothing)
+            ttl_seconds: Per-strategy overrides of ANALYSIS_TTL_SECONDS
+        """
+        self.session_factory = session_factory
+        self.ttl_seconds = dict(ANALYSIS_TTL_SECONDS, **(ttl_seconds or {}))
+        self._lock = threading.Lock()
+        self._inflight = {}               # cache_key -> _Flight
+
+    @staticmethod
+    def fingerprint(ticker, strategy, expiry_date, data, context, model) -> str:
+        context = _stable_context(context or {})
+        if context.get('headlines'):
+            context['headlines'] = list(context['headlines'])[:MAX_HEADLINES]
+        payload = {
+            'ticker': (ticker or '').upper(),
+            'strategy': strategy,
+            'expiry': str(expiry_date) if expiry_date else None,
+            'data': _normalize(data or {}),
+            'context': _normalize(context),
+            'model': model,
+            'day': now_eastern().date().isoformat(),
+        }
+        blob = json.dumps(payload, sort_keys=True, default=str)
+        return hashlib.sha256(blob.encode('utf-8')).hexdigest()
+
+    def get_or_compute(self, key, compute, model=None):
+        """Cached result for `key`, else compute() — shared with concurrent callers."""
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+
+        flight, leader = self.join(key)
+        if not leader:
+            result = self.wait(flight)
+            return result if result is not None else compute()  # Leader failed or overran the wait
+
+        result = None
+        try:
+            result = compute()
+            return result
+        finally:
+            self.finish(key, flight, result, model)
+
+    # ── In-flight calls ─────────────────────────────────────────────
+
+    def join(self, key):
+        """(flight, leader) for `key`; the leader must call finish() once it has a result."""
+        with self._lock:
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = _Flight()
+        return flight, leader
+
+    @staticmethod
+    def wait(flight):
+        """The leader's result, or None if it failed or overran INFLIGHT_WAIT_SECONDS."""
+        flight.done.wait(INFLIGHT_WAIT_SECONDS)
+        return flight.result
+
+    def finish(self, key, flight, result, model=None):
+        """Hand the leader's result (None = failed) to its waiters and store it."""
+        try:
+            if result is not None:
+                flight.result = result
+                self.put(key, result, model)
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            flight.done.set()
+
+    def ttl_for(self, strategy) -> int:
+        return self.ttl_seconds.get(strategy, DEFAULT_TTL_SECONDS)
+
+    # ── ai_analysis_cache table ─────────────────────────────────────
+
+    def get(self, key):
+        """Unexpired result for `key` (marked cached=True), or None."""
+        if self.session_factory is None:
+            return None
+        session = self.session_factory()
+        try:
+            row = (session.query(AIAnalysisCache)
+                   .filter(AIAnalysisCache.cache_key == key,
+                           AIAnalysisCache.expires_at > datetime.utcnow())
+                   .first())
+            if row is None:
+                return None
+            result = json.loads(row.result)
+            result['cached'] = True
+            result['cached_at'] = row.created_date.isoformat() + 'Z' if row.created_date else None
+            return result
+        except Exception as e:
+            logger.debug(f"AI analysis cache read failed: {e}")
+            return None
+        finally:
+            session.close()
+
+    def put(self, key, result, model=None):
+        """Store a successful result; errors are ignored."""
+        if self.session_factory is None or not isinstance(result, dict) or result.get('error'):
+            return
+        session = self.session_factory()
+        try:
+            now = datetime.utcnow()
+            strategy = result.get('strategy')
+            # Drop this key's previous row and anything expired in one pass
+            session.query(AIAnalysisCache).filter(
+                (AIAnalysisCache.cache_key == key) | (AIAnalysisCache.expires_at <= now)
+            ).delete(synchronize_session=False)
+            session.add(AIAnalysisCache(
+                cache_key=key,
+                ticker=(result.get('ticker') or '')[:10],
+                strategy=strategy,
+                model=model,
+                result=json.dumps(result, default=str),
+                created_date=now,
+                expires_at=now + timedelta(seconds=self.ttl_for(strategy)),
+            ))
+            session.commit()
+        except Exception as e:
+            session.rollback()
+            logger.debug(f"AI analysis cache write failed: {e}")
+        finally:
+            session.close()
@@ -24,9 +24,11 @@ class BatchManager:
         self._lock = threading.Lock()
         self._last_request_time = 0.0
 
-    def fetch_option_chains(self, tickers: List[str]) -> Dict[str, Any]:
+    def fetch_option_chains(self, tickers: List[str], chain_filter=None) -> Dict[str, Any]:
         """
         Fetch option chains for a list of tickers concurrently.
+        :param chain_filter: Optional ChainFilter; its DTE window is pushed into
+                             each /live/strikes request (see OratsAPI.get_option_chain).
         """
         results = {}
         processed = 0
@@ -38,7 +40,7 @@ class BatchManager:
         with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
             # Create a dictionary to map future to ticker
             future_to_ticker = {
-                executor.submit(self._fetch_single_safe, ticker): ticker 
+                executor.submit(self._fetch_single_safe, ticker, chain_filter): ticker 
                 for ticker in tickers
             }
             
@@ -61,7 +63,7 @@ class BatchManager:
         logger.info(f"BatchManager: Finished. Fetched {len(results)}/{total} in {elapsed:.2f}s.")
         return results
 
-    def _fetch_single_safe(self, ticker):
+    def _fetch_single_safe(self, ticker, chain_filter=None):
         """
         Wrapper to fetch a single ticker safely with rate limiting.
         """
@@ -72,7 +74,7 @@ class BatchManager:
                 if elapsed < self.delay:
                     time.sleep(self.delay - elapsed)
                 self._last_request_time = time.time()
-            return self.orats_api.get_option_chain(ticker)
+            return self.orats_api.get_option_chain(ticker, chain_filter=chain_filter)
         except Exception as e:
             logger.error(f"Error in thread for {ticker}: {e}")
             return None
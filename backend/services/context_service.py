@@ -15,37 +15,29 @@ Three main operations:
 import logging
 from datetime import datetime
 
+from backend.services.market_context import market_context as shared_market_context
+from backend.services.symbol_master import symbol_master as shared_symbol_master
+
 log = logging.getLogger(__name__)
 
 
 class ContextService:
     """Collects and persists rich trading context for backtesting analysis."""
 
-    # Sector ETF mapping for market regime context
-    SECTOR_ETFS = {
-        'XLK': ['AAPL', 'MSFT', 'NVDA', 'AMD', 'AVGO', 'ORCL', 'CRM', 'ADBE', 'CSCO', 'ACN',
-                 'INTC', 'IBM', 'QCOM', 'TXN', 'AMAT', 'MU', 'LRCX', 'KLAC', 'SNPS', 'CDNS',
-                 'NOW', 'PANW', 'CRWD', 'FTNT', 'PLTR', 'DELL', 'HPE', 'MRVL', 'ON', 'NXPI'],
-        'XLF': ['JPM', 'BAC', 'WFC', 'GS', 'MS', 'C', 'BLK', 'SCHW', 'AXP', 'SPGI'],
-        'XLV': ['UNH', 'JNJ', 'LLY', 'PFE', 'ABBV', 'MRK', 'TMO', 'ABT', 'DHR', 'BMY'],
-        'XLY': ['AMZN', 'TSLA', 'HD', 'MCD', 'NKE', 'SBUX', 'TJX', 'LOW', 'BKNG', 'CMG'],
-        'XLC': ['META', 'GOOGL', 'GOOG', 'NFLX', 'DIS', 'CMCSA', 'T', 'VZ', 'TMUS', 'CHTR'],
-        'XLE': ['XOM', 'CVX', 'COP', 'EOG', 'SLB', 'MPC', 'PSX', 'VLO', 'OXY', 'HAL'],
-        'XLI': ['RTX', 'HON', 'UPS', 'BA', 'CAT', 'DE', 'LMT', 'GE', 'MMM', 'UNP'],
-        'XLP': ['PG', 'KO', 'PEP', 'COST', 'WMT', 'PM', 'MO', 'CL', 'MDLZ', 'EL'],
-        'XLU': ['NEE', 'DUK', 'SO', 'D', 'AEP', 'SRE', 'EXC', 'XEL', 'ED', 'WEC'],
-        'XLRE': ['PLD', 'AMT', 'CCI', 'EQIX', 'PSA', 'SPG', 'O', 'WELL', 'DLR', 'AVB'],
-        'XLB': ['LIN', 'APD', 'SHW', 'ECL', 'FCX', 'NEM', 'NUE', 'VMC', 'MLM', 'DOW'],
-    }
-
-    def __init__(self, orats_api=None, scanner=None):
+    def __init__(self, orats_api=None, scanner=None, market_context=None, symbol_master=None):
         """
         Args:
             orats_api: OratsAPI instance for fetching quotes and Greeks
             scanner: HybridScannerService instance for technical analysis data
+            market_context: MarketContextService supplying SPY/VIX/sector quotes
+                            (default: the process-wide snapshot)
+            symbol_master: SymbolMaster for ticker -> sector ETF
+                           (default: the process-wide instance)
         """
         self.orats = orats_api
         self.scanner = scanner
+        self.market_context = market_context or shared_market_context
+        self.symbol_master = symbol_master or shared_symbol_master
 
     # ─── Public API ───────────────────────────────────────────────
 
@@ -237,7 +229,11 @@ class ContextService:
         return snapshot
 
     def _get_market_regime(self, ticker):
-        """Capture macro market conditions: SPY quote, VIX, sector ETF."""
+        """Capture macro market conditions: SPY quote, VIX, sector ETF.
+
+        Quotes come from the shared market context snapshot, so a trade
+        entry or exit doesn't pay for benchmark quotes.
+        """
         regime = {}
 
         if not self.orats:
@@ -245,7 +241,7 @@ class ContextService:
 
         # SPY (broad market proxy)
         try:
-            spy_quote = self.orats.get_quote('SPY')
+            spy_quote = self.market_context.quote('SPY', self.orats)
             if spy_quote and spy_quote.get('price'):
                 regime['spy'] = {
                     'price': spy_quote['price'],
@@ -257,7 +253,7 @@ class ContextService:
 
         # VIX (volatility index)
         try:
-            vix_quote = self.orats.get_quote('VIX')
+            vix_quote = self.market_context.quote('VIX', self.orats)
             if vix_quote and vix_quote.get('price'):
                 regime['vix'] = {
                     'price': vix_quote['price'],
@@ -270,7 +266,7 @@ class ContextService:
         sector_etf = self._find_sector_etf(ticker)
         if sector_etf:
             try:
-                sector_quote = self.orats.get_quote(sector_etf)
+                sector_quote = self.market_context.quote(sector_etf, self.orats)
                 if sector_quote and sector_quote.get('price'):
                     regime['sector'] = {
                         'etf': sector_etf,
@@ -330,12 +326,8 @@ class ContextService:
     # ─── Helpers ──────────────────────────────────────────────────
 
     def _find_sector_etf(self, ticker):
-        """Find the sector ETF for a given ticker."""
-        ticker_upper = ticker.upper()
-        for etf, members in self.SECTOR_ETFS.items():
-            if ticker_upper in members:
-                return etf
-        return None
+        """Find the sector ETF for a given ticker (symbol master, O(1))."""
+        return self.symbol_master.sector_etf(ticker)
 
     def _find_option_in_chain(self, chain, option_type, strike, expiry):
         """Find a specific option contract in a standardized chain response."""
@@ -0,0 +1,383 @@
+"""
+Cores Snapshot Store — persistent, cross-worker cache for ORATS /cores
+======================================================================
+The /cores universe (~5,000 tickers, T-1 data) used to live in a class
+attribute on HybridScannerService, so every gunicorn worker fetched its own
+copy, lost it on restart, and filtered sectors with a linear pass.
+
+Layout on disk (default: backend/data/cores_snapshot/):
+
+    CURRENT                      → name of the live snapshot directory
+    2026-10-16-1760620000/       → one directory per (tradeDate, fetch time)
+        meta.json                → columns, row count, index maps
+        ticker.npy  bestEtf.npy  → one column per .npy file (memory-mapped)
+        ivPctile1y.npy  ...
+
+Rows are sorted by (bestEtf, sectorName, ticker) at write time, so:
+  - a broad-sector lookup (bestEtf → XLK) is a contiguous row slice
+  - an industry lookup (sectorName) is a precomputed row-index list
+  - a single-ticker lookup is one dict hit
+
+Workers publish a new snapshot by writing a fresh directory and atomically
+swapping CURRENT; readers notice the swap with one os.stat() per call.
+"""
+
+import json
+import logging
+import math
+import os
+import shutil
+import threading
+import time
+
+import numpy as np
+
+from backend.config import Config
+from backend.utils.market_hours import previous_trading_day
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'cores_snapshot')
+
+# String columns (everything else is stored as float64, NaN = missing);
+# dates such as divDate must be listed here or they come back as None
+STRING_COLUMNS = ('ticker', 'tradeDate', 'sectorName', 'bestEtf', 'divDate')
+
+# How long a worker waits for another worker's in-flight refresh
+REFRESH_LOCK_WAIT = 60      # seconds
+REFRESH_LOCK_STALE = 180    # a lock older than this is assumed abandoned
+
+
+class CoresSnapshot:
+    """Read-only, memory-mapped view over one persisted /cores snapshot."""
+
+    def __init__(self, path, meta, columns):
+        self.path = path
+        self.trade_date = meta.get('trade_date')
+        self.fetched_at = meta.get('fetched_at', 0)
+        self._meta = meta
+        self._columns = columns                       # name → np.ndarray (mmap)
+        self._int_columns = set(meta.get('int_columns', []))
+        self._string_columns = set(meta.get('string_columns', STRING_COLUMNS))
+        self._etf_slices = meta.get('etf_slices', {})             # 'XLK' → [start, end)
+        self._sector_rows = meta.get('sector_rows', {})           # 'semiconductors' → [rows]
+        self._ticker_rows = meta.get('ticker_rows', {})           # 'AAPL' → row
+
+    def __len__(self):
+        return int(self._meta.get('rows', 0))
+
+    # ── Row materialization ─────────────────────────────────────────
+
+    def _row(self, i):
+        record = {}
+        for name, col in self._columns.items():
+            value = col[i]
+            if name in self._string_columns:
+                record[name] = str(value) or None
+            else:
+                value = float(value)
+                if math.isnan(value):
+                    record[name] = None
+                elif name in self._int_columns:
+                    record[name] = int(value)
+                else:
+                    record[name] = value
+        return record
+
+    def column(self, name):
+        """Raw column array (memory-mapped; numeric columns use NaN for missing), or None."""
+        return self._columns.get(name)
+
+    def records(self, rows=None):
+        """Materialize dicts for the given row indices (default: all rows)."""
+        if rows is None:
+            rows = range(len(self))
+        return [self._row(i) for i in rows]
+
+    # ── Index lookups ───────────────────────────────────────────────
+
+    def get(self, ticker):
+        """Return the cores record for one ticker, or None."""
+        row = self._ticker_rows.get((ticker or '').replace('$', '').strip().upper())
+        return self._row(row) if row is not None else None
+
+    def field(self, ticker, name):
+        """One column value for one ticker without materializing the row (None if missing)."""
+        row = self._ticker_rows.get((ticker or '').replace('$', '').strip().upper())
+        col = self._columns.get(name)
+        if row is None or col is None:
+            return None
+        value = col[row]
+        if name in self._string_columns:
+            return str(value) or None
+        value = float(value)
+        return None if math.isnan(value) else value
+
+    def etf_slice(self, etf):
+        """Row range [start, end) of the tickers whose bestEtf is `etf` (empty if none)."""
+        start, end = self._etf_slices.get((etf or '').upper(), (0, 0))
+        return slice(start, end)
+
+    def sector_names(self):
+        """Distinct industry names (lower-cased sectorName) with their row indices."""
+        return dict(self._sector_rows)
+
+    def select_rows(self, term, etf_codes=()):
+        """Row indices matching a sector term — same semantics as get_cores_bulk():
+
+        a record matches if its bestEtf is one of `etf_codes` (broad sector)
+        OR its sectorName contains `term` (industry drill-down).
+        """
+        term_lower = (term or '').lower().strip()
+        rows = []
+        for etf in etf_codes:
+            start, end = self._etf_slices.get(etf.upper(), (0, 0))
+            rows.extend(range(start, end))
+        if term_lower:
+            # Substring match over ~70 distinct industry names, not 5,000 rows
+            for name, name_rows in self._sector_rows.items():
+                if term_lower in name:
+                    rows.extend(name_rows)
+        return sorted(set(rows))
+
+    def select(self, term, etf_codes=()):
+        """Materialized records for a sector term (see select_rows)."""
+        return self.records(self.select_rows(term, etf_codes))
+
+
+class CoresSnapshotStore:
+    """Persist /cores snapshots to a columnar directory shared by all workers."""
+
+    label = 'Cores'  # Log prefix (subclasses store other per-ticker tables)
+
+    def __init__(self, base_dir=None, ttl=3600, string_columns=STRING_COLUMNS):
+        self.base_dir = base_dir or DEFAULT_DIR
+        self.ttl = ttl
+        self.string_columns = tuple(string_columns)
+        self._lock = threading.Lock()
+        self._snapshot = None
+        self._current_stamp = None
+
+    # ── Paths ───────────────────────────────────────────────────────
+
+    @property
+    def _current_file(self):
+        return os.path.join(self.base_dir, 'CURRENT')
+
+    @property
+    def _refresh_lock_file(self):
+        return os.path.join(self.base_dir, '.refresh.lock')
+
+    # ── Read side ───────────────────────────────────────────────────
+
+    def current(self):
+        """Return the live snapshot, reloading if another worker swapped CURRENT."""
+        try:
+            st = os.stat(self._current_file)
+        except FileNotFoundError:
+            return None
+        stamp = (st.st_mtime_ns, st.st_size)
+        with self._lock:
+            if self._snapshot is not None and stamp == self._current_stamp:
+                return self._snapshot
+            try:
+                with open(self._current_file, 'r', encoding='utf-8') as f:
+                    name = f.read().strip()
+                self._snapshot = self._load_dir(os.path.join(self.base_dir, name))
+                self._current_stamp = stamp
+            except Exception as e:
+                logger.warning(f"{self.label} snapshot load failed: {e}")
+                self._snapshot = None
+            return self._snapshot
+
+    def _load_dir(self, path):
+        with open(os.path.join(path, 'meta.json'), 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        columns = {
+            name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode='r')
+            for name in meta['columns']
+        }
+        return CoresSnapshot(path, meta, columns)
+
+    def is_fresh(self, snapshot):
+        """Fresh if it already holds the newest T-1 tradeDate, or was fetched within TTL.
+
+        The TTL arm stops a refetch storm in the morning window before ORATS
+        publishes the new tradeDate.
+        """
+        if snapshot is None:
+            return False
+        if snapshot.trade_date and snapshot.trade_date >= previous_trading_day().isoformat():
+            return True
+        return time.time() - snapshot.fetched_at < self.ttl
+
+    # ── Write side ──────────────────────────────────────────────────
+
+    def save(self, records):
+        """Write records as a new columnar snapshot and publish it via CURRENT."""
+        if not records:
+            return self.current()
+
+        os.makedirs(self.base_dir, exist_ok=True)
+        records = sorted(
+            (r for r in records if r.get('ticker')),
+            key=lambda r: ((r.get('bestEtf') or '').upper(),
+                           (r.get('sectorName') or '').lower(),
+                           r.get('ticker')),
+        )
+        trade_date = max((r.get('tradeDate') or '') for r in records) or 'unknown'
+        fetched_at = time.time()
+        name = f"{trade_date}-{int(fetched_at)}-{os.getpid()}"
+        tmp_path = os.path.join(self.base_dir, f".tmp-{name}")
+        os.makedirs(tmp_path, exist_ok=True)
+
+        column_names = []
+        for r in records:
+            for key in r:
+                if key not in column_names:
+                    column_names.append(key)
+
+        int_columns = []
+        for col in column_names:
+            values = [r.get(col) for r in records]
+            if col in self.string_columns:
+                arr = np.array([str(v) if v is not None else '' for v in values], dtype=str)
+            else:
+                arr = np.array([_to_float(v) for v in values], dtype=np.float64)
+                present = [v for v in values if v is not None]
+                if present and all(isinstance(v, int) and not isinstance(v, bool) for v in present):
+                    int_columns.append(col)
+            np.save(os.path.join(tmp_path, f"{col}.npy"), arr)
+
+        # Precomputed index maps
+        etf_slices = {}
+        sector_rows = {}
+        ticker_rows = {}
+        for i, r in enumerate(records):
+            etf = (r.get('bestEtf') or '').upper()
+            if etf:
+                start, _ = etf_slices.get(etf, (i, i))
+                etf_slices[etf] = (start, i + 1)
+            sector_name = (r.get('sectorName') or '').lower()
+            if sector_name:
+                sector_rows.setdefault(sector_name, []).append(i)
+            ticker_rows[r['ticker'].upper()] = i
+
+        meta = {
+            'trade_date': trade_date,
+            'fetched_at': fetched_at,
+            'rows': len(records),
+            'columns': column_names,
+            'int_columns': int_columns,
+            'string_columns': list(self.string_columns),
+            'etf_slices': etf_slices,
+            'sector_rows': sector_rows,
+            'ticker_rows': ticker_rows,
+        }
+        with open(os.path.join(tmp_path, 'meta.json'), 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
+
+        final_path = os.path.join(self.base_dir, name)
+        os.replace(tmp_path, final_path)
+
+        # Atomic publish: readers see either the old or the new CURRENT
+        tmp_current = f"{self._current_file}.{os.getpid()}"
+        with open(tmp_current, 'w', encoding='utf-8') as f:
+            f.write(name)
+        os.replace(tmp_current, self._current_file)
+        logger.info(f"{self.label} snapshot saved: {len(records)} tickers, tradeDate {trade_date}")
+
+        self._prune(keep=name)
+        return self.current()
+
+    def _prune(self, keep, retain=2):
+        """Delete old snapshot directories (keeps the newest `retain`)."""
+        try:
+            dirs = sorted(
+                d for d in os.listdir(self.base_dir)
+                if not d.startswith('.') and d != 'CURRENT' and not d.startswith('CURRENT.')
+                and os.path.isdir(os.path.join(self.base_dir, d))
+            )
+            for d in dirs[:-retain]:
+                if d != keep:
+                    # On Windows an mmapped file can't be removed — try again next refresh
+                    shutil.rmtree(os.path.join(self.base_dir, d), ignore_errors=True)
+        except OSError:
+            pass
+
+    # ── Refresh coordination ────────────────────────────────────────
+
+    def get_or_refresh(self, fetch):
+        """Return a fresh snapshot, calling `fetch()` → list[dict] at most once across workers.
+
+        One worker takes an O_EXCL lock file and fetches; the others wait for
+        CURRENT to change. If the fetch fails, a stale snapshot is still served.
+        """
+        snapshot = self.current()
+        if self.is_fresh(snapshot):
+            return snapshot
+
+        os.makedirs(self.base_dir, exist_ok=True)
+        if self._acquire_refresh_lock():
+            try:
+                snapshot = self.current()  # Another worker may have just finished
+                if self.is_fresh(snapshot):
+                    return snapshot
+                records = fetch()
+                if records:
+                    return self.save(records)
+                logger.warning("Cores refresh returned no data")
+            except Exception as e:
+                logger.warning(f"Cores refresh failed: {e}")
+            finally:
+                self._release_refresh_lock()
+            if snapshot is not None:
+                logger.info("Using stale /cores snapshot")
+            return snapshot
+
+        # Someone else is refreshing — wait for their CURRENT swap
+        deadline = time.time() + REFRESH_LOCK_WAIT
+        while time.time() < deadline:
+            time.sleep(0.5)
+            latest = self.current()
+            if self.is_fresh(latest):
+                return latest
+        return self.current()
+
+    def _acquire_refresh_lock(self):
+        path = self._refresh_lock_file
+        try:
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            os.write(fd, str(os.getpid()).encode())
+            os.close(fd)
+            return True
+        except FileExistsError:
+            try:
+                if time.time() - os.path.getmtime(path) > REFRESH_LOCK_STALE:
+                    os.remove(path)  # Abandoned by a crashed worker
+                    return self._acquire_refresh_lock()
+            except OSError:
+                pass
+            return False
+
+    def _release_refresh_lock(self):
+        try:
+            os.remove(self._refresh_lock_file)
+        except OSError:
+            pass
+
+
+def _to_float(value):
+    if value is None or isinstance(value, bool):
+        return float('nan')
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float('nan')
+
+
+# Process-wide store, shared by the scanner and the symbol master. Data is
+# T-1, so a snapshot holding the previous trading day is fresh until the next
+# session closes; the TTL is the fallback while ORATS publishes the new tradeDate.
+CORES_CACHE_TTL = 3600
+cores_store = CoresSnapshotStore(base_dir=Config.CORES_SNAPSHOT_DIR, ttl=CORES_CACHE_TTL)
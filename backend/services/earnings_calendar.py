@@ -0,0 +1,209 @@
+"""
+Earnings Calendar — daily market-wide earnings index
+====================================================
+scan_weekly asked Finnhub's calendar/earnings for one symbol at a time, so a
+75-ticker sector scan made 75 requests for the same 7-day window, although
+the endpoint returns the whole market's calendar when no symbol is given.
+
+EarningsCalendar keeps that market-wide answer as an index:
+
+  - one bulk calendar/earnings call per trading day (scheduled pre-market)
+    covering EARNINGS_HORIZON_DAYS, reduced to symbol -> next report
+    (date, bmo/amc hour, EPS estimate)
+  - persisted as JSON next to the other runtime caches, so restarts and
+    other workers read it without a request: a reader whose index is not
+    today's re-reads the file when it changed on disk (the scheduler job
+    runs in one process only under gunicorn --preload)
+  - scanners, the AI context and ExitManager answer earnings-proximity
+    questions from the index; a reader that passes a Finnhub client
+    rebuilds a stale index inline once, concurrent readers share that call
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass
+from datetime import date, timedelta
+from typing import Dict, List, Optional
+
+from backend.config import Config
+from backend.utils.market_hours import now_eastern
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CALENDAR_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'earnings_calendar.json')
+EARNINGS_HORIZON_DAYS = 30
+STALE_RETRY_SECONDS = 3600        # After a failed rebuild, serve the old index this long
+
+
+@dataclass
+class EarningsEvent:
+    """Next scheduled report for one symbol."""
+    symbol: str
+    date: str                           # YYYY-MM-DD
+    hour: str = ''                      # bmo / amc / dmh ('' when unannounced)
+    eps_estimate: Optional[float] = None
+
+    def days_until(self, today: date = None) -> int:
+        today = today or now_eastern().date()
+        return (date.fromisoformat(self.date) - today).days
+
+    def as_calendar_entry(self) -> dict:
+        """Same keys as a FinnhubAPI.get_earnings_calendar() entry."""
+        return {'symbol': self.symbol, 'date': self.date, 'hour': self.hour,
+                'epsEstimate': self.eps_estimate}
+
+
+def build_index(entries, today: date) -> Dict[str, EarningsEvent]:
+    """Reduce calendar entries to the earliest report on or after `today` per symbol."""
+    index = {}
+    for entry in entries or []:
+        symbol = (entry.get('symbol') or '').upper()
+        day = entry.get('date')
+        if not symbol or not day:
+            continue
+        try:
+            if date.fromisoformat(day) < today:
+                continue
+        except ValueError:
+            continue
+        current = index.get(symbol)
+        if current is None or day < current.date:
+            index[symbol] = EarningsEvent(symbol=symbol, date=day, hour=entry.get('hour') or '',
+                                          eps_estimate=entry.get('epsEstimate'))
+    return index
+
+
+class EarningsCalendar:
+    """Symbol -> next earnings report, rebuilt from one bulk Finnhub call per trading day."""
+
+    def __init__(self, path=None, horizon_days=EARNINGS_HORIZON_DAYS):
+        self.path = path or Config.EARNINGS_CALENDAR_PATH or DEFAULT_CALENDAR_PATH
+        self.horizon_days = horizon_days
+        self._events: Optional[Dict[str, EarningsEvent]] = None
+        self._as_of: Optional[str] = None     # ET date the index was built for
+        self._stamp = None                    # (mtime_ns, size) of the file last read/written
+        self._failed_at = 0.0
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+
+    # ── Read side ───────────────────────────────────────────────────
+
+    def is_current(self) -> bool:
+        return self._as_of == now_eastern().date().isoformat()
+
+    def next_earnings(self, symbol, finnhub_api=None) -> Optional[EarningsEvent]:
+        """Next report for `symbol` within the horizon (None if none is scheduled)."""
+        events = self._index(finnhub_api)
+        event = events.get((symbol or '').replace('$', '').strip().upper())
+        if event is None or event.days_until() < 0:
+            return None
+        return event
+
+    def days_to_earnings(self, symbol, finnhub_api=None) -> Optional[int]:
+        event = self.next_earnings(symbol, finnhub_api)
+        return event.days_until() if event else None
+
+    def upcoming(self, symbol, within_days, finnhub_api=None) -> List[dict]:
+        """Calendar entries for `symbol` in the next `within_days` days.
+
+        Drop-in for get_earnings_calendar(symbol=..., to_date=today + within_days).
+        """
+        event = self.next_earnings(symbol, finnhub_api)
+        if event is None or event.days_until() > within_days:
+            return []
+        return [event.as_calendar_entry()]
+
+    def _index(self, finnhub_api=None) -> Dict[str, EarningsEvent]:
+        with self._lock:
+            if self._events is None or not self.is_current():
+                self._reload_if_changed()
+            current = self.is_current()
+            events = self._events
+        if current or finnhub_api is None or time.time() - self._failed_at < STALE_RETRY_SECONDS:
+            return events
+        self.refresh(finnhub_api)
+        with self._lock:
+            return self._events
+
+    # ── Refresh ─────────────────────────────────────────────────────
+
+    def refresh(self, finnhub_api, force=False) -> bool:
+        """Rebuild the index from one market-wide calendar call. Skipped if already built today."""
+        with self._refresh_lock:
+            with self._lock:
+                self._reload_if_changed()  # Another process may have refreshed already
+            if not force and self.is_current():
+                return True
+            today = now_eastern().date()
+            entries = finnhub_api.get_earnings_calendar(
+                from_date=today.isoformat(),
+                to_date=(today + timedelta(days=self.horizon_days)).isoformat(),
+            )
+            if entries is None:
+                self._failed_at = time.time()
+                logger.warning("Earnings calendar refresh failed; keeping the previous index")
+                return False
+
+            events = build_index(entries, today)
+            with self._lock:
+                self._events = events
+                self._as_of = today.isoformat()
+            self._failed_at = 0.0
+            self._save()
+            logger.info(f"Earnings calendar: {len(events)} symbols reporting in the next "
+                        f"{self.horizon_days} days (1 request)")
+            return True
+
+    def clear(self):
+        with self._lock:
+            self._events = None
+            self._as_of = None
+
+    # ── Persistence ─────────────────────────────────────────────────
+
+    def _file_stamp(self):
+        try:
+            st = os.stat(self.path)
+            return st.st_mtime_ns, st.st_size
+        except OSError:
+            return None
+
+    def _reload_if_changed(self):
+        """Re-read the file if never read or rewritten since (caller holds self._lock)."""
+        stamp = self._file_stamp()
+        if self._events is None or (stamp is not None and stamp != self._stamp):
+            self._load(stamp)
+
+    def _load(self, stamp=None):
+        """Populate from disk (caller holds self._lock)."""
+        self._stamp = stamp
+        self._events = {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self._events = {s: EarningsEvent(**e) for s, e in data.get('events', {}).items()}
+            self._as_of = data.get('as_of')
+        except (OSError, ValueError, TypeError, AttributeError):
+            pass
+
+    def _save(self):
+        with self._lock:
+            data = {'as_of': self._as_of,
+                    'events': {s: asdict(e) for s, e in self._events.items()}}
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp, self.path)
+            with self._lock:
+                self._stamp = self._file_stamp()
+        except OSError as e:
+            logger.warning(f"Earnings calendar not persisted: {e}")
+
+
+# Process-wide index shared by the scanners, AI context and exit logic
+earnings_calendar = EarningsCalendar()
@@ -0,0 +1,256 @@
+"""
+Feature Store — nightly per-ticker technical features for the ORATS universe
+============================================================================
+Trend signal, HV rank, Minervini stage, RS vs SPY and ATR only change when a
+new daily bar closes, yet every scan recomputed them from raw history.
+
+ORATS hist/dailies is T-1, so a session's bar is only published the next
+morning. build_feature_store() therefore runs pre-market (every 20 minutes
+from 6:00 AM ET until it succeeds) and targets feature_session(), the
+previous trading day — the same session FeatureStore.is_fresh() demands:
+
+  0. skips when the published snapshot already holds that session, and
+     retries later when SPY's hist/dailies does not have its bar yet
+  1. picks the covered universe from the /cores snapshot (liquid options names)
+  2. refreshes each ticker's daily bars in the local HistoryStore
+     (backend/data/history_store/<TICKER>.npz, columnar OHLCV)
+  3. computes features in one IndicatorPanel pass (per-ticker for the rest)
+  4. publishes them as a columnar snapshot (backend/data/feature_store/),
+     using the same CURRENT-swap layout as the /cores snapshot
+
+Scanners read a ticker's features with scanner_utils.get_ticker_features()
+and call patch_live_bar() to apply the live price to the last bar, so SMA
+trend and RS are current without touching history. Consumers today: the
+LEAP scan's trend gate (rejects the wrong-direction pass before any API
+call), the weekly scan's RS vs SPY (no SPY history fetch) and the sector
+ranker, which hands each pick its record. HV rank, ATR and Minervini are
+stored but not substituted: both scans still build the full indicator
+suite for the technical score, which yields them in the same pass (the
+live-price frame revises them in O(1)).
+"""
+
+import logging
+import os
+import threading
+from datetime import datetime, timezone
+
+import numpy as np
+
+from backend.analysis.indicator_frame import IndicatorFrameCache
+from backend.analysis.indicator_panel import prime_indicator_frames
+from backend.analysis.technical_indicators import TechnicalIndicators
+from backend.config import Config
+from backend.services.cores_store import STRING_COLUMNS, CoresSnapshotStore
+from backend.utils.market_hours import previous_trading_day
+
+logger = logging.getLogger(__name__)
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data')
+DEFAULT_FEATURE_DIR = os.path.join(DATA_DIR, 'feature_store')
+DEFAULT_HISTORY_DIR = os.path.join(DATA_DIR, 'history_store')
+
+FEATURE_STRING_COLUMNS = STRING_COLUMNS + ('trend_signal', 'minervini_stage')
+HISTORY_COLUMNS = ('datetime', 'open', 'high', 'low', 'close', 'volume')
+FEATURE_UNIVERSE_MIN_OPT_VOLUME = 100  # Same options-liquidity floor as the sector ranker
+
+
+def feature_session(day=None):
+    """Session whose bar a feature build targets: the newest ORATS hist (T-1) bar."""
+    return previous_trading_day(day)
+
+
+def _last_bar_date(history):
+    candles = (history or {}).get('candles')
+    if not candles:
+        return None
+    # Same UTC reading of the candle timestamp as TechnicalIndicators.prepare_dataframe()
+    return datetime.fromtimestamp(candles[-1]['datetime'] / 1000, tz=timezone.utc).date()
+
+
+class FeatureStore(CoresSnapshotStore):
+    """Columnar per-ticker feature table; fresh when it holds feature_session()'s bar."""
+
+    label = 'Feature'
+
+    def __init__(self, base_dir=None, ttl=0):
+        super().__init__(base_dir=base_dir or DEFAULT_FEATURE_DIR, ttl=ttl,
+                         string_columns=FEATURE_STRING_COLUMNS)
+
+    def is_fresh(self, snapshot, session=None):
+        """Fresh if it holds the bar of `session` (default feature_session()) or later."""
+        if snapshot is None or not snapshot.trade_date:
+            return False
+        session = session or feature_session()
+        return snapshot.trade_date >= session.isoformat()
+
+
+class HistoryStore:
+    """Daily OHLCV per ticker as one compressed columnar .npz file."""
+
+    def __init__(self, base_dir=None):
+        self.base_dir = base_dir or DEFAULT_HISTORY_DIR
+        self._lock = threading.Lock()
+
+    def _path(self, ticker):
+        return os.path.join(self.base_dir, f"{ticker.replace('$', '').upper()}.npz")
+
+    def load(self, ticker):
+        """Return {'candles': [...], 'symbol': ticker} or None if not stored."""
+        try:
+            with np.load(self._path(ticker)) as data:
+                cols = [data[name].tolist() for name in HISTORY_COLUMNS]
+        except (OSError, KeyError, ValueError):
+            return None
+        candles = [dict(zip(HISTORY_COLUMNS, row)) for row in zip(*cols)]
+        return {'candles': candles, 'symbol': ticker, 'empty': not candles}
+
+    def save(self, ticker, history):
+        candles = (history or {}).get('candles') or []
+        if not candles:
+            return
+        os.makedirs(self.base_dir, exist_ok=True)
+        arrays = {'datetime': np.array([c['datetime'] for c in candles], dtype=np.int64)}
+        for name in HISTORY_COLUMNS[1:]:
+            arrays[name] = np.array([c.get(name) for c in candles], dtype=np.float64)
+        # Write-then-rename so readers never see a partial file
+        tmp = f"{self._path(ticker)}.{os.getpid()}.tmp.npz"
+        with self._lock:
+            np.savez_compressed(tmp, **arrays)
+            os.replace(tmp, self._path(ticker))
+
+
+def features_from_frame(frame, cores=None):
+    """Flatten an IndicatorFrame into one feature-store record."""
+    ind = frame.indicators or {}
+    close = frame.df['Close'].to_numpy(dtype=np.float64)
+    ma = (ind.get('moving_averages') or {}).get('values') or {}
+    minervini = ind.get('minervini') or {}
+    sma_50 = float(close[-50:].mean()) if len(close) >= 50 else None
+    sma_200 = ma.get('sma_200')
+    cores = cores or {}
+    return {
+        'ticker': frame.ticker,
+        'tradeDate': frame.df.index[-1].date().isoformat(),
+        'bestEtf': cores.get('bestEtf'),
+        'sectorName': cores.get('sectorName'),
+        'bars': len(close),
+        'close': float(close[-1]),
+        'close_5d_ago': float(close[-6]) if len(close) >= 6 else None,
+        'sma_50': sma_50,
+        'sma_200': float(sma_200) if sma_200 is not None else None,
+        'trend_signal': (ind.get('moving_averages') or {}).get('signal'),
+        'rsi': _float((ind.get('rsi') or {}).get('value')),
+        'atr': _float(frame.atr),
+        'hv_rank': _float(frame.hv_rank),
+        'minervini_score': minervini.get('score'),
+        'minervini_stage': minervini.get('stage'),
+        'rs_vs_spy': _float(frame.relative_strength),
+    }
+
+
+def patch_live_bar(features, live_price):
+    """Apply a live price to the last bar of a feature record (returns a copy).
+
+    Same convention as the weekly scan: the live quote replaces the last
+    Close, so each SMA moves by (live - close) / window and RS vs SPY is
+    recomputed from the close 5 bars back.
+    """
+    if not features or not live_price:
+        return features
+    patched = dict(features)
+    close = features.get('close')
+    delta = live_price - close if close else 0.0
+    for key, window in (('sma_50', 50), ('sma_200', 200)):
+        if patched.get(key) is not None:
+            patched[key] = patched[key] + delta / window
+    if patched.get('sma_50') is not None and patched.get('sma_200') is not None:
+        patched['trend_signal'] = TechnicalIndicators.moving_average_signal(
+            live_price, patched['sma_50'], patched['sma_200'])
+    base = features.get('close_5d_ago')
+    if base and features.get('rs_vs_spy') is not None and close:
+        # rs = (stock 5-bar return - SPY 5-bar return) * 100; only the stock leg moves
+        patched['rs_vs_spy'] = features['rs_vs_spy'] + (live_price - close) / base * 100
+    patched['close'] = live_price
+    return patched
+
+
+def trend_gate_price(features):
+    """Close and the long-term SMA the LEAP direction filter compares it to."""
+    sma = features.get('sma_200')
+    if sma is None:
+        sma = features.get('sma_50')
+    return features.get('close'), sma
+
+
+def build_feature_store(scanner, feature_store=None, history_store=None, max_tickers=500, session=None):
+    """Pre-market job: refresh local histories and publish the feature snapshot.
+
+    Targets `session` (default feature_session()). Returns the number of
+    tickers written — 0 when the snapshot is already current or ORATS has
+    not published that session's bar yet (the scheduler retries).
+    """
+    orats_api = getattr(scanner.batch_manager, 'orats_api', None)
+    if orats_api is None:
+        logger.warning("Feature store: ORATS unavailable, skipping")
+        return 0
+    feature_store = feature_store or type(scanner)._feature_store
+    history_store = history_store or HistoryStore(Config.HISTORY_STORE_DIR)
+    session = session or feature_session()
+
+    if feature_store.is_fresh(feature_store.current(), session):
+        logger.info(f"Feature store: snapshot already holds {session}, skipping")
+        return 0
+    # One cheap probe before fetching the whole universe
+    spy = orats_api.get_history_batch(['SPY']).get('SPY')
+    spy_bar = _last_bar_date(spy)
+    if spy_bar is None or spy_bar < session:
+        logger.info(f"Feature store: hist/dailies has no {session} bar yet (SPY last {spy_bar}), will retry")
+        return 0
+
+    snapshot = type(scanner)._cores_store.get_or_refresh(lambda: orats_api.get_cores_bulk(sector=None))
+    if snapshot is None:
+        logger.warning("Feature store: /cores snapshot unavailable, skipping")
+        return 0
+    universe = [r for r in snapshot.records()
+                if (r.get('avgOptVolu20d') or 0) >= FEATURE_UNIVERSE_MIN_OPT_VOLUME]
+    universe.sort(key=lambda r: r.get('avgOptVolu20d') or 0, reverse=True)
+    cores_by_ticker = {r['ticker']: r for r in universe[:max_tickers]}
+    tickers = list(cores_by_ticker)
+    logger.info(f"\U0001f5c3\ufe0f Feature store: refreshing {len(tickers)} tickers")
+
+    histories = orats_api.get_history_batch([t for t in tickers if t != 'SPY'])
+    if 'SPY' in cores_by_ticker:
+        histories['SPY'] = spy
+    else:
+        history_store.save('SPY', spy)
+    for ticker, history in histories.items():
+        history_store.save(ticker, history)
+    for ticker in tickers:
+        if ticker not in histories:
+            stored = history_store.load(ticker)  # Keep yesterday's bars if today's fetch failed
+            if stored:
+                histories[ticker] = stored
+
+    ti = scanner.technical_analyzer
+    cache = IndicatorFrameCache(maxsize=max(len(histories), 1))
+    prime_indicator_frames(ti, histories, benchmark_history=spy, cache=cache)
+
+    spy_df = ti.prepare_dataframe(spy) if spy else None
+    records = []
+    for ticker, history in histories.items():
+        try:
+            frame = cache.get_or_build(ti, ticker, history)
+            if frame is None:
+                continue
+            if frame.relative_strength is None and spy_df is not None:
+                frame.relative_strength = ti.calculate_relative_strength(frame.df, spy_df)
+            records.append(features_from_frame(frame, cores_by_ticker.get(ticker)))
+        except Exception as e:
+            logger.warning(f"Feature store: {ticker} failed: {e}")
+
+    feature_store.save(records)
+    return len(records)
+
+
+def _float(value):
+    return float(value) if value is not None else None
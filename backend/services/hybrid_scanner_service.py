@@ -13,15 +13,12 @@ The public API contract is unchanged — all existing callers (app.py routes,
 batch_manager, etc.) continue to call the same method names on this class.
 """
 
-import os
-import json
 import logging
+import threading
 import time
-from datetime import datetime, timedelta
 
 from backend.api.tradier import TradierAPI
 from backend.api.fmp import FMPAPI
-from backend.api.free_news import FreeNewsAPIs
 from backend.api.finnhub import FinnhubAPI
 from backend.analysis.technical_indicators import TechnicalIndicators
 from backend.analysis.sentiment_analyzer import SentimentAnalyzer
@@ -29,11 +26,22 @@ from backend.analysis.options_analyzer import OptionsAnalyzer
 from backend.analysis.exit_manager import ExitManager
 from backend.services.watchlist_service import WatchlistService
 from backend.services.batch_manager import BatchManager
+from backend.services.cores_store import cores_store
+from backend.services.feature_store import FeatureStore
+from backend.services.market_context import market_context
+from backend.services.news_cache import NewsSentimentCache
+from backend.services.earnings_calendar import earnings_calendar
+from backend.services.analysis_cache import AnalysisCache
+from backend.services.result_writer import ScanResultWriter
+from backend.services.news_aggregator import NewsAggregator
+from backend.services.universe_store import universe_store
+from backend.services.symbol_master import symbol_master
 from backend.database.models import ScanResult, Opportunity, NewsCache, SessionLocal
 from backend.services.reasoning_engine import ReasoningEngine
 from backend.analysis.regime_detector import RegimeDetector, VIXRegime
-from backend.analysis.macro_signals import MacroSignals
+from backend.analysis.macro_signals import MacroSignals, PutCallHistory
 from backend.analysis.sector_analysis import SectorAnalysis
+from backend.analysis.benchmark_history import benchmark_cache
 from backend.config import Config
 
 # Sub-module imports (refactored from this file)
@@ -48,6 +56,7 @@ from backend.services.scanner_utils import (
     save_scan_results,
     get_latest_results as _get_latest_results,
     get_ai_analysis as _get_ai_analysis,
+    stream_ai_analysis as _stream_ai_analysis,
     sanitize_for_json,
     get_sentiment_score as _get_sentiment_score,
     get_detailed_analysis as _get_detailed_analysis,
@@ -57,6 +66,37 @@ from backend.services.scanner_utils import (
 logger = logging.getLogger(__name__)
 
 
+_UNBUILT = object()
+
+
+class _component:
+    """Client built on first attribute access (timed for the startup report).
+
+    A non-data descriptor like functools.cached_property: the built value
+    lands in the instance __dict__, so later reads never reach here and
+    tests can still assign a stub directly.
+    """
+
+    def __init__(self, factory):
+        self.factory = factory
+        self.__doc__ = factory.__doc__
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        with instance._build_lock:
+            value = instance.__dict__.get(self.name, _UNBUILT)
+            if value is _UNBUILT:
+                start = time.perf_counter()
+                value = self.factory(instance)
+                instance._component_timings[self.name] = round(time.perf_counter() - start, 3)
+                instance.__dict__[self.name] = value
+        return value
+
+
 class HybridScannerService:
     """Scanner service using ORATS + Finnhub for options analysis.
 
@@ -64,150 +104,176 @@ class HybridScannerService:
     maintaining the same public API contract for all callers.
     """
 
-    _ticker_cache = []
-    _orats_universe = None      # Loaded from orats_universe.json
-    _spy_history = None         # F11 FIX: class-level cache (shared across instances)
-
-    # SMART SECTOR SCAN: Session cache for ORATS /cores data
-    # Data is T-1 (prior trading day) so caching for 1 hour is safe.
-    # Multiple sector scans in the same session reuse one API call.
-    _cores_cache = None
-    _cores_cache_time = 0
-    CORES_CACHE_TTL = 3600      # 1 hour in seconds
+    # Ticker list, autocomplete index and ORATS universe, loaded off-thread — see universe_store.py
+    _universe = universe_store
+    # O(1) symbol -> sector / industry / sector ETF / market cap / ORATS coverage — see symbol_master.py
+    _symbol_master = symbol_master
+    # SPY/QQQ/sector ETF/VIX histories, refreshed on trading-day rollover (benchmark_history.py)
+    _benchmarks = benchmark_cache
+
+    # SMART SECTOR SCAN: ORATS /cores snapshot, persisted to disk and shared
+    # across gunicorn workers and with the symbol master (see cores_store.py)
+    _cores_store = cores_store
+    # Nightly per-ticker features (trend, HV rank, Minervini, RS, ATR) — see feature_store.py
+    _feature_store = FeatureStore(base_dir=Config.FEATURE_STORE_DIR)
+    # Read-through Finnhub news/sentiment backed by the NewsCache table — see news_cache.py
+    _news_cache = NewsSentimentCache()
+    # Market-wide next-earnings index, one Finnhub call per day — see earnings_calendar.py
+    _earnings_calendar = earnings_calendar
+    # Fingerprint-keyed AI analyses in the scanner DB, shared in-flight calls — see analysis_cache.py
+    _analysis_cache = AnalysisCache()
+    # Scanner DB: every task opens its own short-lived session (models.session_scope),
+    # so concurrent scans from different request threads never share one
+    session_factory = SessionLocal
+    # Scan results / opportunities / news rows, bulk-written once per scan batch — see result_writer.py
+    _result_writer = ScanResultWriter(session_factory=SessionLocal)
 
     # ═══════════════════════════════════════════════════════════════════════
     #  INITIALIZATION
     # ═══════════════════════════════════════════════════════════════════════
 
     def __init__(self):
+        """Cheap: clients are built on first use, universe data loads in the background."""
+        start = time.perf_counter()
+        self._build_lock = threading.RLock()
+        self._component_timings = {}
         self.yahoo_api = None  # REMOVED (Strict Mode)
-        self.tradier_api = TradierAPI()
-        self.fmp_api = FMPAPI()
-        self.finnhub_api = FinnhubAPI()
-        self.news_api = FreeNewsAPIs()
-        self.technical_analyzer = TechnicalIndicators()
-        self.sentiment_analyzer = SentimentAnalyzer()
-        self.options_analyzer = OptionsAnalyzer()
-        self.exit_manager = ExitManager()
-        self.reasoning_engine = ReasoningEngine()
-        self.watchlist_service = WatchlistService()
-        self.batch_manager = BatchManager()
-        self.db = SessionLocal()
-
-        # --- Trading System Enhancements (S1-S7A) ---
-        orats_ref = self.batch_manager.orats_api if hasattr(self.batch_manager, 'orats_api') else None
-        self.regime_detector = RegimeDetector(orats_api=orats_ref) if Config.ENABLE_VIX_REGIME else None
-        self.macro_signals = MacroSignals(
-            orats_api=orats_ref,
-            fmp_api_key=Config.FMP_API_KEY
+        self.preload_universe()
+        self._init_seconds = round(time.perf_counter() - start, 3)
+        logger.info(f"ScannerService constructed in {self._init_seconds * 1000:.0f}ms "
+                    f"(clients lazy, universe {'ready' if self._universe.ready else 'loading'})")
+
+    @classmethod
+    def preload_universe(cls):
+        """Start loading tickers/ORATS universe off-thread (idempotent, no network)."""
+        cls._universe.start()
+
+    def startup_report(self):
+        """Seconds spent constructing the service, each client built so far, and the universe load."""
+        return {
+            'init_seconds': self._init_seconds,
+            'components': dict(self._component_timings),
+            'universe_ready': self._universe.ready,
+            'universe': dict(self._universe.timings),
+        }
+
+    # ── Clients (built on first access) ─────────────────────────────
+
+    @_component
+    def tradier_api(self):
+        return TradierAPI()
+
+    @_component
+    def fmp_api(self):
+        return FMPAPI()
+
+    @_component
+    def finnhub_api(self):
+        return FinnhubAPI()
+
+    @_component
+    def news_api(self):
+        return NewsAggregator()
+
+    @_component
+    def technical_analyzer(self):
+        return TechnicalIndicators()
+
+    @_component
+    def sentiment_analyzer(self):
+        return SentimentAnalyzer()
+
+    @_component
+    def options_analyzer(self):
+        return OptionsAnalyzer()
+
+    @_component
+    def exit_manager(self):
+        return ExitManager(earnings_calendar=self._earnings_calendar)
+
+    @_component
+    def reasoning_engine(self):
+        return ReasoningEngine(cache=self._analysis_cache)
+
+    @_component
+    def watchlist_service(self):
+        return WatchlistService()
+
+    @_component
+    def batch_manager(self):
+        return BatchManager()
+
+    # --- Trading System Enhancements (S1-S7A) ---
+
+    def _orats_ref(self):
+        return self.batch_manager.orats_api if hasattr(self.batch_manager, 'orats_api') else None
+
+    @_component
+    def regime_detector(self):
+        return RegimeDetector(
+            orats_api=self._orats_ref(), market_context=market_context
+        ) if Config.ENABLE_VIX_REGIME else None
+
+    @_component
+    def macro_signals(self):
+        return MacroSignals(
+            orats_api=self._orats_ref(),
+            fmp_api_key=Config.FMP_API_KEY,
+            cores_store=self._cores_store,
+            history=PutCallHistory(Config.PUT_CALL_HISTORY_PATH),
         ) if Config.ENABLE_PUT_CALL_RATIO else None
-        self.sector_analysis = SectorAnalysis(orats_api=orats_ref) if Config.ENABLE_SECTOR_MOMENTUM else None
-
-        # Check configuration
-        self.use_tradier = self.tradier_api.is_configured()
-        # P3-NEW-4: Schwab removed — ORATS is the primary data source
-        self.use_orats = self.batch_manager.orats_api.is_configured() if hasattr(self.batch_manager, 'orats_api') else False
 
-        # Initialize Ticker Cache if empty
-        if not HybridScannerService._ticker_cache:
-            self._refresh_ticker_cache()
+    @_component
+    def sector_analysis(self):
+        return SectorAnalysis(
+            orats_api=self._orats_ref(), cores_store=self._cores_store,
+            symbol_master=self._symbol_master,
+        ) if Config.ENABLE_SECTOR_MOMENTUM else None
 
-        # Load ORATS universe for coverage checks
-        if HybridScannerService._orats_universe is None:
-            self._load_orats_universe()
+    # Check configuration
+    @_component
+    def use_tradier(self):
+        return self.tradier_api.is_configured()
 
-        if self.use_orats:
+    @_component
+    def use_orats(self):
+        # P3-NEW-4: Schwab removed — ORATS is the primary data source
+        configured = self._orats_ref().is_configured() if self._orats_ref() is not None else False
+        if configured:
             logger.info("ORATS API configured - Primary Source (History + Options)")
         else:
             logger.warning("ORATS API NOT configured - Critical Error for Full Switch")
+        return configured
 
     # ═══════════════════════════════════════════════════════════════════════
     #  TICKER CACHE & UNIVERSE
     # ═══════════════════════════════════════════════════════════════════════
 
     def _refresh_ticker_cache(self):
-        """Load tickers from local JSON file (backend/data/tickers.json)"""
-        logger.info("Loading Ticker Cache...")
-
-        local_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'tickers.json')
-
-        try:
-            with open(local_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-
-            # Check age
-            last_updated_str = data.get('last_updated')
-            if last_updated_str:
-                last_updated = datetime.fromisoformat(last_updated_str)
-                age_days = (datetime.now() - last_updated).days
-
-                if age_days > 90:
-                    logger.warning(f"Ticker list is {age_days} days old (>90 days)")
-                    logger.warning("Run 'python backend/scripts/refresh_tickers.py' to update")
-                else:
-                    logger.info(f"Ticker list age: {age_days} days (updated {last_updated.strftime('%Y-%m-%d')})")
-
-            tickers = data.get('tickers', [])
-
-            # Normalize format
-            filtered = []
-            for t in tickers:
-                filtered.append({
-                    'symbol': t.get('symbol', '').upper(),
-                    'name': t.get('name', ''),
-                    'exchange': t.get('exchange', 'US'),
-                    'sector': t.get('sector'),
-                    'marketCap': t.get('marketCap', 0),
-                    'volume': t.get('volume', 0)
-                })
-
-            HybridScannerService._ticker_cache = filtered
-            logger.info(f"Loaded {len(filtered)} tickers from local cache")
-
-        except FileNotFoundError:
-            logger.error(f"Ticker file not found: {local_path}")
-            logger.warning("Run 'python backend/scripts/refresh_tickers.py' to create it")
-            HybridScannerService._ticker_cache = []
-        except Exception as e:
-            logger.error(f"Error loading tickers: {e}")
-            HybridScannerService._ticker_cache = []
+        """Reload tickers.json / orats_universe.json (snapshot rebuilt if they changed)"""
+        HybridScannerService._universe.reload()
 
     def get_cached_tickers(self):
-        return HybridScannerService._ticker_cache
-
-    def _load_orats_universe(self):
-        """Load ORATS ticker universe from local cache for O(1) coverage lookups."""
-        orats_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'orats_universe.json')
-        try:
-            with open(orats_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            universe = set(data.get('tickers', {}).keys())
-            HybridScannerService._orats_universe = universe
-
-            # Check age
-            last_updated = data.get('last_updated', '')
-            if last_updated:
-                updated_dt = datetime.fromisoformat(last_updated)
-                age_days = (datetime.now() - updated_dt).days
-                if age_days > 7:
-                    logger.warning(f"ORATS universe cache is {age_days} days old. Run 'python backend/scripts/refresh_tickers_v3.py'")
-                else:
-                    logger.info(f"ORATS universe: {len(universe)} tickers (cache age: {age_days} days)")
-            else:
-                logger.info(f"ORATS universe: {len(universe)} tickers loaded")
-        except FileNotFoundError:
-            logger.warning("ORATS universe cache not found. Run 'python backend/scripts/refresh_tickers_v3.py'")
-            HybridScannerService._orats_universe = set()
-        except Exception as e:
-            logger.warning(f"Error loading ORATS universe: {e}")
-            HybridScannerService._orats_universe = set()
+        return HybridScannerService._universe.tickers
+
+    def get_ticker_index(self):
+        return HybridScannerService._universe.index
+
+    def search_tickers(self, query, limit=8):
+        """Autocomplete: top `limit` tickers matching a symbol or company-name prefix."""
+        return HybridScannerService._universe.index.search(query, limit)
+
+    def get_orats_universe(self):
+        """Frozen set of ORATS-covered symbols (empty if the cache file is missing)."""
+        return HybridScannerService._universe.orats
 
     def _is_orats_covered(self, ticker):
         """Check if a ticker is in the ORATS universe (O(1) lookup)."""
-        if not HybridScannerService._orats_universe:
+        universe = self.get_orats_universe()
+        if not universe:
             return True  # If no universe loaded, don't block
         clean = ticker.replace('$', '').strip().upper()
-        return clean in HybridScannerService._orats_universe
+        return clean in universe
 
     def _normalize_ticker(self, ticker):
         """Normalize ticker symbol (uppercase, strip whitespace)."""
@@ -218,19 +284,26 @@ class HybridScannerService:
     #  SCANNING — delegated to sub-modules
     # ═══════════════════════════════════════════════════════════════════════
 
-    def scan_ticker(self, ticker, strict_mode=True, pre_fetched_data=None, direction='CALL', pre_fetched_history=None):
+    def scan_ticker(self, ticker, strict_mode=True, pre_fetched_data=None, direction='CALL', pre_fetched_history=None,
+                    pre_fetched_cores=None, pre_fetched_features=None):
         """Scan a single ticker for LEAP opportunities. Delegates to scanner_leaps.
         
         Args:
             pre_fetched_history: Optional pre-fetched price history dict from
                                 batch get_history_batch(). If provided, skips
                                 the per-ticker ORATS history API call.
+            pre_fetched_cores: Optional ORATS /cores record for the ticker.
+                               If complete, skips the per-ticker hist/cores call.
+            pre_fetched_features: Optional nightly feature record (feature_store.py).
         """
-        return scan_ticker_leaps(self, ticker, strict_mode, pre_fetched_data, direction, pre_fetched_history)
+        return scan_ticker_leaps(self, ticker, strict_mode, pre_fetched_data, direction, pre_fetched_history,
+                                 pre_fetched_cores, pre_fetched_features)
 
-    def scan_weekly_options(self, ticker, weeks_out=0, strategy_tag="WEEKLY", pre_fetched_data=None):
+    def scan_weekly_options(self, ticker, weeks_out=0, strategy_tag="WEEKLY", pre_fetched_data=None,
+                            pre_fetched_cores=None, pre_fetched_features=None):
         """Scan a ticker for weekly options opportunities. Delegates to scanner_weekly."""
-        return scan_weekly(self, ticker, weeks_out, strategy_tag, pre_fetched_data)
+        return scan_weekly(self, ticker, weeks_out, strategy_tag, pre_fetched_data, pre_fetched_cores,
+                           pre_fetched_features)
 
     def scan_0dte_options(self, ticker):
         """Scan a ticker for 0DTE options. Delegates to scanner_weekly."""
@@ -245,11 +318,11 @@ class HybridScannerService:
         return _scan_sector_top_picks(self, sector, min_volume, min_market_cap, limit, weeks_out, industry)
 
     def _get_cores_cached(self, sector=None):
-        """Return cached ORATS /cores data, refreshing if stale.
+        """Return ORATS /cores data from the shared snapshot, refreshing if stale.
 
-        SMART SECTOR SCAN: Caches the full /cores universe response so
-        multiple sector scans in one session only make ONE API call.
-        Data is T-1 (prior trading day close) so hourly caching is safe.
+        SMART SECTOR SCAN: The full /cores universe is fetched once per
+        trading day (by whichever worker gets there first) and persisted as a
+        columnar snapshot, so restarts and other workers reuse it.
 
         Args:
             sector: Optional sector/industry name to filter.
@@ -257,49 +330,25 @@ class HybridScannerService:
         Returns:
             list[dict]: ORATS core records filtered by sector.
         """
-        now = time.time()
         orats_api = self.batch_manager.orats_api if hasattr(self.batch_manager, 'orats_api') else None
 
         if not orats_api:
             return []
 
-        # Check if cache needs refresh
-        if (HybridScannerService._cores_cache is None or
-                now - HybridScannerService._cores_cache_time > self.CORES_CACHE_TTL):
-            try:
-                # Fetch entire universe (no sector filter) — filter client-side
-                HybridScannerService._cores_cache = orats_api.get_cores_bulk(sector=None)
-                HybridScannerService._cores_cache_time = now
-                logger.info(
-                    f"\U0001f504 Refreshed ORATS /cores cache: "
-                    f"{len(HybridScannerService._cores_cache)} tickers"
-                )
-            except Exception as e:
-                logger.warning(f"\u26a0\ufe0f ORATS /cores cache refresh failed: {e}")
-                if HybridScannerService._cores_cache:
-                    logger.info("Using stale /cores cache")
-                else:
-                    return []
-
-        # Client-side sector filter on cached data
-        if sector and HybridScannerService._cores_cache:
+        # Fetch entire universe (no sector filter) — filter against the snapshot indexes
+        snapshot = self._cores_store.get_or_refresh(lambda: orats_api.get_cores_bulk(sector=None))
+        if snapshot is None:
+            logger.warning("\u26a0\ufe0f ORATS /cores snapshot unavailable")
+            return []
+
+        if sector:
             sector_lower = sector.lower().strip()
             etf_codes = orats_api.SECTOR_NAME_MAP.get(sector_lower, [])
-
-            filtered = []
-            for r in HybridScannerService._cores_cache:
-                best_etf = (r.get("bestEtf") or "").upper()
-                sector_name = (r.get("sectorName") or "").lower()
-
-                if best_etf in etf_codes:
-                    filtered.append(r)
-                elif sector_lower in sector_name:
-                    filtered.append(r)
-
+            filtered = snapshot.select(sector_lower, etf_codes)
             logger.info(f"\U0001f4e6 /cores cache hit: {len(filtered)} tickers in '{sector}'")
             return filtered
 
-        return HybridScannerService._cores_cache or []
+        return snapshot.records()
 
     def scan_watchlist(self, username=None):
         """Scan user's watchlist. Delegates to scanner_sector."""
@@ -327,6 +376,9 @@ class HybridScannerService:
     def get_ai_analysis(self, ticker, strategy="LEAP", expiry_date=None, **kwargs):
         return _get_ai_analysis(self, ticker, strategy, expiry_date, **kwargs)
 
+    def stream_ai_analysis(self, ticker, strategy="LEAP", expiry_date=None, **kwargs):
+        return _stream_ai_analysis(self, ticker, strategy, expiry_date, **kwargs)
+
     def _sanitize_for_json(self, obj):
         return sanitize_for_json(obj)
 
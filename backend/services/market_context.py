@@ -0,0 +1,135 @@
+"""
+Market Context — shared SPY/QQQ/VIX/sector ETF quote snapshot
+=============================================================
+ContextService captured SPY, VIX and the sector ETF with three get_quote()
+calls on every trade entry and exit, the sector scan and RegimeDetector
+fetched VIX again, and each get_quote() is a /live/strikes request.
+
+One process-wide snapshot now serves all of them:
+
+  - the scheduler refreshes it every MARKET_CONTEXT_REFRESH_SECONDS while
+    the market is open (all symbols fetched concurrently)
+  - after the close one more refresh captures closing prices, then the
+    snapshot is frozen until the next open — refresh() becomes a no-op
+  - readers never wait on the scheduler: a missing or stale snapshot is
+    refreshed inline once, and concurrent readers share that refresh
+"""
+
+import concurrent.futures
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+from backend.config import Config
+from backend.utils.market_hours import is_market_open
+
+logger = logging.getLogger(__name__)
+
+SECTOR_ETFS = ('XLK', 'XLF', 'XLV', 'XLY', 'XLC', 'XLE', 'XLI', 'XLP', 'XLU', 'XLRE', 'XLB')
+CONTEXT_SYMBOLS = ('SPY', 'QQQ', 'VIX') + SECTOR_ETFS
+
+CONTEXT_FETCH_WORKERS = 8
+
+
+@dataclass
+class MarketContextSnapshot:
+    """Quotes for the context symbols as of one refresh."""
+    quotes: Dict[str, dict]
+    market_open: bool                  # Market state when the snapshot was taken
+    fetched_at: float = field(default_factory=time.time)
+
+    @property
+    def age_seconds(self) -> float:
+        return time.time() - self.fetched_at
+
+
+class MarketContextService:
+    """Background-refreshed quote snapshot shared by scans, regime and trade context."""
+
+    def __init__(self, symbols=CONTEXT_SYMBOLS, refresh_seconds=None):
+        self.symbols = tuple(symbols)
+        self.refresh_seconds = refresh_seconds or Config.MARKET_CONTEXT_REFRESH_SECONDS
+        self._snapshot: Optional[MarketContextSnapshot] = None
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+
+    # ── Read side ───────────────────────────────────────────────────
+
+    def is_current(self, snapshot, market_open=None) -> bool:
+        """Open market: younger than two refresh intervals. Closed: frozen if taken after the close."""
+        if snapshot is None:
+            return False
+        market_open = is_market_open() if market_open is None else market_open
+        if market_open:
+            return snapshot.market_open and snapshot.age_seconds < 2 * self.refresh_seconds
+        return not snapshot.market_open
+
+    def snapshot(self, orats_api=None) -> Optional[MarketContextSnapshot]:
+        """The current snapshot, refreshing inline with `orats_api` if it is missing or stale."""
+        with self._lock:
+            snap = self._snapshot
+        if self.is_current(snap) or orats_api is None:
+            return snap
+        return self.refresh(orats_api) or snap
+
+    def quote(self, symbol, orats_api=None) -> Optional[dict]:
+        """Cached quote for a context symbol (None for symbols outside the snapshot)."""
+        symbol = (symbol or '').replace('$', '').upper()
+        if symbol not in self.symbols:
+            return None
+        snap = self.snapshot(orats_api)
+        return snap.quotes.get(symbol) if snap else None
+
+    # ── Refresh ─────────────────────────────────────────────────────
+
+    def refresh(self, orats_api, force=False) -> Optional[MarketContextSnapshot]:
+        """Fetch every context quote concurrently and publish the snapshot.
+
+        Skipped while the frozen after-close snapshot is current, unless `force`.
+        """
+        with self._refresh_lock:
+            market_open = is_market_open()
+            with self._lock:
+                current = self._snapshot
+            # A concurrent reader may have refreshed while we waited for the lock
+            if not force and self.is_current(current, market_open) and \
+                    (not market_open or current.age_seconds < self.refresh_seconds / 2):
+                return current
+
+            quotes = {}
+            with concurrent.futures.ThreadPoolExecutor(max_workers=CONTEXT_FETCH_WORKERS) as pool:
+                futures = {pool.submit(orats_api.get_quote, symbol): symbol for symbol in self.symbols}
+                for future in concurrent.futures.as_completed(futures):
+                    symbol = futures[future]
+                    try:
+                        quote = future.result()
+                    except Exception as e:
+                        logger.debug(f"Market context: {symbol} quote failed: {e}")
+                        continue
+                    if quote and quote.get('price'):
+                        quotes[symbol] = quote
+
+            if not quotes:
+                logger.warning("Market context refresh returned no quotes; keeping the previous snapshot")
+                return None
+            # Keep the last good quote for symbols that failed this round
+            if current is not None:
+                for symbol, quote in current.quotes.items():
+                    quotes.setdefault(symbol, quote)
+
+            snap = MarketContextSnapshot(quotes=quotes, market_open=market_open)
+            with self._lock:
+                self._snapshot = snap
+            logger.info(f"Market context refreshed: {len(quotes)}/{len(self.symbols)} quotes"
+                        f"{'' if market_open else ' (frozen after close)'}")
+            return snap
+
+    def clear(self):
+        with self._lock:
+            self._snapshot = None
+
+
+# Process-wide snapshot shared by ContextService, RegimeDetector and the scanners
+market_context = MarketContextService()
@@ -0,0 +1,151 @@
+"""
+News Aggregator — concurrent multi-provider headlines under a deadline
+======================================================================
+FreeNewsAPIs (Google News RSS, Yahoo Finance) and NewsAPIs (NewsAPI,
+Finnhub, Alpha Vantage) queried their sources one after another, several
+without HTTP timeouts, so one slow RSS feed stalled the scan behind it.
+
+NewsAggregator.get_all_news():
+
+  - queries every configured provider concurrently
+  - returns whatever has arrived when Config.NEWS_DEADLINE_SECONDS expires;
+    stragglers finish in the background and their results are dropped
+  - deduplicates by URL (tracking parameters stripped) and by normalized
+    title (case, punctuation and a trailing " - Publisher" ignored)
+  - merges in provider priority order, so a duplicate keeps the richer
+    record (e.g. Alpha Vantage's sentiment score over the RSS copy)
+"""
+
+import concurrent.futures
+import logging
+import re
+import time
+from datetime import datetime
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from backend.api.free_news import FreeNewsAPIs
+from backend.api.news_apis import NewsAPIs
+from backend.config import Config
+
+logger = logging.getLogger(__name__)
+
+
+def default_providers():
+    """name -> fn(ticker, days_back) for every provider configured here, in priority order."""
+    free = FreeNewsAPIs()
+    keyed = NewsAPIs()
+    providers = {}
+    if keyed.alphavantage_key:
+        providers['alphavantage'] = lambda ticker, days_back: keyed.get_alphavantage_sentiment(ticker)
+    if keyed.finnhub_key:
+        providers['finnhub'] = keyed.get_finnhub_news
+    if keyed.newsapi_key:
+        providers['newsapi'] = keyed.get_newsapi_articles
+    providers['google_news'] = free.get_google_news
+    providers['yahoo_finance'] = lambda ticker, days_back: free.get_yahoo_finance_news(ticker)
+    return providers
+
+
+def normalize_url(url):
+    """Lowercased host, no fragment/trailing slash, utm_* and similar tracking params removed."""
+    if not url:
+        return ''
+    try:
+        parts = urlsplit(url.strip())
+    except ValueError:
+        return url.strip()
+    query = [(k, v) for k, v in parse_qsl(parts.query) if not k.lower().startswith(('utm_', 'guccounter'))]
+    return urlunsplit(('', parts.netloc.lower(), parts.path.rstrip('/'), urlencode(query), ''))
+
+
+def normalize_title(title, source=None):
+    """Comparable headline: publisher suffix dropped, lowercase alphanumerics and single spaces."""
+    title = (title or '').strip()
+    if source and title.lower().endswith(f" - {source}".lower()):
+        title = title[:-(len(source) + 3)]
+    return ' '.join(re.sub(r'[^a-z0-9]+', ' ', title.lower()).split())
+
+
+def _published_ts(value):
+    """Sortable timestamp from ISO strings, Alpha Vantage's 20240101T120000 or epoch seconds."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    if not value:
+        return 0.0
+    text = str(value)
+    for parse in (lambda v: datetime.fromisoformat(v.replace('Z', '+00:00')),
+                  lambda v: datetime.strptime(v[:15], '%Y%m%dT%H%M%S')):
+        try:
+            return parse(text).timestamp()
+        except (ValueError, OverflowError, OSError):
+            continue
+    return 0.0
+
+
+def merge_articles(batches):
+    """Deduplicate article lists (given in priority order) and sort newest first."""
+    seen_urls, seen_titles, unique = set(), set(), []
+    for articles in batches:
+        for article in articles or []:
+            title_key = normalize_title(article.get('headline'), article.get('source'))
+            if not title_key:
+                continue
+            url_key = normalize_url(article.get('url'))
+            if title_key in seen_titles or (url_key and url_key in seen_urls):
+                continue
+            seen_titles.add(title_key)
+            if url_key:
+                seen_urls.add(url_key)
+            unique.append(article)
+    unique.sort(key=lambda a: _published_ts(a.get('published_date')), reverse=True)
+    return unique
+
+
+class NewsAggregator:
+    """Fans a news request out to every provider and merges what arrives in time."""
+
+    def __init__(self, providers=None, deadline=None):
+        """
+        Args:
+            providers: name -> fn(ticker, days_back) in priority order
+                       (default: default_providers())
+            deadline: Seconds to wait for providers (default Config.NEWS_DEADLINE_SECONDS)
+        """
+        self.providers = providers if providers is not None else default_providers()
+        self.deadline = deadline or Config.NEWS_DEADLINE_SECONDS
+
+    def get_all_news(self, ticker, days_back=7, skip=()):
+        """
+        Deduplicated articles for `ticker` from all providers, newest first.
+
+        Args:
+            skip: Provider names not to query (e.g. 'finnhub' when the caller
+                  just got an empty answer from it)
+        """
+        providers = {name: fn for name, fn in self.providers.items() if name not in skip}
+        if not providers:
+            return []
+
+        results = {}
+        start = time.monotonic()
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=len(providers), thread_name_prefix='news')
+        try:
+            future_to_name = {executor.submit(fn, ticker, days_back): name for name, fn in providers.items()}
+            done, pending = concurrent.futures.wait(future_to_name, timeout=self.deadline)
+            for future in done:
+                name = future_to_name[future]
+                try:
+                    results[name] = future.result() or []
+                except Exception as e:
+                    logger.warning(f"News provider {name} failed for {ticker}: {e}")
+            if pending:
+                late = sorted(future_to_name[f] for f in pending)
+                logger.warning(f"News for {ticker}: {self.deadline}s deadline hit, proceeding without {late}")
+        finally:
+            # Don't block on stragglers — their results are simply dropped
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        articles = merge_articles(results.get(name) for name in providers)
+        logger.info(f"News for {ticker}: {len(articles)} unique articles from "
+                    f"{len(results)}/{len(providers)} providers in {time.monotonic() - start:.1f}s")
+        return articles
@@ -0,0 +1,253 @@
+"""
+News Cache — read-through Finnhub news and sentiment
+====================================================
+scan_weekly, the LEAP scan and get_sentiment_score() called Finnhub
+news-sentiment and company-news live for every ticker on every scan, while
+the NewsCache table was written (by cache_news) and never read.
+
+NewsSentimentCache sits in front of both endpoints:
+
+  - company news: memory → NewsCache table (shared by workers, survives
+    restarts) → Finnhub. Rows younger than Config.NEWS_CACHE_HOURS are
+    served; once older than Config.NEWS_REFRESH_MINUTES they are still
+    served but refreshed in the background (stale-while-revalidate)
+  - premium sentiment: memory only, same freshness window. A FORBIDDEN
+    answer is a plan limitation, not a per-ticker one, so it switches the
+    premium endpoint off for every ticker for FORBIDDEN_BACKOFF_SECONDS
+  - one in-flight fetch per (endpoint, ticker); background refreshes are
+    deduplicated the same way
+"""
+
+import concurrent.futures
+import logging
+import threading
+import time
+from datetime import datetime
+
+from backend.config import Config
+from sqlalchemy import insert
+
+from backend.database.models import NewsCache, SessionLocal, session_scope
+
+logger = logging.getLogger(__name__)
+
+FORBIDDEN = "FORBIDDEN"
+FORBIDDEN_BACKOFF_SECONDS = 6 * 3600
+REFRESH_WORKERS = 2
+MAX_CACHED_ARTICLES = 50
+
+
+def _article_from_row(row):
+    published = row.published_date
+    return {
+        'headline': row.headline,
+        'summary': row.summary,
+        'source': row.source,
+        'url': row.url,
+        'datetime': int(published.timestamp()) if published else None,
+    }
+
+
+def _published_date(article):
+    """Finnhub articles carry a unix `datetime`; analyzed ones an ISO `published_date`."""
+    value = article.get('datetime') or article.get('published_date')
+    try:
+        if isinstance(value, (int, float)):
+            return datetime.fromtimestamp(value)
+        if value:
+            return datetime.fromisoformat(str(value))
+    except (ValueError, OSError, OverflowError):
+        pass
+    return None
+
+
+def news_rows(ticker, articles, sentiment_scores=None, cached_date=None):
+    """NewsCache column dicts for `articles`, aligned with per-article `sentiment_scores`."""
+    cached_date = cached_date or datetime.utcnow()
+    rows = []
+    for i, article in enumerate(list(articles or [])[:MAX_CACHED_ARTICLES]):
+        rows.append({
+            'ticker': ticker,
+            'headline': (article.get('headline') or '')[:500],
+            'summary': article.get('summary'),
+            'source': (article.get('source') or '')[:100],
+            'url': (article.get('url') or '')[:500],
+            'published_date': _published_date(article),
+            'sentiment_score': sentiment_scores[i] if sentiment_scores and i < len(sentiment_scores) else None,
+            'cached_date': cached_date,
+        })
+    return rows
+
+
+def replace_news_rows(session, tickers, rows):
+    """Swap the NewsCache rows of `tickers` for `rows`: one DELETE, one executemany INSERT."""
+    if not tickers:
+        return
+    session.execute(NewsCache.__table__.delete().where(NewsCache.ticker.in_(list(tickers))))
+    if rows:
+        session.execute(insert(NewsCache), rows)
+
+
+class NewsSentimentCache:
+    """Read-through cache over FinnhubAPI.get_company_news / get_news_sentiment."""
+
+    def __init__(self, session_factory=SessionLocal, max_age_hours=None, refresh_minutes=None):
+        """
+        Args:
+            session_factory: SQLAlchemy session factory for the NewsCache table
+                             (None keeps the cache in memory only)
+            max_age_hours: Oldest entry served (default Config.NEWS_CACHE_HOURS)
+            refresh_minutes: Age after which a served entry is refreshed in the background
+        """
+        self.session_factory = session_factory
+        self.max_age = (max_age_hours or Config.NEWS_CACHE_HOURS) * 3600
+        self.refresh_after = (refresh_minutes or Config.NEWS_REFRESH_MINUTES) * 60
+        self._memory = {}                 # (kind, ticker) -> (fetched_at, value)
+        self._lock = threading.Lock()
+        self._inflight = {}               # (kind, ticker) -> threading.Event
+        self._queued = set()              # Background refreshes not yet started
+        self._forbidden_until = 0.0
+        self._refresher = concurrent.futures.ThreadPoolExecutor(
+            max_workers=REFRESH_WORKERS, thread_name_prefix='news-refresh')
+
+    # ── Public API ──────────────────────────────────────────────────
+
+    def get_company_news(self, finnhub_api, ticker):
+        """Recent company news for `ticker` (Finnhub article dicts), cached."""
+        return self._read_through('news', finnhub_api, ticker)
+
+    def get_news_sentiment(self, finnhub_api, ticker):
+        """Premium sentiment dict, FORBIDDEN, or None — cached like get_news_sentiment()."""
+        if time.time() < self._forbidden_until:
+            return FORBIDDEN
+        return self._read_through('sentiment', finnhub_api, ticker)
+
+    def store_articles(self, ticker, articles, sentiment_scores=None, persist=True):
+        """Replace the cached articles for `ticker` (memory and NewsCache table).
+
+        persist=False updates memory only, for callers that write the table
+        rows themselves as part of a larger batch (ScanResultWriter).
+        """
+        ticker = self._key(ticker)
+        articles = list(articles or [])[:MAX_CACHED_ARTICLES]
+        if persist:
+            self._persist(ticker, articles, sentiment_scores)
+        with self._lock:
+            self._memory[('news', ticker)] = (time.time(), articles)
+
+    # ── Read-through ────────────────────────────────────────────────
+
+    @staticmethod
+    def _key(ticker):
+        return (ticker or '').replace('$', '').strip().upper()
+
+    def _read_through(self, kind, finnhub_api, ticker):
+        ticker = self._key(ticker)
+        key = (kind, ticker)
+
+        entry = self._cached(key)
+        if entry is not None:
+            fetched_at, value = entry
+            if time.time() - fetched_at >= self.refresh_after:
+                self._refresh_in_background(key, finnhub_api)
+            return value
+
+        return self._fetch(key, finnhub_api)
+
+    def _cached(self, key):
+        """(fetched_at, value) from memory, then the NewsCache table; None if absent or expired."""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+        if entry is not None and now - entry[0] < self.max_age:
+            return entry
+
+        if key[0] != 'news' or self.session_factory is None:
+            return None
+        entry = self._load(key[1])
+        if entry is not None and now - entry[0] < self.max_age:
+            with self._lock:
+                self._memory[key] = entry
+            return entry
+        return None
+
+    def _fetch(self, key, finnhub_api):
+        """Call Finnhub for `key`, sharing the call with concurrent readers."""
+        with self._lock:
+            waiter = self._inflight.get(key)
+            if waiter is None:
+                self._inflight[key] = threading.Event()
+        if waiter is not None:
+            waiter.wait(timeout=30)
+            with self._lock:
+                entry = self._memory.get(key)
+            return entry[1] if entry else None
+
+        try:
+            kind, ticker = key
+            if kind == 'news':
+                value = finnhub_api.get_company_news(ticker)
+                if isinstance(value, list):
+                    self.store_articles(ticker, value)
+            else:
+                value = finnhub_api.get_news_sentiment(ticker)
+                if value == FORBIDDEN:
+                    self._forbidden_until = time.time() + FORBIDDEN_BACKOFF_SECONDS
+                    logger.info("Finnhub premium sentiment is FORBIDDEN for this key; "
+                                f"skipping it for {FORBIDDEN_BACKOFF_SECONDS // 3600}h")
+                elif value is not None:
+                    with self._lock:
+                        self._memory[key] = (time.time(), value)
+            return value
+        finally:
+            with self._lock:
+                self._inflight.pop(key).set()
+
+    def _refresh_in_background(self, key, finnhub_api):
+        with self._lock:
+            if key in self._inflight or key in self._queued:
+                return
+            self._queued.add(key)
+        try:
+            self._refresher.submit(self._safe_fetch, key, finnhub_api)
+        except RuntimeError:
+            with self._lock:
+                self._queued.discard(key)  # Interpreter shutting down
+
+    def _safe_fetch(self, key, finnhub_api):
+        try:
+            self._fetch(key, finnhub_api)
+        except Exception as e:
+            logger.debug(f"Background news refresh failed for {key}: {e}")
+        finally:
+            with self._lock:
+                self._queued.discard(key)
+
+    # ── NewsCache table ─────────────────────────────────────────────
+
+    def _load(self, ticker):
+        session = self.session_factory()
+        try:
+            rows = (session.query(NewsCache)
+                    .filter(NewsCache.ticker == ticker)
+                    .order_by(NewsCache.published_date.desc())
+                    .all())
+            cached_at = min((r.cached_date for r in rows if r.cached_date), default=None)
+            if cached_at is None:
+                return None
+            age = (datetime.utcnow() - cached_at).total_seconds()
+            return time.time() - age, [_article_from_row(r) for r in rows]
+        except Exception as e:
+            logger.debug(f"NewsCache read failed for {ticker}: {e}")
+            return None
+        finally:
+            session.close()
+
+    def _persist(self, ticker, articles, sentiment_scores=None):
+        if self.session_factory is None:
+            return
+        try:
+            with session_scope(self.session_factory) as session:
+                replace_news_rows(session, [ticker], news_rows(ticker, articles, sentiment_scores))
+        except Exception as e:
+            logger.debug(f"NewsCache write failed for {ticker}: {e}")
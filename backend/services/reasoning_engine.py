@@ -20,7 +20,13 @@ class ReasoningEngine:
     Goal: Identify hidden risks, binary events, and macro trends.
     """
     
-    def __init__(self):
+    def __init__(self, cache=None):
+        """
+        Args:
+            cache: Optional AnalysisCache; identical requests are then served
+                   from it and concurrent ones share a single LLM call
+        """
+        self.cache = cache
         self.api_key = Config.PERPLEXITY_API_KEY
         self.base_url = "https://api.perplexity.ai/chat/completions"
         self.headers = {
@@ -32,12 +38,120 @@ class ReasoningEngine:
     def analyze_ticker(self, ticker, strategy="LEAP", expiry_date=None, data={}, context={}):
         """
         Analyze a ticker using Perplexity AI with a "Risk Manager" persona.
-        Returns a dict with 'analysis', 'verdict', 'score', 'error'.
+        Returns a dict with 'analysis', 'verdict', 'score', 'error'
+        ('cached' and 'cached_at' when served from the analysis cache).
         """
         if not self.api_key:
             logger.error("ReasoningEngine Error: No API Key found.")
             return {"error": "AI Reasoning is disabled (No API Key)."}
 
+        if self.cache is None:
+            return self._analyze(ticker, strategy, expiry_date, data, context)
+        key = self.cache.fingerprint(ticker, strategy, expiry_date, data, context, self.model)
+        return self.cache.get_or_compute(
+            key, lambda: self._analyze(ticker, strategy, expiry_date, data, context), model=self.model)
+
+    def stream_analysis(self, ticker, strategy="LEAP", expiry_date=None, data=None, context=None):
+        """
+        Streaming analyze_ticker(): yields (event, payload) while the model writes.
+
+        Events: ('token', {'text'}) per streamed chunk, then one ('result', dict)
+        parsed and validated exactly like analyze_ticker(), or ('error', {'error'}).
+        A cache hit, or an identical analysis already in flight (streamed or
+        not), is a single 'result' event.
+        """
+        data = data or {}
+        context = context or {}
+        if not self.api_key:
+            yield 'error', {'error': "AI Reasoning is disabled (No API Key)."}
+            return
+        if self.cache is None:
+            event, payload = yield from self._stream(ticker, strategy, expiry_date, data, context)
+            yield event, payload
+            return
+
+        key = self.cache.fingerprint(ticker, strategy, expiry_date, data, context, self.model)
+        cached = self.cache.get(key)
+        if cached is not None:
+            yield 'result', cached
+            return
+
+        flight, leader = self.cache.join(key)
+        if not leader:
+            result = self.cache.wait(flight)
+            if result is not None:
+                yield ('error' if result.get('error') else 'result'), result
+                return
+            # Leader failed or overran the wait: stream our own
+            event, payload = yield from self._stream(ticker, strategy, expiry_date, data, context)
+            if event == 'result':
+                self.cache.put(key, payload, model=self.model)
+            yield event, payload
+            return
+
+        payload = None
+        try:
+            event, payload = yield from self._stream(ticker, strategy, expiry_date, data, context)
+        finally:
+            self.cache.finish(key, flight, payload, model=self.model)
+        yield event, payload
+
+    def _stream(self, ticker, strategy, expiry_date, data, context):
+        """Yield ('token', ...) events and return the final (event, payload) without yielding it."""
+        payload, strategy = self._build_payload(ticker, strategy, expiry_date, data, context)
+        payload['stream'] = True
+        chunks = []
+        try:
+            response = self._open_stream(payload)
+            if isinstance(response, dict):
+                return 'error', response
+            with response:
+                response.encoding = 'utf-8'
+                # OpenAI-compatible SSE: "data: {...choices[0].delta.content...}" lines
+                for line in response.iter_lines(decode_unicode=True):
+                    if not line or not line.startswith('data:'):
+                        continue
+                    body = line[5:].strip()
+                    if body == '[DONE]':
+                        break
+                    try:
+                        text = json.loads(body)['choices'][0].get('delta', {}).get('content')
+                    except (ValueError, KeyError, IndexError, TypeError):
+                        continue
+                    if text:
+                        chunks.append(text)
+                        yield 'token', {'text': text}
+        except requests.RequestException as e:
+            logger.error(f"Reasoning Engine stream failed: {e}")
+            return 'error', {'error': str(e)}
+
+        if not chunks:
+            return 'error', {'error': 'Empty response from Perplexity'}
+        return 'result', self._parse_content(''.join(chunks), ticker, strategy)
+
+    def _open_stream(self, payload):
+        """POST with stream=True, retrying like _analyze until the first byte; error dict on failure."""
+        last_error = None
+        for attempt in range(3):
+            try:
+                response = requests.post(self.base_url, json=payload, headers=self.headers,
+                                         timeout=30, stream=True)
+                if response.status_code == 200:
+                    return response
+                response.close()
+                if response.status_code < 500:
+                    return {"error": f"API Error: {response.status_code}"}
+                last_error = f"HTTP {response.status_code}"
+                logger.warning(f"Perplexity {response.status_code} on stream attempt {attempt+1}/3")
+            except (requests.ConnectionError, requests.Timeout) as e:
+                last_error = e
+                logger.warning(f"Perplexity network error stream attempt {attempt+1}/3: {e}")
+            if attempt < 2:
+                time.sleep(2 ** attempt)
+        return {"error": f"Perplexity unreachable after 3 attempts: {last_error}"}
+
+    def _build_payload(self, ticker, strategy, expiry_date, data, context):
+        """Prompt and request body for analyze_ticker; returns (payload, effective strategy)."""
         # P0-DT-R2 FIX: Differentiate news lookback by strategy
         # 0DTE needs only last 6 hours of news (intraday catalysts)
         # WEEKLY needs 5 days (swing trade window)
@@ -180,6 +294,15 @@ class ReasoningEngine:
         else:
             vix_regime_text = f"Current VIX Regime: {vix_regime_val} (VIX: N/A)"
 
+        earnings_text = "No upcoming earnings report on the calendar."
+        if context and context.get('earnings'):
+            e = context.get('earnings')
+            when = {'bmo': 'before open', 'amc': 'after close'}.get(e.get('hour'), e.get('hour') or 'time TBD')
+            earnings_text = (
+                f"Next report {e.get('date')} ({when}, in {e.get('days_to_earnings', 'N/A')} days) | "
+                f"EPS estimate: {e.get('eps_estimate') if e.get('eps_estimate') is not None else 'N/A'}"
+            )
+
         greeks_text = "No option-specific Greeks available."
         if context and context.get('option_greeks'):
             og = context.get('option_greeks')
@@ -274,7 +397,8 @@ class ReasoningEngine:
             f"3. **GAMMA LEVELS:** {gex_text}\n"
             f"4. **OPTION GREEKS:** {greeks_text}\n"
             f"5. **MARKET REGIME:** {vix_regime_text}\n"
-            f"{f'6. **MONEYNESS:** {trade_details_str}' if trade_details_str else ''}\n\n"
+            f"6. **EARNINGS:** {earnings_text}\n"
+            f"{f'7. **MONEYNESS:** {trade_details_str}' if trade_details_str else ''}\n\n"
             f"### REQUIRED OUTPUT\n"
             f"0. **Data Integrity Check:** Explicitly state: 'Using Live Spot Price: ${spot_price}'\n"
             f"1. **News/Event Check:** Does the news support this {opt_type.upper() if opt_type else 'Trade'}?\n"
@@ -299,7 +423,11 @@ class ReasoningEngine:
             ],
             "temperature": 0.1
         }
+        return payload, strategy
 
+    def _analyze(self, ticker, strategy, expiry_date, data, context):
+        """Build the prompt and call Perplexity (uncached)."""
+        payload, strategy = self._build_payload(ticker, strategy, expiry_date, data, context)
         try:
             response = None
             last_error = None
@@ -322,53 +450,58 @@ class ReasoningEngine:
                 
             data = response.json()
             content = data['choices'][0]['message']['content']
-            parsed = self._extract_json_block(content)
-            
-            # Strip the JSON block and trailing Verdict/Score from content before returning as 'analysis'
-            # The JSON was requested by the prompt for structured extraction, not for display
-            clean_analysis = content
-            # Remove ```json ... ``` blocks
-            clean_analysis = re.sub(r'\n*```json\s*\{.*?\}\s*```\s*', '', clean_analysis, flags=re.DOTALL)
-            # Remove bare JSON objects at end
-            clean_analysis = re.sub(r'\n*\{\s*"score"\s*:[\s\S]*?\}\s*$', '', clean_analysis)
-            # Truncate at "Verdict:" line — this is always the second-to-last item in Perplexity output
-            # Handles all variants: "Verdict:", "5. Verdict:", "5. **Verdict:**", "**5. Verdict:**", "## Verdict", etc.
-            verdict_match = re.search(r'\n+\**\s*(?:\d+\.\s*)?(?:#{1,3}\s*)?\**\s*Verdict\s*\**\s*[:*]', clean_analysis, re.IGNORECASE)
-            if verdict_match:
-                clean_analysis = clean_analysis[:verdict_match.start()]
-            # Clean trailing whitespace and horizontal rules
-            clean_analysis = re.sub(r'\n*-{3,}\s*$', '', clean_analysis).rstrip()
-
-            if parsed:
-                try:
-                    validated = AIAnalysisResult.model_validate(parsed)
-                    validated_data = validated.model_dump()
-                    score = validated_data['score']
-                except ValidationError as ve:
-                    logger.warning(f"Pydantic validation failed for {ticker}: {ve}")
-                    validated_data = parsed
-                    score = min(100, max(0, int(parsed.get('score', 0))))
-
-                if score >= 66: verdict = 'FAVORABLE'
-                elif score >= 41: verdict = 'RISKY'
-                else: verdict = 'AVOID'
-                return {"ticker": ticker, "strategy": strategy, "analysis": clean_analysis, "score": score, "verdict": verdict, "summary": validated_data.get('summary', ''), "risks": validated_data.get('risks', []), "thesis": validated_data.get('thesis', '')}
-            else:
-                score = self._extract_score(content)
-                try:
-                    validated = AIAnalysisResult.model_validate({'score': score, 'verdict': 'RISKY', 'summary': content[:300] if content else '', 'risks': [], 'thesis': ''})
-                    score = validated.score
-                except ValidationError as ve:
-                    logger.warning(f"Pydantic validation failed (regex fallback) for {ticker}: {ve}")
-                if score >= 66: verdict = 'FAVORABLE'
-                elif score >= 41: verdict = 'RISKY'
-                else: verdict = 'AVOID'
-                return {"ticker": ticker, "strategy": strategy, "analysis": clean_analysis, "score": score, "verdict": verdict, "summary": content[:300] if content else '', "risks": [], "thesis": ''}
-            
+            return self._parse_content(content, ticker, strategy)
+
         except Exception as e:
             logger.error(f"Reasoning Engine Failed: {e}")
             return {"error": str(e)}
 
+    def _parse_content(self, content, ticker, strategy):
+        """Result dict from the full model response (JSON block validated with AIAnalysisResult)."""
+        parsed = self._extract_json_block(content)
+        
+        # Strip the JSON block and trailing Verdict/Score from content before returning as 'analysis'
+        # The JSON was requested by the prompt for structured extraction, not for display
+        clean_analysis = content
+        # Remove ```json ... ``` blocks
+        clean_analysis = re.sub(r'\n*```json\s*\{.*?\}\s*```\s*', '', clean_analysis, flags=re.DOTALL)
+        # Remove bare JSON objects at end
+        clean_analysis = re.sub(r'\n*\{\s*"score"\s*:[\s\S]*?\}\s*$', '', clean_analysis)
+        # Truncate at "Verdict:" line — this is always the second-to-last item in Perplexity output
+        # Handles all variants: "Verdict:", "5. Verdict:", "5. **Verdict:**", "**5. Verdict:**", "## Verdict", etc.
+        verdict_match = re.search(r'\n+\**\s*(?:\d+\.\s*)?(?:#{1,3}\s*)?\**\s*Verdict\s*\**\s*[:*]', clean_analysis, re.IGNORECASE)
+        if verdict_match:
+            clean_analysis = clean_analysis[:verdict_match.start()]
+        # Clean trailing whitespace and horizontal rules
+        clean_analysis = re.sub(r'\n*-{3,}\s*$', '', clean_analysis).rstrip()
+
+        if parsed:
+            try:
+                validated = AIAnalysisResult.model_validate(parsed)
+                validated_data = validated.model_dump()
+                score = validated_data['score']
+            except ValidationError as ve:
+                logger.warning(f"Pydantic validation failed for {ticker}: {ve}")
+                validated_data = parsed
+                score = min(100, max(0, int(parsed.get('score', 0))))
+
+            if score >= 66: verdict = 'FAVORABLE'
+            elif score >= 41: verdict = 'RISKY'
+            else: verdict = 'AVOID'
+            return {"ticker": ticker, "strategy": strategy, "analysis": clean_analysis, "score": score, "verdict": verdict, "summary": validated_data.get('summary', ''), "risks": validated_data.get('risks', []), "thesis": validated_data.get('thesis', '')}
+        else:
+            score = self._extract_score(content)
+            try:
+                validated = AIAnalysisResult.model_validate({'score': score, 'verdict': 'RISKY', 'summary': content[:300] if content else '', 'risks': [], 'thesis': ''})
+                score = validated.score
+            except ValidationError as ve:
+                logger.warning(f"Pydantic validation failed (regex fallback) for {ticker}: {ve}")
+            if score >= 66: verdict = 'FAVORABLE'
+            elif score >= 41: verdict = 'RISKY'
+            else: verdict = 'AVOID'
+            return {"ticker": ticker, "strategy": strategy, "analysis": clean_analysis, "score": score, "verdict": verdict, "summary": content[:300] if content else '', "risks": [], "thesis": ''}
+
+
     def calculate_base_score(self, technicals, sentiment):
         score = 50.0
         tech_score = float(technicals.get('score', 50))
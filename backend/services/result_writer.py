@@ -0,0 +1,173 @@
+"""
+Result Writer — batched persistence of scan results
+===================================================
+save_scan_results committed one ScanResult row and then its (up to ten)
+Opportunity rows per scan_ticker call, and cache_news replaced a ticker's
+NewsCache rows in its own transaction. A LEAP sector scan (CALL and PUT
+per ticker) therefore ran hundreds of small SQLite transactions, each one
+taking the write lock and syncing the WAL.
+
+ScanResultWriter buffers those rows and writes them in bulk:
+
+  - inside `with writer.batch():` (scan_watchlist, scan_sector_top_picks)
+    results collect in a per-thread buffer and are flushed once, when the
+    outermost batch exits — one transaction per scan
+  - a flush inserts all ScanResult rows with one multi-row INSERT ...
+    RETURNING id (ids come back in parameter order), then the Opportunity
+    and NewsCache rows as one executemany of a single cached INSERT
+    (insert().values([...]) recompiles per chunk and measured ~10x slower)
+  - outside a batch every add is flushed at once (single-ticker scans)
+  - a batch that grows past MAX_BUFFERED_RESULTS is flushed early, so a
+    huge scan never holds everything in memory
+
+Batches are per thread, so concurrent scans from different request
+threads never flush each other's rows.
+"""
+
+import logging
+import threading
+from contextlib import contextmanager
+
+from sqlalchemy import insert
+
+from backend.database.models import Opportunity, ScanResult, SessionLocal, session_scope
+from backend.services.news_cache import news_rows, replace_news_rows
+
+logger = logging.getLogger(__name__)
+
+MAX_OPPORTUNITIES_PER_RESULT = 10
+MAX_BUFFERED_RESULTS = 500
+
+
+def _opportunity_row(ticker, opp):
+    return {
+        'ticker': ticker,
+        'option_type': opp['option_type'],
+        'strike_price': opp['strike_price'],
+        'expiration_date': opp['expiration_date'],
+        'premium': opp['premium'],
+        'profit_potential': opp['profit_potential'],
+        'days_to_expiry': opp['days_to_expiry'],
+        'volume': opp['volume'],
+        'open_interest': opp['open_interest'],
+        'implied_volatility': opp.get('implied_volatility'),
+        'delta': opp.get('delta'),
+        'opportunity_score': opp['opportunity_score'],
+    }
+
+
+class _Buffer:
+    """Rows collected by one thread's open batch."""
+
+    def __init__(self):
+        self.depth = 0
+        self.results = []       # (ScanResult row, [Opportunity rows])
+        self.news = {}          # ticker -> NewsCache rows (last write wins)
+
+    def __len__(self):
+        return len(self.results) + len(self.news)
+
+    def take(self):
+        results, news = self.results, self.news
+        self.results, self.news = [], {}
+        return results, news
+
+
+class ScanResultWriter:
+    """Buffers ScanResult / Opportunity / NewsCache rows and writes them in bulk."""
+
+    def __init__(self, session_factory=SessionLocal, max_buffered=MAX_BUFFERED_RESULTS):
+        """
+        Args:
+            session_factory: SQLAlchemy session factory for the scanner DB
+            max_buffered: Buffered results/tickers that trigger an early flush
+        """
+        self.session_factory = session_factory
+        self.max_buffered = max_buffered
+        self._local = threading.local()
+
+    # ── Batching ────────────────────────────────────────────────────
+
+    @contextmanager
+    def batch(self):
+        """Buffer this thread's writes until the outermost batch exits, then flush them."""
+        buffer = getattr(self._local, 'buffer', None)
+        if buffer is None:
+            buffer = self._local.buffer = _Buffer()
+        buffer.depth += 1
+        try:
+            yield self
+        finally:
+            buffer.depth -= 1
+            if buffer.depth == 0:
+                self._local.buffer = None
+                self._write(*buffer.take())
+
+    def _buffer(self):
+        buffer = getattr(self._local, 'buffer', None)
+        return buffer if buffer is not None else _Buffer()
+
+    def _added(self, buffer):
+        if buffer.depth == 0 or len(buffer) >= self.max_buffered:
+            self._write(*buffer.take())
+
+    # ── Adding rows ─────────────────────────────────────────────────
+
+    def add_scan(self, ticker, technical_score, sentiment_score, opportunities):
+        """Queue one scan_ticker result and its top opportunities."""
+        opportunities = opportunities or []
+        avg_score = (sum(o['opportunity_score'] for o in opportunities) / len(opportunities)
+                     if opportunities else 0)
+        row = {
+            'ticker': ticker,
+            'technical_score': technical_score,
+            'sentiment_score': sentiment_score,
+            'opportunity_score': avg_score,
+            'profit_potential': opportunities[0]['profit_potential'] if opportunities else 0,
+        }
+        opps = [_opportunity_row(ticker, o) for o in opportunities[:MAX_OPPORTUNITIES_PER_RESULT]]
+        buffer = self._buffer()
+        buffer.results.append((row, opps))
+        self._added(buffer)
+
+    def add_news(self, ticker, articles, sentiment_scores=None):
+        """Queue a replacement of `ticker`'s NewsCache rows."""
+        buffer = self._buffer()
+        buffer.news[ticker] = news_rows(ticker, articles, sentiment_scores)
+        self._added(buffer)
+
+    def flush(self):
+        """Write whatever this thread's open batch holds now."""
+        buffer = getattr(self._local, 'buffer', None)
+        if buffer is not None and len(buffer):
+            self._write(*buffer.take())
+
+    # ── Writing ─────────────────────────────────────────────────────
+
+    def _write(self, results, news):
+        if not results and not news:
+            return
+        try:
+            with session_scope(self.session_factory) as db:
+                if results:
+                    self._insert_results(db, results)
+                if news:
+                    replace_news_rows(db, list(news), [r for rows in news.values() for r in rows])
+        except Exception as e:
+            logger.warning(f"Saving {len(results)} scan results / {len(news)} news tickers failed: {e}")
+
+    @staticmethod
+    def _insert_results(db, results):
+        rows = [row for row, _ in results]
+        if db.get_bind().dialect.insert_executemany_returning_sort_by_parameter_order:
+            # Rendered as multi-row INSERT ... VALUES ... RETURNING id, ids in row order
+            ids = db.execute(insert(ScanResult).returning(ScanResult.id, sort_by_parameter_order=True),
+                             rows).scalars().all()
+        else:
+            ids = [db.execute(insert(ScanResult), row).inserted_primary_key[0] for row in rows]
+
+        opportunities = []
+        for result_id, (_, opps) in zip(ids, results):
+            opportunities.extend(dict(o, scan_result_id=result_id) for o in opps)
+        if opportunities:
+            db.execute(insert(Opportunity), opportunities)
@@ -1,12 +1,27 @@
 import logging
 import math
-from datetime import datetime
+from datetime import datetime, timezone
 from backend.config import Config
+from backend.utils.chain_filter import ChainFilter
+from backend.services.scanner_utils import get_cores_record, get_ticker_features
+from backend.services.feature_store import trend_gate_price
+from backend.services.market_context import market_context
 
 logger = logging.getLogger(__name__)
 
 
-def scan_ticker_leaps(scanner, ticker, strict_mode=True, pre_fetched_data=None, direction='CALL', pre_fetched_history=None):
+def _features_match_history(features, price_history):
+    """Features describe the same last bar as the history the scan will use."""
+    candles = (price_history or {}).get('candles')
+    if not candles:
+        return True  # No history yet: the feature snapshot is fresh (last close)
+    # Same UTC reading of the candle timestamp as TechnicalIndicators.prepare_dataframe()
+    last_bar = datetime.fromtimestamp(candles[-1]['datetime'] / 1000, tz=timezone.utc).date().isoformat()
+    return features.get('tradeDate') == last_bar
+
+
+def scan_ticker_leaps(scanner, ticker, strict_mode=True, pre_fetched_data=None, direction='CALL', pre_fetched_history=None,
+                      pre_fetched_cores=None, pre_fetched_features=None):
     """
     Perform complete LEAP analysis on a single ticker.
     strict_mode: If True, blocks tickers with poor fundamentals (ROE/Margin).
@@ -15,6 +30,10 @@ def scan_ticker_leaps(scanner, ticker, strict_mode=True, pre_fetched_data=None,
     direction: 'CALL' (bullish LEAPs) or 'PUT' (bearish LEAPs) — P0-17
     pre_fetched_history: Optional pre-fetched price history from batch
                          get_history_batch(). Skips per-ticker API call if provided.
+    pre_fetched_cores: Optional ORATS /cores record (e.g. from the sector scan
+                       cache). Skips the per-ticker hist/cores call if complete.
+    pre_fetched_features: Optional nightly feature record (feature_store.py).
+                          Lets the trend filter reject before any API call.
     """
     ticker = scanner._normalize_ticker(ticker)
     logger.info(f"\n{'='*50}")
@@ -26,6 +45,19 @@ def scan_ticker_leaps(scanner, ticker, strict_mode=True, pre_fetched_data=None,
         logger.warning(f"⚠️ {ticker} not in ORATS universe. Skipping.")
         return None
 
+    # Nightly features: apply the P0-17 direction filter up front, so the wrong-trend
+    # pass (CALL or PUT) costs no cores/history/fundamentals calls
+    features = get_ticker_features(scanner, ticker, pre_fetched_features)
+    if features and _features_match_history(features, pre_fetched_history):
+        close, trend_sma = trend_gate_price(features)
+        if close is not None and trend_sma is not None:
+            if direction == 'CALL' and close < trend_sma:
+                logger.error(f"\u274c Downtrend for CALL LEAPs (Price {close:.2f} < SMA {trend_sma:.2f}) [features]")
+                return None
+            if direction == 'PUT' and close > trend_sma:
+                logger.error(f"\u274c Uptrend for PUT LEAPs (Price {close:.2f} > SMA {trend_sma:.2f}) [features]")
+                return None
+
     # Initialize badges early for strict mode logging
     fund_badges = []
     fund_score = 0
@@ -60,7 +92,8 @@ def scan_ticker_leaps(scanner, ticker, strict_mode=True, pre_fetched_data=None,
             # REPLACES Finnhub get_basic_financials() which caused FORBIDDEN aborts
             # ORATS provides options-relevant data: div yield, implied earnings move, options volume
             try:
-                cores = scanner.batch_manager.orats_api.get_hist_cores(clean_ticker)
+                cores = get_cores_record(scanner, clean_ticker, pre_fetched_cores)
+                pre_fetched_cores = cores or pre_fetched_cores  # Reused by G9/G14/G15 below
                 if cores:
                     div_yield = cores.get('divYield', 0) or 0
                     implied_earn_move = cores.get('impliedEarningsMove', 0) or 0
@@ -175,7 +208,10 @@ def scan_ticker_leaps(scanner, ticker, strict_mode=True, pre_fetched_data=None,
             logger.error("❌ Strict Mode: No History Data. Aborting.")
             return None
 
-        df = scanner.technical_analyzer.prepare_dataframe(price_history)
+        # Shared IndicatorFrame: the CALL and PUT passes (and the detail route)
+        # reuse one DataFrame + indicator suite for the same history
+        frame = scanner.technical_analyzer.get_indicator_frame(ticker, price_history)
+        df = frame.df if frame else None
         if df is None or len(df) < 50:
             logger.error("❌ Insufficient Data for Analysis.")
             return None
@@ -263,7 +299,7 @@ def scan_ticker_leaps(scanner, ticker, strict_mode=True, pre_fetched_data=None,
 
         # price_history verified in Phase 1
 
-        indicators = scanner.technical_analyzer.get_all_indicators(price_history)
+        indicators = frame.indicators_copy()
 
         if not indicators:
             logger.error(f"❌ Failed to calculate technical indicators")
@@ -279,7 +315,8 @@ def scan_ticker_leaps(scanner, ticker, strict_mode=True, pre_fetched_data=None,
 
         try:
             # 1. Try Premium "News Sentiment" endpoint first
-            premium_sentiment = scanner.finnhub_api.get_news_sentiment(clean_ticker)
+            news_cache = type(scanner)._news_cache
+            premium_sentiment = news_cache.get_news_sentiment(scanner.finnhub_api, clean_ticker)
 
             if premium_sentiment and premium_sentiment != "FORBIDDEN" and 'sentiment' in premium_sentiment:
                 # Finnhub returns score 0.0 - 1.0 (Bearish < 0.5 < Bullish) -> Map to 0-100
@@ -300,7 +337,7 @@ def scan_ticker_leaps(scanner, ticker, strict_mode=True, pre_fetched_data=None,
                 else:
                     logger.info("ℹ️ Using Free Tier or Data Gap: Analyzing Headlines...")
 
-                news = scanner.finnhub_api.get_company_news(clean_ticker)
+                news = news_cache.get_company_news(scanner.finnhub_api, clean_ticker)
 
                 news_articles = []
                 if news:
@@ -315,11 +352,11 @@ def scan_ticker_leaps(scanner, ticker, strict_mode=True, pre_fetched_data=None,
                     logger.info(f"   • Analyzed {len(news_articles)} Finnhub articles")
 
                 if not news_articles:
-                    # 3. Ultimate Fallback to Free News APIs (Google/Yahoo)
-                    logger.warning("⚠️ No Finnhub news found, falling back to Google/Yahoo...")
-                    news_articles = scanner.news_api.get_all_news(clean_ticker)
+                    # 3. Ultimate Fallback: the other news providers, queried concurrently
+                    logger.warning("⚠️ No Finnhub news found, falling back to the other news providers...")
+                    news_articles = scanner.news_api.get_all_news(clean_ticker, skip=('finnhub',))
 
-                sentiment_analysis = scanner.sentiment_analyzer.analyze_articles(news_articles)
+                sentiment_analysis = scanner.sentiment_analyzer.analyze_articles(news_articles, clean_ticker)
                 sentiment_score = scanner.sentiment_analyzer.calculate_sentiment_score(sentiment_analysis)
                 logger.info(f"✓ Sentiment score: {sentiment_score:.1f}/100")
 
@@ -334,6 +371,18 @@ def scan_ticker_leaps(scanner, ticker, strict_mode=True, pre_fetched_data=None,
         opportunities = []
         options_data = None
 
+        # Predicate pushdown: LEAPs only want DTE >= 150 in ONE direction with
+        # LEAPS-grade liquidity (spread < 40%, OI >= 500). The fetch-level filter
+        # only trims expiries — chain skew (Option B below) still needs both
+        # sides and every strike of the first LEAP expiry.
+        leap_fetch_filter = ChainFilter(min_dte=150)
+        leap_parse_filter = ChainFilter(
+            min_dte=150,
+            direction=direction,
+            min_open_interest=500,
+            max_spread_pct=0.40,
+        )
+
         # [PHASE 3] ORATS / BATCH LOGIC
         if pre_fetched_data:
             logger.info(f"   ℹ️  Using Pre-Fetched Option Data (Batch Mode)")
@@ -341,7 +390,7 @@ def scan_ticker_leaps(scanner, ticker, strict_mode=True, pre_fetched_data=None,
         elif scanner.use_orats:
             logger.info(f"   ℹ️  Fetching from ORATS API...")
             try:
-                options_data = scanner.batch_manager.orats_api.get_option_chain(ticker)
+                options_data = scanner.batch_manager.orats_api.get_option_chain(ticker, chain_filter=leap_fetch_filter)
             except Exception as e:
                 logger.warning(f"   ⚠️ ORATS Fetch Failed: {e}")
                 options_data = None
@@ -350,11 +399,12 @@ def scan_ticker_leaps(scanner, ticker, strict_mode=True, pre_fetched_data=None,
 
         if options_data:
             # Enforce 30% Profit Floor for LEAPs
-            parsed_opps = scanner.options_analyzer.parse_options_chain(options_data, current_price, min_profit_override=30)
+            parsed_opps = scanner.options_analyzer.parse_options_chain(
+                options_data, current_price, min_profit_override=30, chain_filter=leap_parse_filter
+            )
 
-            # [FIX] ORATS returns ALL expiries. Filter for LEAPs (150+ days) manually if using ORATS
-            # Schwab API already filters min_days=150 internally.
-            # We apply a safety filter here for all data sources.
+            # [FIX] ORATS returns ALL expiries. The chain filter above already skips
+            # non-LEAP expiries; this safety filter re-checks DTE for all data sources.
             if parsed_opps:
                 leap_opps = []
                 for o in parsed_opps:
@@ -454,7 +504,7 @@ def scan_ticker_leaps(scanner, ticker, strict_mode=True, pre_fetched_data=None,
                     logger.info(f"   S1 Score Penalty: {regime_context.score_penalty}, Size Mult: {regime_context.position_size_multiplier}")
             elif scanner.use_orats:
                 # Fallback: original inline logic
-                vix_q = scanner.batch_manager.orats_api.get_quote('VIX')
+                vix_q = market_context.quote('VIX', scanner.batch_manager.orats_api)
                 if vix_q and vix_q.get('price'):
                     vix_level_leap = vix_q['price']
                     if vix_level_leap > 30:
@@ -498,7 +548,7 @@ def scan_ticker_leaps(scanner, ticker, strict_mode=True, pre_fetched_data=None,
         cores = None
         try:
             if scanner.use_orats:
-                cores = scanner.batch_manager.orats_api.get_hist_cores(clean_ticker)
+                cores = get_cores_record(scanner, clean_ticker, pre_fetched_cores)
                 if cores:
                     iv_percentile = cores.get('ivPctile1y', 50) or 50
                     logger.info(f"   IV Percentile (1Y): {iv_percentile}")
@@ -511,12 +561,15 @@ def scan_ticker_leaps(scanner, ticker, strict_mode=True, pre_fetched_data=None,
         try:
             if scanner.use_orats:
                 if not cores:  # re-fetch if needed
-                    cores = scanner.batch_manager.orats_api.get_hist_cores(clean_ticker)
+                    cores = get_cores_record(scanner, clean_ticker, pre_fetched_cores)
                 if cores:
                     days_to_earnings = cores.get('daysToNextErn')
                     implied_earnings_move = cores.get('impliedEarningsMove')
-                    if days_to_earnings is not None and days_to_earnings <= 14:
-                        logger.warning(f"   ⚠️ EARNINGS in {days_to_earnings} days (implied move: {implied_earnings_move})")
+            if days_to_earnings is None:
+                # Daily earnings index (no request)
+                days_to_earnings = type(scanner)._earnings_calendar.days_to_earnings(clean_ticker)
+            if days_to_earnings is not None and days_to_earnings <= 14:
+                logger.warning(f"   ⚠️ EARNINGS in {days_to_earnings} days (implied move: {implied_earnings_move})")
         except Exception as e:
             logger.warning(f"   ⚠️ Earnings check failed: {e}")
 
@@ -1,9 +1,70 @@
+import concurrent.futures
 import logging
 from datetime import datetime
 from backend.config import Config
+from backend.utils.chain_filter import ChainFilter
+from backend.services.scanner_weekly import WEEKLY_EXPIRY_FALLBACK_DAYS
+from backend.services.market_context import market_context
 
 logger = logging.getLogger(__name__)
 
+NEWS_PRIME_WORKERS = 4
+
+
+def _fresh_feature_snapshot(scanner):
+    """The nightly feature snapshot, if it holds the last ORATS (T-1) bar (else None)."""
+    store = getattr(type(scanner), '_feature_store', None)
+    try:
+        snapshot = store.current() if store is not None else None
+        return snapshot if store is not None and store.is_fresh(snapshot) else None
+    except Exception as e:
+        logger.debug(f"Feature snapshot unavailable: {e}")
+        return None
+
+
+def _prime_indicator_panel(scanner, batch_history):
+    """Compute indicators for a batch of histories in one panel pass.
+
+    The per-ticker scans that follow hit the shared IndicatorFrame cache
+    instead of running a full indicator pass each.
+    """
+    if not batch_history:
+        return
+    try:
+        orats_api = getattr(scanner.batch_manager, 'orats_api', None) if scanner.use_orats else None
+        scanner.technical_analyzer.prime_indicator_frames(
+            batch_history, benchmark_history=type(scanner)._benchmarks.get_history(orats_api, 'SPY'))
+    except Exception as e:
+        logger.warning(f"\u26a0\ufe0f Indicator panel failed: {e} (falling back to per-ticker indicators)")
+
+
+def _prime_headline_sentiment(scanner, tickers, max_articles):
+    """Score every ticker's headlines in a few batched LLM calls.
+
+    Only tickers without Finnhub premium sentiment are scored — those are the
+    ones the per-ticker scans would send to Perplexity one at a time. The
+    scans then hit the headline-score cache. `max_articles` must match the
+    scan's own news slice (10 weekly, 15 LEAP) so the headline sets agree.
+    """
+    if not tickers or not scanner.sentiment_analyzer.perplexity_api_key:
+        return
+    news_cache = type(scanner)._news_cache
+
+    def headlines_for(ticker):
+        clean = ticker.replace('$', '')
+        premium = news_cache.get_news_sentiment(scanner.finnhub_api, clean)
+        if premium and premium != 'FORBIDDEN' and 'sentiment' in premium:
+            return clean, None
+        news = news_cache.get_company_news(scanner.finnhub_api, clean) or []
+        return clean, [n.get('headline') for n in news[:max_articles] if n.get('headline')]
+
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=NEWS_PRIME_WORKERS) as pool:
+            headlines = {t: h for t, h in pool.map(headlines_for, tickers) if h}
+        scanner.sentiment_analyzer.score_headlines_batch(headlines)
+    except Exception as e:
+        logger.warning(f"\u26a0\ufe0f Batched headline sentiment failed: {e} (falling back to per-ticker scoring)")
+
 
 def scan_watchlist(scanner, username=None):
     """Scan all tickers in watchlist.
@@ -22,19 +83,33 @@ def scan_watchlist(scanner, username=None):
     if scanner.use_orats:
         logger.info(f"\U0001f680 Batch Fetching Options for {len(tickers)} tickers (ORATS)...")
         try:
-            batch_data = scanner.batch_manager.fetch_option_chains(tickers)
+            # Watchlist scans are LEAP scans: only 150+ DTE expiries are needed
+            batch_data = scanner.batch_manager.fetch_option_chains(tickers, chain_filter=ChainFilter(min_dte=150))
         except Exception as e:
             logger.warning(f"\u26a0\ufe0f Batch Fetch Failed: {e}")
+
+    # Batch history + one panel indicator pass for the whole watchlist
+    batch_history = {}
+    orats_api = getattr(scanner.batch_manager, 'orats_api', None) if scanner.use_orats else None
+    if orats_api:
+        try:
+            batch_history = orats_api.get_history_batch(tickers)
+        except Exception as e:
+            logger.warning(f"\u26a0\ufe0f Batch History Fetch Failed: {e} (will fall back to per-ticker)")
+    _prime_indicator_panel(scanner, batch_history)
+    _prime_headline_sentiment(scanner, tickers, max_articles=15)
     
-    results = []
-    for item in watchlist:
-        t = item['ticker']
-        # Pass pre-fetched data if available
-        opts = batch_data.get(t)
+    # One bulk write of every ticker's result when the loop ends (result_writer.py)
+    with scanner._result_writer.batch():
+        results = []
+        for item in watchlist:
+            t = item['ticker']
+            # Pass pre-fetched data if available
+            opts = batch_data.get(t)
         
-        result = scanner.scan_ticker(t, pre_fetched_data=opts)
-        if result:
-            results.append(result)
+            result = scanner.scan_ticker(t, pre_fetched_data=opts, pre_fetched_history=batch_history.get(t))
+            if result:
+                results.append(result)
     
     # Sort
     results.sort(key=lambda x: x['opportunities'][0]['opportunity_score'] if x['opportunities'] else 0, reverse=True)
@@ -69,7 +144,7 @@ def scan_watchlist(scanner, username=None):
 # ═══════════════════════════════════════════════════════════════════════════════
 
 
-def _rank_options_candidates(candidates, min_market_cap=0, min_volume=0, limit=30):
+def _rank_options_candidates(candidates, min_market_cap=0, min_volume=0, limit=30, features=None):
     """Rank sector tickers by options-worthiness using ORATS core data.
 
     Uses a composite scoring model validated against professional options
@@ -80,6 +155,8 @@ def _rank_options_candidates(candidates, min_market_cap=0, min_volume=0, limit=3
         min_market_cap: Minimum market cap filter (user param, in thousands — ORATS mktCap unit)
         min_volume: Minimum stock volume filter (user param)
         limit: How many top candidates to return
+        features: Optional nightly feature snapshot (feature_store.py); each
+                  selected candidate gets its record under 'features'
 
     Returns:
         list[dict]: Top N candidates sorted by composite score,
@@ -199,6 +276,10 @@ def _rank_options_candidates(candidates, min_market_cap=0, min_volume=0, limit=3
     scored.sort(key=lambda x: x["scan_score"], reverse=True)
 
     top_n = scored[:limit]
+    if features is not None:
+        # Deep scans read trend/RS from here instead of recomputing from history
+        for c in top_n:
+            c["features"] = features.get(c["ticker"])
     if top_n:
         logger.info(
             f"\U0001f3af Smart Rank: Top {len(top_n)} selected "
@@ -296,7 +377,7 @@ def scan_sector_top_picks(scanner, sector, min_volume, min_market_cap, limit=30,
 
         # FMP path: still need ORATS coverage filter
         tickers = [c['symbol'] for c in candidates]
-        if type(scanner)._orats_universe:
+        if scanner.get_orats_universe():
             original_count = len(tickers)
             tickers = [t for t in tickers if scanner._is_orats_covered(t)]
             skipped = original_count - len(tickers)
@@ -312,7 +393,8 @@ def scan_sector_top_picks(scanner, sector, min_volume, min_market_cap, limit=30,
             all_sector_tickers,
             min_market_cap=min_market_cap,
             min_volume=min_volume,
-            limit=limit
+            limit=limit,
+            features=_fresh_feature_snapshot(scanner),
         )
 
         if not candidates:
@@ -330,11 +412,19 @@ def scan_sector_top_picks(scanner, sector, min_volume, min_market_cap, limit=30,
     # ═══════════════════════════════════════════════════════════════════════
     # Step 3: Batch Fetch Option Chains (concurrent)
     # ═══════════════════════════════════════════════════════════════════════
+    # DTE window pushed into /live/strikes: LEAPs only need 150+ DTE; weekly
+    # scans only need up to the furthest possible target Friday plus the
+    # nearest-expiry fallback window used by scan_weekly.
+    if weeks_out is None:
+        batch_filter = ChainFilter(min_dte=150)
+    else:
+        batch_filter = ChainFilter(max_dte=(weeks_out + 1) * 7 + WEEKLY_EXPIRY_FALLBACK_DAYS)
+
     batch_data = {}
     if scanner.use_orats:
         logger.info(f"\U0001f680 Batch Fetching Options for {len(tickers)} tickers (ORATS)...")
         try:
-            batch_data = scanner.batch_manager.fetch_option_chains(tickers)
+            batch_data = scanner.batch_manager.fetch_option_chains(tickers, chain_filter=batch_filter)
         except Exception as e:
             logger.warning(f"\u26a0\ufe0f Batch Fetch Failed: {e}")
 
@@ -354,6 +444,9 @@ def scan_sector_top_picks(scanner, sector, min_volume, min_market_cap, limit=30,
             logger.info(f"\u2705 Batch History: {len(batch_history)}/{len(tickers)} tickers fetched")
         except Exception as e:
             logger.warning(f"\u26a0\ufe0f Batch History Fetch Failed: {e} (will fall back to per-ticker)")
+    _prime_indicator_panel(scanner, batch_history)
+    # Weekly scans score news[:10], LEAP scans news[:15]
+    _prime_headline_sentiment(scanner, tickers, max_articles=10 if weeks_out is not None else 15)
 
     # ═══════════════════════════════════════════════════════════════════════
     # Step 4: Deep Scan (sequential per ticker)
@@ -370,7 +463,7 @@ def scan_sector_top_picks(scanner, sector, min_volume, min_market_cap, limit=30,
             if vix_regime == 'CRISIS':
                 logger.warning(f"\u26a0\ufe0f CRISIS mode: tightening filters, reducing position sizes recommended")
         elif scanner.use_orats:
-            vix_quote = scanner.batch_manager.orats_api.get_quote('VIX')
+            vix_quote = market_context.quote('VIX', scanner.batch_manager.orats_api)
             if vix_quote and vix_quote.get('price'):
                 vix_level = vix_quote['price']
                 if vix_level > 30:
@@ -385,34 +478,43 @@ def scan_sector_top_picks(scanner, sector, min_volume, min_market_cap, limit=30,
     except Exception as e:
         logger.warning(f"\u26a0\ufe0f VIX regime detection failed: {e} (proceeding with NORMAL regime)")
 
-    all_results = []
-    for cand in candidates:
-        ticker = cand.get('symbol') or cand.get('ticker', '')
-        if not ticker:
-            continue
-
-        opts = batch_data.get(ticker)
-        hist = batch_history.get(ticker)  # Pre-fetched history (None if batch failed)
-
-        # Choose Scan Mode
-        if weeks_out is not None:
-            res = scanner.scan_weekly_options(ticker, weeks_out=weeks_out, pre_fetched_data=opts)
-        else:
-            res = scanner.scan_ticker(ticker, pre_fetched_data=opts, direction='CALL', pre_fetched_history=hist) # LEAP (calls)
-            # P0-17: Also scan for put LEAPs (bearish)
-            res_put = scanner.scan_ticker(ticker, pre_fetched_data=opts, direction='PUT', pre_fetched_history=hist)
-            if res_put and res_put.get('opportunities'):
-                if res and res.get('opportunities'):
-                    # Merge put opportunities into the call result
-                    res['opportunities'].extend(res_put['opportunities'])
-                else:
-                    res = res_put
-
-        if res and res.get('opportunities'):
-            # Carry forward scan_score from smart ranking (if available)
-            if 'scan_score' in cand:
-                res['scan_score'] = cand['scan_score']
-            all_results.append(res)
+    # One bulk write of every ticker's CALL/PUT results when the loop ends (result_writer.py)
+    with scanner._result_writer.batch():
+        all_results = []
+        for cand in candidates:
+            ticker = cand.get('symbol') or cand.get('ticker', '')
+            if not ticker:
+                continue
+
+            opts = batch_data.get(ticker)
+            hist = batch_history.get(ticker)  # Pre-fetched history (None if batch failed)
+            # The /cores record already carries IV rank, earnings and dividend fields;
+            # FMP fallback candidates don't, and scanners fall back to hist/cores.
+            cores = cand if cand.get('tradeDate') else None
+            features = cand.get('features')
+
+            # Choose Scan Mode
+            if weeks_out is not None:
+                res = scanner.scan_weekly_options(ticker, weeks_out=weeks_out, pre_fetched_data=opts,
+                                                  pre_fetched_cores=cores, pre_fetched_features=features)
+            else:
+                res = scanner.scan_ticker(ticker, pre_fetched_data=opts, direction='CALL', pre_fetched_history=hist,
+                                          pre_fetched_cores=cores, pre_fetched_features=features) # LEAP (calls)
+                # P0-17: Also scan for put LEAPs (bearish)
+                res_put = scanner.scan_ticker(ticker, pre_fetched_data=opts, direction='PUT', pre_fetched_history=hist,
+                                              pre_fetched_cores=cores, pre_fetched_features=features)
+                if res_put and res_put.get('opportunities'):
+                    if res and res.get('opportunities'):
+                        # Merge put opportunities into the call result
+                        res['opportunities'].extend(res_put['opportunities'])
+                    else:
+                        res = res_put
+
+            if res and res.get('opportunities'):
+                # Carry forward scan_score from smart ranking (if available)
+                if 'scan_score' in cand:
+                    res['scan_score'] = cand['scan_score']
+                all_results.append(res)
 
     # ═══════════════════════════════════════════════════════════════════════
     # Step 5: Global Filter & Regroup
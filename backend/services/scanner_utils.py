@@ -2,7 +2,8 @@ import logging
 import math
 import json
 from datetime import datetime, timedelta
-from backend.database.models import ScanResult, Opportunity, NewsCache
+from backend.database.models import ScanResult, session_scope
+from backend.services.market_context import market_context
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +31,68 @@ def calculate_spread_pct(bid, ask):
     return (ask - bid) / mid
 
 
+# Fields the scanners read from a cores record (P0-MM-L2 fundamentals, G9 IV rank,
+# G14 earnings, G15 dividends). All are requested by OratsAPI.get_cores_bulk().
+SCANNER_CORES_FIELDS = (
+    'ivPctile1y', 'daysToNextErn', 'impliedEarningsMove',
+    'avgOptVolu20d', 'divYield', 'divDate',
+)
+
+
+def get_cores_record(scanner, ticker, pre_fetched_cores=None):
+    """Return the T-1 cores record for a ticker, calling ORATS hist/cores only on a miss.
+
+    Lookup order:
+      1. pre_fetched_cores — the /cores bulk record a sector scan already holds
+      2. the shared /cores snapshot, if it is fresh (no refresh is triggered)
+      3. OratsAPI.get_hist_cores() — one round trip
+
+    A record only counts as a hit if it carries every SCANNER_CORES_FIELDS key
+    (a value may still be None), so older snapshots fall through to hist/cores.
+    """
+    clean_ticker = ticker.replace('$', '').upper()
+
+    def _complete(record):
+        return bool(record) and all(k in record for k in SCANNER_CORES_FIELDS)
+
+    if _complete(pre_fetched_cores):
+        return pre_fetched_cores
+
+    store = getattr(type(scanner), '_cores_store', None)
+    if store is not None:
+        try:
+            snapshot = store.current()
+            if store.is_fresh(snapshot):
+                record = snapshot.get(clean_ticker)
+                if _complete(record):
+                    return record
+        except Exception as e:
+            logger.debug(f"Cores snapshot lookup failed for {clean_ticker}: {e}")
+
+    return scanner.batch_manager.orats_api.get_hist_cores(clean_ticker)
+
+
+def get_ticker_features(scanner, ticker, pre_fetched_features=None):
+    """Return the nightly feature record for a ticker, or None (see feature_store.py).
+
+    Lookup order: pre_fetched_features (sector scan candidates), then the
+    shared feature snapshot if it holds the last close. No refresh is
+    triggered; callers fall back to computing from history on a miss.
+    """
+    if pre_fetched_features:
+        return pre_fetched_features
+    store = getattr(type(scanner), '_feature_store', None)
+    if store is None:
+        return None
+    try:
+        snapshot = store.current()
+        if store.is_fresh(snapshot):
+            return snapshot.get(ticker.replace('$', '').upper())
+    except Exception as e:
+        logger.debug(f"Feature snapshot lookup failed for {ticker}: {e}")
+    return None
+
+
 def calculate_greeks_black_scholes(scanner, S, K, T, sigma, r=0.045, opt_type='call'):
     """
     Estimate Greeks using Black-Scholes (Pure Python, no scipy).
@@ -149,56 +212,36 @@ def enrich_greeks(scanner, ticker, strike, expiry_date_str, opt_type, current_pr
 
 
 def cache_news(scanner, ticker, articles, sentiment_analysis):
+    """Store analyzed articles (with per-article sentiment) in the news cache.
+
+    Memory is updated at once; the NewsCache rows go through the result
+    writer, so inside a scan batch they land in the scan's one transaction.
+    """
     try:
-        scanner.db.query(NewsCache).filter(NewsCache.ticker == ticker).delete()
-        for i, article in enumerate(articles):
-            s = sentiment_analysis['sentiment_breakdown'][i]['sentiment'] if i < len(sentiment_analysis['sentiment_breakdown']) else 0
-            scanner.db.add(NewsCache(
-                ticker=ticker,
-                headline=article.get('headline'),
-                summary=article.get('summary'),
-                source=article.get('source'),
-                url=article.get('url'),
-                published_date=article.get('published_date'),
-                sentiment_score=s
-            ))
-        scanner.db.commit()
-    except Exception:
-        scanner.db.rollback()
+        breakdown = sentiment_analysis.get('sentiment_breakdown', [])
+        scores = [b.get('sentiment', 0) for b in breakdown]
+        ticker = (ticker or '').replace('$', '').strip().upper()
+        type(scanner)._news_cache.store_articles(ticker, articles, scores, persist=False)
+        scanner._result_writer.add_news(ticker, articles, scores)
+    except Exception as e:
+        logger.debug(f"News cache write failed for {ticker}: {e}")
 
 
 def save_scan_results(scanner, ticker, technical_score, sentiment_score, opportunities):
+    """Queue the scan result and its top opportunities (see result_writer.py)."""
     try:
-        avg_score = sum(o['opportunity_score'] for o in opportunities) / len(opportunities) if opportunities else 0
-        res = ScanResult(ticker=ticker, technical_score=technical_score, sentiment_score=sentiment_score, opportunity_score=avg_score, profit_potential=opportunities[0]['profit_potential'] if opportunities else 0)
-        scanner.db.add(res)
-        scanner.db.commit()
-
-        for opp in opportunities[:10]:
-            scanner.db.add(Opportunity(
-                scan_result_id=res.id,
-                ticker=ticker,
-                option_type=opp['option_type'],
-                strike_price=opp['strike_price'],
-                expiration_date=opp['expiration_date'],
-                premium=opp['premium'],
-                profit_potential=opp['profit_potential'],
-                days_to_expiry=opp['days_to_expiry'],
-                volume=opp['volume'],
-                open_interest=opp['open_interest'],
-                implied_volatility=opp.get('implied_volatility'),
-                delta=opp.get('delta'),
-                opportunity_score=opp['opportunity_score']
-            ))
-        scanner.db.commit()
-    except Exception:
-        scanner.db.rollback()
+        scanner._result_writer.add_scan(ticker, technical_score, sentiment_score, opportunities)
+    except Exception as e:
+        logger.warning(f"Saving scan results for {ticker} failed: {e}")
 
 
 def get_latest_results(scanner):
     try:
-        results = scanner.db.query(ScanResult).order_by(ScanResult.scan_date.desc()).limit(100).all()
-        return [{'ticker': r.ticker, 'opportunity_score': r.opportunity_score} for r in results]
+        with session_scope(scanner.session_factory) as db:
+            # Two columns straight off ix_scan_results_scan_date, no ORM objects
+            rows = (db.query(ScanResult.ticker, ScanResult.opportunity_score)
+                    .order_by(ScanResult.scan_date.desc()).limit(100).all())
+            return [{'ticker': ticker, 'opportunity_score': score} for ticker, score in rows]
     except Exception:
         return []
 
@@ -207,6 +250,28 @@ def get_ai_analysis(scanner, ticker, strategy="LEAP", expiry_date=None, **kwargs
     """
     Call the AI Reasoning Engine with Rich Context (News, Tech, GEX).
     """
+    context = build_ai_context(scanner, ticker, strategy, expiry_date, **kwargs)
+    return scanner.reasoning_engine.analyze_ticker(ticker, strategy, expiry_date, data=kwargs, context=context)
+
+
+def stream_ai_analysis(scanner, ticker, strategy="LEAP", expiry_date=None, **kwargs):
+    """
+    Streaming get_ai_analysis(): yields (event, payload) pairs for SSE relay.
+
+    A 'status' event goes out before the context scan so the browser shows
+    progress at once; the rest comes from ReasoningEngine.stream_analysis().
+    """
+    yield 'status', {'message': 'Gathering news, technicals and gamma levels...'}
+    context = build_ai_context(scanner, ticker, strategy, expiry_date, **kwargs)
+    yield 'status', {'message': 'Reasoning engine active...'}
+    yield from scanner.reasoning_engine.stream_analysis(ticker, strategy, expiry_date, data=kwargs, context=context)
+
+
+def build_ai_context(scanner, ticker, strategy="LEAP", expiry_date=None, **kwargs):
+    """
+    Gather the AI prompt context (price, news, technicals, GEX, VIX, earnings, Greeks)
+    from a weekly scan of `ticker`. Failures leave the context partially filled.
+    """
     logger.info(f"AI Analysis Requested for {ticker} (Strategy: {strategy})...")
 
     # 1. Gather Context (Reuse Scan Logic)
@@ -285,7 +350,7 @@ def get_ai_analysis(scanner, ticker, strategy="LEAP", expiry_date=None, **kwargs
             # XC-1: VIX regime context for AI reasoning
             try:
                 if scanner.use_orats:
-                    vix_q = scanner.batch_manager.orats_api.get_quote('VIX')
+                    vix_q = market_context.quote('VIX', scanner.batch_manager.orats_api)
                     if vix_q and vix_q.get('price'):
                         vl = vix_q['price']
                         vr = 'CRISIS' if vl > 30 else ('ELEVATED' if vl > 20 else 'NORMAL')
@@ -296,6 +361,19 @@ def get_ai_analysis(scanner, ticker, strategy="LEAP", expiry_date=None, **kwargs
             except Exception:
                 pass  # VIX is supplementary, don't block on failure
 
+            # Next earnings report from the daily index (no request)
+            try:
+                event = type(scanner)._earnings_calendar.next_earnings(ticker)
+                if event:
+                    context['earnings'] = {
+                        'date': event.date,
+                        'hour': event.hour,
+                        'eps_estimate': event.eps_estimate,
+                        'days_to_earnings': event.days_until(),
+                    }
+            except Exception:
+                pass  # Earnings context is supplementary
+
             # E. Option Greeks (Fix 3: Find specific option if strike+type provided)
             req_strike = kwargs.get('strike')
             req_type = kwargs.get('type')
@@ -343,7 +421,7 @@ def get_ai_analysis(scanner, ticker, strategy="LEAP", expiry_date=None, **kwargs
         logger.warning(f"Context gather failed: {e}")
         # Continue without context rather than failing
 
-    return scanner.reasoning_engine.analyze_ticker(ticker, strategy, expiry_date, data=kwargs, context=context)
+    return context
 
 
 def sanitize_for_json(obj):
@@ -381,7 +459,8 @@ def get_sentiment_score(scanner, ticker):
 
     try:
         # 1. Try Premium "News Sentiment" endpoint first
-        premium_sentiment = scanner.finnhub_api.get_news_sentiment(ticker.replace('$', ''))
+        news_cache = type(scanner)._news_cache
+        premium_sentiment = news_cache.get_news_sentiment(scanner.finnhub_api, ticker.replace('$', ''))
 
         if premium_sentiment and premium_sentiment != "FORBIDDEN" and 'sentiment' in premium_sentiment:  # Check structure
             # Finnhub returns score 0.0 - 1.0 (Bearish < 0.5 < Bullish)
@@ -398,13 +477,13 @@ def get_sentiment_score(scanner, ticker):
             sentiment_analysis['article_count'] = 100  # Proxy
 
             # Still try to get headlines for context!
-            news = scanner.finnhub_api.get_company_news(ticker.replace('$', ''))
+            news = news_cache.get_company_news(scanner.finnhub_api, ticker.replace('$', ''))
             if news:
                 sentiment_analysis['headlines'] = [n.get('headline') for n in news[:10] if n.get('headline')]
 
         else:
             # 2. Fallback to Free "Company News" + Local Analysis
-            news = scanner.finnhub_api.get_company_news(ticker.replace('$', ''))
+            news = news_cache.get_company_news(scanner.finnhub_api, ticker.replace('$', ''))
             if news:
                 news_articles = []
                 headlines_list = []
@@ -421,7 +500,7 @@ def get_sentiment_score(scanner, ticker):
                     })
 
                 sentiment_analysis['headlines'] = headlines_list
-                sentiment_analysis = scanner.sentiment_analyzer.analyze_articles(news_articles)
+                sentiment_analysis = scanner.sentiment_analyzer.analyze_articles(news_articles, ticker.replace('$', ''))
                 # RE-ATTACH headlines because analyze_articles might return a new dict or overwrite?
                 # best to ensure it's there
                 sentiment_analysis['headlines'] = headlines_list
@@ -478,7 +557,8 @@ def get_detailed_analysis(scanner, ticker, expiry_date=None):
         if history:
             logger.debug("Preparing DataFrame...")
             # Use get_all_indicators for full indicator suite (matches weekly scan output)
-            indicators = scanner.technical_analyzer.get_all_indicators(history)
+            frame = scanner.technical_analyzer.get_indicator_frame(ticker, history)
+            indicators = frame.indicators_copy() if frame else None
             
             if indicators:
                 logger.debug(f"Full indicators computed via get_all_indicators")
@@ -547,5 +627,7 @@ def get_detailed_analysis(scanner, ticker, expiry_date=None):
 
 
 def close(scanner):
-    scanner.watchlist_service.close()
-    scanner.db.close()
+    # DB sessions are per task (session_scope); only a built watchlist client is left to close
+    built = vars(scanner)
+    if 'watchlist_service' in built:
+        built['watchlist_service'].close()
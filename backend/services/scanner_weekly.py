@@ -1,18 +1,95 @@
+import concurrent.futures
 import logging
 import math
 from datetime import datetime, timedelta
+import numpy as np
 from backend.config import Config
-from backend.services.scanner_utils import calculate_spread_pct
+from backend.services.scanner_utils import calculate_spread_pct, get_cores_record, get_ticker_features
+from backend.services.feature_store import patch_live_bar
+from backend.services.market_context import market_context
 from backend.database.models import Opportunity
+from backend.utils.chain_filter import ChainFilter
 
 logger = logging.getLogger(__name__)
 
+# Chain fetch window past the target Friday. Wide enough that the
+# nearest-expiry fallback still finds a monthly for names without weeklies,
+# narrow enough to skip every LEAP/quarterly expiry during standardization.
+WEEKLY_EXPIRY_FALLBACK_DAYS = 35
 
-def scan_weekly(scanner, ticker, weeks_out=0, strategy_tag="WEEKLY", pre_fetched_data=None):
+# Per-ticker budget for the concurrent data-gathering phase of scan_weekly.
+# Calls still running at the deadline are treated like a failed API call.
+WEEKLY_IO_DEADLINE = 20  # seconds
+
+
+def _fetch_weekly_inputs(scanner, ticker, target_friday, pre_fetched_data=None, pre_fetched_cores=None,
+                         need_spy_history=True):
+    """Issue scan_weekly's independent I/O concurrently under one deadline.
+
+    History, live quote, SPY history, Finnhub sentiment/news, the earnings
+    calendar, the cores record and the option chain don't depend on each
+    other, so gathering them costs the slowest call instead of the sum.
+
+    Returns:
+        dict: task name -> result (None if the call failed or missed the deadline).
+    """
+    clean_ticker = ticker.replace('$', '')
+    today = datetime.now().date()
+    tasks = {}
+
+    if scanner.use_orats:
+        orats_api = scanner.batch_manager.orats_api
+        tasks['history'] = lambda: orats_api.get_history(ticker)
+        tasks['quote'] = lambda: orats_api.get_quote(ticker)
+        if need_spy_history:
+            # Cache hit after the first scan of the session
+            tasks['spy_history'] = lambda: type(scanner)._benchmarks.get_history(orats_api, 'SPY')
+        tasks['cores'] = lambda: get_cores_record(scanner, ticker, pre_fetched_cores)
+        if not pre_fetched_data:
+            # Predicate pushdown: only standardize expiries up to the fallback window
+            weekly_filter = ChainFilter(max_dte=(target_friday - today).days + WEEKLY_EXPIRY_FALLBACK_DAYS)
+            tasks['chain'] = lambda: orats_api.get_option_chain(ticker, chain_filter=weekly_filter)
+
+    # Premium sentiment and free-tier news are requested together; news is
+    # only used when the premium endpoint is FORBIDDEN or empty.
+    # Both are served from the news cache on repeat scans.
+    news_cache = type(scanner)._news_cache
+    tasks['premium_sentiment'] = lambda: news_cache.get_news_sentiment(scanner.finnhub_api, clean_ticker)
+    tasks['news'] = lambda: news_cache.get_company_news(scanner.finnhub_api, clean_ticker)
+    # P0-3: Earnings risk check (next 7 days) from the daily market-wide index;
+    # only the first scan of the day can trigger its one bulk calendar call
+    tasks['earnings'] = lambda: type(scanner)._earnings_calendar.upcoming(
+        clean_ticker, within_days=7, finnhub_api=scanner.finnhub_api)
+
+    results = dict.fromkeys(tasks)
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=len(tasks))
+    try:
+        future_to_task = {executor.submit(fn): name for name, fn in tasks.items()}
+        done, pending = concurrent.futures.wait(future_to_task, timeout=WEEKLY_IO_DEADLINE)
+        for future in done:
+            name = future_to_task[future]
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                logger.warning(f"   {name} fetch failed for {ticker}: {e}")
+        if pending:
+            late = sorted(future_to_task[f] for f in pending)
+            logger.warning(f"   {ticker}: {WEEKLY_IO_DEADLINE}s I/O deadline hit, proceeding without {late}")
+    finally:
+        # Don't block on stragglers — their results are simply dropped
+        executor.shutdown(wait=False, cancel_futures=True)
+    return results
+
+
+def scan_weekly(scanner, ticker, weeks_out=0, strategy_tag="WEEKLY", pre_fetched_data=None, pre_fetched_cores=None,
+                pre_fetched_features=None):
     """
     Perform 'Weekly' or '0DTE' analysis.
     Incorporating Advanced Prop Trading Logic.
     pre_fetched_data: Optional injected option chain (for Batch Mode)
+    pre_fetched_cores: Optional ORATS /cores record; skips hist/cores when complete
+    pre_fetched_features: Optional nightly feature record; RS vs SPY is patched
+                          with the live price instead of loading SPY history
     """
     ticker = scanner._normalize_ticker(ticker)
     logger.info(f"\n{'='*50}")
@@ -22,19 +99,65 @@ def scan_weekly(scanner, ticker, weeks_out=0, strategy_tag="WEEKLY", pre_fetched
     # The correct calculation (with 0DTE/WEEKLY differentiation) happens later in the try block.
 
     try:
-        # 1. Fetch Price & Technical History (1 Year)
+        # 0. Target Date (pure date math — needed up front for the chain DTE window)
+        today = datetime.now().date()
+
+        # [FIX] 0DTE vs Weekly Scan Differentiation
+        # weeks_out=0 has TWO meanings:
+        # 1. 0DTE Scans (strategy_tag=="0DTE"): Same-day expiry, Mon-Fri only
+        # 2. Weekly Scans (strategy_tag=="WEEKLY"): "This Week" = next Friday, works any day
+
+        if weeks_out == 0 and strategy_tag == "0DTE":
+            # TRUE 0DTE: Same-day expiry for indices (Mon-Fri only)
+            if today.weekday() in [5, 6]:  # Saturday=5, Sunday=6
+                raise ValueError("0DTE scans only available Monday-Friday during market hours")
+
+            # Same-day expiry for true 0DTE
+            target_friday = today
+            target_friday_str = target_friday.strftime('%Y-%m-%d')
+            logger.info(f"Target Expiry (0DTE - Same Day): {target_friday_str}")
+
+        elif weeks_out == 0:
+            # WEEKLY "This Week": Next Friday (or Friday+7 if today IS Friday)
+            days_ahead = (4 - today.weekday() + 7) % 7
+
+            # Special case: If today IS Friday and we want "this week",
+            # use today for same-week expiry, not next Friday
+            if days_ahead == 0:
+                # Today is Friday
+                if strategy_tag == "WEEKLY":
+                    # For weekly scans on Friday, target is THIS Friday (today)
+                    target_friday = today
+                else:
+                    # For 0DTE on Friday, same day
+                    target_friday = today
+            else:
+                # Normal case: Next Friday
+                target_friday = today + timedelta(days=days_ahead)
+
+            target_friday_str = target_friday.strftime('%Y-%m-%d')
+            logger.info(f"Target Expiry (This Week): {target_friday_str}")
+
+        else:
+            # WEEKLY "Next Week" / "2 Weeks Out": Calculate future Fridays
+            days_ahead = (4 - today.weekday() + 7) % 7
+            target_friday = today + timedelta(days=days_ahead + (weeks_out * 7))
+            target_friday_str = target_friday.strftime('%Y-%m-%d')
+            logger.info(f"Target Expiry (+{weeks_out} week(s)): {target_friday_str}")
+
+        # Gather all independent I/O concurrently; CPU analysis starts once it's in
+        features = get_ticker_features(scanner, ticker, pre_fetched_features)
+        fetched = _fetch_weekly_inputs(scanner, ticker, target_friday, pre_fetched_data, pre_fetched_cores,
+                                       need_spy_history=not (features and features.get('rs_vs_spy') is not None))
+        if fetched.get('cores'):
+            pre_fetched_cores = fetched['cores']  # Reused by the enrichment block below
+
+        # 1. Price & Technical History (1 Year)
         # Using ORATS Priority -> Yahoo Fallback
         logger.info(f"[1/6] Fetching History & Technicals...")
-        price_history = None
-
-        # ORATS Primary
-        if scanner.use_orats:
-            try:
-                price_history = scanner.batch_manager.orats_api.get_history(ticker)
-                if price_history:
-                    logger.info(f"   History fetched from ORATS ({len(price_history.get('candles', []))} candles)")
-            except Exception as e:
-                logger.warning(f"   ORATS History Error: {e}")
+        price_history = fetched.get('history')
+        if price_history:
+            logger.info(f"   History fetched from ORATS ({len(price_history.get('candles', []))} candles)")
 
         # (Yahoo History Fallback Removed - Strict Mode)
 
@@ -44,52 +167,62 @@ def scan_weekly(scanner, ticker, weeks_out=0, strategy_tag="WEEKLY", pre_fetched
             logger.error("Failed to get price history")
             return None
 
-        # Calculate Indicators
-        indicators = scanner.technical_analyzer.get_all_indicators(price_history)
-        df = scanner.technical_analyzer.prepare_dataframe(price_history)
-
-        # [FIX] Fetch LIVE Quote to ensure we have the real-time price, not yesterday's close
-        # [FIX] Fetch LIVE Quote (ORATS)
+        # [FIX] Apply LIVE Quote to ensure we have the real-time price, not yesterday's close
+        # [FIX] LIVE Quote (ORATS)
+        real_time_price = 0
         try:
-            real_time_price = 0
-            if scanner.use_orats:
-                q = scanner.batch_manager.orats_api.get_quote(ticker)
-                if q:
-                    real_time_price = q.get('price', 0)
+            q = fetched.get('quote')
+            if q:
+                real_time_price = q.get('price', 0) or 0
 
 
             # (Yahoo Quote Fallback Removed - Strict Mode)
 
             if real_time_price:
                 logger.info(f"Live Price Fetched: ${real_time_price:.2f} (Updating History)")
-                df.iloc[-1, df.columns.get_loc('Close')] = real_time_price
         except Exception as e:
             logger.warning(f"Live Quote Error: {e}, using history close.")
+            real_time_price = 0
+
+        # Calculate Indicators — shared IndicatorFrame with the live price already
+        # applied to the last bar, so RSI/MACD/BB/ATR/HV all see the same Close
+        frame = scanner.technical_analyzer.get_indicator_frame(ticker, price_history, live_price=real_time_price or None)
+        if frame is None:
+            logger.error("Failed to prepare price history")
+            return None
+        indicators = frame.indicators_copy()  # Mutated below (Minervini criterion 8)
+        df = frame.df
 
         current_price = df['Close'].iloc[-1]
         current_date = df.index[-1].date()
         logger.info(f"Current Price: ${current_price:.2f}")
 
-        # Advanced Metrics
-        atr = scanner.technical_analyzer.calculate_atr(df)
-        hv_rank = scanner.technical_analyzer.calculate_hv_rank(df)
+        # Advanced Metrics (computed once inside the frame)
+        atr = frame.atr
+        hv_rank = frame.hv_rank
 
         # Relative Strength vs SPY
         rs_score = 0
-        # F11 FIX: Use class-level cache to avoid re-fetching SPY per instance
-        if type(scanner)._spy_history is None:
-            logger.info("Fetching SPY History for Relative Strength (ORATS)...")
-            if scanner.use_orats:
-                try:
-                    type(scanner)._spy_history = scanner.batch_manager.orats_api.get_history('SPY')
-                except Exception as e:
-                    logger.warning(f"SPY History Failed: {e}")
-                    type(scanner)._spy_history = None
-
-        if type(scanner)._spy_history:
-            df_spy = scanner.technical_analyzer.prepare_dataframe(type(scanner)._spy_history)
-            rs_score = scanner.technical_analyzer.calculate_relative_strength(df, df_spy)
+
+        if features and features.get('tradeDate') != current_date.isoformat():
+            features = None  # Snapshot describes a different last bar than this history
+        if frame.relative_strength is not None:
+            # Already computed for this frame's closes in a batched panel pass
+            rs_score = frame.relative_strength
             logger.info(f"Relative Strength vs SPY: {rs_score:.2f}%")
+        elif features and features.get('rs_vs_spy') is not None:
+            # Nightly feature store: patch the live price into the last bar
+            # numpy scalar like calculate_relative_strength(), so criterion 8 scores the same
+            rs_score = np.float64(patch_live_bar(features, current_price)['rs_vs_spy'])
+            logger.info(f"Relative Strength vs SPY: {rs_score:.2f}% (feature store)")
+        else:
+            # Shared benchmark cache (refreshed on trading-day rollover), aligned onto
+            # this ticker's dates so both 5-bar returns cover the same sessions
+            orats_api = scanner.batch_manager.orats_api if scanner.use_orats else None
+            df_spy = type(scanner)._benchmarks.aligned_df(orats_api, 'SPY', df)
+            if df_spy is not None:
+                rs_score = scanner.technical_analyzer.calculate_relative_strength(df, df_spy)
+                logger.info(f"Relative Strength vs SPY: {rs_score:.2f}%")
 
         # Inject RS score into Minervini criterion 8 if available
         if indicators.get('minervini') and rs_score is not None:
@@ -115,7 +248,7 @@ def scan_weekly(scanner, ticker, weeks_out=0, strategy_tag="WEEKLY", pre_fetched
 
         try:
             # 1. Try Premium "News Sentiment" endpoint first
-            premium_sentiment = scanner.finnhub_api.get_news_sentiment(ticker.replace('$',''))
+            premium_sentiment = fetched.get('premium_sentiment')
 
             if premium_sentiment and premium_sentiment != "FORBIDDEN" and 'sentiment' in premium_sentiment: # Check structure
                 # Finnhub returns score 0.0 - 1.0 (Bearish < 0.5 < Bullish)
@@ -132,7 +265,7 @@ def scan_weekly(scanner, ticker, weeks_out=0, strategy_tag="WEEKLY", pre_fetched
             else:
                 # 2. Fallback to Free "Company News" + Local Analysis
                 logger.info("Using Free Tier: Analyzing Headlines...")
-                news = scanner.finnhub_api.get_company_news(ticker.replace('$',''))
+                news = fetched.get('news')
                 if news:
                     news_articles = []
                     for n in news[:10]: # Analyze top 10
@@ -155,79 +288,22 @@ def scan_weekly(scanner, ticker, weeks_out=0, strategy_tag="WEEKLY", pre_fetched
             # Keep default 50
 
 
-        # 3. Target Date & Earnings
-        today = datetime.now().date()
-
-        # [FIX] 0DTE vs Weekly Scan Differentiation
-        # weeks_out=0 has TWO meanings:
-        # 1. 0DTE Scans (strategy_tag=="0DTE"): Same-day expiry, Mon-Fri only
-        # 2. Weekly Scans (strategy_tag=="WEEKLY"): "This Week" = next Friday, works any day
-
-        if weeks_out == 0 and strategy_tag == "0DTE":
-            # TRUE 0DTE: Same-day expiry for indices (Mon-Fri only)
-            if today.weekday() in [5, 6]:  # Saturday=5, Sunday=6
-                raise ValueError("0DTE scans only available Monday-Friday during market hours")
-
-            # Same-day expiry for true 0DTE
-            target_friday = today
-            target_friday_str = target_friday.strftime('%Y-%m-%d')
-            logger.info(f"Target Expiry (0DTE - Same Day): {target_friday_str}")
-
-        elif weeks_out == 0:
-            # WEEKLY "This Week": Next Friday (or Friday+7 if today IS Friday)
-            days_ahead = (4 - today.weekday() + 7) % 7
-
-            # Special case: If today IS Friday and we want "this week",
-            # use today for same-week expiry, not next Friday
-            if days_ahead == 0:
-                # Today is Friday
-                if strategy_tag == "WEEKLY":
-                    # For weekly scans on Friday, target is THIS Friday (today)
-                    target_friday = today
-                else:
-                    # For 0DTE on Friday, same day
-                    target_friday = today
-            else:
-                # Normal case: Next Friday
-                target_friday = today + timedelta(days=days_ahead)
-
-            target_friday_str = target_friday.strftime('%Y-%m-%d')
-            logger.info(f"Target Expiry (This Week): {target_friday_str}")
-
-        else:
-            # WEEKLY "Next Week" / "2 Weeks Out": Calculate future Fridays
-            days_ahead = (4 - today.weekday() + 7) % 7
-            target_friday = today + timedelta(days=days_ahead + (weeks_out * 7))
-            target_friday_str = target_friday.strftime('%Y-%m-%d')
-            logger.info(f"Target Expiry (+{weeks_out} week(s)): {target_friday_str}")
-
+        # 3. Earnings
         earnings_date = None
         has_earnings_risk = False
         earnings_move = None
 
         # P0-3: Re-enable earnings risk check via Finnhub (was stripped during Strict Mode migration)
         try:
-            from datetime import date, timedelta as td
-            today_str = date.today().isoformat()
-            future_str = (date.today() + td(days=7)).isoformat()
-
-            earnings = scanner.finnhub_api.get_earnings_calendar(
-                symbol=ticker,
-                from_date=today_str,
-                to_date=future_str
-            )
+            earnings = fetched.get('earnings')
             if earnings:
                 nearest = earnings[0]
                 earnings_date = nearest.get('date')
                 has_earnings_risk = True
-                # Try to get implied move from ORATS hist/cores
-                if scanner.use_orats:
-                    try:
-                        cores = scanner.batch_manager.orats_api.get_hist_cores(ticker)
-                        if cores:
-                            earnings_move = cores.get('impliedEarningsMove')
-                    except Exception:
-                        pass
+                # Implied move from the ORATS cores record (fetched alongside)
+                cores = fetched.get('cores')
+                if cores:
+                    earnings_move = cores.get('impliedEarningsMove')
                 logger.warning(f"   EARNINGS in {earnings_date} (EPS est: {nearest.get('epsEstimate', 'N/A')}, "
                       f"implied move: {earnings_move or 'N/A'})")
         except Exception as e:
@@ -240,10 +316,8 @@ def scan_weekly(scanner, ticker, weeks_out=0, strategy_tag="WEEKLY", pre_fetched
         # [PHASE 3] ORATS / BATCH LOGIC
         if pre_fetched_data:
             opts = pre_fetched_data
-        elif scanner.use_orats:
-            try:
-                opts = scanner.batch_manager.orats_api.get_option_chain(ticker)
-            except Exception: opts = None
+        else:
+            opts = fetched.get('chain')
 
         # ORATS Post-Processing: Filtering for Target Expiry (Weekly/0DTE)
         # ORATS returns full chain. Schwab returns filtered chain.
@@ -575,18 +649,20 @@ def scan_weekly(scanner, ticker, weeks_out=0, strategy_tag="WEEKLY", pre_fetched
                 regime_context_weekly = scanner.regime_detector.detect()
                 vix_regime_weekly = regime_context_weekly.regime_str
             elif scanner.use_orats:
-                vix_q_w = scanner.batch_manager.orats_api.get_quote('VIX')
+                vix_q_w = market_context.quote('VIX', scanner.batch_manager.orats_api)
                 if vix_q_w and vix_q_w.get('price'):
                     vl_w = vix_q_w['price']
                     if vl_w > 30: vix_regime_weekly = 'CRISIS'
                     elif vl_w > 20: vix_regime_weekly = 'ELEVATED'
 
             if scanner.use_orats:
-                cores_w = scanner.batch_manager.orats_api.get_hist_cores(ticker.replace('$', ''))
+                cores_w = get_cores_record(scanner, ticker, pre_fetched_cores)
                 if cores_w:
                     iv_percentile_weekly = cores_w.get('ivPctile1y', 50) or 50
                     days_to_earnings_weekly = cores_w.get('daysToNextErn')
                     implied_earnings_move_weekly = cores_w.get('impliedEarningsMove')
+            if days_to_earnings_weekly is None:
+                days_to_earnings_weekly = type(scanner)._earnings_calendar.days_to_earnings(ticker)
         except Exception as e:
             logger.warning(f"   Weekly enrichment fetch failed: {e}")
 
@@ -0,0 +1,222 @@
+"""
+Symbol Master — O(1) symbol reference data
+==========================================
+Sector lookups were scattered and slow:
+
+  - WatchlistService._get_sector scraped yf.Ticker(t).info on every add
+  - ContextService._find_sector_etf and SectorAnalysis._find_sector scanned
+    hardcoded ETF member lists one sector at a time
+
+SymbolMaster answers symbol -> sector, industry, sector ETF, market cap and
+ORATS coverage from one in-memory dict, built once from the UniverseStore
+(tickers.json + orats_universe.json) and overlaid per lookup with the
+/cores snapshot's bestEtf / sectorName (one row-index hit, no row copy).
+
+Sector ETF precedence: curated SECTOR_ETF_MEMBERS, then /cores bestEtf
+(when it is one of the 11 SPDR sector ETFs), then the tickers.json sector
+name mapped through SECTOR_NAME_ETFS.
+"""
+
+import logging
+import threading
+from dataclasses import dataclass, replace
+from typing import Optional
+
+from backend.services.cores_store import cores_store as shared_cores_store
+from backend.services.universe_store import universe_store
+
+logger = logging.getLogger(__name__)
+
+# 11 SPDR sector ETFs (same universe as SectorAnalysis.SECTOR_MAP and market_context)
+SECTOR_ETF_NAMES = {
+    'XLK': 'Technology',
+    'XLF': 'Financials',
+    'XLV': 'Health Care',
+    'XLY': 'Consumer Discretionary',
+    'XLC': 'Communication Services',
+    'XLE': 'Energy',
+    'XLI': 'Industrials',
+    'XLP': 'Consumer Staples',
+    'XLU': 'Utilities',
+    'XLRE': 'Real Estate',
+    'XLB': 'Materials',
+}
+
+# Curated large-cap members (formerly ContextService.SECTOR_ETFS); these win
+# over /cores bestEtf, which can pick a non-sector ETF for megacaps
+SECTOR_ETF_MEMBERS = {
+    'XLK': ['AAPL', 'MSFT', 'NVDA', 'AMD', 'AVGO', 'ORCL', 'CRM', 'ADBE', 'CSCO', 'ACN',
+            'INTC', 'IBM', 'QCOM', 'TXN', 'AMAT', 'MU', 'LRCX', 'KLAC', 'SNPS', 'CDNS',
+            'NOW', 'PANW', 'CRWD', 'FTNT', 'PLTR', 'DELL', 'HPE', 'MRVL', 'ON', 'NXPI'],
+    'XLF': ['JPM', 'BAC', 'WFC', 'GS', 'MS', 'C', 'BLK', 'SCHW', 'AXP', 'SPGI'],
+    'XLV': ['UNH', 'JNJ', 'LLY', 'PFE', 'ABBV', 'MRK', 'TMO', 'ABT', 'DHR', 'BMY'],
+    'XLY': ['AMZN', 'TSLA', 'HD', 'MCD', 'NKE', 'SBUX', 'TJX', 'LOW', 'BKNG', 'CMG'],
+    'XLC': ['META', 'GOOGL', 'GOOG', 'NFLX', 'DIS', 'CMCSA', 'T', 'VZ', 'TMUS', 'CHTR'],
+    'XLE': ['XOM', 'CVX', 'COP', 'EOG', 'SLB', 'MPC', 'PSX', 'VLO', 'OXY', 'HAL'],
+    'XLI': ['RTX', 'HON', 'UPS', 'BA', 'CAT', 'DE', 'LMT', 'GE', 'MMM', 'UNP'],
+    'XLP': ['PG', 'KO', 'PEP', 'COST', 'WMT', 'PM', 'MO', 'CL', 'MDLZ', 'EL'],
+    'XLU': ['NEE', 'DUK', 'SO', 'D', 'AEP', 'SRE', 'EXC', 'XEL', 'ED', 'WEC'],
+    'XLRE': ['PLD', 'AMT', 'CCI', 'EQIX', 'PSA', 'SPG', 'O', 'WELL', 'DLR', 'AVB'],
+    'XLB': ['LIN', 'APD', 'SHW', 'ECL', 'FCX', 'NEM', 'NUE', 'VMC', 'MLM', 'DOW'],
+}
+_MEMBER_ETF = {symbol: etf for etf, members in SECTOR_ETF_MEMBERS.items() for symbol in members}
+
+# tickers.json (FMP/Yahoo) and GICS sector names -> SPDR sector ETF
+SECTOR_NAME_ETFS = {
+    'Technology': 'XLK',
+    'Information Technology': 'XLK',
+    'Financial Services': 'XLF',
+    'Financials': 'XLF',
+    'Healthcare': 'XLV',
+    'Health Care': 'XLV',
+    'Consumer Cyclical': 'XLY',
+    'Consumer Discretionary': 'XLY',
+    'Communication Services': 'XLC',
+    'Energy': 'XLE',
+    'Industrials': 'XLI',
+    'Consumer Defensive': 'XLP',
+    'Consumer Staples': 'XLP',
+    'Utilities': 'XLU',
+    'Real Estate': 'XLRE',
+    'Basic Materials': 'XLB',
+    'Materials': 'XLB',
+}
+
+
+@dataclass(frozen=True)
+class SymbolInfo:
+    """Reference data for one symbol."""
+    symbol: str
+    name: Optional[str] = None
+    sector: Optional[str] = None          # tickers.json sector name, e.g. 'Technology'
+    industry: Optional[str] = None        # tickers.json industry, else /cores sectorName
+    sector_etf: Optional[str] = None      # One of SECTOR_ETF_NAMES
+    market_cap: float = 0
+    volume: float = 0
+    orats_covered: bool = False
+
+    def as_dict(self):
+        return {
+            'symbol': self.symbol,
+            'name': self.name,
+            'sector': self.sector,
+            'industry': self.industry,
+            'sector_etf': self.sector_etf,
+            'market_cap': self.market_cap,
+            'volume': self.volume,
+            'orats_covered': self.orats_covered,
+        }
+
+
+def _clean(symbol):
+    return (symbol or '').replace('$', '').strip().upper()
+
+
+class SymbolMaster:
+    """Process-wide symbol -> SymbolInfo map over the ticker universe and /cores."""
+
+    def __init__(self, universe=None, cores_store=None):
+        """
+        Args:
+            universe: UniverseStore with tickers/industries/orats (default: the shared store)
+            cores_store: CoresSnapshotStore for bestEtf/sectorName (default: the
+                         scanner's shared /cores store)
+        """
+        self.universe = universe or universe_store
+        self.cores_store = cores_store or shared_cores_store
+        self._lock = threading.Lock()
+        self._entries = None
+        self._built_from = None          # The tickers list the entries were built from
+
+    def _table(self):
+        """symbol -> SymbolInfo, rebuilt only when the universe has been reloaded."""
+        tickers = self.universe.tickers
+        if self._built_from is not tickers:
+            with self._lock:
+                if self._built_from is not tickers:
+                    self._entries = self._build(tickers, self.universe.industries, self.universe.orats)
+                    self._built_from = tickers
+        return self._entries
+
+    @staticmethod
+    def _build(tickers, industries, orats):
+        entries = {}
+        for t, industry in zip(tickers, industries):
+            symbol = t.get('symbol')
+            if not symbol:
+                continue
+            sector = t.get('sector')
+            entries[symbol] = SymbolInfo(
+                symbol=symbol,
+                name=t.get('name') or None,
+                sector=sector,
+                industry=industry,
+                sector_etf=_MEMBER_ETF.get(symbol) or SECTOR_NAME_ETFS.get(sector),
+                market_cap=t.get('marketCap') or 0,
+                volume=t.get('volume') or 0,
+                orats_covered=symbol in orats,
+            )
+        logger.info(f"Symbol master built: {len(entries)} symbols")
+        return entries
+
+    def _cores_snapshot(self):
+        try:
+            return self.cores_store.current()
+        except Exception as e:
+            logger.debug(f"Symbol master: cores snapshot unavailable: {e}")
+            return None
+
+    # ── Lookups ─────────────────────────────────────────────────────
+
+    def get(self, symbol) -> Optional[SymbolInfo]:
+        """SymbolInfo for `symbol` with /cores fields applied, or None if unknown everywhere."""
+        symbol = _clean(symbol)
+        if not symbol:
+            return None
+        info = self._table().get(symbol)
+
+        snapshot = self._cores_snapshot()
+        best_etf = industry = None
+        if snapshot is not None:
+            best_etf = (snapshot.field(symbol, 'bestEtf') or '').upper()
+            industry = snapshot.field(symbol, 'sectorName')
+
+        if info is None:
+            orats_covered = symbol in self.universe.orats
+            if not (best_etf or industry or orats_covered):
+                return None
+            info = SymbolInfo(symbol=symbol, orats_covered=orats_covered)
+
+        updates = {}
+        if best_etf in SECTOR_ETF_NAMES and symbol not in _MEMBER_ETF and best_etf != info.sector_etf:
+            updates['sector_etf'] = best_etf
+        if industry and not info.industry:
+            updates['industry'] = industry
+        return replace(info, **updates) if updates else info
+
+    def sector(self, symbol) -> Optional[str]:
+        """Sector name (tickers.json), else the SPDR sector name of its sector ETF."""
+        info = self.get(symbol)
+        if info is None:
+            return None
+        return info.sector or SECTOR_ETF_NAMES.get(info.sector_etf)
+
+    def industry(self, symbol) -> Optional[str]:
+        info = self.get(symbol)
+        return info.industry if info else None
+
+    def sector_etf(self, symbol) -> Optional[str]:
+        """SPDR sector ETF for `symbol` (see module docstring for precedence), or None."""
+        info = self.get(symbol)
+        return info.sector_etf if info else None
+
+    def market_cap(self, symbol) -> float:
+        info = self._table().get(_clean(symbol))
+        return info.market_cap if info else 0
+
+    def is_orats_covered(self, symbol) -> bool:
+        return _clean(symbol) in self.universe.orats
+
+
+# Process-wide instance (watchlist, context capture, scanner)
+symbol_master = SymbolMaster()
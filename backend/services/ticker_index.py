@@ -0,0 +1,144 @@
+"""
+Ticker Index — server-side autocomplete over the ticker universe
+================================================================
+The autocomplete downloaded all of tickers.json (~10k records, 2.6 MB) on
+page load and filtered it in the browser on every keystroke.
+
+TickerIndex keeps the normalized ticker list in memory and answers
+search(query) from sorted prefix indexes:
+
+  - symbols and name words (e.g. "BANK", "AMERICA") are kept in sorted
+    lists, so a prefix lookup is a bisect plus a short scan
+  - every word of a multi-word query must prefix-match the ticker
+    ("bank of am" -> BAC)
+  - ranking: exact symbol, symbol prefix, name prefix, any name word;
+    within a tier by market cap, then volume
+  - the full list is serialized and gzipped once per load, with an ETag,
+    for the /api/tickers endpoint
+"""
+
+import bisect
+import gzip
+import hashlib
+import heapq
+import json
+import re
+import threading
+
+DEFAULT_LIMIT = 8
+MAX_LIMIT = 50
+
+# Ranking tiers (lower is better)
+TIER_EXACT_SYMBOL = 0
+TIER_SYMBOL_PREFIX = 1
+TIER_NAME_PREFIX = 2
+TIER_NAME_WORD = 3
+
+_WORD_RE = re.compile(r'[A-Z0-9]+')
+
+
+def _words(text):
+    return _WORD_RE.findall((text or '').upper())
+
+
+def _prefix_range(keys, prefix):
+    """Slice bounds of the entries in sorted `keys` that start with `prefix`."""
+    lo = bisect.bisect_left(keys, prefix)
+    # U+FFFF sorts after any character a ticker or company name uses
+    hi = bisect.bisect_right(keys, prefix + '\uffff', lo)
+    return lo, hi
+
+
+class TickerIndex:
+    """Immutable prefix index over the normalized ticker list."""
+
+    def __init__(self, tickers, state=None):
+        """
+        Args:
+            tickers: Normalized ticker dicts (symbol, name, exchange, sector,
+                     marketCap, volume) as built by UniverseStore
+            state: Sorted arrays from state() for the same `tickers`, to skip
+                   re-tokenizing and sorting (UniverseStore snapshot)
+        """
+        self.tickers = list(tickers or [])
+        self._payload = None
+        self._payload_lock = threading.Lock()
+
+        if state is not None:
+            self._symbol_keys, self._symbol_ids, self._word_keys, self._word_refs = state
+            return
+
+        symbols, words = [], []
+        for i, t in enumerate(self.tickers):
+            symbol = (t.get('symbol') or '').upper()
+            if symbol:
+                symbols.append((symbol, i))
+            for position, word in enumerate(_words(t.get('name'))):
+                words.append((word, i, position))
+        symbols.sort()
+        words.sort()
+        self._symbol_keys = [s for s, _ in symbols]
+        self._symbol_ids = [i for _, i in symbols]
+        self._word_keys = [w for w, _, _ in words]
+        self._word_refs = [(i, position) for _, i, position in words]
+
+    def state(self):
+        """The sorted prefix arrays, marshal/pickle-friendly."""
+        return (self._symbol_keys, self._symbol_ids, self._word_keys, self._word_refs)
+
+    def __len__(self):
+        return len(self.tickers)
+
+    def _rank_key(self, i, tier):
+        t = self.tickers[i]
+        return (tier, -(t.get('marketCap') or 0), -(t.get('volume') or 0), t.get('symbol') or '')
+
+    def _name_matches(self, word):
+        """ticker index -> best tier for tickers with a name word starting with `word`."""
+        lo, hi = _prefix_range(self._word_keys, word)
+        matches = {}
+        for i, position in self._word_refs[lo:hi]:
+            tier = TIER_NAME_PREFIX if position == 0 else TIER_NAME_WORD
+            if tier < matches.get(i, TIER_NAME_WORD + 1):
+                matches[i] = tier
+        return matches
+
+    def search(self, query, limit=DEFAULT_LIMIT):
+        """Top `limit` tickers matching `query`, best first."""
+        query = (query or '').strip().upper()
+        limit = max(1, min(int(limit or DEFAULT_LIMIT), MAX_LIMIT))
+        if not query:
+            return []
+
+        candidates = {}
+        # Symbol tiers use the raw query, so "BRK.B" and "BF-B" match as typed
+        lo, hi = _prefix_range(self._symbol_keys, query)
+        for symbol, i in zip(self._symbol_keys[lo:hi], self._symbol_ids[lo:hi]):
+            candidates[i] = TIER_EXACT_SYMBOL if symbol == query else TIER_SYMBOL_PREFIX
+
+        # Name tiers: every query word must prefix-match a word of the name;
+        # the tier comes from where the first query word matched
+        words = _words(query)
+        if words:
+            name_hits = self._name_matches(words[0])
+            for word in words[1:]:
+                if not name_hits:
+                    break
+                other = self._name_matches(word)
+                name_hits = {i: tier for i, tier in name_hits.items() if i in other}
+            for i, tier in name_hits.items():
+                candidates.setdefault(i, tier)
+
+        best = heapq.nsmallest(limit, candidates.items(), key=lambda item: self._rank_key(*item))
+        return [self.tickers[i] for i, _ in best]
+
+    def payload(self):
+        """(json_bytes, gzip_bytes, etag) for the full list, built once."""
+        if self._payload is None:
+            with self._payload_lock:
+                if self._payload is None:
+                    body = json.dumps({'success': True, 'tickers': self.tickers},
+                                      separators=(',', ':')).encode('utf-8')
+                    etag = hashlib.sha1(body).hexdigest()
+                    self._payload = (body, gzip.compress(body, compresslevel=6), etag)
+        return self._payload
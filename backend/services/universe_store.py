@@ -0,0 +1,273 @@
+"""
+Universe Store — ticker list and ORATS universe, loaded off-thread
+==================================================================
+HybridScannerService.__init__ json.load()ed tickers.json (2.6 MB) and
+orats_universe.json (712 KB) inside the first user request.
+
+UniverseStore:
+
+  - loads both files in a background thread, started at app import via
+    HybridScannerService.preload_universe(), so requests rarely wait
+  - keeps a compact marshal snapshot (universe.bin) holding only what the
+    scanner uses — the normalized ticker rows as tuples, their industries,
+    the ORATS symbol list and the autocomplete index's sorted arrays
+    (symbol_master.py builds on the same data) — rebuilt whenever
+    either JSON source changes (mtime/size)
+  - readers (tickers / index / orats) block only until the load finishes;
+    a worker forked (gunicorn --preload) before the master's load thread
+    finished restarts the load itself
+  - records per-phase timings for the scanner's startup report
+
+backend/scripts/refresh_tickers_v3.py rebuilds the snapshot after writing
+new JSON files, so production starts never parse JSON.
+"""
+
+import logging
+import marshal
+import os
+import threading
+import time
+from datetime import datetime
+
+from backend.config import Config
+from backend.services.ticker_index import TickerIndex
+
+logger = logging.getLogger(__name__)
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data')
+SNAPSHOT_VERSION = 2
+TICKER_FIELDS = ('symbol', 'name', 'exchange', 'sector', 'marketCap', 'volume')
+TICKER_MAX_AGE_DAYS = 90
+ORATS_MAX_AGE_DAYS = 7
+
+
+def _source_stamp(path):
+    try:
+        st = os.stat(path)
+        return [st.st_mtime_ns, st.st_size]
+    except OSError:
+        return None
+
+
+def _ticker_row(t):
+    """One normalized tickers.json record as a tuple in TICKER_FIELDS order."""
+    return (
+        (t.get('symbol') or '').upper(),
+        t.get('name', ''),
+        t.get('exchange', 'US'),
+        t.get('sector'),
+        t.get('marketCap', 0),
+        t.get('volume', 0),
+    )
+
+
+def _age_days(iso_timestamp):
+    if not iso_timestamp:
+        return None
+    try:
+        return (datetime.now() - datetime.fromisoformat(iso_timestamp)).days
+    except ValueError:
+        return None
+
+
+class UniverseStore:
+    """Ticker records, autocomplete index and ORATS coverage set, loaded once in the background."""
+
+    # Serializes the post-fork reset; only ever taken in a forked child
+    _fork_lock = threading.Lock()
+
+    def __init__(self, data_dir=None, snapshot_path=None):
+        """
+        Args:
+            data_dir: Directory holding tickers.json and orats_universe.json
+            snapshot_path: Marshal snapshot (default Config.UNIVERSE_SNAPSHOT_PATH
+                           or <data_dir>/universe.bin)
+        """
+        self.data_dir = data_dir or DATA_DIR
+        self.tickers_path = os.path.join(self.data_dir, 'tickers.json')
+        self.orats_path = os.path.join(self.data_dir, 'orats_universe.json')
+        self.snapshot_path = (snapshot_path or Config.UNIVERSE_SNAPSHOT_PATH
+                              or os.path.join(self.data_dir, 'universe.bin'))
+        self.timings = {}
+
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        self._thread = None
+        self._pid = os.getpid()          # Process that owns _thread
+        self._tickers = []
+        self._industries = []
+        self._index = TickerIndex([])
+        self._orats = frozenset()
+
+    # ── Loading ─────────────────────────────────────────────────────
+
+    def start(self):
+        """Begin loading in a daemon thread (no-op once started in this process)."""
+        if self._pid != os.getpid():
+            self._after_fork()
+        with self._lock:
+            if self._thread is None and not self._ready.is_set():
+                self._thread = threading.Thread(target=self._load_in_background,
+                                                name='universe-load', daemon=True)
+                self._thread.start()
+
+    def _after_fork(self):
+        """Forked child (gunicorn --preload): the parent's load thread did not come along.
+
+        Fresh lock and event (the parent's may have been mid-use at fork
+        time); an unfinished load is started again in this process.
+        """
+        with UniverseStore._fork_lock:
+            if self._pid == os.getpid():
+                return
+            ready = self._ready.is_set()
+            self._lock = threading.Lock()
+            self._ready = threading.Event()
+            if ready:
+                self._ready.set()
+            self._thread = None
+            self._pid = os.getpid()
+
+    def wait(self, timeout=None):
+        """Block until loaded, starting the load if nobody has. True when ready."""
+        self.start()
+        return self._ready.wait(timeout)
+
+    @property
+    def ready(self):
+        return self._ready.is_set()
+
+    def _load_in_background(self):
+        try:
+            self.reload()
+        except Exception as e:
+            logger.error(f"Universe load failed: {e}")
+        finally:
+            self._ready.set()
+
+    def reload(self):
+        """Load synchronously, from the snapshot when it matches both JSON sources."""
+        start = time.perf_counter()
+        sources = {'tickers': _source_stamp(self.tickers_path), 'orats': _source_stamp(self.orats_path)}
+
+        snapshot = self._read_snapshot(sources)
+        self.timings['source'] = 'snapshot' if snapshot else 'json'
+        fresh = snapshot is None
+        if fresh:
+            snapshot = self._parse_sources(sources)
+
+        t0 = time.perf_counter()
+        tickers = [dict(zip(TICKER_FIELDS, row)) for row in snapshot['tickers']]
+        industries = snapshot['industries']
+        index = TickerIndex(tickers, state=snapshot.get('index'))
+        orats = frozenset(snapshot['orats'])
+        self.timings['index_seconds'] = round(time.perf_counter() - t0, 3)
+
+        if fresh and (tickers or orats):
+            snapshot['index'] = index.state()
+            self._write_snapshot(snapshot)
+
+        self._tickers, self._industries, self._index, self._orats = tickers, industries, index, orats
+        self._ready.set()
+        self.timings['load_seconds'] = round(time.perf_counter() - start, 3)
+
+        self._log_age('Ticker list', snapshot.get('tickers_updated'), TICKER_MAX_AGE_DAYS,
+                      'backend/scripts/refresh_tickers.py')
+        self._log_age('ORATS universe', snapshot.get('orats_updated'), ORATS_MAX_AGE_DAYS,
+                      'backend/scripts/refresh_tickers_v3.py')
+        logger.info(f"Universe loaded from {self.timings['source']}: {len(tickers)} tickers, "
+                    f"{len(orats)} ORATS symbols in {self.timings['load_seconds']:.2f}s")
+
+    def _read_snapshot(self, sources):
+        t0 = time.perf_counter()
+        try:
+            with open(self.snapshot_path, 'rb') as f:
+                snapshot = marshal.loads(f.read())
+        except FileNotFoundError:
+            return None
+        except (EOFError, ValueError, TypeError, OSError) as e:
+            logger.warning(f"Universe snapshot unreadable, rebuilding: {e}")
+            return None
+        if (not isinstance(snapshot, dict) or snapshot.get('version') != SNAPSHOT_VERSION
+                or snapshot.get('sources') != sources):
+            return None
+        self.timings['snapshot_read_seconds'] = round(time.perf_counter() - t0, 3)
+        return snapshot
+
+    def _parse_sources(self, sources):
+        """Parse the JSON sources into the compact snapshot form."""
+        import json  # Only on a cold or stale snapshot
+
+        t0 = time.perf_counter()
+        snapshot = {'version': SNAPSHOT_VERSION, 'sources': sources,
+                    'tickers': [], 'industries': [], 'tickers_updated': None,
+                    'orats': [], 'orats_updated': None}
+        try:
+            with open(self.tickers_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            snapshot['tickers'] = [_ticker_row(t) for t in data.get('tickers', [])]
+            snapshot['industries'] = [t.get('industry') for t in data.get('tickers', [])]
+            snapshot['tickers_updated'] = data.get('last_updated')
+        except FileNotFoundError:
+            logger.error(f"Ticker file not found: {self.tickers_path}")
+            logger.warning("Run 'python backend/scripts/refresh_tickers.py' to create it")
+        except Exception as e:
+            logger.error(f"Error loading tickers: {e}")
+
+        try:
+            with open(self.orats_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            snapshot['orats'] = sorted(data.get('tickers', {}).keys())
+            snapshot['orats_updated'] = data.get('last_updated')
+        except FileNotFoundError:
+            logger.warning("ORATS universe cache not found. Run 'python backend/scripts/refresh_tickers_v3.py'")
+        except Exception as e:
+            logger.warning(f"Error loading ORATS universe: {e}")
+        self.timings['json_parse_seconds'] = round(time.perf_counter() - t0, 3)
+        return snapshot
+
+    def _write_snapshot(self, snapshot):
+        tmp = f"{self.snapshot_path}.{os.getpid()}.tmp"  # Workers may rebuild concurrently
+        try:
+            with open(tmp, 'wb') as f:
+                marshal.dump(snapshot, f)
+            os.replace(tmp, self.snapshot_path)
+        except OSError as e:
+            logger.warning(f"Could not write universe snapshot {self.snapshot_path}: {e}")
+
+    @staticmethod
+    def _log_age(label, updated, max_age_days, script):
+        age = _age_days(updated)
+        if age is None:
+            return
+        if age > max_age_days:
+            logger.warning(f"{label} is {age} days old (>{max_age_days} days). Run 'python {script}'")
+        else:
+            logger.info(f"{label} age: {age} days")
+
+    # ── Readers (block until loaded) ────────────────────────────────
+
+    @property
+    def tickers(self):
+        self.wait()
+        return self._tickers
+
+    @property
+    def industries(self):
+        """tickers.json industry per record, parallel to `tickers`."""
+        self.wait()
+        return self._industries
+
+    @property
+    def index(self):
+        self.wait()
+        return self._index
+
+    @property
+    def orats(self):
+        self.wait()
+        return self._orats
+
+
+# Process-wide store, shared by the scanner and the symbol master
+universe_store = UniverseStore()
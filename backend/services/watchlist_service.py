@@ -1,9 +1,12 @@
-from backend.database.models import Watchlist, SessionLocal
-import yfinance as yf
+from backend.database.models import Watchlist, SessionLocal, session_scope
+from backend.services.symbol_master import symbol_master
 
 class WatchlistService:
-    def __init__(self):
-        self.db = SessionLocal()
+    """Watchlist CRUD. Each call uses its own short-lived session, so one
+    instance (e.g. the scanner's) is safe to share across request threads."""
+
+    def __init__(self, session_factory=SessionLocal):
+        self.session_factory = session_factory
         
     def add_ticker(self, ticker, username):
         """
@@ -17,32 +20,29 @@ class WatchlistService:
             Success boolean and message
         """
         try:
-            # Check if ticker already exists for this user
-            existing = self.db.query(Watchlist).filter(
-                Watchlist.ticker == ticker.upper(),
-                Watchlist.username == username
-            ).first()
-            
-            if existing:
-                return False, f"{ticker} already in watchlist"
-            
-            # Get sector information using yfinance
-            sector = self._get_sector(ticker)
-            
-            # Add to watchlist
-            new_ticker = Watchlist(
-                ticker=ticker.upper(),
-                username=username,
-                sector=sector
-            )
-            
-            self.db.add(new_ticker)
-            self.db.commit()
-            
+            with session_scope(self.session_factory) as db:
+                # Check if ticker already exists for this user
+                existing = db.query(Watchlist).filter(
+                    Watchlist.ticker == ticker.upper(),
+                    Watchlist.username == username
+                ).first()
+
+                if existing:
+                    return False, f"{ticker} already in watchlist"
+
+                # Sector from the local symbol master (no network call)
+                sector = self._get_sector(ticker)
+
+                # Add to watchlist (committed when the scope exits)
+                db.add(Watchlist(
+                    ticker=ticker.upper(),
+                    username=username,
+                    sector=sector
+                ))
+
             return True, f"{ticker} added to watchlist"
             
         except Exception as e:
-            self.db.rollback()
             return False, f"Error adding ticker: {str(e)}"
     
     def remove_ticker(self, ticker, username):
@@ -57,21 +57,20 @@ class WatchlistService:
             Success boolean and message
         """
         try:
-            ticker_obj = self.db.query(Watchlist).filter(
-                Watchlist.ticker == ticker.upper(),
-                Watchlist.username == username
-            ).first()
-            
-            if not ticker_obj:
-                return False, f"{ticker} not found in watchlist"
-            
-            self.db.delete(ticker_obj)
-            self.db.commit()
-            
+            with session_scope(self.session_factory) as db:
+                ticker_obj = db.query(Watchlist).filter(
+                    Watchlist.ticker == ticker.upper(),
+                    Watchlist.username == username
+                ).first()
+
+                if not ticker_obj:
+                    return False, f"{ticker} not found in watchlist"
+
+                db.delete(ticker_obj)
+
             return True, f"{ticker} removed from watchlist"
             
         except Exception as e:
-            self.db.rollback()
             return False, f"Error removing ticker: {str(e)}"
     
     def get_watchlist(self, username):
@@ -85,18 +84,19 @@ class WatchlistService:
             List of ticker dictionaries
         """
         try:
-            tickers = self.db.query(Watchlist).filter(
-                Watchlist.username == username
-            ).all()
-            
-            return [
-                {
-                    'ticker': t.ticker,
-                    'sector': t.sector,
-                    'added_date': t.added_date.isoformat() if t.added_date else None
-                }
-                for t in tickers
-            ]
+            with session_scope(self.session_factory) as db:
+                tickers = db.query(Watchlist).filter(
+                    Watchlist.username == username
+                ).all()
+
+                return [
+                    {
+                        'ticker': t.ticker,
+                        'sector': t.sector,
+                        'added_date': t.added_date.isoformat() if t.added_date else None
+                    }
+                    for t in tickers
+                ]
             
         except Exception as e:
             print(f"Error getting watchlist: {str(e)}")
@@ -114,12 +114,13 @@ class WatchlistService:
             List of tickers
         """
         try:
-            tickers = self.db.query(Watchlist).filter(
-                Watchlist.sector == sector,
-                Watchlist.username == username
-            ).all()
-            
-            return [t.ticker for t in tickers]
+            with session_scope(self.session_factory) as db:
+                tickers = db.query(Watchlist).filter(
+                    Watchlist.sector == sector,
+                    Watchlist.username == username
+                ).all()
+
+                return [t.ticker for t in tickers]
             
         except Exception as e:
             print(f"Error getting tickers by sector: {str(e)}")
@@ -127,21 +128,15 @@ class WatchlistService:
     
     def _get_sector(self, ticker):
         """
-        Get sector for a ticker using yfinance
+        Get sector for a ticker from the local symbol master
         
         Args:
             ticker: Stock ticker symbol
         
         Returns:
-            Sector name or None
+            Sector name, or 'Unknown'
         """
-        try:
-            stock = yf.Ticker(ticker)
-            info = stock.info
-            return info.get('sector', 'Unknown')
-        except Exception as e:
-            print(f"Error getting sector for {ticker}: {str(e)}")
-            return 'Unknown'
+        return symbol_master.sector(ticker) or 'Unknown'
     
     def get_related_tickers(self, ticker, username, limit=5):
         """
@@ -156,28 +151,28 @@ class WatchlistService:
             List of related ticker symbols
         """
         try:
-            # Get sector of the ticker
-            ticker_obj = self.db.query(Watchlist).filter(
-                Watchlist.ticker == ticker.upper(),
-                Watchlist.username == username
-            ).first()
-            
-            if not ticker_obj or not ticker_obj.sector:
-                return []
-            
-            # Get other tickers in same sector
-            related = self.db.query(Watchlist).filter(
-                Watchlist.sector == ticker_obj.sector,
-                Watchlist.username == username,
-                Watchlist.ticker != ticker.upper()
-            ).limit(limit).all()
-            
-            return [t.ticker for t in related]
+            with session_scope(self.session_factory) as db:
+                # Get sector of the ticker
+                ticker_obj = db.query(Watchlist).filter(
+                    Watchlist.ticker == ticker.upper(),
+                    Watchlist.username == username
+                ).first()
+
+                if not ticker_obj or not ticker_obj.sector:
+                    return []
+
+                # Get other tickers in same sector
+                related = db.query(Watchlist).filter(
+                    Watchlist.sector == ticker_obj.sector,
+                    Watchlist.username == username,
+                    Watchlist.ticker != ticker.upper()
+                ).limit(limit).all()
+
+                return [t.ticker for t in related]
             
         except Exception as e:
             print(f"Error getting related tickers: {str(e)}")
             return []
     
     def close(self):
-        """Close database session"""
-        self.db.close()
+        """No-op: sessions are opened and closed per call (kept for existing callers)"""
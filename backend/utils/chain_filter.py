@@ -0,0 +1,99 @@
+"""
+Chain Filter — predicate pushdown for option chain parsing
+==========================================================
+Scanners only need a slice of a full ORATS chain:
+
+- LEAP scans:   DTE >= 150, one direction (CALL or PUT)
+- Weekly/0DTE:  one target Friday (plus a small fallback window)
+
+Without a filter, OratsAPI._standardize_response() builds a call AND a
+put object for every strike of every expiry, and
+OptionsAnalyzer.parse_options_chain() builds an opportunity dict for
+each, only for the scanner to throw most of them away afterwards.
+
+A ChainFilter is passed down into both steps so irrelevant expiries and
+strikes are skipped BEFORE any per-contract object is allocated.
+Every field defaults to "no constraint" — ChainFilter() accepts everything.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class ChainFilter:
+    """Immutable set of predicates applied while walking an option chain.
+
+    Attributes:
+        min_dte / max_dte: Inclusive days-to-expiry window.
+        direction: 'CALL', 'PUT' or None (both sides).
+        min_moneyness / max_moneyness: Inclusive strike / spot band
+            (e.g. 0.80-1.20 keeps strikes within ±20% of spot).
+            Ignored when spot is unknown.
+        min_open_interest: Minimum open interest per contract.
+        min_volume: Minimum daily volume per contract.
+        max_spread_pct: Maximum (ask - bid) / mid, as a decimal (0.40 = 40%).
+            Only enforced when both bid and ask are quoted.
+    """
+    min_dte: Optional[int] = None
+    max_dte: Optional[int] = None
+    direction: Optional[str] = None
+    min_moneyness: Optional[float] = None
+    max_moneyness: Optional[float] = None
+    min_open_interest: Optional[int] = None
+    min_volume: Optional[int] = None
+    max_spread_pct: Optional[float] = None
+
+    # ── Expiry level ────────────────────────────────────────────────
+
+    def accepts_dte(self, days_to_expiry):
+        """True if an expiry with this DTE is inside the window."""
+        if self.min_dte is not None and days_to_expiry < self.min_dte:
+            return False
+        if self.max_dte is not None and days_to_expiry > self.max_dte:
+            return False
+        return True
+
+    # ── Side level ──────────────────────────────────────────────────
+
+    def wants_calls(self):
+        return self.direction is None or self.direction.upper() == 'CALL'
+
+    def wants_puts(self):
+        return self.direction is None or self.direction.upper() == 'PUT'
+
+    def wants_side(self, option_type):
+        """option_type: 'Call'/'Put'/'CALL'/'PUT' (case-insensitive)."""
+        return self.wants_calls() if str(option_type).upper() == 'CALL' else self.wants_puts()
+
+    # ── Strike level ────────────────────────────────────────────────
+
+    def accepts_strike(self, strike, spot):
+        """True if strike / spot falls inside the moneyness band."""
+        if self.min_moneyness is None and self.max_moneyness is None:
+            return True
+        if not spot or spot <= 0:
+            return True  # Can't judge moneyness without a spot price
+        moneyness = strike / spot
+        if self.min_moneyness is not None and moneyness < self.min_moneyness:
+            return False
+        if self.max_moneyness is not None and moneyness > self.max_moneyness:
+            return False
+        return True
+
+    # ── Contract level ──────────────────────────────────────────────
+
+    def accepts_contract(self, bid, ask, open_interest, volume):
+        """True if a single contract passes the liquidity predicates."""
+        if self.min_open_interest is not None and (open_interest or 0) < self.min_open_interest:
+            return False
+        if self.min_volume is not None and (volume or 0) < self.min_volume:
+            return False
+        if self.max_spread_pct is not None:
+            bid = bid or 0
+            ask = ask or 0
+            if bid > 0 and ask > bid:
+                mid = (ask + bid) / 2
+                if (ask - bid) / mid > self.max_spread_pct:
+                    return False
+        return True
@@ -11,7 +11,7 @@ Point 5: Strict US/Eastern market hours enforcement.
 
 import os
 import logging
-from datetime import datetime, time, timedelta
+from datetime import date, datetime, time, timedelta
 
 import pytz
 import holidays
@@ -77,6 +77,37 @@ def is_weekday() -> bool:
     return now_eastern().weekday() <= 4
 
 
+def is_trading_day(day: date) -> bool:
+    """Check if a calendar date is an NYSE trading day (weekday, not a holiday)."""
+    return day.weekday() <= 4 and day not in NYSE_HOLIDAYS
+
+
+def previous_trading_day(day: date = None) -> date:
+    """Get the last NYSE trading day strictly before `day` (default: today ET).
+
+    ORATS end-of-day datasets (/cores, hist/*) are T-1: during a session the
+    newest tradeDate available is the previous trading day.
+    """
+    day = day or now_eastern().date()
+    prev = day - timedelta(days=1)
+    while not is_trading_day(prev):
+        prev -= timedelta(days=1)
+    return prev
+
+
+def last_completed_session(now: datetime = None) -> date:
+    """Get the newest trading day whose daily bar has closed (as of `now`, default now ET).
+
+    After the post-market bookend on a trading day that is today; before it
+    (or on a weekend/holiday) it is the previous trading day.
+    """
+    now = now or now_eastern()
+    today = now.date()
+    if is_trading_day(today) and now.time() >= POST_MARKET_BOOKEND:
+        return today
+    return previous_trading_day(today)
+
+
 def get_market_status() -> dict:
     """Get detailed market status for logging and UI display.
 
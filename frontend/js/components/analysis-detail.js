@@ -196,21 +196,67 @@ window.analysisDetail = {
             }
 
             // F28 FIX: Encode ticker in URL to handle special characters
-            const response = await fetch(`/api/analysis/ai/${encodeURIComponent(ticker)}`, {
+            // Streamed as SSE: progress and model tokens render as they arrive
+            const response = await fetch(`/api/analysis/ai/${encodeURIComponent(ticker)}/stream`, {
                 method: 'POST',
                 headers: { 'Content-Type': 'application/json' },
                 body: JSON.stringify(payload)
             });
-            const data = await response.json();
+            if (!response.ok || !response.body) {
+                container.innerHTML = `<p class="text-danger">Analysis Failed: HTTP ${response.status}</p>`;
+                return;
+            }
 
-            if (data.success && data.ai_analysis) {
-                // Store in shared cache
-                if (cacheKey) {
-                    aiCache.set(cacheKey, data.ai_analysis);
+            let streamed = '';
+            let finished = false;
+            const onEvent = (event, data) => {
+                if (event === 'status') {
+                    container.innerHTML = `
+                        <div class="text-center">
+                            <p style="color: var(--accent);">🧠 ${data.message}</p>
+                        </div>
+                    `;
+                } else if (event === 'token') {
+                    if (!streamed) {
+                        container.innerHTML = `<div id="ai-stream-text" style="white-space: pre-wrap; line-height: 1.6;"></div>`;
+                    }
+                    streamed += data.text;
+                    // textContent: model output is never interpreted as HTML while streaming
+                    document.getElementById('ai-stream-text').textContent = streamed;
+                } else if (event === 'result') {
+                    finished = true;
+                    if (cacheKey) {
+                        aiCache.set(cacheKey, data);
+                    }
+                    this.renderAIResult(data, ticker);
+                } else if (event === 'error') {
+                    finished = true;
+                    container.innerHTML = `<p class="text-danger">Analysis Failed: ${data.error || 'Unknown error'}</p>`;
                 }
-                this.renderAIResult(data.ai_analysis, ticker);
-            } else {
-                container.innerHTML = `<p class="text-danger">Analysis Failed: ${data.error || 'Unknown error'}</p>`;
+            };
+
+            const reader = response.body.getReader();
+            const decoder = new TextDecoder();
+            let buffer = '';
+            while (true) {
+                const { value, done } = await reader.read();
+                if (done) break;
+                buffer += decoder.decode(value, { stream: true });
+                let boundary;
+                while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+                    const raw = buffer.slice(0, boundary);
+                    buffer = buffer.slice(boundary + 2);
+                    let event = 'message';
+                    let dataLine = '';
+                    for (const line of raw.split('\n')) {
+                        if (line.startsWith('event:')) event = line.slice(6).trim();
+                        else if (line.startsWith('data:')) dataLine += line.slice(5).trim();
+                    }
+                    if (dataLine) onEvent(event, JSON.parse(dataLine));
+                }
+            }
+            if (!finished) {
+                container.innerHTML = `<p class="text-danger">Analysis Failed: stream ended early</p>`;
             }
         } catch (e) {
             console.error(e);
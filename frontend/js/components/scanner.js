@@ -3,7 +3,8 @@ const scanner = {
     isScanning: false,
     scanMode: 'weekly-0', // Default to This Week
     scanDirection: 'BOTH', // Always BOTH — shows mixed CALL + PUT results
-    tickers: [], // Full list of cached tickers
+    searchTimer: null,
+    searchSeq: 0, // Drops responses that arrive after a newer keystroke's
 
     async init() {
         console.log('Scanner initialized');
@@ -20,25 +21,16 @@ const scanner = {
         this.searchInput = document.getElementById('quick-scan-input');
         this.resultsList = document.getElementById('autocomplete-list');
 
-        // 1. Load Data
-        try {
-            const response = await fetch('/api/data/tickers.json');
-            const data = await response.json();
-            this.tickers = data.tickers || [];
-            console.log(`✅ Smart Search: Loaded ${this.tickers.length} tickers`);
-        } catch (e) {
-            console.error("Failed to load tickers:", e);
-        }
-
         if (!this.searchInput || !this.resultsList) return;
 
-        // 2. Event Listeners
+        // Server-side prefix search (/api/tickers/search), debounced per keystroke
         this.searchInput.addEventListener('input', (e) => {
-            const query = e.target.value;
+            const query = e.target.value.trim();
+            clearTimeout(this.searchTimer);
             if (query.length > 0) {
-                const matches = this.searchTickers(query);
-                this.showResults(matches);
+                this.searchTimer = setTimeout(() => this.runSearch(query), 120);
             } else {
+                this.searchSeq++;
                 this.resultsList.style.display = 'none';
             }
         });
@@ -51,27 +43,16 @@ const scanner = {
         });
     },
 
-    searchTickers(query) {
+    async searchTickers(query) {
         if (!query || query.length < 1) return [];
-        query = query.toUpperCase();
-
-        // Priority 1: Starts with Symbol
-        const symbolMatches = this.tickers.filter(t => t.symbol.toUpperCase().startsWith(query));
-
-        // Priority 2: Starts with Name
-        const nameStartMatches = this.tickers.filter(t =>
-            !symbolMatches.includes(t) &&
-            (t.name || '').toUpperCase().startsWith(query)
-        );
-
-        // Priority 3: Contains Name (Optional but helpful)
-        const nameContainsMatches = this.tickers.filter(t =>
-            !symbolMatches.includes(t) &&
-            !nameStartMatches.includes(t) &&
-            (t.name || '').toUpperCase().includes(query)
-        );
+        const result = await api.searchTickers(query, 8);
+        return result.success ? result.tickers : [];
+    },
 
-        return [...symbolMatches, ...nameStartMatches, ...nameContainsMatches].slice(0, 8);
+    async runSearch(query) {
+        const seq = ++this.searchSeq;
+        const matches = await this.searchTickers(query);
+        if (seq === this.searchSeq) this.showResults(matches);
     },
 
     showResults(matches) {
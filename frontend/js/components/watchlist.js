@@ -1,7 +1,8 @@
 // Watchlist component
 const watchlist = {
     maxItems: 30,
-    tickers: [], // For autocomplete
+    searchTimer: null,
+    searchSeq: 0, // Drops responses that arrive after a newer keystroke's
 
     async init() {
         console.log("Watchlist Initialized");
@@ -10,9 +11,6 @@ const watchlist = {
 
         // Initial load
         await this.load();
-
-        // Load tickers for autocomplete (Reuse scanner logic or fetch)
-        await this.loadTickers();
     },
 
     cacheElements() {
@@ -26,13 +24,14 @@ const watchlist = {
     bindEvents() {
         if (!this.input) return;
 
-        // Autocomplete
+        // Autocomplete (server-side prefix search, debounced)
         this.input.addEventListener('input', (e) => {
-            const query = e.target.value;
+            const query = e.target.value.trim();
+            clearTimeout(this.searchTimer);
             if (query.length > 0) {
-                const matches = this.searchTickers(query);
-                this.showResults(matches);
+                this.searchTimer = setTimeout(() => this.runSearch(query), 120);
             } else {
+                this.searchSeq++;
                 this.hideResults();
             }
         });
@@ -147,34 +146,16 @@ const watchlist = {
 
     // --- Autocomplete Helpers ---
 
-    async loadTickers() {
-        try {
-            if (window.scanner && window.scanner.tickers && window.scanner.tickers.length > 0) {
-                this.tickers = window.scanner.tickers;
-            } else {
-                const response = await fetch('/api/data/tickers.json');
-                const data = await response.json();
-                this.tickers = data.tickers || [];
-            }
-            console.log(`✅ Watchlist: Loaded ${this.tickers.length} tickers for autocomplete`);
-        } catch (e) {
-            console.error("Failed to load tickers:", e);
-        }
-    },
-
-    searchTickers(query) {
+    async searchTickers(query) {
         if (!query || query.length < 1) return [];
-        query = query.toUpperCase();
-
-        const symbolMatches = this.tickers.filter(t => t.symbol.toUpperCase().startsWith(query));
-        const nameStartMatches = this.tickers.filter(t =>
-            !symbolMatches.includes(t) && (t.name || '').toUpperCase().startsWith(query)
-        );
-        const nameContainsMatches = this.tickers.filter(t =>
-            !symbolMatches.includes(t) && !nameStartMatches.includes(t) && (t.name || '').toUpperCase().includes(query)
-        );
+        const result = await api.searchTickers(query, 8);
+        return result.success ? result.tickers : [];
+    },
 
-        return [...symbolMatches, ...nameStartMatches, ...nameContainsMatches].slice(0, 8);
+    async runSearch(query) {
+        const seq = ++this.searchSeq;
+        const matches = await this.searchTickers(query);
+        if (seq === this.searchSeq) this.showResults(matches);
     },
 
     showResults(matches) {
@@ -96,6 +96,10 @@ const api = {
         return this.request('/tickers');
     },
 
+    async searchTickers(query, limit = 8) {
+        return this.request(`/tickers/search?q=${encodeURIComponent(query)}&limit=${limit}`);
+    },
+
     async runSectorScan(sector, minCap, minVol, weeksOut, industry) {
         return this.request('/scan/sector', {
             method: 'POST',
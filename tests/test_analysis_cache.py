@@ -0,0 +1,137 @@
+"""
+Tests for the persistent AI analysis cache
+==========================================
+Verifies that ReasoningEngine serves identical analysis requests from the
+ai_analysis_cache table, keys on normalized prompt inputs, expires entries
+by strategy, never stores errors, and shares one LLM call between
+concurrent identical requests.
+
+Run: pytest tests/test_analysis_cache.py -v
+"""
+
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.database.models import AIAnalysisCache, Base
+from backend.services.analysis_cache import AnalysisCache
+from backend.services.reasoning_engine import ReasoningEngine
+
+CONTEXT = {'current_price': 187.4312, 'headlines': ['Beat and raise'], 'technicals': {'rsi': 61.2}}
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine('sqlite://')
+    Base.metadata.create_all(engine, tables=[AIAnalysisCache.__table__])
+    return sessionmaker(bind=engine)
+
+
+def _engine(cache, calls, delay=0.0, result=None):
+    engine = ReasoningEngine(cache=cache)
+    engine.api_key = 'test-key'
+
+    def analyze(ticker, strategy, expiry_date, data, context):
+        calls.append(ticker)
+        time.sleep(delay)
+        return result or {'ticker': ticker, 'strategy': strategy, 'score': 70, 'verdict': 'FAVORABLE'}
+    engine._analyze = analyze
+    return engine
+
+
+class TestAnalysisCache:
+
+    def test_repeat_request_is_served_from_db(self, session_factory):
+        calls = []
+        engine = _engine(AnalysisCache(session_factory=session_factory), calls)
+        first = engine.analyze_ticker('NVDA', 'WEEKLY', '2026-10-23', data={'strike': 190}, context=CONTEXT)
+        # Sub-cent price jitter maps to the same fingerprint
+        second = engine.analyze_ticker('nvda', 'WEEKLY', '2026-10-23', data={'strike': 190},
+                                       context=dict(CONTEXT, current_price=187.4349))
+        assert calls == ['NVDA']
+        assert 'cached' not in first
+        assert second['cached'] is True and second['score'] == 70
+
+    def test_context_minutes_later_hits(self, session_factory):
+        def context(price, rsi, atr, hv_rank, bb_pct, sma_5, volume_ratio, z, volume, oi, delta, vix):
+            return {
+                'current_price': price,
+                'headlines': ['Beat and raise'],
+                'technicals': {'rsi': rsi, 'trend': 'Bullish', 'atr': atr, 'hv_rank': hv_rank,
+                               'sma_5': sma_5, 'sma_50': '181.20', 'volume_ratio': volume_ratio,
+                               'volume_signal': 'high', 'volume_zscore': z, 'bb_bandwidth_pct': bb_pct},
+                'option_greeks': {'delta': delta, 'gamma': 0.0312, 'theta': -0.2141, 'iv': 41.3,
+                                  'oi': oi, 'volume': volume},
+                'vix': {'level': vix, 'regime': 'NORMAL'}, 'vix_regime': 'NORMAL', 'vix_level': vix,
+            }
+        calls = []
+        engine = _engine(AnalysisCache(session_factory=session_factory), calls)
+        data = {'strike': 190, 'type': 'call'}
+        engine.analyze_ticker('NVDA', 'WEEKLY', '2026-10-23', data=data,
+                              context=context(187.43, '61.2', '4.31', '38.4', '42', '186.91', '1.42', '1.8',
+                                              5210, 18344, 0.4521, 17.23))
+        second = engine.analyze_ticker('NVDA', 'WEEKLY', '2026-10-23', data=data,
+                                       context=context(187.61, '62.1', '4.33', '38.9', '44', '186.95', '1.47',
+                                                       '1.9', 5874, 18391, 0.4587, 17.21))
+        assert calls == ['NVDA']
+        assert second['cached'] is True
+
+    def test_bucketed_fields_keep_sign_and_magnitude(self):
+        def key(theta):
+            return AnalysisCache.fingerprint('NVDA', 'WEEKLY', '2026-10-23', {},
+                                             {'option_greeks': {'theta': theta}}, 'm')
+        keys = {key(-2.0), key(-0.5), key(2.0), key(0.5)}
+        assert len(keys) == 4
+        assert key(-0.2141) == key(-0.2150)
+
+    def test_changed_inputs_miss(self, session_factory):
+        calls = []
+        engine = _engine(AnalysisCache(session_factory=session_factory), calls)
+        engine.analyze_ticker('NVDA', 'WEEKLY', '2026-10-23', context=CONTEXT)
+        engine.analyze_ticker('NVDA', 'WEEKLY', '2026-10-23', context=dict(CONTEXT, headlines=['Guide cut']))
+        engine.analyze_ticker('NVDA', 'LEAP', '2027-12-17', context=CONTEXT)
+        assert len(calls) == 3
+
+    def test_ttl_follows_strategy(self, session_factory):
+        cache = AnalysisCache(session_factory=session_factory)
+        engine = _engine(cache, [])
+        engine.analyze_ticker('SPY', '0DTE', context=CONTEXT)
+        engine.analyze_ticker('SPY', 'LEAP', context=CONTEXT)
+        session = session_factory()
+        ttl = {r.strategy: r.expires_at - r.created_date for r in session.query(AIAnalysisCache)}
+        session.close()
+        assert ttl == {'0DTE': timedelta(seconds=cache.ttl_for('0DTE')),
+                       'LEAP': timedelta(seconds=cache.ttl_for('LEAP'))}
+
+    def test_expired_rows_and_errors_are_not_served(self, session_factory):
+        calls = []
+        engine = _engine(AnalysisCache(session_factory=session_factory), calls, result={'error': 'API Error: 429'})
+        engine.analyze_ticker('AMD', 'WEEKLY', context=CONTEXT)
+        engine.analyze_ticker('AMD', 'WEEKLY', context=CONTEXT)
+        assert len(calls) == 2
+
+        engine = _engine(AnalysisCache(session_factory=session_factory), calls)
+        engine.analyze_ticker('AMD', 'LEAP', context=CONTEXT)
+        session = session_factory()
+        session.query(AIAnalysisCache).update({'expires_at': datetime.utcnow() - timedelta(seconds=1)})
+        session.commit()
+        session.close()
+        engine.analyze_ticker('AMD', 'LEAP', context=CONTEXT)
+        assert len(calls) == 4
+
+    def test_concurrent_requests_share_one_call(self):
+        calls = []
+        engine = _engine(AnalysisCache(session_factory=None), calls, delay=0.2)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(
+            engine.analyze_ticker('TSLA', 'WEEKLY', context=CONTEXT))) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert calls == ['TSLA']
+        assert [r['score'] for r in results] == [70] * 4
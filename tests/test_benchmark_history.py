@@ -0,0 +1,101 @@
+"""
+Tests for the shared benchmark history cache
+============================================
+Verifies that BenchmarkHistoryCache fetches each benchmark once per
+session, re-fetches on trading-day rollover (and hourly while the newest bar
+is missing), batches sector ETF misses, and aligns benchmark bars onto a
+stock's dates for relative strength.
+
+Run: pytest tests/test_benchmark_history.py -v
+"""
+
+from datetime import date, datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from backend.analysis import benchmark_history
+from backend.analysis.benchmark_history import BenchmarkHistoryCache
+from backend.analysis.technical_indicators import TechnicalIndicators
+
+
+def _history(closes, start=date(2026, 1, 5)):
+    """Daily candles on consecutive calendar days starting at `start`."""
+    base = int(datetime(start.year, start.month, start.day).timestamp() * 1000)
+    return {'candles': [{'datetime': base + i * 86_400_000, 'open': c, 'high': c, 'low': c,
+                         'close': c, 'volume': 1000} for i, c in enumerate(closes)],
+            'symbol': 'SPY', 'empty': False}
+
+
+@pytest.fixture
+def orats():
+    api = MagicMock()
+    api.get_history.side_effect = lambda symbol: _history([100.0 + i for i in range(10)])
+    api.get_history_batch.side_effect = lambda symbols: {s: _history([50.0] * 30) for s in symbols}
+    return api
+
+
+def _session(day):
+    return patch.object(benchmark_history, 'last_completed_session', lambda: day)
+
+
+class TestBenchmarkHistoryCache:
+
+    def test_fetches_once_per_session(self, orats):
+        cache = BenchmarkHistoryCache()
+        with _session(date(2026, 1, 14)):
+            first = cache.get_history(orats, 'SPY')
+            assert cache.get_history(orats, '$spy') is first
+        assert orats.get_history.call_count == 1
+
+    def test_rollover_refetches(self, orats):
+        cache = BenchmarkHistoryCache()
+        with _session(date(2026, 1, 14)):
+            cache.get_history(orats, 'SPY')
+        with _session(date(2026, 1, 15)):
+            cache.get_history(orats, 'SPY')
+        assert orats.get_history.call_count == 2
+
+    def test_missing_newest_bar_retries_after_stale_window(self, orats):
+        cache = BenchmarkHistoryCache()
+        with _session(date(2026, 1, 20)):  # History ends 2026-01-14
+            entry = cache.get_entry(orats, 'SPY')
+            cache.get_entry(orats, 'SPY')
+            assert orats.get_history.call_count == 1
+            entry.fetched_at -= benchmark_history.STALE_RETRY_SECONDS + 1
+            cache.get_entry(orats, 'SPY')
+        assert orats.get_history.call_count == 2
+
+    def test_failed_fetch_keeps_previous_entry(self, orats):
+        cache = BenchmarkHistoryCache()
+        with _session(date(2026, 1, 14)):
+            first = cache.get_history(orats, 'SPY')
+        orats.get_history.side_effect = lambda symbol: None
+        with _session(date(2026, 1, 15)):
+            assert cache.get_history(orats, 'SPY') is first
+
+    def test_sector_etfs_are_batched(self, orats):
+        cache = BenchmarkHistoryCache()
+        with _session(date(2026, 1, 14)):
+            cache.get_history(orats, 'XLK')
+            histories = cache.get_histories(orats, ['XLK', 'XLF', 'XLE'])
+            assert set(histories) == {'XLK', 'XLF', 'XLE'}
+            cache.get_histories(orats, ['XLK', 'XLF', 'XLE'])
+        orats.get_history_batch.assert_called_once_with(['XLF', 'XLE'])
+
+    def test_aligned_df_matches_stock_dates(self, orats):
+        cache = BenchmarkHistoryCache()
+        ti = TechnicalIndicators()
+        # Stock history ends two days before SPY's and skips one session
+        stock = _history([10.0 + i for i in range(8)])
+        del stock['candles'][3]
+        df = ti.prepare_dataframe(stock)
+        with _session(date(2026, 1, 14)):
+            aligned = cache.aligned_df(orats, 'SPY', df)
+        assert list(aligned.index) == list(df.index)
+        assert aligned['Close'].iloc[-1] == 107.0  # SPY close on the stock's last date
+
+        expected_market = (107.0 - 101.0) / 101.0
+        expected_stock = (17.0 - 11.0) / 11.0
+        assert ti.calculate_relative_strength(df, aligned) == pytest.approx(
+            (expected_stock - expected_market) * 100)
@@ -0,0 +1,141 @@
+"""
+Tests for ChainFilter predicate pushdown
+========================================
+Verifies that OratsAPI._standardize_response() and
+OptionsAnalyzer.parse_options_chain() skip expiries, sides and strikes
+rejected by a ChainFilter, and that no filter means no behaviour change.
+
+Run: pytest tests/test_chain_filter.py -v
+"""
+
+import os
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+os.environ.setdefault('ORATS_API_KEY', 'test-orats-key')
+
+from backend.api.orats import OratsAPI
+from backend.analysis.options_analyzer import OptionsAnalyzer
+from backend.utils.chain_filter import ChainFilter
+
+
+def _expiry(days):
+    return (datetime.now() + timedelta(days=days)).strftime('%Y-%m-%d')
+
+
+def _raw_chain():
+    """Two expiries (7d, 200d) x three strikes, spot $100. Calls liquid, puts thin."""
+    rows = []
+    for days in (7, 200):
+        for strike in (80, 100, 120):
+            rows.append({
+                'ticker': 'ABC', 'expirDate': _expiry(days), 'strike': strike,
+                'stockPrice': 100.0, 'delta': 0.55,
+                'callBidPrice': 5.0, 'callAskPrice': 5.5,
+                'callOpenInterest': 1000, 'callVolume': 50,
+                'putBidPrice': 4.0, 'putAskPrice': 6.0,
+                'putOpenInterest': 10, 'putVolume': 5,
+            })
+    return {'data': rows}
+
+
+class TestChainFilterPredicates:
+
+    def test_default_accepts_everything(self):
+        f = ChainFilter()
+        assert f.accepts_dte(-1) and f.accepts_dte(900)
+        assert f.wants_calls() and f.wants_puts()
+        assert f.accepts_strike(10, 100)
+        assert f.accepts_contract(0, 0, 0, 0)
+
+    def test_spread_only_enforced_with_two_sided_quote(self):
+        f = ChainFilter(max_spread_pct=0.10)
+        assert not f.accepts_contract(4.0, 6.0, 0, 0)   # 40% spread
+        assert f.accepts_contract(0, 6.0, 0, 0)         # no bid — can't judge
+
+
+class TestStandardizePushdown:
+
+    def test_no_filter_builds_full_chain(self):
+        std = OratsAPI(api_key='x')._standardize_response(_raw_chain())
+        assert len(std['callExpDateMap']) == 2
+        assert len(std['putExpDateMap']) == 2
+
+    def test_dte_direction_and_moneyness(self):
+        f = ChainFilter(min_dte=150, direction='CALL', min_moneyness=0.9, max_moneyness=1.1)
+        std = OratsAPI(api_key='x')._standardize_response(_raw_chain(), chain_filter=f)
+        assert std['putExpDateMap'] == {}
+        assert len(std['callExpDateMap']) == 1
+        (strikes,) = std['callExpDateMap'].values()
+        assert list(strikes) == ['100']
+
+
+class TestParsePushdown:
+
+    def test_direction_and_liquidity_filter(self):
+        std = OratsAPI(api_key='x')._standardize_response(_raw_chain())
+        analyzer = OptionsAnalyzer()
+        f = ChainFilter(min_dte=150, direction='CALL', min_open_interest=500)
+        opps = analyzer.parse_options_chain(std, 100.0, chain_filter=f)
+        assert opps
+        assert all(o['option_type'] == 'Call' for o in opps)
+        assert all(o['days_to_expiry'] >= 150 for o in opps)
+
+    def test_filter_is_subset_of_unfiltered(self):
+        std = OratsAPI(api_key='x')._standardize_response(_raw_chain())
+        analyzer = OptionsAnalyzer()
+        full = analyzer.parse_options_chain(std, 100.0)
+        f = ChainFilter(direction='PUT')
+        puts = analyzer.parse_options_chain(std, 100.0, chain_filter=f)
+        assert len(puts) == sum(1 for o in full if o['option_type'] == 'Put')
+
+
+class TestLiveStrikesRequests:
+    """user-027: DTE window + field projection are sent to /live/strikes."""
+
+    def _mock_get(self, rows):
+        resp = MagicMock()
+        resp.json.return_value = {'data': rows}
+        resp.raise_for_status.return_value = None
+        return MagicMock(return_value=resp)
+
+    def test_chain_sends_dte_window_and_fields(self):
+        get = self._mock_get(_raw_chain()['data'])
+        with patch('backend.api.orats.requests.get', get):
+            OratsAPI(api_key='x').get_option_chain('ABC', chain_filter=ChainFilter(min_dte=150))
+        params = get.call_args.kwargs['params']
+        assert params['dte'] == f"149,{OratsAPI.MAX_CHAIN_DTE + 1}"
+        assert params['fields'] == OratsAPI.CHAIN_FIELDS
+
+    def test_quote_projects_front_expiries(self):
+        get = self._mock_get([{'ticker': 'ABC', 'stockPrice': 101.5}])
+        with patch('backend.api.orats.requests.get', get):
+            quote = OratsAPI(api_key='x').get_quote('ABC')
+        assert quote['price'] == 101.5
+        params = get.call_args.kwargs['params']
+        assert params['fields'] == OratsAPI.QUOTE_FIELDS
+        assert params['dte'] == '0,46'
+
+    def test_option_quote_falls_back_when_window_empty(self):
+        row = {'expirDate': _expiry(30), 'strike': 100, 'stockPrice': 100,
+               'callBidPrice': 1.0, 'callAskPrice': 1.2, 'delta': 0.5}
+        first, second = self._mock_get([]), self._mock_get([row])
+        calls = iter([first.return_value, second.return_value])
+        with patch('backend.api.orats.requests.get', side_effect=lambda *a, **k: next(calls)) as get:
+            quote = OratsAPI(api_key='x').get_option_quote('ABC', 100, _expiry(30), 'CALL')
+        assert get.call_count == 2
+        assert 'dte' not in get.call_args.kwargs['params']
+        assert quote['bid'] == 1.0
+
+    def test_option_quote_falls_back_when_window_misses_contract(self):
+        # Weekend/holiday lag: the window holds the neighbouring daily expiries only
+        neighbours = [{'expirDate': _expiry(d), 'strike': 100, 'callBidPrice': 9.0} for d in (1, 3)]
+        target = {'expirDate': _expiry(2), 'strike': 100, 'stockPrice': 100,
+                  'callBidPrice': 1.0, 'callAskPrice': 1.2, 'delta': 0.5}
+        first, second = self._mock_get(neighbours), self._mock_get(neighbours + [target])
+        calls = iter([first.return_value, second.return_value])
+        with patch('backend.api.orats.requests.get', side_effect=lambda *a, **k: next(calls)) as get:
+            quote = OratsAPI(api_key='x').get_option_quote('SPY', 100, _expiry(2), 'CALL')
+        assert get.call_count == 2
+        assert 'dte' not in get.call_args.kwargs['params']
+        assert quote['bid'] == 1.0
@@ -0,0 +1,134 @@
+"""
+Tests for the persistent /cores snapshot store
+==============================================
+Verifies that CoresSnapshotStore round-trips records through the columnar
+on-disk format, answers sector/ticker lookups from its indexes, and only
+calls the fetcher when the snapshot is stale.
+
+Run: pytest tests/test_cores_store.py -v
+"""
+
+from datetime import date
+from unittest.mock import MagicMock
+
+from backend.services.cores_store import CoresSnapshotStore
+from backend.services.scanner_utils import SCANNER_CORES_FIELDS, get_cores_record
+from backend.utils.market_hours import previous_trading_day
+
+
+def _records(trade_date):
+    return [
+        {'ticker': 'NVDA', 'tradeDate': trade_date, 'sectorName': 'Semiconductors',
+         'bestEtf': 'XLK', 'mktCap': 3000000, 'ivPctile1y': 42.5, 'daysToNextErn': 30},
+        {'ticker': 'JPM', 'tradeDate': trade_date, 'sectorName': 'Banks',
+         'bestEtf': 'XLF', 'mktCap': 500000, 'ivPctile1y': None, 'daysToNextErn': 12},
+        {'ticker': 'AAPL', 'tradeDate': trade_date, 'sectorName': 'Consumer Electronics',
+         'bestEtf': 'XLK', 'mktCap': 3500000, 'ivPctile1y': 18.0, 'daysToNextErn': None},
+    ]
+
+
+class TestRoundTrip:
+
+    def test_values_and_types_survive(self, tmp_path):
+        store = CoresSnapshotStore(base_dir=str(tmp_path))
+        snap = store.save(_records('2026-01-02'))
+        nvda = snap.get('nvda')
+        assert nvda['ticker'] == 'NVDA'
+        assert nvda['ivPctile1y'] == 42.5
+        assert nvda['mktCap'] == 3000000 and isinstance(nvda['mktCap'], int)
+        assert snap.get('JPM')['ivPctile1y'] is None
+        assert snap.get('ZZZZ') is None
+        assert len(snap) == 3
+
+    def test_new_store_instance_reads_current(self, tmp_path):
+        CoresSnapshotStore(base_dir=str(tmp_path)).save(_records('2026-01-02'))
+        other = CoresSnapshotStore(base_dir=str(tmp_path))  # e.g. another worker
+        assert other.current().trade_date == '2026-01-02'
+
+
+class TestSelect:
+
+    def test_etf_slice_or_sector_name(self, tmp_path):
+        snap = CoresSnapshotStore(base_dir=str(tmp_path)).save(_records('2026-01-02'))
+        tech = {r['ticker'] for r in snap.select('technology', ['XLK'])}
+        assert tech == {'NVDA', 'AAPL'}
+        semis = {r['ticker'] for r in snap.select('semiconductors')}
+        assert semis == {'NVDA'}
+
+
+class TestRefresh:
+
+    def test_fresh_snapshot_skips_fetch(self, tmp_path):
+        store = CoresSnapshotStore(base_dir=str(tmp_path), ttl=0)
+        store.save(_records(previous_trading_day().isoformat()))
+        calls = []
+        store.get_or_refresh(lambda: calls.append(1) or _records('x'))
+        assert calls == []
+
+    def test_stale_snapshot_refetches_and_survives_failure(self, tmp_path):
+        store = CoresSnapshotStore(base_dir=str(tmp_path), ttl=0)
+        store.save(_records('2000-01-03'))
+        snap = store.get_or_refresh(lambda: _records(previous_trading_day().isoformat()))
+        assert snap.trade_date == previous_trading_day().isoformat()
+
+        stale = CoresSnapshotStore(base_dir=str(tmp_path / 'b'), ttl=0)
+        stale.save(_records('2000-01-03'))
+
+        def boom():
+            raise RuntimeError('ORATS down')
+        assert stale.get_or_refresh(boom).trade_date == '2000-01-03'
+
+
+class TestScannerCoresLookup:
+    """user-029: scanners reuse /cores records and call hist/cores only on a miss."""
+
+    def _scanner(self, store):
+        scanner_cls = type('FakeScanner', (), {'_cores_store': store})
+        scanner = scanner_cls()
+        scanner.batch_manager = MagicMock()
+        scanner.batch_manager.orats_api.get_hist_cores.return_value = {'ticker': 'HIST'}
+        return scanner
+
+    def _complete(self, trade_date):
+        extra = {k: None for k in SCANNER_CORES_FIELDS}
+        return [{**extra, **r} for r in _records(trade_date)]
+
+    def test_pre_fetched_record_skips_api(self, tmp_path):
+        scanner = self._scanner(CoresSnapshotStore(base_dir=str(tmp_path)))
+        record = self._complete('2026-01-02')[0]
+        assert get_cores_record(scanner, 'NVDA', record) is record
+        scanner.batch_manager.orats_api.get_hist_cores.assert_not_called()
+
+    def test_fresh_snapshot_hit(self, tmp_path):
+        store = CoresSnapshotStore(base_dir=str(tmp_path))
+        store.save(self._complete(previous_trading_day().isoformat()))
+        scanner = self._scanner(store)
+        assert get_cores_record(scanner, '$JPM')['ticker'] == 'JPM'
+        scanner.batch_manager.orats_api.get_hist_cores.assert_not_called()
+
+    def test_div_date_reaches_scan_cores(self, tmp_path):
+        store = CoresSnapshotStore(base_dir=str(tmp_path))
+        records = self._complete(previous_trading_day().isoformat())
+        records[0]['divDate'] = '2026-11-14'
+        snap = store.save(records)
+        scanner = self._scanner(store)
+        assert get_cores_record(scanner, 'NVDA')['divDate'] == '2026-11-14'
+        assert snap.field('NVDA', 'divDate') == '2026-11-14'
+        sector = {r['ticker']: r for r in snap.select('technology', ['XLK'])}
+        assert get_cores_record(scanner, 'NVDA', sector['NVDA'])['divDate'] == '2026-11-14'
+        assert get_cores_record(scanner, 'JPM')['divDate'] is None
+        scanner.batch_manager.orats_api.get_hist_cores.assert_not_called()
+
+    def test_incomplete_record_falls_back_to_hist_cores(self, tmp_path):
+        store = CoresSnapshotStore(base_dir=str(tmp_path))
+        store.save(_records(previous_trading_day().isoformat()))  # no divYield/divDate
+        scanner = self._scanner(store)
+        assert get_cores_record(scanner, 'NVDA', {'ticker': 'NVDA'}) == {'ticker': 'HIST'}
+        scanner.batch_manager.orats_api.get_hist_cores.assert_called_once_with('NVDA')
+
+
+class TestTradingCalendar:
+
+    def test_previous_trading_day_skips_weekend_and_holiday(self):
+        assert previous_trading_day(date(2026, 1, 5)) == date(2026, 1, 2)   # Monday → Friday
+        assert previous_trading_day(date(2025, 12, 26)) == date(2025, 12, 24)  # Christmas
@@ -0,0 +1,95 @@
+"""
+Tests for the daily earnings calendar index
+===========================================
+Verifies that EarningsCalendar builds a symbol -> next report index from
+one market-wide Finnhub call, answers proximity questions without further
+requests, persists across instances (picking up another process's
+refresh from disk), and feeds ExitManager.
+
+Run: pytest tests/test_earnings_calendar.py -v
+"""
+
+from datetime import timedelta
+from unittest.mock import MagicMock
+
+import pytest
+
+from backend.analysis.exit_manager import ExitManager
+from backend.services.earnings_calendar import EarningsCalendar, build_index
+from backend.utils.market_hours import now_eastern
+
+TODAY = now_eastern().date()
+
+
+def _day(offset):
+    return (TODAY + timedelta(days=offset)).isoformat()
+
+
+@pytest.fixture
+def finnhub():
+    api = MagicMock()
+    api.get_earnings_calendar.return_value = [
+        {'symbol': 'NVDA', 'date': _day(12), 'hour': 'amc', 'epsEstimate': 0.9},
+        {'symbol': 'NVDA', 'date': _day(3), 'hour': 'amc', 'epsEstimate': 0.8},
+        {'symbol': 'AAPL', 'date': _day(20), 'hour': 'bmo', 'epsEstimate': 1.5},
+        {'symbol': 'OLD', 'date': _day(-1), 'hour': 'bmo'},
+    ]
+    return api
+
+
+@pytest.fixture
+def calendar(tmp_path):
+    return EarningsCalendar(path=str(tmp_path / 'earnings.json'))
+
+
+class TestEarningsCalendar:
+
+    def test_build_index_keeps_earliest_upcoming(self):
+        index = build_index([{'symbol': 'x', 'date': _day(5)}, {'symbol': 'X', 'date': _day(2)},
+                             {'symbol': 'Y', 'date': _day(-3)}, {'symbol': 'Z', 'date': 'bad'}], TODAY)
+        assert list(index) == ['X']
+        assert index['X'].date == _day(2)
+
+    def test_one_bulk_request_serves_every_symbol(self, calendar, finnhub):
+        assert calendar.days_to_earnings('NVDA', finnhub) == 3
+        assert calendar.upcoming('$nvda', within_days=7, finnhub_api=finnhub) == [
+            {'symbol': 'NVDA', 'date': _day(3), 'hour': 'amc', 'epsEstimate': 0.8}]
+        assert calendar.upcoming('AAPL', within_days=7, finnhub_api=finnhub) == []
+        assert calendar.next_earnings('MSFT', finnhub) is None
+        finnhub.get_earnings_calendar.assert_called_once()
+        assert 'symbol' not in finnhub.get_earnings_calendar.call_args.kwargs
+
+    def test_index_survives_restart(self, calendar, finnhub, tmp_path):
+        calendar.refresh(finnhub)
+        reloaded = EarningsCalendar(path=str(tmp_path / 'earnings.json'))
+        assert reloaded.days_to_earnings('AAPL', finnhub) == 20
+        finnhub.get_earnings_calendar.assert_called_once()
+
+    def test_worker_picks_up_refresh_written_by_another_process(self, calendar, finnhub, tmp_path):
+        worker = EarningsCalendar(path=str(tmp_path / 'earnings.json'))
+        assert worker.days_to_earnings('NVDA') is None          # Nothing on disk yet
+        calendar.refresh(finnhub)                               # Scheduler job in the master
+        assert worker.days_to_earnings('NVDA') == 3
+        worker_finnhub = MagicMock()
+        assert worker.refresh(worker_finnhub)
+        worker_finnhub.get_earnings_calendar.assert_not_called()
+
+    def test_failed_refresh_keeps_index_and_backs_off(self, calendar, finnhub):
+        calendar.refresh(finnhub)
+        calendar._as_of = None                     # Pretend it is a new day
+        finnhub.get_earnings_calendar.return_value = None
+        assert calendar.days_to_earnings('NVDA', finnhub) == 3
+        assert calendar.days_to_earnings('NVDA', finnhub) == 3
+        assert finnhub.get_earnings_calendar.call_count == 2
+
+
+class TestExitManagerUsesIndex:
+
+    def test_should_exit_looks_up_position_ticker(self, calendar, finnhub):
+        finnhub.get_earnings_calendar.return_value = [{'symbol': 'AMD', 'date': _day(1), 'hour': 'amc'}]
+        calendar.refresh(finnhub)
+        manager = ExitManager(earnings_calendar=calendar)
+        plan = manager.generate_exit_plan({'ticker': 'AMD', 'premium': 2.0}, strategy='WEEKLY')
+        result = manager.should_exit({'ticker': 'AMD'}, current_pnl_pct=5.0, dte_remaining=5, exit_plan=plan)
+        assert result['should_exit'] is True
+        assert 'Earnings' in result['reason']
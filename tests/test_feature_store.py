@@ -0,0 +1,132 @@
+"""
+Tests for the nightly feature store
+===================================
+Verifies that build_feature_store() persists histories and publishes one
+feature record per ticker matching TechnicalIndicators, waits for ORATS to
+publish the targeted session's bar and is then fresh for it, that
+patch_live_bar() reproduces a recompute with the live Close, and that the
+LEAP scan's trend filter rejects from features before any API call.
+
+Run: pytest tests/test_feature_store.py -v
+"""
+
+from datetime import timedelta
+from unittest.mock import MagicMock
+
+import pytest
+
+from backend.analysis.technical_indicators import TechnicalIndicators
+from backend.services.cores_store import CoresSnapshotStore
+from backend.services.feature_store import (
+    FeatureStore, HistoryStore, _last_bar_date, build_feature_store, patch_live_bar,
+)
+from backend.services.scanner_leaps import scan_ticker_leaps
+from tests.test_indicator_panel import _aligned_history
+
+
+def _cores(ticker, opt_volume=5000):
+    return {'ticker': ticker, 'tradeDate': '2026-01-02', 'bestEtf': 'XLK',
+            'sectorName': 'Software', 'avgOptVolu20d': opt_volume}
+
+
+@pytest.fixture
+def histories():
+    return {'AAA': _aligned_history(300, seed=1), 'BBB': _aligned_history(260, seed=2),
+            'SPY': _aligned_history(300, seed=3)}
+
+
+@pytest.fixture
+def scanner(tmp_path, histories):
+    cores_store = CoresSnapshotStore(base_dir=str(tmp_path / 'cores'))
+    cores_store.save([_cores('AAA'), _cores('BBB'), _cores('THIN', opt_volume=10)])
+    scanner_cls = type('FakeScanner', (), {
+        '_cores_store': cores_store,
+        '_feature_store': FeatureStore(base_dir=str(tmp_path / 'features')),
+    })
+    scanner = scanner_cls()
+    scanner.technical_analyzer = TechnicalIndicators()
+    scanner.batch_manager = MagicMock()
+    scanner.batch_manager.orats_api.get_history_batch.side_effect = \
+        lambda tickers: {t: histories[t] for t in tickers if t in histories}
+    return scanner
+
+
+@pytest.fixture
+def session(histories):
+    """The session the fake hist/dailies has published (its last bar)."""
+    return _last_bar_date(histories['SPY'])
+
+
+class TestBuildFeatureStore:
+
+    def test_publishes_features_for_liquid_universe(self, scanner, histories, session, tmp_path):
+        history_store = HistoryStore(str(tmp_path / 'history'))
+        assert build_feature_store(scanner, history_store=history_store, session=session) == 2
+
+        calls = scanner.batch_manager.orats_api.get_history_batch.call_args_list
+        assert calls[0][0][0] == ['SPY']   # Publication probe
+        assert 'THIN' not in calls[-1][0][0]
+
+        ti = TechnicalIndicators()
+        snapshot = type(scanner)._feature_store.current()
+        record = snapshot.get('AAA')
+        expected = ti.get_all_indicators(histories['AAA'])
+        assert record['tradeDate'] == ti.prepare_dataframe(histories['AAA']).index[-1].date().isoformat()
+        assert record['trend_signal'] == expected['moving_averages']['signal']
+        assert record['minervini_stage'] == expected['minervini']['stage']
+        assert record['hv_rank'] == pytest.approx(expected['volatility']['values']['hv_rank'])
+        assert record['atr'] == pytest.approx(expected['volatility']['values']['atr'])
+        assert record['rs_vs_spy'] == pytest.approx(ti.calculate_relative_strength(
+            ti.prepare_dataframe(histories['AAA']), ti.prepare_dataframe(histories['SPY'])))
+        assert record['bestEtf'] == 'XLK'
+
+        # Local history store holds what was fetched
+        assert history_store.load('BBB')['candles'] == histories['BBB']['candles']
+
+    def test_waits_for_session_bar_then_is_fresh_for_it(self, scanner, session, tmp_path):
+        history_store = HistoryStore(str(tmp_path / 'history'))
+        store = type(scanner)._feature_store
+        api = scanner.batch_manager.orats_api
+
+        # Pre-market, before ORATS has published the targeted session's bar
+        assert build_feature_store(scanner, history_store=history_store,
+                                   session=session + timedelta(days=1)) == 0
+        assert api.get_history_batch.call_count == 1 and store.current() is None
+
+        assert build_feature_store(scanner, history_store=history_store, session=session) == 2
+        assert store.is_fresh(store.current(), session)
+        assert not store.is_fresh(store.current(), session + timedelta(days=1))
+
+        # Later runs that morning are no-ops
+        api.get_history_batch.reset_mock()
+        assert build_feature_store(scanner, history_store=history_store, session=session) == 0
+        api.get_history_batch.assert_not_called()
+
+    def test_patch_live_bar_matches_recompute(self, scanner, histories, session, tmp_path):
+        build_feature_store(scanner, history_store=HistoryStore(str(tmp_path / 'history')), session=session)
+        record = type(scanner)._feature_store.current().get('AAA')
+        live = record['close'] * 0.9
+        patched = patch_live_bar(record, live)
+
+        ti = TechnicalIndicators()
+        df = ti.prepare_dataframe(histories['AAA'])
+        df.iloc[-1, df.columns.get_loc('Close')] = live
+        ma, signal = ti.calculate_moving_averages(df)
+        assert patched['sma_200'] == pytest.approx(ma['sma_200'])
+        assert patched['trend_signal'] == signal
+        assert patched['rs_vs_spy'] == pytest.approx(
+            ti.calculate_relative_strength(df, ti.prepare_dataframe(histories['SPY'])))
+        assert record['close'] != live  # original untouched
+
+
+class TestLeapTrendGate:
+
+    def test_wrong_trend_rejected_before_any_api_call(self):
+        scanner = MagicMock()
+        scanner._normalize_ticker.side_effect = lambda t: t
+        scanner._is_orats_covered.return_value = True
+        features = {'ticker': 'ABC', 'close': 90.0, 'sma_200': 100.0, 'sma_50': 95.0}
+
+        assert scan_ticker_leaps(scanner, 'ABC', direction='CALL', pre_fetched_features=features) is None
+        scanner.batch_manager.orats_api.get_hist_cores.assert_not_called()
+        scanner.batch_manager.orats_api.get_history.assert_not_called()
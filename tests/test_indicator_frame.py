@@ -0,0 +1,78 @@
+"""
+Tests for the shared IndicatorFrame cache
+=========================================
+Verifies that TechnicalIndicators.get_indicator_frame() builds the
+DataFrame + indicator suite once per (ticker, last bar, live price),
+applies the live-price override before computing, and hands out
+independent indicator dicts.
+
+Run: pytest tests/test_indicator_frame.py -v
+"""
+
+import math
+from unittest.mock import patch
+
+import pytest
+
+from backend.analysis.indicator_frame import indicator_frames
+from backend.analysis.technical_indicators import TechnicalIndicators
+
+
+def _history(bars=300, start=100.0):
+    candles = []
+    t0 = 1_600_000_000_000
+    for i in range(bars):
+        close = start + 10 * math.sin(i / 9.0) + i * 0.05
+        candles.append({
+            'datetime': t0 + i * 86_400_000,
+            'open': close - 0.5, 'high': close + 1.0, 'low': close - 1.0,
+            'close': close, 'volume': 1_000_000 + (i % 7) * 50_000,
+        })
+    return {'candles': candles}
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    indicator_frames.clear()
+    yield
+    indicator_frames.clear()
+
+
+class TestIndicatorFrame:
+
+    def test_matches_get_all_indicators(self):
+        ti = TechnicalIndicators()
+        hist = _history()
+        frame = ti.get_indicator_frame('ABC', hist)
+        direct = ti.get_all_indicators(hist)
+        assert frame.indicators['rsi']['value'] == pytest.approx(direct['rsi']['value'])
+        assert frame.atr == pytest.approx(direct['volatility']['values']['atr'])
+        assert frame.hv_rank == pytest.approx(direct['volatility']['values']['hv_rank'])
+
+    def test_built_once_per_key(self):
+        ti = TechnicalIndicators()
+        hist = _history()
+        with patch.object(ti, 'get_all_indicators_for_df', wraps=ti.get_all_indicators_for_df) as compute:
+            first = ti.get_indicator_frame('ABC', hist)
+            second = ti.get_indicator_frame('$abc', hist)
+            live = ti.get_indicator_frame('ABC', hist, live_price=123.45)
+        assert first is second
+        assert live is not first
+        # The live-price frame revises the base frame incrementally (LiveBarState)
+        assert compute.call_count == 1
+
+    def test_live_price_applied_before_indicators(self):
+        ti = TechnicalIndicators()
+        frame = ti.get_indicator_frame('ABC', _history(), live_price=250.0)
+        assert frame.current_price == 250.0
+        assert frame.indicators['bollinger_bands']['values']['current_price'] == 250.0
+
+    def test_indicators_copy_is_isolated(self):
+        ti = TechnicalIndicators()
+        frame = ti.get_indicator_frame('ABC', _history())
+        mine = frame.indicators_copy()
+        mine['minervini']['criteria']['8_rs_rating'] = True
+        assert frame.indicators['minervini']['criteria']['8_rs_rating'] is None
+
+    def test_empty_history(self):
+        assert TechnicalIndicators().get_indicator_frame('ABC', {'candles': []}) is None
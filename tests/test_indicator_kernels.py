@@ -0,0 +1,100 @@
+"""
+Tests for the pure-NumPy indicator kernels
+==========================================
+Every kernel in backend/analysis/indicator_kernels.py must reproduce the
+`ta` / pandas series it replaces, and TechnicalIndicators must produce the
+same get_all_indicators() output with kernels on and off.
+
+Run: pytest tests/test_indicator_kernels.py -v
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+import ta
+
+from backend.analysis import indicator_kernels as k
+from backend.analysis.technical_indicators import TechnicalIndicators
+
+
+def _ohlcv(n=300, seed=7):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, n)))
+    high = close * (1 + rng.uniform(0, 0.02, n))
+    low = close * (1 - rng.uniform(0, 0.02, n))
+    volume = rng.integers(500_000, 2_000_000, n).astype(float)
+    return close, high, low, volume
+
+
+def _assert_series(actual, expected):
+    np.testing.assert_allclose(actual, np.asarray(expected, dtype=float),
+                               rtol=1e-9, atol=1e-9, equal_nan=True)
+
+
+class TestKernelsMatchTa:
+
+    @pytest.mark.parametrize('period', [2, 14])
+    def test_rsi(self, period):
+        close, *_ = _ohlcv()
+        _assert_series(k.wilder_rsi(close, period),
+                       ta.momentum.RSIIndicator(pd.Series(close), window=period).rsi())
+
+    def test_macd(self):
+        close, *_ = _ohlcv()
+        ref = ta.trend.MACD(pd.Series(close), window_slow=26, window_fast=12, window_sign=9)
+        line, signal, diff = k.macd(close)
+        _assert_series(line, ref.macd())
+        _assert_series(signal, ref.macd_signal())
+        _assert_series(diff, ref.macd_diff())
+
+    def test_bollinger_and_sma(self):
+        close, *_ = _ohlcv()
+        ref = ta.volatility.BollingerBands(pd.Series(close), window=20, window_dev=2)
+        upper, middle, lower = k.bollinger(close)
+        _assert_series(upper, ref.bollinger_hband())
+        _assert_series(middle, ref.bollinger_mavg())
+        _assert_series(lower, ref.bollinger_lband())
+        _assert_series(k.rolling_mean(close, 200),
+                       ta.trend.SMAIndicator(pd.Series(close), window=200).sma_indicator())
+
+    def test_atr(self):
+        close, high, low, _ = _ohlcv()
+        ref = ta.volatility.AverageTrueRange(pd.Series(high), pd.Series(low), pd.Series(close), window=14)
+        _assert_series(k.atr(high, low, close, 14), ref.average_true_range())
+
+    def test_historical_volatility(self):
+        close, *_ = _ohlcv()
+        s = pd.Series(close)
+        ref = np.log(s / s.shift(1)).rolling(window=20).std() * np.sqrt(252) * 100
+        _assert_series(k.historical_volatility(close, 20), ref)
+
+    def test_short_input(self):
+        close = np.array([1.0, 2.0, 3.0])
+        assert np.isnan(k.rolling_mean(close, 5)).all()
+        assert (k.atr(close, close, close, 14) == 0).all()
+
+
+class TestTechnicalIndicatorsSwitch:
+
+    def test_get_all_indicators_same_with_and_without_kernels(self):
+        close, high, low, volume = _ohlcv()
+        history = {'candles': [
+            {'datetime': 1_600_000_000_000 + i * 86_400_000, 'open': c, 'high': h,
+             'low': l, 'close': c, 'volume': v}
+            for i, (c, h, l, v) in enumerate(zip(close, high, low, volume))
+        ]}
+        fast = TechnicalIndicators(use_kernels=True).get_all_indicators(history)
+        slow = TechnicalIndicators(use_kernels=False).get_all_indicators(history)
+
+        for key in ('rsi', 'macd', 'bollinger_bands', 'moving_averages', 'rsi2', 'minervini'):
+            assert fast[key].get('signal') == slow[key].get('signal'), key
+        assert fast['rsi']['value'] == pytest.approx(slow['rsi']['value'])
+        assert fast['macd']['values']['histogram'] == pytest.approx(slow['macd']['values']['histogram'])
+        assert fast['bollinger_bands']['values']['bandwidth_percentile'] == pytest.approx(
+            slow['bollinger_bands']['values']['bandwidth_percentile'])
+        assert fast['moving_averages']['values']['sma_200'] == pytest.approx(
+            slow['moving_averages']['values']['sma_200'])
+        assert fast['volatility']['values'] == pytest.approx(slow['volatility']['values'])
+        assert fast['rsi2']['value'] == pytest.approx(slow['rsi2']['value'])
+        assert fast['minervini']['criteria'] == slow['minervini']['criteria']
+        assert fast['minervini']['sma200'] == pytest.approx(slow['minervini']['sma200'])
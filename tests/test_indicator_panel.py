@@ -0,0 +1,94 @@
+"""
+Tests for the multi-ticker indicator panel
+==========================================
+A panel pass over a batch of histories must produce the same indicator
+dicts as per-ticker get_all_indicators(), skip histories that don't line
+up with the panel dates, and prime the shared IndicatorFrame cache so the
+per-ticker scans don't recompute.
+
+Run: pytest tests/test_indicator_panel.py -v
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from backend.analysis.indicator_frame import IndicatorFrameCache, indicator_frames
+from backend.analysis.indicator_panel import prime_indicator_frames
+from backend.analysis.technical_indicators import TechnicalIndicators
+from tests.test_live_indicators import _assert_same, _df, _history
+
+END_BARS = 300
+
+
+def _aligned_history(bars, seed):
+    """History of `bars` candles ending on the same date as every other ticker."""
+    hist = _history(_df(n=bars, seed=seed))
+    offset = END_BARS - bars
+    for i, candle in enumerate(hist['candles']):
+        candle['datetime'] = 1_600_000_000_000 + (i + offset) * 86_400_000
+    return hist
+
+
+@pytest.fixture
+def histories():
+    hists = {f'T{i}': _aligned_history(bars, seed=i)
+             for i, bars in enumerate([300, 280, 260, 275, 300, 120])}
+    gappy = _aligned_history(300, seed=42)
+    del gappy['candles'][150]
+    hists['GAP'] = gappy
+    return hists
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    indicator_frames.clear()
+    yield
+    indicator_frames.clear()
+
+
+class TestIndicatorPanel:
+
+    def test_matches_per_ticker_indicators(self, histories):
+        ti = TechnicalIndicators()
+        cache = IndicatorFrameCache()
+        primed = prime_indicator_frames(ti, histories, cache=cache)
+
+        # Short (120 bars) and gappy histories stay on the per-ticker path
+        assert primed == 5
+        assert cache.make_key('T5', histories['T5']) not in cache
+        assert cache.make_key('GAP', histories['GAP']) not in cache
+
+        for ticker in ('T0', 'T1', 'T2', 'T3', 'T4'):
+            frame = cache._frames[cache.make_key(ticker, histories[ticker])]
+            _assert_same(frame.indicators, ti.get_all_indicators(histories[ticker]))
+            assert len(frame.df) == len(histories[ticker]['candles'])
+
+    def test_relative_strength_vs_benchmark(self, histories):
+        ti = TechnicalIndicators()
+        cache = IndicatorFrameCache()
+        spy = _aligned_history(300, seed=99)
+        prime_indicator_frames(ti, histories, benchmark_history=spy, cache=cache)
+
+        frame = cache._frames[cache.make_key('T1', histories['T1'])]
+        expected = ti.calculate_relative_strength(ti.prepare_dataframe(histories['T1']),
+                                                  ti.prepare_dataframe(spy))
+        assert frame.relative_strength == pytest.approx(expected)
+
+        # A live-price revision keeps RS, with the stock leg moved to the live price
+        live = cache.get_or_build(ti, 'T1', histories['T1'], live_price=frame.current_price * 1.03)
+        expected = ti.calculate_relative_strength(live.df, ti.prepare_dataframe(spy))
+        assert live.relative_strength == pytest.approx(expected)
+
+    def test_primed_frames_serve_per_ticker_scans(self, histories):
+        ti = TechnicalIndicators()
+        assert ti.prime_indicator_frames(histories) == 5
+
+        with patch.object(ti, 'get_all_indicators_for_df', wraps=ti.get_all_indicators_for_df) as compute:
+            frame = ti.get_indicator_frame('T0', histories['T0'])
+            ti.get_indicator_frame('T0', histories['T0'], live_price=123.0)
+        assert frame is not None
+        assert compute.call_count == 0
+
+        # Already-cached tickers are not recomputed
+        assert ti.prime_indicator_frames({'T0': histories['T0'], 'T4': histories['T4']}) == 0
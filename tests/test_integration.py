@@ -710,13 +710,17 @@ class TestHealthAndMisc:
 
     def test_tickers_endpoint(self, auth_client, mock_scanner):
         """GET /api/tickers returns the cached ticker list."""
-        mock_scanner.get_cached_tickers.return_value = ['AAPL', 'MSFT', 'GOOGL']
+        from backend.services.ticker_index import TickerIndex
+        mock_scanner.get_ticker_index.return_value = TickerIndex(
+            [{'symbol': s, 'name': s} for s in ('AAPL', 'MSFT', 'GOOGL')])
         resp = auth_client.get('/api/tickers')
         assert resp.status_code == 200
         data = resp.get_json()
         assert data['success'] is True
-        assert 'AAPL' in data['tickers']
-        assert 'MSFT' in data['tickers']
+        symbols = [t['symbol'] for t in data['tickers']]
+        assert 'AAPL' in symbols
+        assert 'MSFT' in symbols
+        assert auth_client.get('/api/tickers', headers={'If-None-Match': resp.headers['ETag']}).status_code == 304
 
 
 # ══════════════════════════════════════════════════════════════════════════════
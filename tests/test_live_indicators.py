@@ -0,0 +1,125 @@
+"""
+Tests for incremental live-bar indicator state
+==============================================
+LiveBarState must produce the same get_all_indicators() output as a full
+recompute when the last Close is revised, and advancing a state seeded on
+N-1 bars by the Nth bar must match a state seeded on all N bars.
+
+Run: pytest tests/test_live_indicators.py -v
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.analysis.indicator_frame import indicator_frames
+from backend.analysis.live_indicators import LiveBarState
+from backend.analysis.technical_indicators import TechnicalIndicators
+
+
+def _df(n=320, seed=11):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, n)))
+    return pd.DataFrame({
+        'Open': close,
+        'High': close * (1 + rng.uniform(0, 0.02, n)),
+        'Low': close * (1 - rng.uniform(0, 0.02, n)),
+        'Close': close,
+        'Volume': rng.integers(500_000, 2_000_000, n).astype(float),
+    })
+
+
+def _history(df):
+    return {'candles': [
+        {'datetime': 1_600_000_000_000 + i * 86_400_000, 'open': r.Open, 'high': r.High,
+         'low': r.Low, 'close': r.Close, 'volume': r.Volume}
+        for i, r in enumerate(df.itertuples())
+    ]}
+
+
+def _assert_same(actual, expected, path=''):
+    if isinstance(expected, dict):
+        assert set(actual) == set(expected), path
+        for key in expected:
+            _assert_same(actual[key], expected[key], f"{path}.{key}")
+    elif isinstance(expected, float):
+        assert actual == pytest.approx(expected, rel=1e-9, abs=1e-9), path
+    else:
+        assert actual == expected, path
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    indicator_frames.clear()
+    yield
+    indicator_frames.clear()
+
+
+class TestLiveBarState:
+
+    @pytest.mark.parametrize('factor', [1.0, 0.93, 1.04, 1.12])
+    def test_revised_close_matches_full_recompute(self, factor):
+        ti = TechnicalIndicators()
+        df = _df()
+        state = LiveBarState.from_df(df)
+        price = float(df['Close'].iloc[-1]) * factor
+
+        live = df.copy()
+        live.iloc[-1, live.columns.get_loc('Close')] = price
+        expected = ti.get_all_indicators_for_df(live)
+
+        _assert_same(state.indicators(ti, price, expected['_data_quality']), expected)
+
+    def test_advance_matches_fresh_seed(self):
+        ti = TechnicalIndicators()
+        df = _df()
+        state = LiveBarState.from_df(df.iloc[:-1])
+        last = df.iloc[-1]
+        state.advance({'high': last.High, 'low': last.Low, 'close': last.Close, 'volume': last.Volume})
+
+        fresh = LiveBarState.from_df(df)
+        _assert_same(state.indicators(ti), fresh.indicators(ti))
+        _assert_same(state.indicators(ti), ti.get_all_indicators_for_df(df))
+
+    def test_minervini_scored_like_full_pass(self):
+        ti = TechnicalIndicators()
+        df = _df(seed=3)
+        df[['High', 'Low', 'Close']] = df[['High', 'Low', 'Close']].mul(np.linspace(1, 3, len(df)), axis=0)
+        price = float(df['Close'].iloc[-1]) * 1.01
+        live = df.copy()
+        live.iloc[-1, live.columns.get_loc('Close')] = price
+
+        expected = ti.get_all_indicators_for_df(live)['minervini']
+        actual = LiveBarState.from_df(df).indicators(ti, price)['minervini']
+        assert any(expected['criteria'].values())
+        assert (actual['score'], actual['stage']) == (expected['score'], expected['stage'])
+        assert [type(v) for v in actual['criteria'].values()] == [type(v) for v in expected['criteria'].values()]
+
+    def test_short_history_not_seeded(self):
+        assert LiveBarState.from_df(_df(n=200)) is None
+
+
+class TestLivePriceFrames:
+
+    def test_live_frame_revises_base_without_full_recompute(self):
+        ti = TechnicalIndicators()
+        hist = _history(_df())
+        calls = []
+        original = ti.get_all_indicators_for_df
+        ti.get_all_indicators_for_df = lambda df: calls.append(1) or original(df)
+
+        base = ti.get_indicator_frame('ABC', hist)
+        first = ti.get_indicator_frame('ABC', hist, live_price=101.5)
+        second = ti.get_indicator_frame('ABC', hist, live_price=99.25)
+
+        assert len(calls) == 1
+        assert base.current_price != 101.5
+        assert first.current_price == 101.5
+        assert second.indicators['moving_averages']['values']['current_price'] == 99.25
+
+    def test_short_history_falls_back_to_full_build(self):
+        ti = TechnicalIndicators()
+        hist = _history(_df(n=120))
+        frame = ti.get_indicator_frame('ABC', hist, live_price=88.0)
+        assert frame.current_price == 88.0
+        assert frame.indicators['bollinger_bands']['values']['current_price'] == 88.0
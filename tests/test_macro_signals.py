@@ -0,0 +1,77 @@
+"""
+Tests for put/call ratios from the /cores snapshot
+==================================================
+Verifies that put_call_ratios() aggregates equity, index and per-sector
+ratios from the cached snapshot, that MacroSignals uses it without any
+network call, and that the daily series persists across instances.
+
+Run: pytest tests/test_macro_signals.py -v
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from backend.analysis.macro_signals import MacroSignals, PutCallHistory, put_call_ratios
+from backend.services.cores_store import CoresSnapshotStore
+from backend.utils.market_hours import previous_trading_day
+
+
+def _row(ticker, etf, p_vol, c_vol, p_oi=0, c_oi=0):
+    return {'ticker': ticker, 'tradeDate': previous_trading_day().isoformat(), 'bestEtf': etf,
+            'sectorName': '', 'pVolu': p_vol, 'cVolu': c_vol, 'pOi': p_oi, 'cOi': c_oi}
+
+
+@pytest.fixture
+def cores_store(tmp_path):
+    store = CoresSnapshotStore(base_dir=str(tmp_path / 'cores'))
+    store.save([
+        _row('NVDA', 'XLK', 300, 600, 1000, 2000),
+        _row('AAPL', 'XLK', 100, 400, 500, 1500),
+        _row('JPM', 'XLF', 200, 200, 400, 500),
+        _row('XLK', 'XLK', 5000, 1000),   # Sector benchmark: excluded from equity
+        _row('SPY', 'SPY', 9000, 6000),   # Index product
+        _row('QQQ', '', 1000, 2000),
+    ])
+    return store
+
+
+class TestPutCallRatios:
+
+    def test_equity_index_and_sector_ratios(self, cores_store):
+        ratios = put_call_ratios(cores_store.current())
+        assert ratios['equity'] == pytest.approx(600 / 1200)
+        assert ratios['equity_oi'] == round(1900 / 4000, 3)
+        assert ratios['index'] == round(10000 / 8000, 3)
+        assert ratios['sectors'] == {'XLK': 0.4, 'XLF': 1.0}
+        assert (ratios['puts'], ratios['calls']) == (600, 1200)
+
+
+class TestMacroSignals:
+
+    def test_cores_signal_makes_no_requests(self, cores_store, tmp_path):
+        orats = MagicMock()
+        history = PutCallHistory(str(tmp_path / 'pc.json'))
+        signal = MacroSignals(orats_api=orats, cores_store=cores_store, history=history).get_put_call_signal()
+        assert orats.method_calls == []
+        assert signal.source == 'orats_cores'
+        assert signal.ratio == 0.5
+        assert signal.sector_ratios['XLF'] == 1.0
+        # (0.5 - 0.65) / 0.12 with fewer than 10 days of history
+        assert signal.z_score == pytest.approx(-1.25)
+
+    def test_series_survives_restart(self, tmp_path):
+        path = str(tmp_path / 'pc.json')
+        for day, ratio in enumerate([0.6, 0.7, 0.8]):
+            PutCallHistory(path).record(f'2026-01-0{day + 1}', ratio)
+        PutCallHistory(path).record('2026-01-03', 0.8)  # Same day again: no duplicate
+        assert PutCallHistory(path).record('2026-01-04', 0.9) == [0.6, 0.7, 0.8, 0.9]
+
+    def test_z_score_uses_persisted_series(self, cores_store, tmp_path):
+        history = PutCallHistory(str(tmp_path / 'pc.json'))
+        for i in range(20):
+            history.record(f'2025-12-{i + 1:02d}', 0.4 if i % 2 else 0.6)
+        signal = MacroSignals(cores_store=cores_store, history=history).get_put_call_signal()
+        assert len(history.load()) == 21
+        assert signal.z_score is not None and abs(signal.z_score) < 0.75
+        assert signal.signal == 'neutral'
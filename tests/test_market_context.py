@@ -0,0 +1,80 @@
+"""
+Tests for the shared market context snapshot
+============================================
+Verifies that MarketContextService fetches all context quotes in one
+refresh, serves readers from the snapshot, refreshes while the market is
+open, freezes after the close, and that ContextService reads from it.
+
+Run: pytest tests/test_market_context.py -v
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from backend.services import market_context as market_context_module
+from backend.services.context_service import ContextService
+from backend.services.market_context import CONTEXT_SYMBOLS, MarketContextService
+
+
+@pytest.fixture
+def orats():
+    api = MagicMock()
+    api.get_quote.side_effect = lambda symbol: {'symbol': symbol, 'price': 100.0}
+    return api
+
+
+def _market(is_open):
+    return patch.object(market_context_module, 'is_market_open', lambda: is_open)
+
+
+class TestMarketContextService:
+
+    def test_readers_share_one_refresh(self, orats):
+        service = MarketContextService(refresh_seconds=60)
+        with _market(True):
+            assert service.quote('SPY', orats)['price'] == 100.0
+            assert service.quote('VIX', orats)['price'] == 100.0
+            assert service.quote('AAPL', orats) is None  # Not a context symbol
+        assert orats.get_quote.call_count == len(CONTEXT_SYMBOLS)
+
+    def test_stale_snapshot_refreshes_while_open(self, orats):
+        service = MarketContextService(refresh_seconds=60)
+        with _market(True):
+            service.quote('SPY', orats)
+            service._snapshot.fetched_at -= 121
+            service.quote('SPY', orats)
+        assert orats.get_quote.call_count == 2 * len(CONTEXT_SYMBOLS)
+
+    def test_frozen_after_close(self, orats):
+        service = MarketContextService(refresh_seconds=60)
+        with _market(True):
+            service.refresh(orats)
+        with _market(False):
+            service.refresh(orats)              # Captures the close
+            service._snapshot.fetched_at -= 3600
+            service.refresh(orats)              # Frozen: no-op
+            service.quote('SPY', orats)
+        assert orats.get_quote.call_count == 2 * len(CONTEXT_SYMBOLS)
+
+    def test_failed_symbols_keep_last_quote(self, orats):
+        service = MarketContextService(refresh_seconds=60)
+        with _market(True):
+            service.refresh(orats)
+            orats.get_quote.side_effect = lambda symbol: None if symbol == 'VIX' else {'price': 101.0}
+            service.refresh(orats, force=True)
+        assert service.quote('VIX')['price'] == 100.0
+        assert service.quote('SPY')['price'] == 101.0
+
+
+class TestContextServiceUsesSnapshot:
+
+    def test_market_regime_from_snapshot(self, orats):
+        service = MarketContextService(refresh_seconds=60)
+        with _market(False):
+            service.refresh(orats)
+            orats.get_quote.reset_mock()
+            regime = ContextService(orats_api=orats, market_context=service)._get_market_regime('NVDA')
+        orats.get_quote.assert_not_called()
+        assert regime['spy']['price'] == 100.0
+        assert regime['sector']['etf'] == 'XLK'
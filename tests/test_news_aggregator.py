@@ -0,0 +1,92 @@
+"""
+Tests for the concurrent multi-provider news aggregator
+=======================================================
+Verifies that NewsAggregator queries providers in parallel, returns what
+arrived when the deadline expires, isolates provider failures, and
+deduplicates by URL and normalized title in provider priority order, and
+that the Finnhub provider requests the full days_back window.
+
+Run: pytest tests/test_news_aggregator.py -v
+"""
+
+import datetime
+import time
+from unittest.mock import patch
+
+from backend.api.finnhub import FinnhubAPI
+from backend.api.news_apis import NewsAPIs
+from backend.services.news_aggregator import NewsAggregator, normalize_title, normalize_url
+
+
+def _provider(articles, delay=0.0):
+    def fetch(ticker, days_back):
+        time.sleep(delay)
+        return articles
+    return fetch
+
+
+def _article(headline, url, source='Wire', published='2026-10-16T12:00:00'):
+    return {'headline': headline, 'url': url, 'source': source, 'published_date': published}
+
+
+class TestNewsAggregator:
+
+    def test_providers_run_concurrently(self):
+        providers = {f'p{i}': _provider([_article(f'Story {i}', f'https://x.com/{i}')], delay=0.2)
+                     for i in range(4)}
+        start = time.monotonic()
+        articles = NewsAggregator(providers=providers, deadline=5).get_all_news('NVDA')
+        assert time.monotonic() - start < 0.2 * 3
+        assert len(articles) == 4
+
+    def test_slow_and_failing_providers_do_not_stall(self):
+        def broken(ticker, days_back):
+            raise RuntimeError('boom')
+        providers = {
+            'fast': _provider([_article('Fast story', 'https://a.com/1')]),
+            'slow_rss': _provider([_article('Slow story', 'https://b.com/1')], delay=2),
+            'broken': broken,
+        }
+        start = time.monotonic()
+        articles = NewsAggregator(providers=providers, deadline=0.3).get_all_news('NVDA')
+        assert time.monotonic() - start < 1.0
+        assert [a['headline'] for a in articles] == ['Fast story']
+
+    def test_dedup_by_url_and_title_keeps_priority_copy(self):
+        providers = {
+            'alphavantage': _provider([dict(_article('Nvidia beats estimates', 'https://r.com/a?utm_source=av'),
+                                            sentiment_score=0.4)]),
+            'google_news': _provider([
+                _article('Nvidia Beats Estimates - Reuters', 'https://news.google.com/x', source='Reuters'),
+                _article('Different headline, same page', 'https://R.com/a/'),
+                _article('Chip stocks rally', 'https://c.com/1', published='2026-10-17T09:00:00'),
+            ]),
+        }
+        articles = NewsAggregator(providers=providers, deadline=5).get_all_news('NVDA')
+        assert [a['headline'] for a in articles] == ['Chip stocks rally', 'Nvidia beats estimates']
+        assert articles[1]['sentiment_score'] == 0.4
+
+    def test_skip_excludes_provider(self):
+        called = []
+        providers = {'finnhub': lambda t, d: called.append(t) or [],
+                     'google_news': _provider([_article('Story', 'https://x.com/1')])}
+        articles = NewsAggregator(providers=providers, deadline=5).get_all_news('AMD', skip=('finnhub',))
+        assert called == [] and len(articles) == 1
+
+    def test_normalizers(self):
+        assert normalize_url('https://WWW.Site.com/path/?utm_medium=x&id=7#top') == '//www.site.com/path?id=7'
+        assert normalize_title('Apple Slides 3%! - MarketWatch', 'MarketWatch') == 'apple slides 3'
+
+
+class TestFinnhubProvider:
+
+    def test_requests_full_days_back_window(self):
+        apis = NewsAPIs()
+        apis.finnhub_key = 'test-key'
+        item = {'headline': 'Old but in range', 'url': 'https://x.com/a', 'source': 'Wire',
+                'datetime': int(time.time()) - 6 * 86400}
+        with patch.object(FinnhubAPI, '_get', return_value=[item]) as get:
+            articles = apis.get_finnhub_news('AAPL', days_back=7)
+        params = get.call_args.args[1]
+        assert params['from'] == (datetime.date.today() - datetime.timedelta(days=7)).isoformat()
+        assert [a['headline'] for a in articles] == ['Old but in range']
@@ -0,0 +1,92 @@
+"""
+Tests for the read-through Finnhub news cache
+=============================================
+Verifies that NewsSentimentCache serves repeat lookups from memory or the
+NewsCache table, refreshes stale entries in the background, shares one
+Finnhub call between concurrent readers, and backs off the premium
+sentiment endpoint after a FORBIDDEN answer.
+
+Run: pytest tests/test_news_cache.py -v
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.database.models import Base, NewsCache
+from backend.services.news_cache import FORBIDDEN, NewsSentimentCache
+
+ARTICLES = [{'headline': 'Beat and raise', 'summary': 's', 'source': 'wire', 'url': 'http://x',
+             'datetime': 1_760_000_000}]
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine('sqlite://')
+    Base.metadata.create_all(engine, tables=[NewsCache.__table__])
+    return sessionmaker(bind=engine)
+
+
+@pytest.fixture
+def finnhub():
+    api = MagicMock()
+    api.get_company_news.return_value = ARTICLES
+    api.get_news_sentiment.return_value = {'sentiment': {'bullishPercent': 0.7}}
+    return api
+
+
+class TestNewsSentimentCache:
+
+    def test_repeat_reads_hit_memory(self, finnhub, session_factory):
+        cache = NewsSentimentCache(session_factory=session_factory)
+        assert cache.get_company_news(finnhub, '$aapl') == ARTICLES
+        assert cache.get_company_news(finnhub, 'AAPL') == ARTICLES
+        cache.get_news_sentiment(finnhub, 'AAPL')
+        cache.get_news_sentiment(finnhub, 'AAPL')
+        assert finnhub.get_company_news.call_count == 1
+        assert finnhub.get_news_sentiment.call_count == 1
+
+    def test_table_serves_other_workers(self, finnhub, session_factory):
+        NewsSentimentCache(session_factory=session_factory).get_company_news(finnhub, 'AAPL')
+        other = NewsSentimentCache(session_factory=session_factory)  # e.g. after a restart
+        news = other.get_company_news(finnhub, 'AAPL')
+        assert news[0]['headline'] == 'Beat and raise'
+        assert news[0]['datetime'] == 1_760_000_000
+        assert finnhub.get_company_news.call_count == 1
+
+    def test_stale_entry_served_and_refreshed_in_background(self, finnhub):
+        cache = NewsSentimentCache(session_factory=None, refresh_minutes=1)
+        cache.get_company_news(finnhub, 'AAPL')
+        fetched_at, value = cache._memory[('news', 'AAPL')]
+        cache._memory[('news', 'AAPL')] = (fetched_at - 120, value)
+        assert cache.get_company_news(finnhub, 'AAPL') == ARTICLES
+        cache._refresher.shutdown(wait=True)
+        assert finnhub.get_company_news.call_count == 2
+        assert time.time() - cache._memory[('news', 'AAPL')][0] < 5
+
+    def test_concurrent_readers_share_one_call(self, finnhub):
+        def slow(ticker):
+            time.sleep(0.2)
+            return ARTICLES
+        finnhub.get_company_news.side_effect = slow
+        cache = NewsSentimentCache(session_factory=None)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(cache.get_company_news(finnhub, 'AAPL')))
+                   for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert results == [ARTICLES] * 4
+        assert finnhub.get_company_news.call_count == 1
+
+    def test_forbidden_disables_premium_for_all_tickers(self, finnhub):
+        finnhub.get_news_sentiment.return_value = FORBIDDEN
+        cache = NewsSentimentCache(session_factory=None)
+        assert cache.get_news_sentiment(finnhub, 'AAPL') == FORBIDDEN
+        assert cache.get_news_sentiment(finnhub, 'MSFT') == FORBIDDEN
+        assert finnhub.get_news_sentiment.call_count == 1
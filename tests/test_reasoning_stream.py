@@ -0,0 +1,107 @@
+"""
+Tests for streaming AI analysis
+===============================
+Verifies that ReasoningEngine.stream_analysis relays Perplexity's streamed
+tokens as they arrive, parses the final JSON block into the same result
+analyze_ticker returns, caches it, waits on an identical analysis already
+in flight instead of paying for a second call, and reports HTTP errors as
+one event.
+
+Run: pytest tests/test_reasoning_stream.py -v
+"""
+
+import json
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+from backend.services import reasoning_engine
+from backend.services.analysis_cache import AnalysisCache
+from backend.services.reasoning_engine import ReasoningEngine
+
+CHUNKS = ['**News:** Beat and raise.\n',
+          '```json\n{"score": 72, "verdict": "FAVORABLE", "summary": "Strong quarter.", ',
+          '"risks": ["Valuation"], "thesis": "Momentum."}\n```']
+
+
+def _sse_response(chunks, status=200):
+    response = MagicMock()
+    response.status_code = status
+    response.__enter__.return_value = response
+    lines = []
+    for text in chunks:
+        lines += [f"data: {json.dumps({'choices': [{'delta': {'content': text}}]})}", '']
+    response.iter_lines.return_value = lines + ['data: [DONE]']
+    return response
+
+
+def _engine(cache=None):
+    engine = ReasoningEngine(cache=cache)
+    engine.api_key = 'test-key'
+    return engine
+
+
+class TestStreamAnalysis:
+
+    def test_tokens_then_validated_result(self):
+        with patch.object(reasoning_engine.requests, 'post', return_value=_sse_response(CHUNKS)) as post:
+            events = list(_engine().stream_analysis('NVDA', 'WEEKLY', context={'current_price': 187.4}))
+        assert post.call_args.kwargs['stream'] is True
+        assert post.call_args.kwargs['json']['stream'] is True
+        assert [e for e, _ in events] == ['token', 'token', 'token', 'result']
+        assert events[0][1] == {'text': CHUNKS[0]}
+        result = events[-1][1]
+        assert (result['score'], result['verdict'], result['risks']) == (72, 'FAVORABLE', ['Valuation'])
+        assert '```json' not in result['analysis']
+
+    def test_result_is_cached_for_repeat_requests(self):
+        cache = AnalysisCache(session_factory=None)
+        cache.get = MagicMock(side_effect=[None, {'score': 72, 'cached': True}])
+        cache.put = MagicMock()
+        engine = _engine(cache)
+        with patch.object(reasoning_engine.requests, 'post', return_value=_sse_response(CHUNKS)) as post:
+            list(engine.stream_analysis('NVDA', 'WEEKLY'))
+            repeat = list(engine.stream_analysis('NVDA', 'WEEKLY'))
+        assert post.call_count == 1
+        cache.put.assert_called_once()
+        assert repeat == [('result', {'score': 72, 'cached': True})]
+
+    def test_concurrent_identical_requests_share_one_call(self):
+        engine = _engine(AnalysisCache(session_factory=None))
+        started = threading.Event()
+
+        def slow_post(*args, **kwargs):
+            started.set()
+            time.sleep(0.2)
+            return _sse_response(CHUNKS)
+
+        def slow_analyze(*args):
+            started.set()
+            time.sleep(0.2)
+            return {'ticker': 'NVDA', 'score': 72, 'verdict': 'FAVORABLE'}
+        engine._analyze = slow_analyze
+
+        with patch.object(reasoning_engine.requests, 'post', side_effect=slow_post) as post:
+            leader = threading.Thread(target=lambda: list(engine.stream_analysis('NVDA', 'WEEKLY')))
+            leader.start()
+            started.wait(1)
+            follower = list(engine.stream_analysis('NVDA', 'WEEKLY'))
+            leader.join()
+            assert post.call_count == 1
+            assert [e for e, _ in follower] == ['result']
+            assert follower[0][1]['score'] == 72
+
+            # A stream joins a non-streaming analyze_ticker() call in flight too
+            started.clear()
+            leader = threading.Thread(target=lambda: engine.analyze_ticker('NVDA', 'LEAP'))
+            leader.start()
+            started.wait(1)
+            follower = list(engine.stream_analysis('NVDA', 'LEAP'))
+            leader.join()
+            assert post.call_count == 1
+            assert follower == [('result', {'ticker': 'NVDA', 'score': 72, 'verdict': 'FAVORABLE'})]
+
+    def test_http_error_is_one_event(self):
+        with patch.object(reasoning_engine.requests, 'post', return_value=_sse_response([], status=401)):
+            events = list(_engine().stream_analysis('NVDA', 'WEEKLY'))
+        assert events == [('error', {'error': 'API Error: 401'})]
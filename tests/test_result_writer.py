@@ -0,0 +1,112 @@
+"""
+Tests for batched scan result persistence
+=========================================
+Verifies that ScanResultWriter writes each add at once outside a batch,
+holds a batch's results, opportunities and news rows until the outermost
+batch exits and then writes them in one transaction with the right
+scan_result_id links, keeps batches per thread, flushes early past
+max_buffered, and that the scanner tables carry their lookup indexes.
+
+Run: pytest tests/test_result_writer.py -v
+"""
+
+import threading
+from datetime import datetime
+
+import pytest
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import sessionmaker
+
+from backend.database.models import (Base, NewsCache, Opportunity, ScanResult,
+                                     create_scanner_engine, session_scope)
+from backend.services.result_writer import ScanResultWriter
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_scanner_engine(f"sqlite:///{tmp_path / 'scanner.db'}")
+    Base.metadata.create_all(engine, tables=[ScanResult.__table__, Opportunity.__table__,
+                                             NewsCache.__table__])
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session_factory(engine):
+    return sessionmaker(bind=engine)
+
+
+def _commits(engine):
+    counter = []
+    event.listen(engine, 'commit', lambda conn: counter.append(1))
+    return counter
+
+
+def _opportunity(strike, score):
+    return {'option_type': 'CALL', 'strike_price': strike, 'expiration_date': datetime(2027, 1, 15),
+            'premium': 5.0, 'profit_potential': 20.0, 'days_to_expiry': 400, 'volume': 10,
+            'open_interest': 100, 'opportunity_score': score}
+
+
+def _counts(session_factory):
+    with session_scope(session_factory) as db:
+        return db.query(ScanResult).count(), db.query(Opportunity).count(), db.query(NewsCache).count()
+
+
+class TestScanResultWriter:
+
+    def test_unbatched_add_writes_at_once(self, session_factory):
+        writer = ScanResultWriter(session_factory)
+        writer.add_scan('AAPL', 60, 55, [_opportunity(100 + i, 70) for i in range(12)])
+        assert _counts(session_factory) == (1, 10, 0)
+
+    def test_batch_writes_once_with_linked_opportunities(self, engine, session_factory):
+        writer = ScanResultWriter(session_factory)
+        commits = _commits(engine)
+        with writer.batch():
+            for i in range(30):
+                writer.add_scan(f'T{i}', 60, 55, [_opportunity(100 + i, 60 + j) for j in range(3)])
+            with writer.batch():  # Nested batches join the outer one
+                writer.add_news('T0', [{'headline': 'Beat', 'url': 'http://x', 'datetime': 1_760_000_000}], [0.5])
+            assert _counts(session_factory) == (0, 0, 0)
+            commits.clear()
+        assert len(commits) == 1
+        assert _counts(session_factory) == (30, 90, 1)
+
+        with session_scope(session_factory) as db:
+            for result in db.query(ScanResult).all():
+                opps = db.query(Opportunity).filter(Opportunity.scan_result_id == result.id).all()
+                assert {o.ticker for o in opps} == {result.ticker}
+                assert result.opportunity_score == 61
+            assert db.query(NewsCache).one().sentiment_score == 0.5
+
+    def test_news_replaces_previous_rows(self, session_factory):
+        writer = ScanResultWriter(session_factory)
+        writer.add_news('AAPL', [{'headline': f'Old {i}', 'url': f'http://x/{i}'} for i in range(3)])
+        writer.add_news('AAPL', [{'headline': 'New', 'url': 'http://y'}])
+        with session_scope(session_factory) as db:
+            assert [r.headline for r in db.query(NewsCache).all()] == ['New']
+
+    def test_batches_are_per_thread(self, session_factory):
+        writer = ScanResultWriter(session_factory)
+        with writer.batch():
+            writer.add_scan('AAPL', 60, 55, [])
+            other = threading.Thread(target=writer.add_scan, args=('MSFT', 60, 55, []))
+            other.start()
+            other.join()
+            assert _counts(session_factory)[0] == 1  # MSFT had no batch open
+        assert _counts(session_factory)[0] == 2
+
+    def test_large_batch_flushes_early(self, session_factory):
+        writer = ScanResultWriter(session_factory, max_buffered=5)
+        with writer.batch():
+            for i in range(12):
+                writer.add_scan(f'T{i}', 60, 55, [])
+            assert _counts(session_factory)[0] == 10
+        assert _counts(session_factory)[0] == 12
+
+    def test_scanner_tables_are_indexed(self, engine):
+        indexed = lambda table: [i['column_names'] for i in inspect(engine).get_indexes(table)]
+        assert ['ticker', 'scan_date'] in indexed('scan_results')
+        assert ['scan_date'] in indexed('scan_results')
+        assert ['scan_result_id'] in indexed('opportunities')
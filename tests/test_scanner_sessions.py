@@ -0,0 +1,89 @@
+"""
+Tests for per-task scanner DB sessions
+======================================
+Verifies that the scanner DB engine runs SQLite in WAL mode with a busy
+timeout, that session_scope commits/rolls back and always closes, and that
+scan results and watchlist writes from many threads at once all land
+without sharing a session.
+
+Run: pytest tests/test_scanner_sessions.py -v
+"""
+
+import threading
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from backend.database.models import (Base, Opportunity, ScanResult, Watchlist,
+                                     create_scanner_engine, session_scope)
+from backend.services import scanner_utils
+from backend.services.result_writer import ScanResultWriter
+from backend.services.watchlist_service import WatchlistService
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    engine = create_scanner_engine(f"sqlite:///{tmp_path / 'scanner.db'}")
+    Base.metadata.create_all(engine, tables=[Watchlist.__table__, ScanResult.__table__,
+                                             Opportunity.__table__])
+    yield sessionmaker(bind=engine)
+    engine.dispose()
+
+
+def _opportunity(i):
+    return {'option_type': 'CALL', 'strike_price': 100 + i, 'expiration_date': datetime(2027, 1, 15),
+            'premium': 5.0, 'profit_potential': 20.0, 'days_to_expiry': 400, 'volume': 10,
+            'open_interest': 100, 'opportunity_score': 70 + i}
+
+
+def _run_threads(target, count):
+    errors = []
+
+    def run(i):
+        try:
+            target(i)
+        except Exception as e:  # pragma: no cover - surfaced by the assert below
+            errors.append(e)
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(count)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert errors == []
+
+
+class TestScannerSessions:
+
+    def test_sqlite_runs_in_wal_with_busy_timeout(self, session_factory):
+        with session_scope(session_factory) as db:
+            conn = db.connection()
+            assert conn.exec_driver_sql('PRAGMA journal_mode').scalar() == 'wal'
+            assert conn.exec_driver_sql('PRAGMA busy_timeout').scalar() > 0
+
+    def test_session_scope_rolls_back_on_error(self, session_factory):
+        with pytest.raises(RuntimeError):
+            with session_scope(session_factory) as db:
+                db.add(Watchlist(ticker='AAPL', username='alice'))
+                raise RuntimeError('boom')
+        with session_scope(session_factory) as db:
+            assert db.query(Watchlist).count() == 0
+
+    def test_concurrent_scan_results(self, session_factory):
+        scanner = SimpleNamespace(session_factory=session_factory,
+                                  _result_writer=ScanResultWriter(session_factory))
+        _run_threads(lambda i: scanner_utils.save_scan_results(
+            scanner, f'T{i}', 60, 55, [_opportunity(j) for j in range(3)]), count=12)
+        with session_scope(session_factory) as db:
+            assert db.query(ScanResult).count() == 12
+            assert db.query(Opportunity).count() == 36
+        assert len(scanner_utils.get_latest_results(scanner)) == 12
+
+    def test_shared_watchlist_service_across_threads(self, session_factory, monkeypatch):
+        monkeypatch.setattr(WatchlistService, '_get_sector', lambda self, ticker: 'Technology')
+        service = WatchlistService(session_factory=session_factory)
+        _run_threads(lambda i: service.add_ticker(f'T{i}', f'user{i % 3}'), count=12)
+        assert sum(len(service.get_watchlist(f'user{u}')) for u in range(3)) == 12
+        assert service.remove_ticker('T0', 'user0') == (True, 'T0 removed from watchlist')
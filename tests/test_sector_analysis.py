@@ -0,0 +1,82 @@
+"""
+Tests for sector momentum from the /cores snapshot
+==================================================
+Verifies that SectorAnalysis ranks sector ETFs and industries from the
+cached /cores snapshot without any ORATS call, falls back to constituents
+for ETFs missing from the universe, and only fetches history for the rest.
+
+Run: pytest tests/test_sector_analysis.py -v
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from backend.analysis import sector_analysis
+from backend.analysis.sector_analysis import SectorAnalysis
+from backend.services.cores_store import CoresSnapshotStore
+from backend.utils.market_hours import previous_trading_day
+
+ETF_CHANGES = {'XLK': 6.0, 'XLF': 1.5, 'XLV': -2.0, 'XLY': 3.0, 'XLC': 4.5, 'XLE': -4.0,
+               'XLI': 0.5, 'XLP': -1.0, 'XLU': 2.0, 'XLB': -3.0}
+
+
+def _records():
+    trade_date = previous_trading_day().isoformat()
+    records = [{'ticker': etf, 'tradeDate': trade_date, 'bestEtf': etf, 'sectorName': '',
+                'stkPxChng1m': change} for etf, change in ETF_CHANGES.items()]
+    # XLRE has no row of its own: five REIT constituents with a median of 5.0
+    for i, change in enumerate([1.0, 5.0, 7.0, 9.0, 2.0]):
+        records.append({'ticker': f'REIT{i}', 'tradeDate': trade_date, 'bestEtf': 'XLRE',
+                        'sectorName': 'REITs', 'stkPxChng1m': change})
+    for i, change in enumerate([10.0, 12.0, 11.0, 14.0, 13.0]):
+        records.append({'ticker': f'SEMI{i}', 'tradeDate': trade_date, 'bestEtf': 'XLK',
+                        'sectorName': 'Semiconductors', 'stkPxChng1m': change})
+    return records
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    sector_analysis._sector_cache.clear()
+    yield
+    sector_analysis._sector_cache.clear()
+
+
+@pytest.fixture
+def cores_store(tmp_path):
+    store = CoresSnapshotStore(base_dir=str(tmp_path))
+    store.save(_records())
+    return store
+
+
+class TestCoresRankings:
+
+    def test_ranks_without_api_calls(self, cores_store):
+        orats = MagicMock()
+        result = SectorAnalysis(orats_api=orats, cores_store=cores_store).get_sector_rankings()
+        assert orats.method_calls == []
+        assert result.source == 'orats_cores'
+        assert [r.etf for r in result.rankings[:3]] == ['XLK', 'XLRE', 'XLC']
+        assert result.rankings[1].momentum_pct == 5.0  # Constituent median
+        assert {r.etf for r in result.rankings if r.tier == 'bottom'} == {'XLV', 'XLB', 'XLE'}
+
+    def test_missing_etfs_fall_back_to_history(self, tmp_path):
+        store = CoresSnapshotStore(base_dir=str(tmp_path))
+        store.save([r for r in _records() if r['ticker'] != 'XLU'])
+        orats = MagicMock()
+        orats.get_history_batch.return_value = {}
+        orats.get_history.return_value = None
+        orats.get_quote.return_value = {'pctChange': 0.7}
+        result = SectorAnalysis(orats_api=orats, cores_store=store).get_sector_rankings()
+        orats.get_history_batch.assert_called_once_with(['XLU'])
+        orats.get_history.assert_not_called()
+        assert next(r for r in result.rankings if r.etf == 'XLU').momentum_pct == 0.7
+
+    def test_industry_rankings(self, cores_store):
+        industries = SectorAnalysis(cores_store=cores_store).get_industry_rankings()
+        assert [(g['industry'], g['momentum_pct'], g['members']) for g in industries] == [
+            ('semiconductors', 12.0, 5), ('reits', 5.0, 5)]
+
+    def test_unmapped_ticker_uses_cores_best_etf(self, cores_store):
+        info = SectorAnalysis(cores_store=cores_store).get_ticker_sector_modifier('SEMI3')
+        assert info['etf'] == 'XLK' and info['tier'] == 'top'
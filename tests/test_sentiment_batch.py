@@ -0,0 +1,83 @@
+"""
+Tests for batched headline sentiment scoring
+============================================
+Verifies that SentimentAnalyzer.score_headlines_batch packs many tickers
+into few Perplexity calls under a token budget, returns per-ticker scores
+and rationales, and that scored headline sets are never sent again.
+
+Run: pytest tests/test_sentiment_batch.py -v
+"""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from backend.analysis import sentiment_analyzer
+from backend.analysis.sentiment_analyzer import SentimentAnalyzer
+
+HEADLINES = {
+    'AAPL': ['Apple beats on services revenue', 'iPhone demand steady in China'],
+    'MSFT': ['Azure growth accelerates'],
+    'TSLA': ['Tesla recalls 200k vehicles', 'Deliveries miss estimates'],
+}
+
+
+def _response(payload):
+    resp = MagicMock()
+    resp.status_code = 200
+    resp.json.return_value = {'choices': [{'message': {'content': json.dumps(payload)}}]}
+    return resp
+
+
+def _answer(**scores):
+    return {t: {'score': s, 'rationale': f'{t} rationale'} for t, s in scores.items()}
+
+
+@pytest.fixture(autouse=True)
+def _clear_scores():
+    sentiment_analyzer._headline_scores.clear()
+    yield
+    sentiment_analyzer._headline_scores.clear()
+
+
+@pytest.fixture
+def analyzer():
+    analyzer = SentimentAnalyzer()
+    analyzer.perplexity_api_key = 'test-key'
+    return analyzer
+
+
+class TestBatchScoring:
+
+    def test_one_call_for_many_tickers(self, analyzer):
+        with patch.object(sentiment_analyzer.requests, 'post',
+                          return_value=_response(_answer(AAPL=70, MSFT=64, TSLA=22))) as post:
+            scores = analyzer.score_headlines_batch(HEADLINES)
+        assert post.call_count == 1
+        assert {t: s for t, (s, _) in scores.items()} == {'AAPL': 70, 'MSFT': 64, 'TSLA': 22}
+        assert scores['TSLA'][1] == [{'source': 'Perplexity AI', 'score': 22, 'rationale': 'TSLA rationale'}]
+
+    def test_token_budget_splits_requests(self, analyzer):
+        chunks = analyzer._pack_headline_batches(list(HEADLINES.items()), token_budget=15)
+        assert [[t for t, _ in chunk] for chunk in chunks] == [['AAPL'], ['MSFT'], ['TSLA']]
+
+    def test_unchanged_headlines_are_never_rescored(self, analyzer):
+        with patch.object(sentiment_analyzer.requests, 'post',
+                          return_value=_response(_answer(AAPL=70, MSFT=64))) as post:
+            analyzer.score_headlines_batch(HEADLINES)
+            # TSLA was missing from the answer: only it is requested again
+            analyzer.score_headlines_batch(HEADLINES)
+            assert 'TSLA' in post.call_args.kwargs['json']['messages'][1]['content']
+            assert 'AAPL' not in post.call_args.kwargs['json']['messages'][1]['content']
+            # The per-ticker scorer shares the cache (headline order does not matter)
+            score, breakdown = analyzer.score_headlines_with_perplexity('aapl', HEADLINES['AAPL'][::-1])
+        assert post.call_count == 2
+        assert score == 70 and breakdown[0]['rationale'] == 'AAPL rationale'
+
+    def test_changed_headlines_are_rescored(self, analyzer):
+        with patch.object(sentiment_analyzer.requests, 'post',
+                          return_value=_response({'score': 40, 'rationale': 'r'})) as post:
+            analyzer.score_headlines_with_perplexity('MSFT', HEADLINES['MSFT'])
+            analyzer.score_headlines_with_perplexity('MSFT', HEADLINES['MSFT'] + ['Activision writedown'])
+        assert post.call_count == 2
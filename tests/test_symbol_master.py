@@ -0,0 +1,107 @@
+"""
+Tests for the in-memory symbol master
+=====================================
+Verifies that SymbolMaster resolves sector, industry, sector ETF, market
+cap and ORATS coverage from the ticker universe with O(1) lookups, overlays
+/cores bestEtf and sectorName, keeps curated ETF members authoritative, and
+that the watchlist gets its sector without a network call.
+
+Run: pytest tests/test_symbol_master.py -v
+"""
+
+import json
+import os
+
+import pytest
+
+from backend.services.cores_store import CoresSnapshotStore
+from backend.services.symbol_master import SymbolMaster
+from backend.services.universe_store import UniverseStore
+from backend.utils.market_hours import previous_trading_day
+
+TICKERS = [
+    {'symbol': 'AAPL', 'name': 'Apple Inc.', 'sector': 'Technology',
+     'industry': 'Consumer Electronics', 'marketCap': 3.5e12, 'volume': 5e7},
+    {'symbol': 'JNJ', 'name': 'Johnson & Johnson', 'sector': 'Healthcare',
+     'industry': 'Drug Manufacturers', 'marketCap': 4e11, 'volume': 7e6},
+    {'symbol': 'SMCI', 'name': 'Super Micro Computer', 'sector': 'Technology',
+     'marketCap': 2e10, 'volume': 3e7},
+    {'symbol': 'OBSC', 'name': 'Obscure Holdings', 'sector': None, 'marketCap': 1e8},
+]
+
+
+@pytest.fixture
+def universe(tmp_path):
+    with open(tmp_path / 'tickers.json', 'w') as f:
+        json.dump({'tickers': TICKERS}, f)
+    with open(tmp_path / 'orats_universe.json', 'w') as f:
+        json.dump({'tickers': {s: {} for s in ('AAPL', 'JNJ', 'SMCI', 'SPY')}}, f)
+    store = UniverseStore(data_dir=str(tmp_path))
+    store.reload()
+    return store
+
+
+@pytest.fixture
+def cores_store(tmp_path):
+    trade_date = previous_trading_day().isoformat()
+    store = CoresSnapshotStore(base_dir=str(tmp_path / 'cores'))
+    store.save([
+        {'ticker': 'SMCI', 'tradeDate': trade_date, 'bestEtf': 'XLK', 'sectorName': 'Computer Hardware', 'pxCls': 40.0},
+        {'ticker': 'OBSC', 'tradeDate': trade_date, 'bestEtf': 'XLI', 'sectorName': 'Conglomerates', 'pxCls': 5.0},
+        {'ticker': 'AAPL', 'tradeDate': trade_date, 'bestEtf': 'QQQ', 'sectorName': 'Hardware', 'pxCls': 230.0},
+        {'ticker': 'CORE1', 'tradeDate': trade_date, 'bestEtf': 'XLE', 'sectorName': 'Oil', 'pxCls': 12.0},
+    ])
+    return store
+
+
+class TestSymbolMaster:
+
+    def test_universe_fields(self, universe, tmp_path):
+        master = SymbolMaster(universe=universe, cores_store=CoresSnapshotStore(base_dir=str(tmp_path / 'none')))
+        info = master.get('$jnj ')
+        assert (info.sector, info.industry, info.sector_etf) == ('Healthcare', 'Drug Manufacturers', 'XLV')
+        assert info.market_cap == 4e11 and info.orats_covered
+        assert master.sector('OBSC') is None and master.sector_etf('OBSC') is None
+        assert master.is_orats_covered('SPY') and not master.is_orats_covered('OBSC')
+        assert master.get('NOPE') is None
+
+    def test_cores_overlay(self, universe, cores_store):
+        master = SymbolMaster(universe=universe, cores_store=cores_store)
+        # bestEtf fills in a sector ETF and sectorName an industry
+        assert (master.sector_etf('OBSC'), master.industry('OBSC')) == ('XLI', 'Conglomerates')
+        assert master.sector('OBSC') == 'Industrials'
+        assert master.industry('SMCI') == 'Computer Hardware'
+        # Curated members win; non-sector bestEtf (QQQ) is ignored
+        assert master.sector_etf('AAPL') == 'XLK'
+        assert master.industry('AAPL') == 'Consumer Electronics'
+        # Symbols only /cores knows still resolve
+        assert master.sector_etf('CORE1') == 'XLE'
+
+    def test_rebuilds_after_universe_reload(self, universe, tmp_path):
+        master = SymbolMaster(universe=universe, cores_store=CoresSnapshotStore(base_dir=str(tmp_path / 'none')))
+        assert master.get('NVDA') is None
+        with open(tmp_path / 'tickers.json', 'w') as f:
+            json.dump({'tickers': TICKERS + [{'symbol': 'NVDA', 'sector': 'Technology'}]}, f)
+        os.utime(tmp_path / 'tickers.json', ns=(1, 1))
+        universe.reload()
+        assert master.sector_etf('NVDA') == 'XLK'
+
+
+class TestSharedCoresStore:
+
+    def test_scanner_and_symbol_master_share_one_store(self):
+        from backend.services.hybrid_scanner_service import HybridScannerService
+        from backend.services.symbol_master import symbol_master
+        assert symbol_master.cores_store is HybridScannerService._cores_store
+        assert HybridScannerService._symbol_master is symbol_master
+
+
+class TestWatchlistSector:
+
+    def test_watchlist_sector_comes_from_symbol_master(self, universe, tmp_path, monkeypatch):
+        from backend.services import watchlist_service
+        master = SymbolMaster(universe=universe, cores_store=CoresSnapshotStore(base_dir=str(tmp_path / 'none')))
+        monkeypatch.setattr(watchlist_service, 'symbol_master', master)
+        service = watchlist_service.WatchlistService.__new__(watchlist_service.WatchlistService)
+        assert service._get_sector('aapl') == 'Technology'
+        assert service._get_sector('ZZZZ') == 'Unknown'
@@ -0,0 +1,78 @@
+"""
+Tests for the server-side ticker autocomplete index
+===================================================
+Verifies that TickerIndex matches symbol and company-name prefixes
+(including multi-word queries), ranks exact symbols first and otherwise by
+market cap and volume, caps the result count, and serves the full list
+as a gzipped payload with a stable ETag.
+
+Run: pytest tests/test_ticker_index.py -v
+"""
+
+import gzip
+import json
+
+from backend.services.ticker_index import MAX_LIMIT, TickerIndex
+
+
+def _ticker(symbol, name, cap=0, volume=0):
+    return {'symbol': symbol, 'name': name, 'exchange': 'US', 'sector': None,
+            'marketCap': cap, 'volume': volume}
+
+
+TICKERS = [
+    _ticker('AAPL', 'Apple Inc.', 3.5e12, 50e6),
+    _ticker('APLE', 'Apple Hospitality REIT, Inc.', 3.6e9, 2e6),
+    _ticker('AA', 'Alcoa Corp', 9e9, 5e6),
+    _ticker('A', 'Agilent Technologies, Inc.', 35e9, 2e6),
+    _ticker('BAC', 'Bank of America Corporation', 300e9, 40e6),
+    _ticker('BOH', 'Bank of Hawaii Corporation', 2.5e9, 1e6),
+    _ticker('MSFT', 'Microsoft Corporation', 3.1e12, 20e6),
+    _ticker('MU', 'Micron Technology, Inc.', 100e9, 20e6),
+    _ticker('BRK-B', 'Berkshire Hathaway Inc.', 900e9, 4e6),
+    _ticker('ZZZA', 'Quiet Co', 0, 5e3),
+    _ticker('ZZZB', 'Quieter Co', 0, 9e3),
+]
+
+
+def _symbols(results):
+    return [t['symbol'] for t in results]
+
+
+class TestTickerIndexSearch:
+
+    def test_exact_symbol_ranks_first(self):
+        index = TickerIndex(TICKERS)
+        assert _symbols(index.search('a', limit=3)) == ['A', 'AAPL', 'AA']
+
+    def test_name_prefix_matches_by_market_cap(self):
+        index = TickerIndex(TICKERS)
+        assert _symbols(index.search('apple')) == ['AAPL', 'APLE']
+        assert _symbols(index.search('micro')) == ['MSFT', 'MU']
+
+    def test_multi_word_query_requires_every_word(self):
+        index = TickerIndex(TICKERS)
+        assert _symbols(index.search('bank of am')) == ['BAC']
+        assert _symbols(index.search('bank of')) == ['BAC', 'BOH']
+
+    def test_symbol_with_punctuation_and_volume_tiebreak(self):
+        index = TickerIndex(TICKERS)
+        assert _symbols(index.search('brk-b')) == ['BRK-B']
+        assert _symbols(index.search('zzz')) == ['ZZZB', 'ZZZA']
+
+    def test_limits_and_empty_query(self):
+        index = TickerIndex(TICKERS * 10)
+        assert index.search('  ') == []
+        assert len(index.search('a', limit=2)) == 2
+        assert len(index.search('a', limit=10_000)) <= MAX_LIMIT
+
+
+class TestTickerIndexPayload:
+
+    def test_gzip_payload_round_trips_with_stable_etag(self):
+        body, gzipped, etag = TickerIndex(TICKERS).payload()
+        assert json.loads(gzip.decompress(gzipped)) == json.loads(body)
+        assert json.loads(body)['tickers'][0]['symbol'] == 'AAPL'
+        assert len(gzipped) < len(body)
+        assert TickerIndex(TICKERS).payload()[2] == etag
+        assert TickerIndex(TICKERS[:-1]).payload()[2] != etag
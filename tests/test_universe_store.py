@@ -0,0 +1,105 @@
+"""
+Tests for the off-thread universe loader and lazy scanner startup
+=================================================================
+Verifies that UniverseStore loads tickers.json and orats_universe.json in
+the background, writes a compact snapshot that later starts load instead
+of the JSON, rebuilds it when a source changes, and that scanner clients
+are only built (and timed) on first access.
+
+Run: pytest tests/test_universe_store.py -v
+"""
+
+import json
+import os
+import time
+
+import pytest
+
+from backend.services.universe_store import UniverseStore
+
+
+def _write_sources(data_dir, symbols=('AAPL', 'MSFT'), orats=('AAPL', 'MSFT', 'SPY')):
+    tickers = [{'symbol': s.lower(), 'name': f'{s} Inc.', 'sector': 'Technology',
+                'marketCap': 10 ** 9 * (i + 1), 'volume': 1000, 'industry': 'unused'}
+               for i, s in enumerate(symbols)]
+    with open(os.path.join(data_dir, 'tickers.json'), 'w') as f:
+        json.dump({'last_updated': '2026-10-01T00:00:00', 'tickers': tickers}, f)
+    with open(os.path.join(data_dir, 'orats_universe.json'), 'w') as f:
+        json.dump({'last_updated': '2026-10-01T00:00:00',
+                   'tickers': {s: {'minDate': None, 'maxDate': None} for s in orats}}, f)
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    _write_sources(str(tmp_path))
+    return str(tmp_path)
+
+
+class TestUniverseStore:
+
+    def test_background_load_normalizes_records(self, data_dir):
+        store = UniverseStore(data_dir=data_dir)
+        store.start()
+        assert store.wait(timeout=5)
+        assert [t['symbol'] for t in store.tickers] == ['AAPL', 'MSFT']
+        assert set(store.tickers[0]) == {'symbol', 'name', 'exchange', 'sector', 'marketCap', 'volume'}
+        assert store.orats == frozenset({'AAPL', 'MSFT', 'SPY'})
+        assert [t['symbol'] for t in store.index.search('ms')] == ['MSFT']
+        assert store.timings['source'] == 'json'
+
+    def test_second_start_reads_snapshot(self, data_dir):
+        UniverseStore(data_dir=data_dir).reload()
+        assert os.path.exists(os.path.join(data_dir, 'universe.bin'))
+        store = UniverseStore(data_dir=data_dir)
+        store.reload()
+        assert store.timings['source'] == 'snapshot'
+        assert len(store.tickers) == 2
+
+    def test_changed_source_rebuilds_snapshot(self, data_dir):
+        UniverseStore(data_dir=data_dir).reload()
+        time.sleep(0.01)
+        _write_sources(data_dir, symbols=('AAPL', 'MSFT', 'NVDA'))
+        store = UniverseStore(data_dir=data_dir)
+        store.reload()
+        assert store.timings['source'] == 'json'
+        assert [t['symbol'] for t in store.tickers] == ['AAPL', 'MSFT', 'NVDA']
+
+    @pytest.mark.skipif(not hasattr(os, 'fork'), reason='needs os.fork')
+    @pytest.mark.parametrize('warm_snapshot', [False, True])
+    def test_forked_child_finishes_interrupted_load(self, data_dir, monkeypatch, warm_snapshot):
+        if warm_snapshot:
+            UniverseStore(data_dir=data_dir).reload()
+        slow_reload = UniverseStore.reload
+
+        def reload(self):
+            time.sleep(0.3)
+            slow_reload(self)
+        monkeypatch.setattr(UniverseStore, 'reload', reload)
+
+        store = UniverseStore(data_dir=data_dir)
+        store.start()                     # Like preload_universe() in the gunicorn master
+        pid = os.fork()
+        if pid == 0:                      # Worker: the load thread was not forked with us
+            ok = store.wait(timeout=5) and len(store.tickers) == 2
+            os._exit(0 if ok else 1)
+        _, status = os.waitpid(pid, 0)
+        assert os.WEXITSTATUS(status) == 0
+        assert store.wait(timeout=5)
+
+    def test_missing_files_load_empty(self, tmp_path):
+        store = UniverseStore(data_dir=str(tmp_path))
+        assert store.wait(timeout=5)
+        assert store.tickers == [] and store.orats == frozenset()
+
+
+class TestLazyScanner:
+
+    def test_clients_built_on_first_access(self):
+        from backend.services.hybrid_scanner_service import HybridScannerService
+
+        scanner = HybridScannerService()
+        assert 'fmp_api' not in vars(scanner)
+        assert scanner.fmp_api is scanner.fmp_api
+        report = scanner.startup_report()
+        assert list(report['components']) == ['fmp_api']
+        assert report['init_seconds'] < 1.0
@@ -0,0 +1,78 @@
+"""
+Tests for the concurrent I/O fan-out in scan_weekly
+===================================================
+Verifies that _fetch_weekly_inputs() issues its independent calls in
+parallel, drops calls that miss the per-ticker deadline, and isolates
+failures to the call that raised.
+
+Run: pytest tests/test_weekly_fanout.py -v
+"""
+
+import os
+import tempfile
+import time
+from datetime import date, timedelta
+from unittest.mock import MagicMock, patch
+
+os.environ.setdefault('ORATS_API_KEY', 'test-orats-key')
+
+from backend.analysis.benchmark_history import BenchmarkHistoryCache
+from backend.services import scanner_weekly
+from backend.services.earnings_calendar import EarningsCalendar
+from backend.services.news_cache import NewsSentimentCache
+from backend.services.scanner_weekly import _fetch_weekly_inputs
+
+
+def _scanner(delay=0.0):
+    def slow(value):
+        def call(*args, **kwargs):
+            time.sleep(delay)
+            return value
+        return call
+
+    scanner = type('FakeScanner', (), {'_benchmarks': BenchmarkHistoryCache(), '_cores_store': None,
+                                       '_news_cache': NewsSentimentCache(session_factory=None),
+                                       '_earnings_calendar': EarningsCalendar(
+                                           path=os.path.join(tempfile.mkdtemp(), 'earnings.json'))})()
+    scanner.use_orats = True
+    orats = scanner.batch_manager = MagicMock()
+    orats.orats_api.get_history.side_effect = slow({'candles': [1]})
+    orats.orats_api.get_quote.side_effect = slow({'price': 101.0})
+    orats.orats_api.get_option_chain.side_effect = slow({'callExpDateMap': {}})
+    orats.orats_api.get_hist_cores.side_effect = slow({'impliedEarningsMove': 4.2})
+    finnhub = scanner.finnhub_api = MagicMock()
+    finnhub.get_news_sentiment.side_effect = slow('FORBIDDEN')
+    finnhub.get_company_news.side_effect = slow([])
+    finnhub.get_earnings_calendar.side_effect = slow([])
+    return scanner
+
+
+class TestWeeklyFanout:
+
+    def test_calls_run_concurrently(self):
+        scanner = _scanner(delay=0.2)
+        start = time.monotonic()
+        fetched = _fetch_weekly_inputs(scanner, 'ABC', date.today() + timedelta(days=4))
+        elapsed = time.monotonic() - start
+        assert fetched['quote'] == {'price': 101.0}
+        assert fetched['cores'] == {'impliedEarningsMove': 4.2}
+        assert set(fetched) >= {'history', 'spy_history', 'chain', 'news', 'earnings'}
+        assert elapsed < 0.2 * 3  # 9 calls x 0.2s sequentially would be ~1.8s
+
+    def test_pre_fetched_chain_is_not_refetched(self):
+        scanner = _scanner()
+        fetched = _fetch_weekly_inputs(scanner, 'ABC', date.today(), pre_fetched_data={'x': 1})
+        assert 'chain' not in fetched
+        scanner.batch_manager.orats_api.get_option_chain.assert_not_called()
+
+    def test_deadline_and_failure_isolation(self):
+        scanner = _scanner()
+        scanner.batch_manager.orats_api.get_quote.side_effect = RuntimeError('boom')
+        scanner.finnhub_api.get_company_news.side_effect = lambda *a, **k: time.sleep(1)
+        with patch.object(scanner_weekly, 'WEEKLY_IO_DEADLINE', 0.3):
+            start = time.monotonic()
+            fetched = _fetch_weekly_inputs(scanner, 'ABC', date.today())
+        assert time.monotonic() - start < 0.9
+        assert fetched['quote'] is None
+        assert fetched['news'] is None
+        assert fetched['history'] == {'candles': [1]}